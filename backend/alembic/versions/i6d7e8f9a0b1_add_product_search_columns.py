@@ -0,0 +1,73 @@
+"""add product search columns (tsvector / pg_trgm)
+
+Revision ID: i6d7e8f9a0b1
+Revises: h5c6d7e8f9a0
+Create Date: 2026-01-20 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'i6d7e8f9a0b1'
+down_revision: str | None = 'h5c6d7e8f9a0'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# app/infrastructure/db/models/product_model.py の定義と同じ式
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(tagline, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+SEARCH_TEXT_SQL = (
+    "coalesce(name, '') || ' ' || coalesce(name_ja, '') || ' ' || "
+    "coalesce(tagline, '') || ' ' || coalesce(description, '')"
+)
+
+
+def upgrade() -> None:
+    # 1. トライグラム検索の拡張を有効化
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # 2. 生成列を追加（既存行もDB側で計算される）
+    op.add_column(
+        'products',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+        ),
+    )
+    op.add_column(
+        'products',
+        sa.Column('search_text', sa.Text(), sa.Computed(SEARCH_TEXT_SQL, persisted=True)),
+    )
+
+    # 3. GINインデックス
+    op.create_index(
+        'ix_products_search_vector',
+        'products',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_products_search_text_trgm',
+        'products',
+        ['search_text'],
+        postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_search_text_trgm', table_name='products')
+    op.drop_index('ix_products_search_vector', table_name='products')
+    op.drop_column('products', 'search_text')
+    op.drop_column('products', 'search_vector')
+    # pg_trgm は他で使われている可能性があるため削除しない
@@ -0,0 +1,38 @@
+"""add (created_at, id) indexes for cursor pagination
+
+Revision ID: j7e8f9a0b1c2
+Revises: i6d7e8f9a0b1
+Create Date: 2026-01-21 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'j7e8f9a0b1c2'
+down_revision: str | None = 'i6d7e8f9a0b1'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Admin一覧の (created_at DESC, id DESC) の並びとカーソル条件をインデックスで解決する
+    op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'])
+    op.create_index('ix_admin_logs_created_at_id', 'admin_logs', ['created_at', 'id'])
+    # 入稿データのAdmin一覧は注文に紐付いたもののみを対象とする
+    op.create_index(
+        'ix_uploads_created_at_id_linked',
+        'uploads',
+        ['created_at', 'id'],
+        postgresql_where=sa.text('order_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_uploads_created_at_id_linked', table_name='uploads')
+    op.drop_index('ix_admin_logs_created_at_id', table_name='admin_logs')
+    op.drop_index('ix_orders_created_at_id', table_name='orders')
@@ -0,0 +1,95 @@
+"""add product_list_view table
+
+Revision ID: k8f9a0b1c2d3
+Revises: j7e8f9a0b1c2
+Create Date: 2026-01-22 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'k8f9a0b1c2d3'
+down_revision: str | None = 'j7e8f9a0b1c2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 商品カードに表示する列（インデックスのINCLUDE列にも使用する）
+_CARD_COLUMNS = [
+    'name',
+    'name_ja',
+    'slug',
+    'tagline',
+    'base_price',
+    'price_note',
+    'is_featured',
+    'main_image_url',
+]
+
+
+def upgrade() -> None:
+    # 商品一覧用の非正規化テーブル（商品・画像の書き込み時にアプリ側で更新する）
+    op.create_table(
+        'product_list_view',
+        sa.Column('product_id', sa.String(length=100), nullable=False),
+        sa.Column('category_id', sa.String(length=50), nullable=False),
+        sa.Column('name', sa.String(length=200), nullable=False),
+        sa.Column('name_ja', sa.String(length=200), nullable=False),
+        sa.Column('slug', sa.String(length=200), nullable=True),
+        sa.Column('tagline', sa.String(length=255), nullable=True),
+        sa.Column('base_price', sa.Integer(), nullable=False),
+        sa.Column('price_note', sa.String(length=255), nullable=True),
+        sa.Column('main_image_url', sa.String(length=500), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_featured', sa.Boolean(), nullable=True),
+        sa.Column('sort_order', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id'),
+    )
+    # カテゴリ別一覧: (is_active, category_id) で絞り込み、並び順のままインデックスを読む
+    # カード表示列をINCLUDEしてIndex Only Scanで返せるようにする
+    op.create_index(
+        'ix_product_list_view_category_order',
+        'product_list_view',
+        ['is_active', 'category_id', 'sort_order', sa.text('created_at DESC')],
+        postgresql_include=_CARD_COLUMNS,
+    )
+    # 全カテゴリ一覧・おすすめ一覧用
+    op.create_index(
+        'ix_product_list_view_order',
+        'product_list_view',
+        ['is_active', 'sort_order', sa.text('created_at DESC')],
+        postgresql_include=['category_id', *_CARD_COLUMNS],
+    )
+
+    # 既存商品を投入（メイン画像は is_main 優先、なければ先頭の画像）
+    op.execute(
+        """
+        INSERT INTO product_list_view (
+            product_id, category_id, name, name_ja, slug, tagline, base_price,
+            price_note, main_image_url, is_active, is_featured, sort_order, created_at
+        )
+        SELECT
+            p.id, p.category_id, p.name, p.name_ja, p.slug, p.tagline, p.base_price,
+            p.price_note,
+            (
+                SELECT i.s3_url FROM product_images i
+                WHERE i.product_id = p.id
+                ORDER BY i.is_main DESC NULLS LAST, i.sort_order, i.id
+                LIMIT 1
+            ),
+            p.is_active, p.is_featured, p.sort_order, p.created_at
+        FROM products p
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_list_view_order', table_name='product_list_view')
+    op.drop_index('ix_product_list_view_category_order', table_name='product_list_view')
+    op.drop_table('product_list_view')
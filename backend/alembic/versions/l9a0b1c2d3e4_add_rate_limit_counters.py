@@ -0,0 +1,44 @@
+"""add rate_limit_counters table
+
+Revision ID: l9a0b1c2d3e4
+Revises: k8f9a0b1c2d3
+Create Date: 2026-01-23 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'l9a0b1c2d3e4'
+down_revision: str | None = 'k8f9a0b1c2d3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 認証系APIのレート制限カウンター（RATE_LIMIT_BACKEND=postgres の場合に使用）
+    op.create_table(
+        'rate_limit_counters',
+        sa.Column('key', sa.String(length=320), nullable=False),
+        sa.Column('window_start', sa.BigInteger(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('expires_at', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('key', 'window_start'),
+    )
+    op.create_index(
+        op.f('ix_rate_limit_counters_expires_at'),
+        'rate_limit_counters',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_rate_limit_counters_expires_at'), table_name='rate_limit_counters'
+    )
+    op.drop_table('rate_limit_counters')
@@ -0,0 +1,45 @@
+"""add daily_sales table
+
+Revision ID: m0b1c2d3e4f5
+Revises: l9a0b1c2d3e4
+Create Date: 2026-01-24 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'm0b1c2d3e4f5'
+down_revision: str | None = 'l9a0b1c2d3e4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 売上統計用の日次集計（注文日・ステータスごと）
+    op.create_table(
+        'daily_sales',
+        sa.Column('sales_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(length=30), nullable=False),
+        sa.Column('orders', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('sales_date', 'status'),
+    )
+
+    # 既存注文を集計して投入
+    op.execute(
+        """
+        INSERT INTO daily_sales (sales_date, status, orders, revenue)
+        SELECT date(created_at), status, count(id), coalesce(sum(total), 0)
+        FROM orders
+        GROUP BY date(created_at), status
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_sales')
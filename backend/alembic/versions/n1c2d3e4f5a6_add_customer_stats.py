@@ -0,0 +1,60 @@
+"""add customer_stats table
+
+Revision ID: n1c2d3e4f5a6
+Revises: m0b1c2d3e4f5
+Create Date: 2026-01-25 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'n1c2d3e4f5a6'
+down_revision: str | None = 'm0b1c2d3e4f5'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_INDEXED_COLUMNS = ('order_count', 'total_spent', 'last_order_at')
+
+
+def upgrade() -> None:
+    # 顧客一覧・詳細用の顧客別集計（一覧の並び替え用に各列へインデックス）
+    op.create_table(
+        'customer_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('total_spent', sa.BigInteger(), nullable=False),
+        sa.Column('last_order_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    for column in _INDEXED_COLUMNS:
+        op.create_index(
+            op.f(f'ix_customer_stats_{column}'), 'customer_stats', [column], unique=False
+        )
+
+    # 既存注文を集計して投入（累計購入金額は未払い・キャンセルを除く）
+    op.execute(
+        """
+        INSERT INTO customer_stats (user_id, order_count, total_spent, last_order_at)
+        SELECT
+            user_id,
+            count(id),
+            coalesce(
+                sum(total) FILTER (WHERE status NOT IN ('pending', 'cancelled')), 0
+            ),
+            max(created_at)
+        FROM orders
+        GROUP BY user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    for column in _INDEXED_COLUMNS:
+        op.drop_index(op.f(f'ix_customer_stats_{column}'), table_name='customer_stats')
+    op.drop_table('customer_stats')
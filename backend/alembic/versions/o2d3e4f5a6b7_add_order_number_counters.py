@@ -0,0 +1,46 @@
+"""add order_number_counters table
+
+Revision ID: o2d3e4f5a6b7
+Revises: n1c2d3e4f5a6
+Create Date: 2026-01-26 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'o2d3e4f5a6b7'
+down_revision: str | None = 'n1c2d3e4f5a6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 注文番号の日付ごとの連番
+    op.create_table(
+        'order_number_counters',
+        sa.Column('counter_date', sa.Date(), nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('counter_date'),
+    )
+
+    # 既存の注文番号（ACQ-YYMMDD-XXX）の日付ごとの最大連番から続ける
+    op.execute(
+        r"""
+        INSERT INTO order_number_counters (counter_date, last_value)
+        SELECT
+            to_date(split_part(order_number, '-', 2), 'YYMMDD'),
+            max(split_part(order_number, '-', 3)::integer)
+        FROM orders
+        WHERE order_number ~ '^ACQ-\d{6}-\d+$'
+        GROUP BY 1
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('order_number_counters')
@@ -0,0 +1,59 @@
+"""add email_outbox table
+
+Revision ID: p3e4f5a6b7c8
+Revises: o2d3e4f5a6b7
+Create Date: 2026-01-27 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'p3e4f5a6b7c8'
+down_revision: str | None = 'o2d3e4f5a6b7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # メール送信キュー（アウトボックス）
+    op.create_table(
+        'email_outbox',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('kind', sa.String(length=50), nullable=False),
+        sa.Column('to_email', sa.String(length=255), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('dedupe_key', sa.String(length=255), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column(
+            'next_attempt_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column(
+            'created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False
+        ),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('dedupe_key'),
+    )
+    # 送信待ちの行だけを送信予定時刻順に取得する
+    op.create_index(
+        'ix_email_outbox_pending',
+        'email_outbox',
+        ['next_attempt_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_pending', table_name='email_outbox')
+    op.drop_table('email_outbox')
@@ -0,0 +1,56 @@
+"""add stripe_events table
+
+Revision ID: q4f5a6b7c8d9
+Revises: p3e4f5a6b7c8
+Create Date: 2026-01-28 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'q4f5a6b7c8d9'
+down_revision: str | None = 'p3e4f5a6b7c8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Stripe Webhookイベントの受信台帳（イベントIDで重複を弾く）
+    op.create_table(
+        'stripe_events',
+        sa.Column('id', sa.String(length=255), nullable=False),
+        sa.Column('type', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column(
+            'next_attempt_at',
+            sa.DateTime(),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column(
+            'received_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False
+        ),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    # 処理待ちの行だけを処理予定時刻順に取得する
+    op.create_index(
+        'ix_stripe_events_pending',
+        'stripe_events',
+        ['next_attempt_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stripe_events_pending', table_name='stripe_events')
+    op.drop_table('stripe_events')
@@ -0,0 +1,84 @@
+"""add requires_upload / upload_item_count to orders
+
+Revision ID: r5a6b7c8d9e0
+Revises: q4f5a6b7c8d9
+Create Date: 2026-01-29 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'r5a6b7c8d9e0'
+down_revision: str | None = 'q4f5a6b7c8d9'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 注文作成時に明細の入稿要件から計算する入稿の要否・対象明細数
+    op.add_column(
+        'orders',
+        sa.Column(
+            'requires_upload',
+            sa.Boolean(),
+            server_default=sa.text('false'),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'orders',
+        sa.Column(
+            'upload_item_count',
+            sa.Integer(),
+            server_default=sa.text('0'),
+            nullable=False,
+        ),
+    )
+
+    # 入稿要件が保存されていなかった既存の明細は商品からコピーする
+    op.execute(
+        """
+        UPDATE order_items oi
+        SET upload_requirements = p.upload_requirements
+        FROM products p
+        WHERE oi.product_id = p.id
+          AND oi.upload_requirements IS NULL
+          AND p.upload_requirements IS NOT NULL
+        """
+    )
+
+    # 既存の注文の入稿要否を明細から計算
+    op.execute(
+        """
+        UPDATE orders o
+        SET upload_item_count = s.upload_item_count,
+            requires_upload = s.upload_item_count > 0
+        FROM (
+            SELECT order_id, count(*) AS upload_item_count
+            FROM order_items
+            WHERE upload_requirements IS NOT NULL
+              AND upload_requirements NOT IN ('null'::jsonb, '{}'::jsonb)
+            GROUP BY order_id
+        ) s
+        WHERE o.id = s.order_id
+        """
+    )
+
+    # 管理画面の「入稿あり」の絞り込み用（入稿ありの注文だけを新しい順に読む）
+    op.create_index(
+        'ix_orders_requires_upload',
+        'orders',
+        ['created_at'],
+        postgresql_where=sa.text('requires_upload'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orders_requires_upload', table_name='orders')
+    op.drop_column('orders', 'upload_item_count')
+    op.drop_column('orders', 'requires_upload')
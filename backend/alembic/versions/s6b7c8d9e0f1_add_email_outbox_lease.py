@@ -0,0 +1,38 @@
+"""add locked_until to email_outbox
+
+Revision ID: s6b7c8d9e0f1
+Revises: r5a6b7c8d9e0
+Create Date: 2026-01-30 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 's6b7c8d9e0f1'
+down_revision: str | None = 'r5a6b7c8d9e0'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 送信中（sending）の行のリース期限
+    op.add_column('email_outbox', sa.Column('locked_until', sa.DateTime(), nullable=True))
+    # リース期限を過ぎた送信中の行を取得する
+    op.create_index(
+        'ix_email_outbox_sending',
+        'email_outbox',
+        ['locked_until'],
+        postgresql_where=sa.text("status = 'sending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_sending', table_name='email_outbox')
+    # 送信中の行は送信待ちに戻す
+    op.execute("UPDATE email_outbox SET status = 'pending' WHERE status = 'sending'")
+    op.drop_column('email_outbox', 'locked_until')
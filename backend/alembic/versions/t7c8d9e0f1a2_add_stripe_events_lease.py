@@ -0,0 +1,40 @@
+"""add locked_until to stripe_events
+
+Revision ID: t7c8d9e0f1a2
+Revises: s6b7c8d9e0f1
+Create Date: 2026-01-31 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 't7c8d9e0f1a2'
+down_revision: str | None = 's6b7c8d9e0f1'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 処理中（processing）の行のリース期限
+    op.add_column(
+        'stripe_events', sa.Column('locked_until', sa.DateTime(), nullable=True)
+    )
+    # リース期限を過ぎた処理中の行を取得する
+    op.create_index(
+        'ix_stripe_events_processing',
+        'stripe_events',
+        ['locked_until'],
+        postgresql_where=sa.text("status = 'processing'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stripe_events_processing', table_name='stripe_events')
+    # 処理中の行は処理待ちに戻す
+    op.execute("UPDATE stripe_events SET status = 'pending' WHERE status = 'processing'")
+    op.drop_column('stripe_events', 'locked_until')
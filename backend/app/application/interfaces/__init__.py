@@ -1,14 +1,22 @@
 """Application層インターフェース"""
 
+from app.application.interfaces.email_outbox import EmailKind, IEmailOutbox
 from app.application.interfaces.email_service import IEmailService
+from app.application.interfaces.rate_limiter import IRateLimiter, RateLimit
 from app.application.interfaces.security_service import ISecurityService
 from app.application.interfaces.storage_service import IStorageService, PresignedUrlResult
+from app.application.interfaces.stripe_event_ledger import IStripeEventLedger
 from app.application.interfaces.unit_of_work import IUnitOfWork
 
 __all__ = [
+    'EmailKind',
+    'IEmailOutbox',
     'IEmailService',
+    'IRateLimiter',
     'ISecurityService',
     'IStorageService',
+    'IStripeEventLedger',
     'IUnitOfWork',
     'PresignedUrlResult',
+    'RateLimit',
 ]
@@ -0,0 +1,100 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from enum import Enum
+from typing import Any
+
+from app.application.interfaces.email_service import IEmailService, OrderConfirmationData
+
+
+class EmailKind(str, Enum):
+    """送信キューに記録するメールの種類"""
+
+    VERIFICATION = 'verification'  # メール認証
+    PASSWORD_RESET = 'password_reset'  # パスワードリセット
+    WELCOME = 'welcome'  # ウェルカム
+    ORDER_CONFIRMATION = 'order_confirmation'  # 注文確認
+
+
+class IEmailOutbox(ABC):
+    """メール送信キュー（アウトボックス）のインターフェース
+
+    ユースケースは送信するメールをキューに記録するだけで、実際の送信は
+    バックグラウンドの配信処理が IEmailService で行う。記録はユースケースと同じ
+    トランザクションで行うため、ロールバックされた処理のメールは送信されない。
+    """
+
+    @abstractmethod
+    def enqueue(
+        self,
+        kind: EmailKind,
+        to_email: str,
+        payload: dict[str, Any],
+        dedupe_key: str | None = None,
+    ) -> None:
+        """メールを送信キューに記録する
+
+        Args:
+            kind: メールの種類
+            to_email: 宛先
+            payload: メール本文の生成に使うデータ（JSONに変換できる値）
+            dedupe_key: 重複防止キー（同じキーのメールは1度だけ記録する）
+        """
+        pass
+
+    def enqueue_verification_email(self, to_email: str, verification_url: str) -> None:
+        """メール認証メールを送信キューに記録"""
+        self.enqueue(
+            EmailKind.VERIFICATION, to_email, {'verification_url': verification_url}
+        )
+
+    def enqueue_password_reset_email(self, to_email: str, reset_url: str) -> None:
+        """パスワードリセットメールを送信キューに記録"""
+        self.enqueue(EmailKind.PASSWORD_RESET, to_email, {'reset_url': reset_url})
+
+    def enqueue_welcome_email(
+        self, to_email: str, user_name: str | None, dedupe_key: str | None = None
+    ) -> None:
+        """ウェルカムメールを送信キューに記録"""
+        self.enqueue(
+            EmailKind.WELCOME, to_email, {'user_name': user_name}, dedupe_key=dedupe_key
+        )
+
+    def enqueue_order_confirmation_email(
+        self,
+        to_email: str,
+        order_data: OrderConfirmationData,
+        dedupe_key: str | None = None,
+    ) -> None:
+        """注文確認メールを送信キューに記録"""
+        self.enqueue(
+            EmailKind.ORDER_CONFIRMATION,
+            to_email,
+            asdict(order_data),
+            dedupe_key=dedupe_key,
+        )
+
+
+def send_queued_email(
+    email_service: IEmailService,
+    kind: EmailKind,
+    to_email: str,
+    payload: dict[str, Any],
+) -> bool:
+    """送信キューに記録したメールを IEmailService で送信する
+
+    Returns:
+        送信に成功した場合True
+    """
+    if kind == EmailKind.VERIFICATION:
+        return email_service.send_verification_email(
+            to_email, payload['verification_url']
+        )
+    if kind == EmailKind.PASSWORD_RESET:
+        return email_service.send_password_reset_email(to_email, payload['reset_url'])
+    if kind == EmailKind.WELCOME:
+        return email_service.send_welcome_email(to_email, payload['user_name'])
+    if kind == EmailKind.ORDER_CONFIRMATION:
+        return email_service.send_order_confirmation_email(
+            to_email, OrderConfirmationData(**payload)
+        )
+    raise ValueError(f'Unknown email kind: {kind}')
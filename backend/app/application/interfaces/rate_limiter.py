@@ -0,0 +1,47 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from app.domain.exceptions.auth import RateLimitExceededError
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """レート制限の設定（window_seconds 秒あたり limit 回まで）"""
+
+    limit: int
+    window_seconds: int
+
+
+class IRateLimiter(ABC):
+    """レート制限のインターフェース"""
+
+    @abstractmethod
+    def hit(self, key: str, rate_limit: RateLimit) -> float:
+        """key の試行を1回記録する
+
+        Returns:
+            上限を超えた場合は再試行できるまでの秒数、許可された場合は0
+        """
+        pass
+
+    def enforce(
+        self,
+        action: str,
+        ip_address: str | None,
+        email: str,
+        per_ip: RateLimit,
+        per_email: RateLimit,
+    ) -> None:
+        """IPアドレス単位・メールアドレス単位の上限を確認する
+
+        パスワードのハッシュ化やメール送信の前に呼び出し、上限を超えた試行を安価に拒否する。
+
+        Raises:
+            RateLimitExceededError: いずれかの上限を超えた場合
+        """
+        retry_after = self.hit(f'{action}:email:{email.strip().lower()}', per_email)
+        if ip_address:
+            retry_after = max(retry_after, self.hit(f'{action}:ip:{ip_address}', per_ip))
+        if retry_after > 0:
+            raise RateLimitExceededError(retry_after_seconds=math.ceil(retry_after))
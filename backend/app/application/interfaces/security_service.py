@@ -27,6 +27,17 @@ class ISecurityService(ABC):
         """パスワードを検証"""
         pass
 
+    @abstractmethod
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """パスワードを検証し、ハッシュの更新が必要な場合は新しいハッシュも返す
+
+        Returns:
+            (検証結果, 新しいハッシュ) 新しいハッシュは更新不要の場合None
+        """
+        pass
+
     @abstractmethod
     def hash_password(self, password: str) -> str:
         """パスワードをハッシュ化"""
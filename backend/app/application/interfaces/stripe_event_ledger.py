@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IStripeEventLedger(ABC):
+    """Stripe Webhookイベントの受信台帳のインターフェース
+
+    Webhookはイベントを台帳に記録するだけで応答し、注文の更新などの処理は
+    バックグラウンドの処理が行う。台帳はイベントIDで一意のため、Stripeの再送や
+    重複配信は記録の時点で弾かれ、同じイベントを2度処理しない。
+    """
+
+    @abstractmethod
+    def record(self, event_id: str, event_type: str, payload: dict[str, Any]) -> bool:
+        """受信したイベントを記録する
+
+        Args:
+            event_id: StripeのイベントID（evt_...）
+            event_type: イベントの種類（payment_intent.succeeded 等）
+            payload: イベントのオブジェクト（data.object）
+
+        Returns:
+            初めて受信したイベントの場合True（再送・重複配信の場合はFalse）
+        """
+        pass
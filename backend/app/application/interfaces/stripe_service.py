@@ -85,6 +85,6 @@ class IStripeService(ABC):
             sig_header: Stripe-Signatureヘッダー
 
         Returns:
-            Stripeイベントオブジェクト
+            Stripeイベントオブジェクト（id, type, data.object）
         """
         pass
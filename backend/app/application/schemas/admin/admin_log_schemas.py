@@ -42,12 +42,14 @@ class GetAdminLogsInputDTO(BaseModel):
     date_to: date | None = None
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: str | None = None
 
 
 class GetAdminLogsOutputDTO(BaseModel):
     """操作ログ一覧取得出力DTO"""
 
     logs: list[AdminLogDTO]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
@@ -41,6 +41,8 @@ class AdminOrderDTO(BaseModel):
     delivered_at: datetime | None
     cancelled_at: datetime | None
     notes: str | None
+    requires_upload: bool
+    upload_item_count: int
     created_at: datetime
 
 
@@ -66,17 +68,20 @@ class GetAdminOrdersInputDTO(BaseModel):
     status: list[OrderStatus] | None = None
     date_from: datetime | None = None
     date_to: datetime | None = None
+    requires_upload: bool | None = None
     limit: int = Field(default=20, ge=1, le=100)
     offset: int = Field(default=0, ge=0)
+    cursor: str | None = None
 
 
 class GetAdminOrdersOutputDTO(BaseModel):
     """注文一覧取得出力DTO"""
 
     orders: list[AdminOrderDTO]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 # ========== 注文詳細 ==========
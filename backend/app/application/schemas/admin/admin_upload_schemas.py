@@ -39,15 +39,17 @@ class GetAdminUploadsInputDTO(BaseModel):
     date_to: datetime | None = Field(None, description='終了日')
     limit: int = Field(20, ge=1, le=100, description='取得件数')
     offset: int = Field(0, ge=0, description='オフセット')
+    cursor: str | None = Field(None, description='次ページ取得用カーソル')
 
 
 class GetAdminUploadsOutputDTO(BaseModel):
     """Admin入稿データ一覧取得出力DTO"""
 
     uploads: list[AdminUploadDTO] = Field(..., description='入稿データ一覧')
-    total: int = Field(..., description='総件数')
+    total: int | None = Field(..., description='総件数（カーソル指定時はNone）')
     limit: int = Field(..., description='取得件数')
     offset: int = Field(..., description='オフセット')
+    next_cursor: str | None = Field(None, description='次ページ取得用カーソル')
 
 
 # === 入稿データ詳細取得 ===
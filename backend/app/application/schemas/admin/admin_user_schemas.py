@@ -4,6 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.domain.entities.customer_stats import CustomerSortKey
+
 
 # === 顧客DTO ===
 class CustomerDTO(BaseModel):
@@ -16,6 +18,9 @@ class CustomerDTO(BaseModel):
     phone: str | None = Field(None, description='電話番号')
     company: str | None = Field(None, description='会社名')
     is_email_verified: bool = Field(..., description='メール認証済み')
+    order_count: int = Field(..., description='注文数')
+    total_spent: int = Field(..., description='累計購入金額')
+    last_order_at: datetime | None = Field(None, description='最終注文日時')
     created_at: datetime | None = Field(None, description='登録日時')
     updated_at: datetime | None = Field(None, description='更新日時')
 
@@ -24,8 +29,6 @@ class CustomerDetailDTO(CustomerDTO):
     """顧客詳細DTO"""
 
     stripe_customer_id: str | None = Field(None, description='Stripe顧客ID')
-    order_count: int = Field(..., description='注文数')
-    total_spent: int = Field(..., description='累計購入金額')
 
 
 # === 顧客一覧取得 ===
@@ -33,6 +36,9 @@ class GetCustomersInputDTO(BaseModel):
     """顧客一覧取得入力DTO"""
 
     search: str | None = Field(None, description='検索キーワード（email/name）')
+    sort_by: CustomerSortKey = Field(
+        CustomerSortKey.CREATED_AT, description='並び順（いずれも降順）'
+    )
     limit: int = Field(20, ge=1, le=100, description='取得件数')
     offset: int = Field(0, ge=0, description='オフセット')
 
@@ -110,6 +110,14 @@ class ProductDetailDTO(BaseModel):
     updated_at: datetime | None
 
 
+class ProductVersionDTO(BaseModel):
+    """商品バージョンDTO（条件付きGET用）"""
+
+    product_id: str
+    updated_at: datetime | None
+    version: str
+
+
 class ProductListOutputDTO(BaseModel):
     """商品一覧出力DTO"""
 
@@ -2,7 +2,8 @@ import logging
 import secrets
 from datetime import datetime, timedelta
 
-from app.application.interfaces.email_service import IEmailService
+from app.application.interfaces.email_outbox import IEmailOutbox
+from app.application.interfaces.rate_limiter import IRateLimiter, RateLimit
 from app.application.interfaces.security_service import ISecurityService
 from app.application.schemas.account.auth_schemas import (
     LoginInputDTO,
@@ -47,16 +48,22 @@ class AuthUsecase:
         security_service: ISecurityService,
         user_repository: IUserRepository,
         token_repository: IVerificationTokenRepository,
-        email_service: IEmailService,
+        email_outbox: IEmailOutbox,
+        rate_limiter: IRateLimiter | None = None,
     ):
         self.security_service = security_service
         self.user_repository = user_repository
         self.token_repository = token_repository
-        self.email_service = email_service
+        self.email_outbox = email_outbox
+        self.rate_limiter = rate_limiter
         self.settings = get_settings()
 
-    def register(self, input_dto: RegisterInputDTO) -> RegisterOutputDTO:
+    def register(
+        self, input_dto: RegisterInputDTO, ip_address: str | None = None
+    ) -> RegisterOutputDTO:
         """会員登録"""
+        self._enforce_email_rate_limit('register', ip_address, input_dto.email)
+
         # メールアドレスの重複チェック
         existing_user = self.user_repository.get_by_email(input_dto.email)
         if existing_user:
@@ -86,9 +93,9 @@ class AuthUsecase:
         )
         self.token_repository.create(verification_token)
 
-        # 認証メール送信
+        # 認証メールを送信キューに記録
         verification_url = f'{self.settings.frontend_url}/verify-email?token={token}'
-        self.email_service.send_verification_email(
+        self.email_outbox.enqueue_verification_email(
             to_email=created_user.email,
             verification_url=verification_url,
         )
@@ -101,18 +108,39 @@ class AuthUsecase:
             message='会員登録が完了しました。メールをご確認ください。',
         )
 
-    def login(self, input_dto: LoginInputDTO) -> LoginOutputDTO:
+    def login(
+        self, input_dto: LoginInputDTO, ip_address: str | None = None
+    ) -> LoginOutputDTO:
         """ログイン"""
+        # パスワード検証（bcrypt）の前に試行回数を確認する
+        if self.rate_limiter is not None:
+            self.rate_limiter.enforce(
+                'login',
+                ip_address,
+                input_dto.email,
+                per_ip=RateLimit(
+                    self.settings.rate_limit_login_per_ip,
+                    self.settings.rate_limit_login_window_seconds,
+                ),
+                per_email=RateLimit(
+                    self.settings.rate_limit_login_per_email,
+                    self.settings.rate_limit_login_window_seconds,
+                ),
+            )
+
         # ユーザー取得
         user = self.user_repository.get_by_email(input_dto.email)
         if user is None:
             raise InvalidCredentialsError()
 
-        # パスワード検証
-        if not self.security_service.verify_password(
+        # パスワード検証（ハッシュのコストが変わっていれば再ハッシュして保存）
+        verified, new_password_hash = self.security_service.verify_and_update_password(
             input_dto.password, user.password_hash
-        ):
+        )
+        if not verified:
             raise InvalidCredentialsError()
+        if new_password_hash is not None:
+            self.user_repository.update_password(user.id, new_password_hash)
 
         # メール認証済みかチェック
         if not user.is_email_verified:
@@ -159,10 +187,12 @@ class AuthUsecase:
         # トークンを使用済みにする
         self.token_repository.mark_as_used(token_entity.id, verified_at)
 
-        # ウェルカムメール送信
+        # ウェルカムメールを送信キューに記録（ユーザーごとに1回）
         user = self.user_repository.get_by_id(token_entity.user_id)
         if user:
-            self.email_service.send_welcome_email(user.email, user.name)
+            self.email_outbox.enqueue_welcome_email(
+                user.email, user.name, dedupe_key=f'welcome:{user.id}'
+            )
 
         logger.info(f'Email verified for user_id: {token_entity.user_id}')
 
@@ -172,9 +202,11 @@ class AuthUsecase:
         )
 
     def request_password_reset(
-        self, input_dto: PasswordResetRequestInputDTO
+        self, input_dto: PasswordResetRequestInputDTO, ip_address: str | None = None
     ) -> PasswordResetRequestOutputDTO:
         """パスワードリセット依頼"""
+        self._enforce_email_rate_limit('password_reset', ip_address, input_dto.email)
+
         # ユーザー取得（存在しなくても成功として返す = セキュリティ対策）
         user = self.user_repository.get_by_email(input_dto.email)
         if user:
@@ -193,11 +225,11 @@ class AuthUsecase:
             )
             self.token_repository.create(reset_token)
 
-            # リセットメール送信
+            # リセットメールを送信キューに記録
             reset_url = (
                 f'{self.settings.frontend_url}/password-reset/confirm?token={token}'
             )
-            self.email_service.send_password_reset_email(
+            self.email_outbox.enqueue_password_reset_email(
                 to_email=user.email,
                 reset_url=reset_url,
             )
@@ -232,9 +264,11 @@ class AuthUsecase:
         )
 
     def resend_verification_email(
-        self, input_dto: ResendVerificationInputDTO
+        self, input_dto: ResendVerificationInputDTO, ip_address: str | None = None
     ) -> ResendVerificationOutputDTO:
         """メール認証再送信"""
+        self._enforce_email_rate_limit('resend_verification', ip_address, input_dto.email)
+
         user = self.user_repository.get_by_email(input_dto.email)
         if user is None:
             # セキュリティ対策: ユーザーが存在しなくても成功として返す
@@ -261,9 +295,9 @@ class AuthUsecase:
         )
         self.token_repository.create(verification_token)
 
-        # 認証メール送信
+        # 認証メールを送信キューに記録
         verification_url = f'{self.settings.frontend_url}/verify-email?token={token}'
-        self.email_service.send_verification_email(
+        self.email_outbox.enqueue_verification_email(
             to_email=user.email,
             verification_url=verification_url,
         )
@@ -274,6 +308,26 @@ class AuthUsecase:
             message='認証メールを再送信しました',
         )
 
+    def _enforce_email_rate_limit(
+        self, action: str, ip_address: str | None, email: str
+    ) -> None:
+        """メール送信を伴う操作の試行回数を確認（上限超過で RateLimitExceededError）"""
+        if self.rate_limiter is None:
+            return
+        self.rate_limiter.enforce(
+            action,
+            ip_address,
+            email,
+            per_ip=RateLimit(
+                self.settings.rate_limit_email_per_ip,
+                self.settings.rate_limit_email_window_seconds,
+            ),
+            per_email=RateLimit(
+                self.settings.rate_limit_email_per_email,
+                self.settings.rate_limit_email_window_seconds,
+            ),
+        )
+
     def _generate_token(self) -> str:
         """セキュアなトークンを生成"""
         return secrets.token_urlsafe(32)
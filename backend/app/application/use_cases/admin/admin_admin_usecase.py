@@ -47,20 +47,16 @@ class AdminAdminUsecase:
         Returns:
             管理者一覧取得出力DTO
         """
-        admins = self.admin_repository.get_all(
+        page = self.admin_repository.get_all(
             role=input_dto.role,
             is_active=input_dto.is_active,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
-        total = self.admin_repository.count_all(
-            role=input_dto.role,
-            is_active=input_dto.is_active,
-        )
 
         return GetAdminsOutputDTO(
-            admins=[self._to_admin_dto(a) for a in admins],
-            total=total,
+            admins=[self._to_admin_dto(a) for a in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
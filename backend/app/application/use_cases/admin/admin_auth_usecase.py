@@ -3,6 +3,7 @@
 import logging
 from datetime import datetime
 
+from app.application.interfaces.rate_limiter import IRateLimiter, RateLimit
 from app.application.interfaces.security_service import ISecurityService
 from app.application.schemas.admin.admin_auth_schemas import (
     AdminLoginInputDTO,
@@ -10,6 +11,7 @@ from app.application.schemas.admin.admin_auth_schemas import (
     AdminLogoutOutputDTO,
     AdminStatusOutputDTO,
 )
+from app.config import get_settings
 from app.domain.entities.admin import AdminLog
 from app.domain.exceptions.admin import (
     AdminInactiveError,
@@ -29,10 +31,12 @@ class AdminAuthUsecase:
         admin_repository: IAdminRepository,
         admin_log_repository: IAdminLogRepository,
         security_service: ISecurityService,
+        rate_limiter: IRateLimiter | None = None,
     ) -> None:
         self.admin_repository = admin_repository
         self.admin_log_repository = admin_log_repository
         self.security_service = security_service
+        self.rate_limiter = rate_limiter
 
     def login(
         self,
@@ -49,21 +53,40 @@ class AdminAuthUsecase:
             ログイン出力DTO
 
         Raises:
+            RateLimitExceededError: 試行回数の上限超過
             AdminInvalidCredentialsError: 認証失敗
             AdminInactiveError: アカウント無効化
         """
+        # パスワード検証（bcrypt）の前に試行回数を確認する
+        if self.rate_limiter is not None:
+            settings = get_settings()
+            window_seconds = settings.rate_limit_login_window_seconds
+            self.rate_limiter.enforce(
+                'admin_login',
+                ip_address,
+                input_dto.email,
+                per_ip=RateLimit(settings.rate_limit_login_per_ip, window_seconds),
+                per_email=RateLimit(settings.rate_limit_login_per_email, window_seconds),
+            )
+
         admin = self.admin_repository.get_by_email(input_dto.email)
         if admin is None:
             raise AdminInvalidCredentialsError()
 
-        if not self.security_service.verify_password(
+        verified, new_password_hash = self.security_service.verify_and_update_password(
             input_dto.password, admin.password_hash
-        ):
+        )
+        if not verified:
             raise AdminInvalidCredentialsError()
 
         if not admin.is_active:
             raise AdminInactiveError()
 
+        # ハッシュのコストが変わっていれば再ハッシュして保存
+        if new_password_hash is not None:
+            admin.password_hash = new_password_hash
+            self.admin_repository.update(admin)
+
         # 最終ログイン日時を更新
         self.admin_repository.update_last_login(admin.id, datetime.utcnow())
 
@@ -8,8 +8,8 @@ from app.application.schemas.admin.admin_dashboard_schemas import (
     StatsDataPointDTO,
     StatsSummaryDTO,
 )
+from app.domain.repositories.dashboard_repository import IDashboardRepository
 from app.domain.repositories.order_repository import IOrderRepository
-from app.domain.repositories.user_repository import IUserRepository
 
 
 class AdminDashboardUsecase:
@@ -18,28 +18,25 @@ class AdminDashboardUsecase:
     def __init__(
         self,
         order_repository: IOrderRepository,
-        user_repository: IUserRepository,
+        dashboard_repository: IDashboardRepository,
     ):
         self.order_repository = order_repository
-        self.user_repository = user_repository
+        self.dashboard_repository = dashboard_repository
 
     def get_dashboard(self) -> GetDashboardOutputDTO:
         """ダッシュボード情報を取得"""
-        today_stats = self.order_repository.get_today_stats()
-        pending_count = self.order_repository.get_pending_count()
-        processing_count = self.order_repository.get_processing_count()
-        new_customers = self.user_repository.count_new_this_month()
+        summary = self.dashboard_repository.get_summary()
 
-        summary = DashboardSummaryDTO(
-            today_orders=today_stats['orders'],
-            today_revenue=today_stats['revenue'],
-            pending_orders=pending_count,
-            processing_orders=processing_count,
-            new_customers_this_month=new_customers,
+        return GetDashboardOutputDTO(
+            summary=DashboardSummaryDTO(
+                today_orders=summary.today_orders,
+                today_revenue=summary.today_revenue,
+                pending_orders=summary.pending_orders,
+                processing_orders=summary.processing_orders,
+                new_customers_this_month=summary.new_customers_this_month,
+            )
         )
 
-        return GetDashboardOutputDTO(summary=summary)
-
     def get_stats(self, input_dto: GetStatsInputDTO) -> GetStatsOutputDTO:
         """売上統計を取得"""
         from datetime import datetime
@@ -33,7 +33,7 @@ class AdminLogUsecase:
         if input_dto.date_to:
             date_to = datetime.combine(input_dto.date_to, datetime.max.time())
 
-        logs = self.admin_log_repository.get_all(
+        page = self.admin_log_repository.get_all(
             admin_id=input_dto.admin_id,
             action=input_dto.action,
             target_type=input_dto.target_type,
@@ -41,21 +41,15 @@ class AdminLogUsecase:
             date_to=date_to,
             limit=input_dto.limit,
             offset=input_dto.offset,
-        )
-
-        total = self.admin_log_repository.count_all(
-            admin_id=input_dto.admin_id,
-            action=input_dto.action,
-            target_type=input_dto.target_type,
-            date_from=date_from,
-            date_to=date_to,
+            cursor=input_dto.cursor,
         )
 
         return GetAdminLogsOutputDTO(
-            logs=[self._to_log_dto(log) for log in logs],
-            total=total,
+            logs=[self._to_log_dto(log) for log in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
+            next_cursor=page.next_cursor,
         )
 
     def _get_admin_name(self, admin_id: int) -> str | None:
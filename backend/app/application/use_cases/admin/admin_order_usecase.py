@@ -29,26 +29,23 @@ class AdminOrderUsecase:
 
     def get_orders(self, input_dto: GetAdminOrdersInputDTO) -> GetAdminOrdersOutputDTO:
         """注文一覧を取得"""
-        orders = self.order_repository.get_all(
+        page = self.order_repository.get_all(
             search=input_dto.search,
             status=input_dto.status,
             date_from=input_dto.date_from,
             date_to=input_dto.date_to,
+            requires_upload=input_dto.requires_upload,
             limit=input_dto.limit,
             offset=input_dto.offset,
-        )
-        total = self.order_repository.count_all(
-            search=input_dto.search,
-            status=input_dto.status,
-            date_from=input_dto.date_from,
-            date_to=input_dto.date_to,
+            cursor=input_dto.cursor,
         )
 
         return GetAdminOrdersOutputDTO(
-            orders=[self._to_order_dto(order) for order in orders],
-            total=total,
+            orders=[self._to_order_dto(order) for order in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
+            next_cursor=page.next_cursor,
         )
 
     def get_order(self, order_id: int) -> GetAdminOrderOutputDTO:
@@ -187,6 +184,8 @@ class AdminOrderUsecase:
             delivered_at=order.delivered_at,
             cancelled_at=order.cancelled_at,
             notes=order.notes,
+            requires_upload=order.requires_upload,
+            upload_item_count=order.upload_item_count,
             created_at=order.created_at,
         )
 
@@ -213,6 +212,8 @@ class AdminOrderUsecase:
             cancel_reason=order.cancel_reason,
             notes=order.notes,
             admin_notes=order.admin_notes,
+            requires_upload=order.requires_upload,
+            upload_item_count=order.upload_item_count,
             created_at=order.created_at,
             updated_at=order.updated_at,
             items=[
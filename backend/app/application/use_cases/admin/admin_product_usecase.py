@@ -64,32 +64,24 @@ class AdminProductUsecase:
         """商品一覧を取得"""
         # Adminの場合はis_active=Noneで全商品取得可能
         if input_dto.search:
-            products = self.product_repository.search(
+            page = self.product_repository.search(
                 keyword=input_dto.search,
                 category_id=input_dto.category_id,
+                is_active=input_dto.is_active,
                 limit=input_dto.limit,
                 offset=input_dto.offset,
             )
-            total = self.product_repository.count(
-                category_id=input_dto.category_id,
-                is_active=input_dto.is_active,
-                keyword=input_dto.search,
-            )
         else:
-            products = self.product_repository.get_all(
+            page = self.product_repository.get_page(
                 category_id=input_dto.category_id,
                 is_active=input_dto.is_active,
                 limit=input_dto.limit,
                 offset=input_dto.offset,
             )
-            total = self.product_repository.count(
-                category_id=input_dto.category_id,
-                is_active=input_dto.is_active,
-            )
 
         return GetAdminProductsOutputDTO(
-            products=[self._to_product_dto(p) for p in products],
-            total=total,
+            products=[self._to_product_dto(p) for p in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
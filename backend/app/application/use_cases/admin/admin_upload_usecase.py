@@ -32,7 +32,7 @@ class AdminUploadUsecase:
 
     def get_uploads(self, input_dto: GetAdminUploadsInputDTO) -> GetAdminUploadsOutputDTO:
         """入稿データ一覧を取得"""
-        uploads = self.upload_repository.get_all_paginated(
+        page = self.upload_repository.get_all_paginated(
             status=input_dto.status,
             user_id=input_dto.user_id,
             order_id=input_dto.order_id,
@@ -40,20 +40,15 @@ class AdminUploadUsecase:
             date_to=input_dto.date_to,
             limit=input_dto.limit,
             offset=input_dto.offset,
-        )
-        total = self.upload_repository.count_all_by_filters(
-            status=input_dto.status,
-            user_id=input_dto.user_id,
-            order_id=input_dto.order_id,
-            date_from=input_dto.date_from,
-            date_to=input_dto.date_to,
+            cursor=input_dto.cursor,
         )
 
         return GetAdminUploadsOutputDTO(
-            uploads=[self._to_dto(upload) for upload in uploads],
-            total=total,
+            uploads=[self._to_dto(upload) for upload in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
+            next_cursor=page.next_cursor,
         )
 
     def get_upload(self, upload_id: int) -> GetAdminUploadOutputDTO:
@@ -9,9 +9,11 @@ from app.application.schemas.admin.admin_user_schemas import (
     GetCustomersOutputDTO,
 )
 from app.application.schemas.checkout.order_schemas import GetOrdersOutputDTO, OrderDTO
+from app.domain.entities.customer_stats import CustomerStats
 from app.domain.entities.order import Order
 from app.domain.entities.user import User
 from app.domain.exceptions.user import UserNotFoundError
+from app.domain.repositories.customer_stats_repository import ICustomerStatsRepository
 from app.domain.repositories.order_repository import IOrderRepository
 from app.domain.repositories.user_repository import IUserRepository
 
@@ -23,9 +25,11 @@ class AdminUserUsecase:
         self,
         user_repository: IUserRepository,
         order_repository: IOrderRepository,
+        customer_stats_repository: ICustomerStatsRepository,
     ) -> None:
         self.user_repository = user_repository
         self.order_repository = order_repository
+        self.customer_stats_repository = customer_stats_repository
 
     def get_customers(self, input_dto: GetCustomersInputDTO) -> GetCustomersOutputDTO:
         """顧客一覧を取得
@@ -36,16 +40,18 @@ class AdminUserUsecase:
         Returns:
             顧客一覧取得出力DTO
         """
-        users = self.user_repository.get_all(
+        page = self.user_repository.get_all(
             search=input_dto.search,
+            sort_by=input_dto.sort_by,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
-        total = self.user_repository.count_all(search=input_dto.search)
+        # ページ内の顧客の注文集計をまとめて取得
+        stats = self.customer_stats_repository.get_by_user_ids([u.id for u in page.items])
 
         return GetCustomersOutputDTO(
-            customers=[self._to_customer_dto(u) for u in users],
-            total=total,
+            customers=[self._to_customer_dto(u, stats[u.id]) for u in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
@@ -66,8 +72,7 @@ class AdminUserUsecase:
         if user is None:
             raise UserNotFoundError()
 
-        order_count = self.order_repository.count_by_user_id(user_id)
-        total_spent = self.order_repository.get_total_spent_by_user_id(user_id)
+        stats = self.customer_stats_repository.get_by_user_id(user_id)
 
         return GetCustomerOutputDTO(
             customer=CustomerDetailDTO(
@@ -79,8 +84,9 @@ class AdminUserUsecase:
                 company=user.company,
                 is_email_verified=user.is_email_verified,
                 stripe_customer_id=user.stripe_customer_id,
-                order_count=order_count,
-                total_spent=total_spent,
+                order_count=stats.order_count,
+                total_spent=stats.total_spent,
+                last_order_at=stats.last_order_at,
                 created_at=user.created_at,
                 updated_at=user.updated_at,
             )
@@ -112,7 +118,8 @@ class AdminUserUsecase:
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
-        total = self.order_repository.count_by_user_id(user_id)
+        # 注文数は顧客別集計から取得（注文テーブルを数え直さない）
+        total = self.customer_stats_repository.get_by_user_id(user_id).order_count
 
         return GetOrdersOutputDTO(
             orders=[self._to_order_dto(o) for o in orders],
@@ -121,8 +128,8 @@ class AdminUserUsecase:
             offset=input_dto.offset,
         )
 
-    def _to_customer_dto(self, user: User) -> CustomerDTO:
-        """UserエンティティをCustomerDTOに変換"""
+    def _to_customer_dto(self, user: User, stats: CustomerStats) -> CustomerDTO:
+        """Userエンティティと注文集計をCustomerDTOに変換"""
         return CustomerDTO(
             id=user.id,
             email=user.email,
@@ -131,6 +138,9 @@ class AdminUserUsecase:
             phone=user.phone,
             company=user.company,
             is_email_verified=user.is_email_verified,
+            order_count=stats.order_count,
+            total_spent=stats.total_spent,
+            last_order_at=stats.last_order_at,
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
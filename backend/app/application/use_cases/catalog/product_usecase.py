@@ -15,6 +15,7 @@ from app.application.schemas.catalog.product_schemas import (
     ProductSearchInputDTO,
     ProductSearchOutputDTO,
     ProductSpecDTO,
+    ProductVersionDTO,
     RelatedProductDTO,
 )
 from app.domain.entities.product import (
@@ -22,8 +23,10 @@ from app.domain.entities.product import (
     ProductFaq,
     ProductFeature,
     ProductImage,
+    ProductListItem,
     ProductOption,
     ProductSpec,
+    RelatedProduct,
 )
 from app.domain.exceptions.product import ProductNotActiveError, ProductNotFoundError
 from app.domain.repositories.product_repository import IProductRepository
@@ -37,22 +40,16 @@ class ProductUsecase:
 
     def get_products(self, input_dto: ProductListInputDTO) -> ProductListOutputDTO:
         """商品一覧を取得"""
-        products = self.product_repository.get_all(
+        page = self.product_repository.get_list_items(
             category_id=input_dto.category_id,
-            is_active=True,
             is_featured=input_dto.is_featured,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
 
-        total = self.product_repository.count(
-            category_id=input_dto.category_id,
-            is_active=True,
-        )
-
         return ProductListOutputDTO(
-            products=[self._to_list_item_dto(p) for p in products],
-            total=total,
+            products=[self._card_to_list_item_dto(p) for p in page.items],
+            total=page.total,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
@@ -69,6 +66,27 @@ class ProductUsecase:
 
         return self._to_detail_dto(product)
 
+    def get_product_version(self, product_id: str) -> ProductVersionDTO:
+        """商品詳細のバージョンを取得（詳細DTOを組み立てずに変更有無を判定するため）"""
+        version = self.product_repository.get_version(product_id)
+
+        if version is None:
+            raise ProductNotFoundError()
+
+        if not version.is_active:
+            raise ProductNotActiveError()
+
+        updated_at = version.updated_at.isoformat() if version.updated_at else ''
+        child_versions = [
+            f'{name}={stamp}' for name, stamp in sorted(version.child_versions.items())
+        ]
+
+        return ProductVersionDTO(
+            product_id=product_id,
+            updated_at=version.updated_at,
+            version='|'.join([product_id, updated_at, *child_versions]),
+        )
+
     def get_product_by_slug(self, slug: str) -> ProductDetailDTO:
         """商品詳細を取得（スラッグで）"""
         product = self.product_repository.get_by_slug(slug, include_relations=True)
@@ -97,13 +115,11 @@ class ProductUsecase:
 
     def get_related_products(self, product_id: str) -> ProductRelatedOutputDTO:
         """関連商品を取得"""
-        product = self.product_repository.get_by_id(product_id, include_relations=False)
+        related = self.product_repository.get_related_products(product_id)
 
-        if product is None:
+        if related is None:
             raise ProductNotFoundError()
 
-        related = self.product_repository.get_related_products(product_id)
-
         return ProductRelatedOutputDTO(
             product_id=product_id,
             related_products=[self._to_related_dto(p) for p in related],
@@ -111,33 +127,28 @@ class ProductUsecase:
 
     def get_featured_products(self, limit: int = 10) -> ProductListOutputDTO:
         """おすすめ商品を取得"""
-        products = self.product_repository.get_featured(limit=limit)
+        page = self.product_repository.get_list_items(is_featured=True, limit=limit)
 
         return ProductListOutputDTO(
-            products=[self._to_list_item_dto(p) for p in products],
-            total=len(products),
+            products=[self._card_to_list_item_dto(p) for p in page.items],
+            total=len(page.items),
             limit=limit,
             offset=0,
         )
 
     def search_products(self, input_dto: ProductSearchInputDTO) -> ProductSearchOutputDTO:
         """商品を検索"""
-        products = self.product_repository.search(
+        page = self.product_repository.search(
             keyword=input_dto.keyword,
             category_id=input_dto.category_id,
+            is_active=True,
             limit=input_dto.limit,
             offset=input_dto.offset,
         )
 
-        total = self.product_repository.count(
-            category_id=input_dto.category_id,
-            is_active=True,
-            keyword=input_dto.keyword,
-        )
-
         return ProductSearchOutputDTO(
-            products=[self._to_list_item_dto(p) for p in products],
-            total=total,
+            products=[self._to_list_item_dto(p) for p in page.items],
+            total=page.total,
             keyword=input_dto.keyword,
             category_id=input_dto.category_id,
             limit=input_dto.limit,
@@ -164,6 +175,25 @@ class ProductUsecase:
             images=[self._to_image_dto(img) for img in product.images],
         )
 
+    def _card_to_list_item_dto(self, item: ProductListItem) -> ProductListItemDTO:
+        """商品カードエンティティを一覧アイテムDTOに変換
+
+        一覧ビューは画像一覧を持たないため images は空で返す（カード表示は main_image_url）。
+        """
+        return ProductListItemDTO(
+            id=item.id,
+            category_id=item.category_id,
+            name=item.name,
+            name_ja=item.name_ja,
+            slug=item.slug,
+            tagline=item.tagline,
+            base_price=item.base_price,
+            price_note=item.price_note,
+            is_featured=item.is_featured,
+            main_image_url=item.main_image_url,
+            images=[],
+        )
+
     def _to_detail_dto(self, product: Product) -> ProductDetailDTO:
         """商品エンティティを詳細DTOに変換"""
         return ProductDetailDTO(
@@ -192,8 +222,8 @@ class ProductUsecase:
             updated_at=product.updated_at,
         )
 
-    def _to_related_dto(self, product: Product) -> RelatedProductDTO:
-        """商品エンティティを関連商品DTOに変換"""
+    def _to_related_dto(self, product: RelatedProduct) -> RelatedProductDTO:
+        """関連商品エンティティをDTOに変換"""
         return RelatedProductDTO(
             id=product.id,
             name=product.name,
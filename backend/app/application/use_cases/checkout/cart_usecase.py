@@ -11,6 +11,7 @@ from app.application.schemas.checkout.cart_schemas import (
     UpdateCartItemOutputDTO,
 )
 from app.domain.entities.cart_item import CartItem
+from app.domain.entities.product import ProductProjection
 from app.domain.exceptions.cart import CartItemNotFoundError
 from app.domain.exceptions.common import OperationFailedError, PermissionDeniedError
 from app.domain.exceptions.product import ProductNotActiveError, ProductNotFoundError
@@ -36,13 +37,18 @@ class CartUsecase:
         """カート内容を取得"""
         cart_items = self.cart_item_repository.get_by_user_id(user_id)
 
+        # カート内の商品情報を1クエリでまとめて取得
+        products = self.product_repository.get_many_by_ids(
+            [cart_item.product_id for cart_item in cart_items],
+            projection=ProductProjection.SUMMARY_WITH_IMAGE,
+        )
+
         items: list[CartItemDTO] = []
         total_quantity = 0
         subtotal = 0
 
         for cart_item in cart_items:
-            # 商品情報を取得
-            product = self.product_repository.get_by_id(cart_item.product_id)
+            product = products.get(cart_item.product_id)
 
             if product is None:
                 # 商品が削除されている場合はカートから除去
@@ -17,6 +17,7 @@ from app.application.schemas.checkout.order_schemas import (
     OrderItemDTO,
 )
 from app.domain.entities.order import Order, OrderItem, OrderStatus
+from app.domain.entities.product import ProductProjection
 from app.domain.exceptions.address import AddressNotFoundError
 from app.domain.exceptions.cart import CartEmptyError, NoAvailableProductsError
 from app.domain.exceptions.common import PermissionDeniedError
@@ -115,6 +116,8 @@ class OrderUsecase:
             notes=input_dto.notes,
             items=order_items,
         )
+        # 入稿の要否は明細にコピーした入稿要件から作成時に1度だけ決める
+        order.calculate_upload_requirements()
 
         created_order = self.order_repository.create(order)
 
@@ -139,9 +142,14 @@ class OrderUsecase:
         self, items: list[CreateOrderItemInputDTO]
     ) -> list[OrderItem]:
         """入力から注文明細を作成"""
+        products = self.product_repository.get_many_by_ids(
+            [item_input.product_id for item_input in items],
+            projection=ProductProjection.SUMMARY,
+        )
+
         order_items: list[OrderItem] = []
         for item_input in items:
-            product = self.product_repository.get_by_id(item_input.product_id)
+            product = products.get(item_input.product_id)
             if product is None:
                 raise ProductNotFoundError(item_input.product_id)
             if not product.is_active:
@@ -169,9 +177,14 @@ class OrderUsecase:
         if not cart_items:
             raise CartEmptyError()
 
+        products = self.product_repository.get_many_by_ids(
+            [cart_item.product_id for cart_item in cart_items],
+            projection=ProductProjection.SUMMARY,
+        )
+
         order_items: list[OrderItem] = []
         for cart_item in cart_items:
-            product = self.product_repository.get_by_id(cart_item.product_id)
+            product = products.get(cart_item.product_id)
             if product is None:
                 self.cart_item_repository.delete(cart_item.id)
                 continue
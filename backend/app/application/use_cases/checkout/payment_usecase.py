@@ -3,10 +3,9 @@
 import logging
 from datetime import datetime
 
-from app.application.interfaces.email_service import (
-    IEmailService,
-    OrderConfirmationData,
-)
+from app.application.interfaces.email_outbox import IEmailOutbox
+from app.application.interfaces.email_service import OrderConfirmationData
+from app.application.interfaces.stripe_event_ledger import IStripeEventLedger
 from app.application.interfaces.stripe_service import IStripeService
 from app.application.schemas.checkout.payment_schemas import (
     CreatePaymentIntentInputDTO,
@@ -22,11 +21,19 @@ from app.domain.exceptions.payment import (
 )
 from app.domain.repositories.address_repository import IAddressRepository
 from app.domain.repositories.order_repository import IOrderRepository
-from app.domain.repositories.product_repository import IProductRepository
 from app.domain.repositories.user_repository import IUserRepository
 
 logger = logging.getLogger(__name__)
 
+# 台帳に記録してバックグラウンドで処理するWebhookイベント
+HANDLED_EVENT_TYPES = frozenset(
+    {
+        'payment_intent.succeeded',
+        'payment_intent.payment_failed',
+        'charge.refunded',
+    }
+)
+
 
 class PaymentUsecase:
     """決済ユースケース"""
@@ -36,16 +43,16 @@ class PaymentUsecase:
         stripe_service: IStripeService,
         order_repository: IOrderRepository,
         user_repository: IUserRepository,
-        email_service: IEmailService,
+        email_outbox: IEmailOutbox,
         address_repository: IAddressRepository,
-        product_repository: IProductRepository,
+        stripe_event_ledger: IStripeEventLedger,
     ):
         self.stripe_service = stripe_service
         self.order_repository = order_repository
         self.user_repository = user_repository
-        self.email_service = email_service
+        self.email_outbox = email_outbox
         self.address_repository = address_repository
-        self.product_repository = product_repository
+        self.stripe_event_ledger = stripe_event_ledger
 
     def create_payment_intent(
         self, user_id: int, input_dto: CreatePaymentIntentInputDTO
@@ -120,7 +127,11 @@ class PaymentUsecase:
         )
 
     def handle_webhook(self, payload: bytes, sig_header: str) -> None:
-        """Webhookを処理
+        """Webhookを受信する
+
+        署名を検証してイベントを台帳に記録するだけで応答する。
+        注文の更新などは、コミット後にバックグラウンドの処理が process_webhook_event で行う。
+        台帳はイベントIDで一意のため、Stripeの再送・重複配信は記録されない。
 
         Args:
             payload: リクエストボディ
@@ -135,11 +146,26 @@ class PaymentUsecase:
             logger.error(f'Webhook signature verification failed: {e}')
             raise WebhookSignatureError() from e
 
+        event_id = event.get('id')
         event_type = event.get('type')
+
+        if event_type not in HANDLED_EVENT_TYPES:
+            logger.info(f'Unhandled event type: {event_type}')
+            return
+
         data = event.get('data', {}).get('object', {})
+        if self.stripe_event_ledger.record(event_id, event_type, data):
+            logger.info(f'Received webhook event: {event_type} ({event_id})')
+        else:
+            logger.info(f'Duplicate webhook event skipped: {event_type} ({event_id})')
 
-        logger.info(f'Received webhook event: {event_type}')
+    def process_webhook_event(self, event_type: str, data: dict) -> None:
+        """台帳に記録したWebhookイベントを処理する（バックグラウンドの処理から呼ぶ）
 
+        Args:
+            event_type: イベントの種類
+            data: イベントのオブジェクト（data.object）
+        """
         if event_type == 'payment_intent.succeeded':
             self._handle_payment_succeeded(data)
         elif event_type == 'payment_intent.payment_failed':
@@ -182,12 +208,9 @@ class PaymentUsecase:
             logger.info(f'Order {order.order_number} already processed, skipping')
             return
 
-        # 入稿が必要な商品があるかチェック
-        requires_upload = self._check_requires_upload(order)
-
-        # ステータスを更新
+        # ステータスを更新（入稿の要否は注文作成時に計算済み）
         order.paid_at = datetime.now()
-        if requires_upload:
+        if order.requires_upload:
             # 入稿必要商品あり → 審査待ち（入稿は支払い前に完了している前提）
             order.status = OrderStatus.REVIEWING
             logger.info(
@@ -203,11 +226,14 @@ class PaymentUsecase:
 
         self.order_repository.update(order)
 
-        # 注文確認メールを送信
-        self._send_order_confirmation_email(order)
+        # 注文確認メールを送信キューに記録
+        self._enqueue_order_confirmation_email(order)
+
+    def _enqueue_order_confirmation_email(self, order) -> None:
+        """注文確認メールを送信キューに記録
 
-    def _send_order_confirmation_email(self, order) -> None:
-        """注文確認メールを送信
+        決済成功の更新と同じトランザクションで記録し、送信はバックグラウンドで行う。
+        Webhookが再送されても、注文ごとの重複防止キーにより1通だけ送信する。
 
         Args:
             order: 注文エンティティ
@@ -251,14 +277,16 @@ class PaymentUsecase:
                 user_name=user.name or '',
             )
 
-            # メール送信
-            self.email_service.send_order_confirmation_email(user.email, order_data)
-
         except Exception as e:
-            # メール送信失敗は注文処理に影響させない
+            # メールの作成失敗は注文処理に影響させない
             logger.error(
-                f'Failed to send order confirmation email for {order.order_number}: {e}'
+                f'Failed to build order confirmation email for {order.order_number}: {e}'
             )
+            return
+
+        self.email_outbox.enqueue_order_confirmation_email(
+            user.email, order_data, dedupe_key=f'order_confirmation:{order.id}'
+        )
 
     def _handle_payment_failed(self, payment_intent: dict) -> None:
         """決済失敗を処理
@@ -285,20 +313,3 @@ class PaymentUsecase:
         payment_intent_id = charge.get('payment_intent')
 
         logger.info(f'Refund processed for PaymentIntent {payment_intent_id}')
-
-    def _check_requires_upload(self, order) -> bool:
-        """注文に入稿が必要な商品が含まれているかチェック
-
-        upload_requirements がある商品は入稿が必要。
-
-        Args:
-            order: 注文エンティティ
-
-        Returns:
-            入稿が必要な商品が1つでもあればTrue
-        """
-        for item in order.items:
-            product = self.product_repository.get_by_id(item.product_id)
-            if product and product.upload_requirements:
-                return True
-        return False
@@ -17,6 +17,19 @@ class Settings(BaseSettings):
     postgres_password: str
     postgres_db: str
     postgres_port: int = 5432
+    # リードレプリカ（空の場合はプライマリのみ）。カタログ・管理画面の集計の読み取りに使う
+    postgres_replica_host: str = ''
+    postgres_replica_port: int = 5432
+    # 書き込み後にプライマリから読む秒数（レプリカの遅延より長くする）
+    replica_read_your_writes_seconds: float = 5.0
+    # コネクションプール（同期・非同期エンジンそれぞれに適用）
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800  # RDS側の切断より前に接続を作り直す
+    db_pool_pre_ping: bool = True  # フェイルオーバー後の切断済み接続を検出する
+    # APIリクエストの文の実行時間の上限（0の場合は無制限。バッチ・バックグラウンド処理は対象外）
+    db_statement_timeout_ms: int = 30_000
     stage: str = 'development'  # デフォルトは開発環境
     database_url: str = ''
 
@@ -28,10 +41,51 @@ class Settings(BaseSettings):
     jwt_algorithm: str = 'RS256'  # RS256 for RSA, HS256 for HMAC (deprecated)
     jwt_private_key: str = ''  # RSA private key for signing (RS256)
     jwt_public_key: str = ''  # RSA public key for verification (RS256)
+    jwt_key_id: str = 'default'  # 署名鍵のID（トークンの kid ヘッダー）
+    # 鍵ローテーション中に検証のみ受け付ける旧公開鍵（{"kid": "PEM"} のJSON）
+    jwt_additional_public_keys: dict[str, str] = {}
+    # 検証済みトークンのクレームをキャッシュする秒数（0で無効）
+    jwt_claims_cache_ttl_seconds: float = 30.0
+    jwt_claims_cache_max_entries: int = 10_000
+
+    # パスワードハッシュ（bcrypt）のワーカープロセス
+    password_hash_workers: int = 2
+    # ワーカーが埋まっているときに待たせる最大件数と待ち時間（超えた分は503）
+    password_hash_max_queue: int = 32
+    password_hash_queue_timeout_seconds: float = 5.0
+    # bcryptのコスト（0の場合は password_hash_target_ms に収まる値を起動時に計測）
+    password_bcrypt_rounds: int = 12
+    password_hash_target_ms: float = 250.0
+
+    # 認証系APIのレート制限（memory: プロセス内 / postgres: 複数タスクで共有）
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = 'memory'
+    # ログイン（会員・管理者）: window 秒あたりの試行回数
+    rate_limit_login_per_ip: int = 20
+    rate_limit_login_per_email: int = 5
+    rate_limit_login_window_seconds: int = 300
+    # メール送信を伴う操作（会員登録・認証メール再送信・パスワードリセット依頼）
+    rate_limit_email_per_ip: int = 10
+    rate_limit_email_per_email: int = 3
+    rate_limit_email_window_seconds: int = 3600
+    # X-Forwarded-For を信頼するプロキシ（ALB / VPC）のCIDR（JSON配列。空の場合は接続元を使う）
+    trusted_proxy_cidrs: list[str] = []
 
     # Resend settings
     resend_api_key: str = ''
     email_from: str = 'ACRIQUE <noreply@acrique.jp>'
+    # メール送信キュー（email_outbox）の配信処理（APIプロセス内のバックグラウンドスレッド）
+    email_outbox_dispatcher_enabled: bool = True
+    email_outbox_batch_size: int = 20
+    email_outbox_poll_interval_seconds: float = 5.0
+    # 送信失敗時の再送（30秒, 60秒, 120秒, ... 最大1時間間隔で max_attempts 回まで）
+    email_outbox_max_attempts: int = 8
+    email_outbox_backoff_base_seconds: float = 30.0
+    email_outbox_backoff_max_seconds: float = 3600.0
+    # 送信済み・失敗のメールを残す日数
+    email_outbox_retention_days: int = 30
+    # 送信中の行のリース秒数（バッチ全件の送信が終わる時間より長くする）
+    email_outbox_lease_seconds: float = 600.0
 
     # Frontend URL (for email links)
     frontend_url: str = 'http://localhost:3000'
@@ -47,9 +101,45 @@ class Settings(BaseSettings):
     # 例: 'd1234567890.cloudfront.net'
     cdn_domain_name: str = ''
 
+    # カタログキャッシュ（商品・商品マスタの読み取りキャッシュ）
+    catalog_cache_enabled: bool = True
+    catalog_cache_ttl_seconds: float = 60.0
+    catalog_cache_max_entries: int = 1024
+
+    # カタログAPIのHTTPキャッシュ（Cache-Control）
+    catalog_http_max_age_seconds: int = 60
+    catalog_http_stale_while_revalidate_seconds: int = 300
+
+    # 管理画面ダッシュボードの集計結果をキャッシュする秒数（0で無効）
+    admin_dashboard_cache_ttl_seconds: float = 5.0
+
+    # 一覧の総件数: 推定件数がこの値以上の場合は全件を数えず概算値を返す（操作ログ等）
+    pagination_estimate_threshold: int = 100_000
+
     # Stripe settings
     stripe_secret_key: str = ''
     stripe_webhook_secret: str = ''
+    # APIの接続先（空の場合はStripe本番。ローカルの stripe-mock は http://localhost:12111）
+    stripe_api_base: str = ''
+    # Stripe APIのHTTPクライアント（プロセス内で共有し、接続を keep-alive で再利用する）
+    stripe_connect_timeout_seconds: float = 5.0
+    stripe_read_timeout_seconds: float = 30.0
+    stripe_max_network_retries: int = 2
+    stripe_max_connections: int = 20
+    stripe_max_keepalive_connections: int = 10
+    stripe_keepalive_expiry_seconds: float = 30.0
+    # Webhookイベント台帳（stripe_events）の処理（APIプロセス内のバックグラウンドスレッド）
+    stripe_events_processor_enabled: bool = True
+    stripe_events_batch_size: int = 20
+    stripe_events_poll_interval_seconds: float = 5.0
+    # 処理失敗時の再処理（10秒, 20秒, 40秒, ... 最大10分間隔で max_attempts 回まで）
+    stripe_events_max_attempts: int = 8
+    stripe_events_backoff_base_seconds: float = 10.0
+    stripe_events_backoff_max_seconds: float = 600.0
+    # 処理済み・失敗のイベントを残す日数（Stripeの再送期間の3日より長くする）
+    stripe_events_retention_days: int = 30
+    # 処理中の行のリース秒数（バッチ全件の処理が終わる時間より長くする）
+    stripe_events_lease_seconds: float = 300.0
 
     class Config:
         env_file = '.env'
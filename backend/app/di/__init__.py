@@ -3,11 +3,21 @@
 共通のDBセッション取得関数と各ユースケースのDI設定を提供する。
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.db.session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    create_async_read_session,
+    create_read_session,
+    reset_statement_timeout,
+    set_request_statement_timeout,
+)
+from app.presentation.read_your_writes import prefers_primary_reads
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -16,16 +26,80 @@ def get_db() -> Generator[Session, None, None]:
     FastAPIのDependsで使用する。
     リクエストごとにセッションを作成し、終了時にクローズする。
     例外発生時はロールバック、正常終了時はコミットを行う。
+    接続は最初のクエリの実行時にプールから取得するため、DBにアクセスしなかった
+    リクエスト（バリデーションエラー等）ではプールを消費せず、コミットも行わない。
+    文の実行時間はトランザクションごとに DB_STATEMENT_TIMEOUT_MS で打ち切る。
 
     Yields:
         Session: SQLAlchemyセッション
     """
     db = SessionLocal()
+    set_request_statement_timeout(db)
     try:
         yield db
-        db.commit()
+        if db.in_transaction():
+            db.commit()
     except Exception:
         db.rollback()
         raise
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """非同期DBセッションを取得
+
+    async defのエンドポイントから使用する。get_db と同じく
+    例外発生時はロールバック、正常終了時はコミットを行う。
+    I/O待ちの間はイベントループに制御を返すため、スレッドプールのワーカーを占有しない。
+
+    Yields:
+        AsyncSession: SQLAlchemy非同期セッション
+    """
+    async with AsyncSessionLocal() as db:
+        set_request_statement_timeout(db)
+        try:
+            yield db
+            if db.in_transaction():
+                await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """読み取り専用のDBセッションを取得
+
+    参照のみのユースケースで使用する。AUTOCOMMITで実行するため BEGIN / COMMIT の
+    往復がなく、終了時もコミットせずにクローズする。書き込み（flush）はエラーになる。
+    リードレプリカが設定されている場合はレプリカに接続する（管理画面で更新した直後の
+    リクエストはプライマリ）。
+
+    Yields:
+        Session: 読み取り専用のSQLAlchemyセッション
+    """
+    db = create_read_session(prefer_primary=prefers_primary_reads(request))
+    set_request_statement_timeout(db)
+    try:
+        yield db
+    finally:
+        reset_statement_timeout(db)
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """読み取り専用の非同期DBセッションを取得
+
+    get_read_db の非同期版。カタログAPI等の参照のみのエンドポイントで使用する。
+
+    Yields:
+        AsyncSession: 読み取り専用のSQLAlchemy非同期セッション
+    """
+    async with create_async_read_session(
+        prefer_primary=prefers_primary_reads(request)
+    ) as db:
+        set_request_statement_timeout(db)
+        try:
+            yield db
+        finally:
+            await db.run_sync(reset_statement_timeout)
@@ -9,7 +9,8 @@ from app.infrastructure.db.repositories.user_repository_impl import UserReposito
 from app.infrastructure.db.repositories.verification_token_repository_impl import (
     VerificationTokenRepositoryImpl,
 )
-from app.infrastructure.email.resend_email_service import ResendEmailService
+from app.infrastructure.email.email_outbox_impl import EmailOutboxImpl
+from app.infrastructure.security.rate_limiter import get_rate_limiter
 from app.infrastructure.security.security_service_impl import SecurityServiceImpl
 
 
@@ -18,11 +19,12 @@ def get_auth_usecase(session: Session = Depends(get_db)) -> AuthUsecase:
     security_service = SecurityServiceImpl()
     user_repository = UserRepositoryImpl(session)
     token_repository = VerificationTokenRepositoryImpl(session)
-    email_service = ResendEmailService()
+    email_outbox = EmailOutboxImpl(session)
 
     return AuthUsecase(
         security_service=security_service,
         user_repository=user_repository,
         token_repository=token_repository,
-        email_service=email_service,
+        email_outbox=email_outbox,
+        rate_limiter=get_rate_limiter(),
     )
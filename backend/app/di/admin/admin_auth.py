@@ -9,6 +9,7 @@ from app.infrastructure.db.repositories.admin_repository_impl import (
     AdminLogRepositoryImpl,
     AdminRepositoryImpl,
 )
+from app.infrastructure.security.rate_limiter import get_rate_limiter
 from app.infrastructure.security.security_service_impl import SecurityServiceImpl
 
 
@@ -25,4 +26,5 @@ def get_admin_auth_usecase(session: Session = Depends(get_db)) -> AdminAuthUseca
         admin_repository=AdminRepositoryImpl(session),
         admin_log_repository=AdminLogRepositoryImpl(session),
         security_service=SecurityServiceImpl(),
+        rate_limiter=get_rate_limiter(),
     )
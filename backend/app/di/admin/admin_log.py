@@ -4,7 +4,7 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.admin.admin_log_usecase import AdminLogUsecase
-from app.di import get_db
+from app.di import get_read_db
 from app.infrastructure.db.repositories.admin_repository_impl import (
     AdminLogRepositoryImpl,
     AdminRepositoryImpl,
@@ -12,7 +12,7 @@ from app.infrastructure.db.repositories.admin_repository_impl import (
 
 
 def get_admin_log_usecase(
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
 ) -> AdminLogUsecase:
     """AdminLogUsecaseを取得"""
     admin_log_repository = AdminLogRepositoryImpl(session)
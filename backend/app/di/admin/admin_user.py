@@ -5,6 +5,9 @@ from sqlalchemy.orm import Session
 
 from app.application.use_cases.admin.admin_user_usecase import AdminUserUsecase
 from app.di import get_db
+from app.infrastructure.db.repositories.customer_stats_repository_impl import (
+    CustomerStatsRepositoryImpl,
+)
 from app.infrastructure.db.repositories.order_repository_impl import OrderRepositoryImpl
 from app.infrastructure.db.repositories.user_repository_impl import UserRepositoryImpl
 
@@ -21,4 +24,5 @@ def get_admin_user_usecase(session: Session = Depends(get_db)) -> AdminUserUseca
     return AdminUserUsecase(
         user_repository=UserRepositoryImpl(session),
         order_repository=OrderRepositoryImpl(session),
+        customer_stats_repository=CustomerStatsRepositoryImpl(session),
     )
@@ -1,19 +1,36 @@
 """商品依存性注入設定"""
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.catalog.product_usecase import ProductUsecase
-from app.di import get_db
+from app.config import get_settings
+from app.di import get_async_read_db
+from app.domain.repositories.product_repository import IProductRepository
+from app.infrastructure.cache.cached_product_repository import CachedProductRepository
+from app.infrastructure.cache.catalog_cache import get_catalog_cache
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.db.repositories.product_repository_impl import (
     ProductRepositoryImpl,
 )
 
 
-def get_product_usecase(session: Session = Depends(get_db)) -> ProductUsecase:
-    """ProductUsecaseを取得（依存性注入）"""
-    product_repository = ProductRepositoryImpl(session)
+def build_product_usecase(session: Session) -> ProductUsecase:
+    """セッションからProductUsecaseを組み立てる"""
+    product_repository: IProductRepository = ProductRepositoryImpl(session)
+    if get_settings().catalog_cache_enabled:
+        product_repository = CachedProductRepository(
+            product_repository, get_catalog_cache()
+        )
 
     return ProductUsecase(
         product_repository=product_repository,
     )
+
+
+async def get_product_usecase(
+    session: AsyncSession = Depends(get_async_read_db),
+) -> AsyncUsecase[ProductUsecase]:
+    """非同期セッション上のProductUsecaseを取得（依存性注入）"""
+    return AsyncUsecase(session, build_product_usecase)
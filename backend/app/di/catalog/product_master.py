@@ -1,21 +1,40 @@
 """商品マスタ依存性注入設定（公開API用）"""
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.catalog.product_master_usecase import ProductMasterUsecase
-from app.di import get_db
+from app.config import get_settings
+from app.di import get_async_read_db
+from app.domain.repositories.product_master_repository import IProductMasterRepository
+from app.infrastructure.cache.cached_product_master_repository import (
+    CachedProductMasterRepository,
+)
+from app.infrastructure.cache.catalog_cache import get_catalog_cache
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.db.repositories.product_master_repository_impl import (
     ProductMasterRepositoryImpl,
 )
 
 
-def get_product_master_usecase(
-    session: Session = Depends(get_db),
-) -> ProductMasterUsecase:
-    """ProductMasterUsecaseを取得（依存性注入）"""
-    product_master_repository = ProductMasterRepositoryImpl(session)
+def build_product_master_usecase(session: Session) -> ProductMasterUsecase:
+    """セッションからProductMasterUsecaseを組み立てる"""
+    product_master_repository: IProductMasterRepository = ProductMasterRepositoryImpl(
+        session
+    )
+    if get_settings().catalog_cache_enabled:
+        product_master_repository = CachedProductMasterRepository(
+            product_master_repository, get_catalog_cache()
+        )
 
     return ProductMasterUsecase(
         product_master_repository=product_master_repository,
     )
+
+
+async def get_product_master_usecase(
+    session: AsyncSession = Depends(get_async_read_db),
+) -> AsyncUsecase[ProductMasterUsecase]:
+    """非同期セッション上のProductMasterUsecaseを取得（依存性注入）"""
+    return AsyncUsecase(session, build_product_master_usecase)
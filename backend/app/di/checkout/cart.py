@@ -1,10 +1,12 @@
 """カート依存性注入設定"""
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.checkout.cart_usecase import CartUsecase
-from app.di import get_db
+from app.di import get_async_db
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.db.repositories.cart_item_repository_impl import (
     CartItemRepositoryImpl,
 )
@@ -13,8 +15,8 @@ from app.infrastructure.db.repositories.product_repository_impl import (
 )
 
 
-def get_cart_usecase(session: Session = Depends(get_db)) -> CartUsecase:
-    """CartUsecaseを取得（依存性注入）"""
+def build_cart_usecase(session: Session) -> CartUsecase:
+    """セッションからCartUsecaseを組み立てる"""
     cart_item_repository = CartItemRepositoryImpl(session)
     product_repository = ProductRepositoryImpl(session)
 
@@ -22,3 +24,10 @@ def get_cart_usecase(session: Session = Depends(get_db)) -> CartUsecase:
         cart_item_repository=cart_item_repository,
         product_repository=product_repository,
     )
+
+
+async def get_cart_usecase(
+    session: AsyncSession = Depends(get_async_db),
+) -> AsyncUsecase[CartUsecase]:
+    """非同期セッション上のCartUsecaseを取得（依存性注入）"""
+    return AsyncUsecase(session, build_cart_usecase)
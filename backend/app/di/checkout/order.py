@@ -1,10 +1,12 @@
 """注文依存性注入設定"""
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.checkout.order_usecase import OrderUsecase
-from app.di import get_db
+from app.di import get_async_db
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.db.repositories.address_repository_impl import (
     AddressRepositoryImpl,
 )
@@ -19,8 +21,8 @@ from app.infrastructure.db.repositories.product_repository_impl import (
 )
 
 
-def get_order_usecase(session: Session = Depends(get_db)) -> OrderUsecase:
-    """OrderUsecaseを取得（依存性注入）"""
+def build_order_usecase(session: Session) -> OrderUsecase:
+    """セッションからOrderUsecaseを組み立てる"""
     order_repository = OrderRepositoryImpl(session)
     product_repository = ProductRepositoryImpl(session)
     cart_item_repository = CartItemRepositoryImpl(session)
@@ -32,3 +34,10 @@ def get_order_usecase(session: Session = Depends(get_db)) -> OrderUsecase:
         cart_item_repository=cart_item_repository,
         address_repository=address_repository,
     )
+
+
+async def get_order_usecase(
+    session: AsyncSession = Depends(get_async_db),
+) -> AsyncUsecase[OrderUsecase]:
+    """非同期セッション上のOrderUsecaseを取得（依存性注入）"""
+    return AsyncUsecase(session, build_order_usecase)
@@ -1,40 +1,95 @@
 """決済依存性注入設定"""
 
+from functools import lru_cache
+
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.checkout.payment_usecase import PaymentUsecase
-from app.di import get_db
+from app.config import get_settings
+from app.di import get_async_db
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.db.repositories.address_repository_impl import (
     AddressRepositoryImpl,
 )
 from app.infrastructure.db.repositories.order_repository_impl import (
     OrderRepositoryImpl,
 )
-from app.infrastructure.db.repositories.product_repository_impl import (
-    ProductRepositoryImpl,
-)
 from app.infrastructure.db.repositories.user_repository_impl import (
     UserRepositoryImpl,
 )
-from app.infrastructure.email.resend_email_service import ResendEmailService
-from app.infrastructure.stripe.stripe_service_impl import StripeServiceImpl
+from app.infrastructure.db.session import SessionLocal
+from app.infrastructure.email.email_outbox_impl import EmailOutboxImpl
+from app.infrastructure.stripe.event_processor import StripeEventProcessor
+from app.infrastructure.stripe.stripe_event_ledger_impl import StripeEventLedgerImpl
+from app.infrastructure.stripe.stripe_service_impl import (
+    AsyncStripeServiceImpl,
+    StripeServiceImpl,
+)
+
 
+def build_payment_usecase(
+    session: Session, stripe_service: StripeServiceImpl | None = None
+) -> PaymentUsecase:
+    """セッションからPaymentUsecaseを組み立てる
 
-def get_payment_usecase(session: Session = Depends(get_db)) -> PaymentUsecase:
-    """PaymentUsecaseを取得（依存性注入）"""
-    stripe_service = StripeServiceImpl()
+    Args:
+        session: DBセッション
+        stripe_service: Stripeサービス（省略時は同期メソッドで呼び出す実装）
+    """
+    stripe_service = stripe_service or StripeServiceImpl()
     order_repository = OrderRepositoryImpl(session)
     user_repository = UserRepositoryImpl(session)
-    email_service = ResendEmailService()
+    email_outbox = EmailOutboxImpl(session)
     address_repository = AddressRepositoryImpl(session)
-    product_repository = ProductRepositoryImpl(session)
+    stripe_event_ledger = StripeEventLedgerImpl(session)
 
     return PaymentUsecase(
         stripe_service=stripe_service,
         order_repository=order_repository,
         user_repository=user_repository,
-        email_service=email_service,
+        email_outbox=email_outbox,
         address_repository=address_repository,
-        product_repository=product_repository,
+        stripe_event_ledger=stripe_event_ledger,
+    )
+
+
+def build_async_payment_usecase(session: Session) -> PaymentUsecase:
+    """非同期セッションの同期セッションからPaymentUsecaseを組み立てる
+
+    Stripe APIは非同期メソッドで呼び出すため、AsyncUsecase.run の中でだけ使う。
+    """
+    return build_payment_usecase(session, AsyncStripeServiceImpl())
+
+
+async def get_payment_usecase(
+    session: AsyncSession = Depends(get_async_db),
+) -> AsyncUsecase[PaymentUsecase]:
+    """非同期セッション上のPaymentUsecaseを取得（依存性注入）
+
+    DBはasyncpg、Stripe APIは httpx の非同期クライアントでイベントループ上で待機するため、
+    PaymentIntentの作成やWebhookの受信がスレッドプールのワーカーを占有しない。
+    """
+    return AsyncUsecase(session, build_async_payment_usecase)
+
+
+def _process_webhook_event(session: Session, event_type: str, data: dict) -> None:
+    build_payment_usecase(session).process_webhook_event(event_type, data)
+
+
+@lru_cache
+def get_stripe_event_processor() -> StripeEventProcessor:
+    """設定から StripeEventProcessor を生成（プロセス内で1つ）"""
+    settings = get_settings()
+    return StripeEventProcessor(
+        session_factory=SessionLocal,
+        handler=_process_webhook_event,
+        batch_size=settings.stripe_events_batch_size,
+        max_attempts=settings.stripe_events_max_attempts,
+        backoff_base_seconds=settings.stripe_events_backoff_base_seconds,
+        backoff_max_seconds=settings.stripe_events_backoff_max_seconds,
+        poll_interval_seconds=settings.stripe_events_poll_interval_seconds,
+        retention_days=settings.stripe_events_retention_days,
+        lease_seconds=settings.stripe_events_lease_seconds,
     )
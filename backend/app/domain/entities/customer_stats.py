@@ -0,0 +1,29 @@
+"""顧客別集計エンティティ"""
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class CustomerSortKey(str, Enum):
+    """顧客一覧の並び順（いずれも降順）"""
+
+    CREATED_AT = 'created_at'  # 登録日時
+    ORDER_COUNT = 'order_count'  # 注文数
+    TOTAL_SPENT = 'total_spent'  # 累計購入金額
+    LAST_ORDER_AT = 'last_order_at'  # 最終注文日時
+
+
+class CustomerStats(BaseModel):
+    """顧客ごとの注文集計"""
+
+    user_id: int = Field(..., description='ユーザーID')
+    order_count: int = Field(default=0, description='注文数（全ステータス）')
+    total_spent: int = Field(
+        default=0, description='累計購入金額（未払い・キャンセルを除く）'
+    )
+    last_order_at: datetime | None = Field(None, description='最終注文日時')
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,20 @@
+"""ダッシュボード集計エンティティ"""
+
+from pydantic import BaseModel, Field
+
+
+class DashboardSummary(BaseModel):
+    """管理画面ダッシュボードの概要"""
+
+    today_orders: int = Field(
+        default=0, description='本日の注文数（未払い・キャンセルを除く）'
+    )
+    today_revenue: int = Field(default=0, description='本日の売上')
+    pending_orders: int = Field(
+        default=0, description='対応待ち注文数（審査待ち・再入稿待ち）'
+    )
+    processing_orders: int = Field(default=0, description='製作中注文数（確定・製作中）')
+    new_customers_this_month: int = Field(default=0, description='今月の新規会員数')
+
+    class Config:
+        from_attributes = True
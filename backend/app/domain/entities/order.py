@@ -90,6 +90,8 @@ class Order(BaseModel):
     cancel_reason: str | None = Field(None, description='キャンセル理由')
     notes: str | None = Field(None, description='顧客備考')
     admin_notes: str | None = Field(None, description='管理者メモ')
+    requires_upload: bool = Field(False, description='入稿が必要な明細を含むか')
+    upload_item_count: int = Field(0, ge=0, description='入稿が必要な明細数')
     created_at: datetime | None = Field(None, description='作成日時')
     updated_at: datetime | None = Field(None, description='更新日時')
     items: list[OrderItem] = Field(default_factory=list, description='注文明細')
@@ -110,3 +112,8 @@ class Order(BaseModel):
         self.subtotal = sum(item.subtotal for item in self.items)
         self.tax = int(self.subtotal * tax_rate)
         self.total = self.subtotal + self.tax + self.shipping_fee
+
+    def calculate_upload_requirements(self) -> None:
+        """明細の入稿要件から入稿の要否と対象明細数を計算"""
+        self.upload_item_count = sum(1 for item in self.items if item.upload_requirements)
+        self.requires_upload = self.upload_item_count > 0
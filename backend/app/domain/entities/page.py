@@ -0,0 +1,27 @@
+"""ページングエンティティ"""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+T = TypeVar('T')
+
+
+class Page(BaseModel, Generic[T]):
+    """ページング結果エンティティ
+
+    1ページ分の要素と、検索条件に一致する総件数をまとめて返す。
+    総件数が概算値の場合は is_total_estimated が True になる。
+    カーソルページングでは総件数を数えないため total は None になる。
+    """
+
+    items: list[T] = Field(default_factory=list, description='ページ内の要素')
+    total: int | None = Field(default=0, description='検索条件に一致する総件数')
+    limit: int | None = Field(None, description='取得件数')
+    offset: int = Field(default=0, description='オフセット')
+    is_total_estimated: bool = Field(
+        default=False, description='総件数が統計情報による概算値かどうか'
+    )
+    next_cursor: str | None = Field(
+        None, description='次ページ取得用のカーソル（次ページがない場合はNone）'
+    )
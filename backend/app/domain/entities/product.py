@@ -1,6 +1,7 @@
 """商品エンティティ"""
 
 from datetime import datetime
+from enum import Enum
 
 from pydantic import BaseModel, Field
 
@@ -58,6 +59,98 @@ class Product(BaseModel):
         return self.images[0].s3_url if self.images else None
 
 
+class ProductProjection(str, Enum):
+    """商品の一括取得時に読み込む列の範囲
+
+    SUMMARY: 価格・名称・公開状態・入稿要件のみ（注文明細の作成用）
+    SUMMARY_WITH_IMAGE: SUMMARYにメイン画像URLを加えたもの（カート表示用）
+    """
+
+    SUMMARY = 'summary'
+    SUMMARY_WITH_IMAGE = 'summary_with_image'
+
+
+class ProductSummary(BaseModel):
+    """商品サマリーエンティティ
+
+    カート・注文処理で必要な列だけを持つ軽量な読み取り専用エンティティ。
+    """
+
+    id: str = Field(..., description='商品ID')
+    name: str = Field(..., description='英語名')
+    name_ja: str = Field(..., description='日本語名')
+    base_price: int = Field(..., description='税抜基本価格')
+    upload_requirements: dict | None = Field(None, description='入稿要件（JSONB）')
+    is_active: bool = Field(default=True, description='公開状態')
+    main_image_url: str | None = Field(
+        None, description='メイン画像URL（SUMMARY_WITH_IMAGE時のみ）'
+    )
+
+    class Config:
+        """Pydantic設定"""
+
+        from_attributes = True
+
+
+class ProductListItem(BaseModel):
+    """商品一覧アイテムエンティティ
+
+    一覧・おすすめの商品カードに必要な列だけを持つ読み取り専用エンティティ。
+    商品一覧用の非正規化テーブル（product_list_view）から取得する。
+    """
+
+    id: str = Field(..., description='商品ID')
+    category_id: str = Field(..., description='カテゴリID')
+    name: str = Field(..., description='英語名')
+    name_ja: str = Field(..., description='日本語名')
+    slug: str | None = Field(None, description='URL用スラッグ')
+    tagline: str | None = Field(None, description='キャッチコピー')
+    base_price: int = Field(..., description='税抜基本価格')
+    price_note: str | None = Field(None, description='価格補足')
+    is_featured: bool = Field(default=False, description='おすすめ')
+    main_image_url: str | None = Field(None, description='メイン画像URL')
+
+    class Config:
+        """Pydantic設定"""
+
+        from_attributes = True
+
+
+class RelatedProduct(BaseModel):
+    """関連商品エンティティ
+
+    商品詳細ページの関連商品カードに必要な列だけを持つ読み取り専用エンティティ。
+    """
+
+    id: str = Field(..., description='商品ID')
+    name: str = Field(..., description='英語名')
+    name_ja: str = Field(..., description='日本語名')
+    slug: str | None = Field(None, description='URL用スラッグ')
+    base_price: int = Field(..., description='税抜基本価格')
+    main_image_url: str | None = Field(None, description='メイン画像URL')
+
+    class Config:
+        """Pydantic設定"""
+
+        from_attributes = True
+
+
+class ProductVersion(BaseModel):
+    """商品バージョンエンティティ
+
+    商品本体の更新日時と子コレクション（画像・オプション等）の状態から
+    商品詳細の内容が変わったかどうかを判定するための軽量な情報。
+    """
+
+    product_id: str = Field(..., description='商品ID')
+    is_active: bool = Field(default=True, description='公開状態')
+    updated_at: datetime | None = Field(None, description='商品の更新日時')
+    child_versions: dict[str, str] = Field(
+        default_factory=dict,
+        description='子コレクションごとのバージョン（件数:最大ID）',
+    )
+
+
 class ProductImage(BaseModel):
     """商品画像エンティティ"""
 
@@ -7,6 +7,7 @@ from app.domain.exceptions.auth import (
     EmailNotVerifiedError,
     InvalidCredentialsError,
     InvalidTokenError,
+    RateLimitExceededError,
 )
 from app.domain.exceptions.base import DomainException
 from app.domain.exceptions.cart import (
@@ -15,9 +16,11 @@ from app.domain.exceptions.cart import (
     NoAvailableProductsError,
 )
 from app.domain.exceptions.common import (
+    InvalidCursorError,
     NotFoundError,
     OperationFailedError,
     PermissionDeniedError,
+    ServiceBusyError,
     ValidationError,
 )
 from app.domain.exceptions.order import OrderCannotCancelError, OrderNotFoundError
@@ -32,12 +35,15 @@ __all__ = [
     'PermissionDeniedError',
     'OperationFailedError',
     'ValidationError',
+    'InvalidCursorError',
+    'ServiceBusyError',
     # Auth
     'EmailAlreadyExistsError',
     'EmailAlreadyVerifiedError',
     'InvalidCredentialsError',
     'EmailNotVerifiedError',
     'InvalidTokenError',
+    'RateLimitExceededError',
     # User
     'UserNotFoundError',
     'InvalidPasswordError',
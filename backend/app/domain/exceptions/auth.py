@@ -51,3 +51,18 @@ class EmailAlreadyVerifiedError(DomainException):
             message='このメールアドレスは既に認証済みです',
             code='EMAIL_ALREADY_VERIFIED',
         )
+
+
+class RateLimitExceededError(DomainException):
+    """試行回数の上限を超えた
+
+    Attributes:
+        retry_after_seconds: 再試行できるまでの秒数（Retry-Afterヘッダーに使用）
+    """
+
+    def __init__(self, retry_after_seconds: int):
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            message='試行回数の上限に達しました。しばらくしてから再度お試しください',
+            code='RATE_LIMIT_EXCEEDED',
+        )
@@ -41,3 +41,26 @@ class ValidationError(DomainException):
             message=message,
             code='VALIDATION_ERROR',
         )
+
+
+class InvalidCursorError(DomainException):
+    """ページングカーソルが不正"""
+
+    def __init__(self, message: str = 'カーソルが不正です'):
+        super().__init__(
+            message=message,
+            code='INVALID_CURSOR',
+        )
+
+
+class ServiceBusyError(DomainException):
+    """処理が混み合っており受け付けられない"""
+
+    def __init__(
+        self,
+        message: str = '現在処理が混み合っています。しばらくしてから再度お試しください',
+    ):
+        super().__init__(
+            message=message,
+            code='SERVICE_BUSY',
+        )
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from app.domain.entities.admin import Admin, AdminLog, AdminRole
+from app.domain.entities.page import Page
 
 
 class IAdminRepository(ABC):
@@ -26,17 +27,8 @@ class IAdminRepository(ABC):
         is_active: bool | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Admin]:
-        """管理者一覧を取得"""
-        pass
-
-    @abstractmethod
-    def count_all(
-        self,
-        role: AdminRole | None = None,
-        is_active: bool | None = None,
-    ) -> int:
-        """管理者数を取得"""
+    ) -> Page[Admin]:
+        """管理者一覧を総件数と合わせて取得"""
         pass
 
     @abstractmethod
@@ -88,18 +80,11 @@ class IAdminLogRepository(ABC):
         date_to: datetime | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[AdminLog]:
-        """操作ログ一覧を取得（フィルタリング対応）"""
-        pass
+        cursor: str | None = None,
+    ) -> Page[AdminLog]:
+        """操作ログ一覧を総件数と合わせて取得（フィルタリング対応）
 
-    @abstractmethod
-    def count_all(
-        self,
-        admin_id: int | None = None,
-        action: str | None = None,
-        target_type: str | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """操作ログ数を取得"""
+        件数が多い場合、総件数は統計情報による概算値になる。
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
         pass
@@ -0,0 +1,19 @@
+"""顧客別集計リポジトリインターフェース"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.customer_stats import CustomerStats
+
+
+class ICustomerStatsRepository(ABC):
+    """顧客ごとの注文集計リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_by_user_id(self, user_id: int) -> CustomerStats:
+        """顧客の注文集計を取得（注文がない場合は0件の集計）"""
+        pass
+
+    @abstractmethod
+    def get_by_user_ids(self, user_ids: list[int]) -> dict[int, CustomerStats]:
+        """複数顧客の注文集計をまとめて取得（注文がない顧客は0件の集計）"""
+        pass
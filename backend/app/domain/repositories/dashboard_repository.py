@@ -0,0 +1,14 @@
+"""ダッシュボード集計リポジトリインターフェース"""
+
+from abc import ABC, abstractmethod
+
+from app.domain.entities.dashboard import DashboardSummary
+
+
+class IDashboardRepository(ABC):
+    """管理画面ダッシュボード集計リポジトリのインターフェース"""
+
+    @abstractmethod
+    def get_summary(self) -> DashboardSummary:
+        """ダッシュボードの概要（本日の売上・対応待ち件数・今月の新規会員数）を取得"""
+        pass
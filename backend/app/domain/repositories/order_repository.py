@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any
 
 from app.domain.entities.order import Order, OrderItem, OrderStatus
+from app.domain.entities.page import Page
 
 
 class IOrderRepository(ABC):
@@ -55,11 +56,6 @@ class IOrderRepository(ABC):
         """注文番号を生成（ACQ-YYMMDD-XXX形式）"""
         pass
 
-    @abstractmethod
-    def get_total_spent_by_user_id(self, user_id: int) -> int:
-        """ユーザーの累計購入金額を取得"""
-        pass
-
     @abstractmethod
     def get_all(
         self,
@@ -67,21 +63,15 @@ class IOrderRepository(ABC):
         status: list[OrderStatus] | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        requires_upload: bool | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Order]:
-        """注文一覧を取得（Admin用）"""
-        pass
+        cursor: str | None = None,
+    ) -> Page[Order]:
+        """注文一覧を総件数と合わせて取得（Admin用）
 
-    @abstractmethod
-    def count_all(
-        self,
-        search: str | None = None,
-        status: list[OrderStatus] | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """注文数を取得（Admin用）"""
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
         pass
 
     @abstractmethod
@@ -94,21 +84,6 @@ class IOrderRepository(ABC):
         """売上統計を取得"""
         pass
 
-    @abstractmethod
-    def get_today_stats(self) -> dict[str, Any]:
-        """本日の統計を取得"""
-        pass
-
-    @abstractmethod
-    def get_pending_count(self) -> int:
-        """対応待ち注文数を取得"""
-        pass
-
-    @abstractmethod
-    def get_processing_count(self) -> int:
-        """製作中注文数を取得"""
-        pass
-
 
 class IOrderItemRepository(ABC):
     """注文明細リポジトリのインターフェース"""
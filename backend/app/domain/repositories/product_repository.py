@@ -2,14 +2,20 @@
 
 from abc import ABC, abstractmethod
 
+from app.domain.entities.page import Page
 from app.domain.entities.product import (
     Product,
     ProductFaq,
     ProductFeature,
     ProductImage,
+    ProductListItem,
     ProductOption,
+    ProductProjection,
     ProductRelation,
     ProductSpec,
+    ProductSummary,
+    ProductVersion,
+    RelatedProduct,
 )
 
 
@@ -32,6 +38,29 @@ class IProductRepository(ABC):
         """商品一覧を取得"""
         pass
 
+    @abstractmethod
+    def get_page(
+        self,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[Product]:
+        """商品一覧を総件数と合わせて取得"""
+        pass
+
+    @abstractmethod
+    def get_list_items(
+        self,
+        category_id: str | None = None,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[ProductListItem]:
+        """公開中の商品カード一覧を総件数と合わせて取得（一覧用の非正規化テーブルから）"""
+        pass
+
     @abstractmethod
     def get_by_id(
         self, product_id: str, include_relations: bool = True
@@ -39,6 +68,20 @@ class IProductRepository(ABC):
         """IDで商品を取得"""
         pass
 
+    @abstractmethod
+    def get_many_by_ids(
+        self,
+        product_ids: list[str],
+        projection: ProductProjection = ProductProjection.SUMMARY,
+    ) -> dict[str, ProductSummary]:
+        """複数の商品を1クエリで取得（商品IDをキーとする辞書、存在しないIDは含まない）"""
+        pass
+
+    @abstractmethod
+    def get_version(self, product_id: str) -> ProductVersion | None:
+        """商品詳細のバージョン情報を取得（条件付きGET用）"""
+        pass
+
     @abstractmethod
     def get_by_slug(self, slug: str, include_relations: bool = True) -> Product | None:
         """スラッグで商品を取得"""
@@ -54,10 +97,11 @@ class IProductRepository(ABC):
         self,
         keyword: str,
         category_id: str | None = None,
+        is_active: bool | None = True,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Product]:
-        """商品を検索"""
+    ) -> Page[Product]:
+        """商品を関連度順に検索し、総件数と合わせて返す"""
         pass
 
     @abstractmethod
@@ -181,8 +225,8 @@ class IProductRepository(ABC):
     # ===================
 
     @abstractmethod
-    def get_related_products(self, product_id: str) -> list[Product]:
-        """関連商品を取得"""
+    def get_related_products(self, product_id: str) -> list[RelatedProduct] | None:
+        """公開中の関連商品を並び順で取得（商品が存在しない場合はNone）"""
         pass
 
     @abstractmethod
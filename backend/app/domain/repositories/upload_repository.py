@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from app.domain.entities.page import Page
 from app.domain.entities.upload import Upload
 
 
@@ -87,18 +88,10 @@ class IUploadRepository(ABC):
         date_to: datetime | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Upload]:
-        """Admin用: 入稿データ一覧を取得（フィルタ・ページネーション対応）"""
-        pass
+        cursor: str | None = None,
+    ) -> Page[Upload]:
+        """Admin用: 入稿データ一覧を総件数と合わせて取得（フィルタ・ページネーション対応）
 
-    @abstractmethod
-    def count_all_by_filters(
-        self,
-        status: str | None = None,
-        user_id: int | None = None,
-        order_id: int | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """Admin用: フィルタ条件に合致する件数を取得"""
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
         pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from app.domain.entities.customer_stats import CustomerSortKey
+from app.domain.entities.page import Page
 from app.domain.entities.user import User
 
 
@@ -46,18 +48,9 @@ class IUserRepository(ABC):
     def get_all(
         self,
         search: str | None = None,
+        sort_by: CustomerSortKey = CustomerSortKey.CREATED_AT,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[User]:
-        """ユーザー一覧を取得（検索・ページネーション対応）"""
-        pass
-
-    @abstractmethod
-    def count_all(self, search: str | None = None) -> int:
-        """ユーザー数を取得"""
-        pass
-
-    @abstractmethod
-    def count_new_this_month(self) -> int:
-        """今月の新規ユーザー数を取得"""
+    ) -> Page[User]:
+        """ユーザー一覧を総件数と合わせて取得（検索・並び替え・ページネーション対応）"""
         pass
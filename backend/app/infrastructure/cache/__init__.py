@@ -0,0 +1,21 @@
+"""キャッシュ関連のインフラ実装"""
+
+from app.infrastructure.cache.cached_product_master_repository import (
+    CachedProductMasterRepository,
+)
+from app.infrastructure.cache.cached_product_repository import CachedProductRepository
+from app.infrastructure.cache.catalog_cache import (
+    CacheStats,
+    CatalogCache,
+    get_catalog_cache,
+    mark_catalog_dirty,
+)
+
+__all__ = [
+    'CacheStats',
+    'CachedProductMasterRepository',
+    'CachedProductRepository',
+    'CatalogCache',
+    'get_catalog_cache',
+    'mark_catalog_dirty',
+]
@@ -0,0 +1,34 @@
+"""キャッシュ付きダッシュボード集計リポジトリ"""
+
+from functools import lru_cache
+
+from app.config import get_settings
+from app.domain.entities.dashboard import DashboardSummary
+from app.domain.repositories.dashboard_repository import IDashboardRepository
+from app.infrastructure.cache.catalog_cache import CatalogCache
+
+
+class CachedDashboardRepository(IDashboardRepository):
+    """ダッシュボード集計の前段に置く短時間のキャッシュ
+
+    管理画面は開いているタブごとにダッシュボードをポーリングするため、
+    数秒間は同じ集計結果を返して集計クエリの実行回数を抑える。
+    """
+
+    def __init__(self, repository: IDashboardRepository, cache: CatalogCache):
+        self.repository = repository
+        self.cache = cache
+
+    def get_summary(self) -> DashboardSummary:
+        """ダッシュボードの概要を取得"""
+        return self.cache.get_or_load(
+            ('dashboard', 'summary'), self.repository.get_summary
+        )
+
+
+@lru_cache
+def get_dashboard_cache() -> CatalogCache:
+    """ダッシュボード集計のキャッシュを取得（プロセス内で1つ）"""
+    return CatalogCache(
+        max_entries=1, ttl_seconds=get_settings().admin_dashboard_cache_ttl_seconds
+    )
@@ -0,0 +1,66 @@
+"""キャッシュ付き商品マスタリポジトリ（公開API用）"""
+
+from app.domain.entities.product_master import ProductMaster
+from app.domain.repositories.product_master_repository import IProductMasterRepository
+from app.infrastructure.cache.catalog_cache import CatalogCache
+
+
+class CachedProductMasterRepository(IProductMasterRepository):
+    """商品マスタリポジトリの前段に置くread-throughキャッシュ
+
+    返却されるエンティティはキャッシュと共有されるため、変更してはならない。
+    """
+
+    def __init__(self, repository: IProductMasterRepository, cache: CatalogCache):
+        self.repository = repository
+        self.cache = cache
+
+    def get_all(
+        self,
+        model_category: str | None = None,
+        is_active: bool | None = True,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ProductMaster]:
+        """商品マスタ一覧を取得"""
+        return self.cache.get_or_load(
+            ('product_master', 'get_all', model_category, is_active, limit, offset),
+            lambda: self.repository.get_all(
+                model_category=model_category,
+                is_active=is_active,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+
+    def get_by_id(self, master_id: str) -> ProductMaster | None:
+        """IDで商品マスタを取得"""
+        return self.cache.get_or_load(
+            ('product_master', 'get_by_id', master_id),
+            lambda: self.repository.get_by_id(master_id),
+        )
+
+    def count(
+        self,
+        model_category: str | None = None,
+        is_active: bool | None = True,
+    ) -> int:
+        """商品マスタ数をカウント"""
+        return self.cache.get_or_load(
+            ('product_master', 'count', model_category, is_active),
+            lambda: self.repository.count(
+                model_category=model_category, is_active=is_active
+            ),
+        )
+
+    def create(self, master: ProductMaster) -> ProductMaster:
+        """商品マスタを作成"""
+        return self.repository.create(master)
+
+    def update(self, master: ProductMaster) -> ProductMaster:
+        """商品マスタを更新"""
+        return self.repository.update(master)
+
+    def delete(self, master_id: str) -> bool:
+        """商品マスタを削除"""
+        return self.repository.delete(master_id)
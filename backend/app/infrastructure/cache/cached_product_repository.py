@@ -0,0 +1,280 @@
+"""キャッシュ付き商品リポジトリ（公開API用）"""
+
+from app.domain.entities.page import Page
+from app.domain.entities.product import (
+    Product,
+    ProductFaq,
+    ProductFeature,
+    ProductImage,
+    ProductListItem,
+    ProductOption,
+    ProductProjection,
+    ProductRelation,
+    ProductSpec,
+    ProductSummary,
+    ProductVersion,
+    RelatedProduct,
+)
+from app.domain.repositories.product_repository import IProductRepository
+from app.infrastructure.cache.catalog_cache import CatalogCache
+
+
+class CachedProductRepository(IProductRepository):
+    """商品リポジトリの前段に置くread-throughキャッシュ
+
+    ストアフロントの読み取り（一覧・おすすめ・詳細・オプション・関連商品）を
+    キャッシュし、書き込みはそのまま委譲する。
+    返却されるエンティティはキャッシュと共有されるため、変更してはならない。
+    Admin用ユースケースにはキャッシュなしのリポジトリを注入すること。
+    """
+
+    def __init__(self, repository: IProductRepository, cache: CatalogCache):
+        self.repository = repository
+        self.cache = cache
+
+    # ===================
+    # 商品 (Products)
+    # ===================
+
+    def get_all(
+        self,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Product]:
+        """商品一覧を取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_all', category_id, is_active, is_featured, limit, offset),
+            lambda: self.repository.get_all(
+                category_id=category_id,
+                is_active=is_active,
+                is_featured=is_featured,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+
+    def get_page(
+        self,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[Product]:
+        """商品一覧を総件数と合わせて取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_page', category_id, is_active, is_featured, limit, offset),
+            lambda: self.repository.get_page(
+                category_id=category_id,
+                is_active=is_active,
+                is_featured=is_featured,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+
+    def get_list_items(
+        self,
+        category_id: str | None = None,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[ProductListItem]:
+        """公開中の商品カード一覧を総件数と合わせて取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_list_items', category_id, is_featured, limit, offset),
+            lambda: self.repository.get_list_items(
+                category_id=category_id,
+                is_featured=is_featured,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+
+    def get_by_id(
+        self, product_id: str, include_relations: bool = True
+    ) -> Product | None:
+        """IDで商品を取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_by_id', product_id, include_relations),
+            lambda: self.repository.get_by_id(
+                product_id, include_relations=include_relations
+            ),
+        )
+
+    def get_many_by_ids(
+        self,
+        product_ids: list[str],
+        projection: ProductProjection = ProductProjection.SUMMARY,
+    ) -> dict[str, ProductSummary]:
+        """複数の商品を1クエリで取得（キャッシュしない）"""
+        return self.repository.get_many_by_ids(product_ids, projection=projection)
+
+    def get_version(self, product_id: str) -> ProductVersion | None:
+        """商品詳細のバージョン情報を取得（条件付きGET用）"""
+        return self.cache.get_or_load(
+            ('product', 'get_version', product_id),
+            lambda: self.repository.get_version(product_id),
+        )
+
+    def get_by_slug(self, slug: str, include_relations: bool = True) -> Product | None:
+        """スラッグで商品を取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_by_slug', slug, include_relations),
+            lambda: self.repository.get_by_slug(
+                slug, include_relations=include_relations
+            ),
+        )
+
+    def get_featured(self, limit: int = 10) -> list[Product]:
+        """おすすめ商品を取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_featured', limit),
+            lambda: self.repository.get_featured(limit=limit),
+        )
+
+    def search(
+        self,
+        keyword: str,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Page[Product]:
+        """商品を検索（キーワードの種類が多いためキャッシュしない）"""
+        return self.repository.search(
+            keyword=keyword,
+            category_id=category_id,
+            is_active=is_active,
+            limit=limit,
+            offset=offset,
+        )
+
+    def count(
+        self,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        keyword: str | None = None,
+    ) -> int:
+        """商品数をカウント（キーワード指定時はキャッシュしない）"""
+        if keyword is not None:
+            return self.repository.count(
+                category_id=category_id, is_active=is_active, keyword=keyword
+            )
+        return self.cache.get_or_load(
+            ('product', 'count', category_id, is_active),
+            lambda: self.repository.count(category_id=category_id, is_active=is_active),
+        )
+
+    def create(self, product: Product) -> Product:
+        """商品を作成"""
+        return self.repository.create(product)
+
+    def update(self, product: Product) -> Product:
+        """商品を更新"""
+        return self.repository.update(product)
+
+    def delete(self, product_id: str) -> bool:
+        """商品を削除"""
+        return self.repository.delete(product_id)
+
+    # ===================
+    # 商品画像 (Product Images)
+    # ===================
+
+    def get_images(self, product_id: str) -> list[ProductImage]:
+        """商品の画像一覧を取得"""
+        return self.repository.get_images(product_id)
+
+    def get_image(self, image_id: int) -> ProductImage | None:
+        """画像をIDで取得"""
+        return self.repository.get_image(image_id)
+
+    def add_image(self, image: ProductImage) -> ProductImage:
+        """商品画像を追加"""
+        return self.repository.add_image(image)
+
+    def update_image(self, image: ProductImage) -> ProductImage:
+        """商品画像を更新（メタデータのみ: alt, is_main, sort_order）"""
+        return self.repository.update_image(image)
+
+    def delete_image(self, image_id: int) -> bool:
+        """商品画像を削除"""
+        return self.repository.delete_image(image_id)
+
+    # ===================
+    # 商品オプション (Product Options)
+    # ===================
+
+    def get_options(self, product_id: str) -> list[ProductOption]:
+        """商品のオプション一覧を取得"""
+        return self.cache.get_or_load(
+            ('product', 'get_options', product_id),
+            lambda: self.repository.get_options(product_id),
+        )
+
+    def update_options(
+        self, product_id: str, options: list[ProductOption]
+    ) -> list[ProductOption]:
+        """商品オプションを一括更新（既存を削除して新規作成）"""
+        return self.repository.update_options(product_id, options)
+
+    # ===================
+    # 商品スペック (Product Specs)
+    # ===================
+
+    def get_specs(self, product_id: str) -> list[ProductSpec]:
+        """商品のスペック一覧を取得"""
+        return self.repository.get_specs(product_id)
+
+    def update_specs(
+        self, product_id: str, specs: list[ProductSpec]
+    ) -> list[ProductSpec]:
+        """商品スペックを一括更新"""
+        return self.repository.update_specs(product_id, specs)
+
+    # ===================
+    # 商品特長 (Product Features)
+    # ===================
+
+    def get_features(self, product_id: str) -> list[ProductFeature]:
+        """商品の特長一覧を取得"""
+        return self.repository.get_features(product_id)
+
+    def update_features(
+        self, product_id: str, features: list[ProductFeature]
+    ) -> list[ProductFeature]:
+        """商品特長を一括更新"""
+        return self.repository.update_features(product_id, features)
+
+    # ===================
+    # 商品FAQ (Product FAQs)
+    # ===================
+
+    def get_faqs(self, product_id: str) -> list[ProductFaq]:
+        """商品のFAQ一覧を取得"""
+        return self.repository.get_faqs(product_id)
+
+    def update_faqs(self, product_id: str, faqs: list[ProductFaq]) -> list[ProductFaq]:
+        """商品FAQを一括更新"""
+        return self.repository.update_faqs(product_id, faqs)
+
+    # ===================
+    # 関連商品 (Product Relations)
+    # ===================
+
+    def get_related_products(self, product_id: str) -> list[RelatedProduct] | None:
+        """公開中の関連商品を並び順で取得（商品が存在しない場合はNone）"""
+        return self.cache.get_or_load(
+            ('product', 'get_related_products', product_id),
+            lambda: self.repository.get_related_products(product_id),
+        )
+
+    def update_relations(
+        self, product_id: str, relations: list[ProductRelation]
+    ) -> list[ProductRelation]:
+        """関連商品を一括更新"""
+        return self.repository.update_relations(product_id, relations)
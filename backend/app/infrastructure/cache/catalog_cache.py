@@ -0,0 +1,162 @@
+"""カタログ読み取りキャッシュ
+
+商品・商品マスタの読み取り結果をプロセス内に保持するread-throughキャッシュ。
+TTLとLRUで件数を制限し、Admin側の書き込みがコミットされた時点で無効化する。
+
+無効化の流れ:
+    1. 商品/商品マスタリポジトリの書き込み系メソッドが mark_catalog_dirty(session) を呼ぶ
+    2. そのセッションがコミットされると after_commit フックでキャッシュを無効化する
+    3. ロールバックされた場合はフラグを破棄し、キャッシュは維持する
+
+キャッシュはプロセス（ECSタスク）ごとに独立しているため、
+他タスクでの更新はTTL経過後に反映される。
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.infrastructure.db.read_routing import pin_primary_reads
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# セッションに書き込みフラグを保持するキー
+_DIRTY_KEY = 'catalog_cache_dirty'
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """キャッシュの統計情報"""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    version: int
+
+    @property
+    def hit_rate(self) -> float:
+        """ヒット率（0.0〜1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CatalogCache:
+    """TTL・LRU付きのバージョン管理されたインメモリキャッシュ
+
+    キャッシュ値は読み取り専用として扱うこと（呼び出し側で変更しない）。
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def version(self) -> int:
+        """現在のキャッシュバージョン（無効化のたびに増加）"""
+        return self._version
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """キャッシュから取得し、なければloaderで読み込んで保存する
+
+        読み込み中に無効化が発生した場合、読み込んだ値は古い可能性があるため保存しない。
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            version = self._version
+
+        value = loader()
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return value
+
+    def invalidate(self) -> None:
+        """全エントリを無効化し、バージョンを進める"""
+        with self._lock:
+            self._version += 1
+            self._invalidations += 1
+            self._entries.clear()
+        logger.debug(f'カタログキャッシュを無効化しました (version={self._version})')
+
+    def stats(self) -> CacheStats:
+        """統計情報を取得"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+                ttl_seconds=self.ttl_seconds,
+                version=self._version,
+            )
+
+
+def mark_catalog_dirty(session: Session) -> None:
+    """セッションにカタログ更新フラグを立てる（コミット時にキャッシュを無効化）"""
+    session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session: Session) -> None:
+    """カタログを更新したトランザクションのコミット後にキャッシュを無効化
+
+    リードレプリカの反映待ちの間に古いデータでキャッシュを作り直さないよう、
+    しばらくの間このプロセスの読み取りをプライマリに向ける。
+    """
+    if session.info.pop(_DIRTY_KEY, False):
+        pin_primary_reads()
+        get_catalog_cache().invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session: Session) -> None:
+    """ロールバックされた更新ではキャッシュを無効化しない"""
+    session.info.pop(_DIRTY_KEY, None)
+
+
+@lru_cache
+def get_catalog_cache() -> CatalogCache:
+    """アプリケーション全体で共有するカタログキャッシュを取得"""
+    settings = get_settings()
+    return CatalogCache(
+        max_entries=settings.catalog_cache_max_entries,
+        ttl_seconds=settings.catalog_cache_ttl_seconds,
+    )
@@ -0,0 +1,49 @@
+"""同期ユースケースを非同期セッション上で実行するラッパー
+
+ユースケースとリポジトリ実装は同期のまま（domain/repositories のインターフェース）とし、
+AsyncSession.run_sync でgreenlet上に載せて実行する。SQLの発行はasyncpg経由で
+イベントループ上で待機されるため、リクエストがスレッドプールのワーカーを占有しない。
+
+ユースケース内でDB以外のブロッキングI/O（Stripe・S3・メール送信等）を行うものは
+イベントループを止めてしまうため、このラッパーでは実行しないこと。
+（AsyncStripeServiceImpl のように、外部APIの非同期メソッドを await_only で待機する実装は可）
+
+使用例:
+    def get_async_product_usecase(
+        session: AsyncSession = Depends(get_async_db),
+    ) -> AsyncUsecase[ProductUsecase]:
+        return AsyncUsecase(
+            session, lambda s: ProductUsecase(product_repository=ProductRepositoryImpl(s))
+        )
+
+    @router.get('')
+    async def get_products(
+        product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_async_product_usecase),
+    ):
+        output_dto = await product_usecase.run(lambda u: u.get_products(input_dto))
+"""
+
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+U = TypeVar('U')
+R = TypeVar('R')
+
+
+class AsyncUsecase(Generic[U]):
+    """AsyncSession に紐付いた同期ユースケース
+
+    ユースケースは AsyncSession の同期セッション（sync_session）から1度だけ組み立て、
+    run() のたびに run_sync で実行する。
+    """
+
+    def __init__(self, session: AsyncSession, factory: Callable[[Session], U]):
+        self.session = session
+        self.usecase = factory(session.sync_session)
+
+    async def run(self, call: Callable[[U], R]) -> R:
+        """ユースケースのメソッドを非同期セッション上で実行"""
+        return await self.session.run_sync(lambda _: call(self.usecase))
@@ -4,18 +4,27 @@ from app.infrastructure.db.models.address_model import AddressModel
 from app.infrastructure.db.models.admin_model import AdminLogModel, AdminModel
 from app.infrastructure.db.models.base import Base
 from app.infrastructure.db.models.cart_item_model import CartItemModel
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.models.daily_sales_model import DailySalesModel
+from app.infrastructure.db.models.email_outbox_model import EmailOutboxModel
 from app.infrastructure.db.models.order_model import OrderItemModel, OrderModel
+from app.infrastructure.db.models.order_number_counter_model import (
+    OrderNumberCounterModel,
+)
 from app.infrastructure.db.models.product_master_model import ProductMasterModel
 from app.infrastructure.db.models.product_model import (
     ProductFaqModel,
     ProductFeatureModel,
     ProductImageModel,
+    ProductListViewModel,
     ProductModel,
     ProductOptionModel,
     ProductOptionValueModel,
     ProductRelationModel,
     ProductSpecModel,
 )
+from app.infrastructure.db.models.rate_limit_model import RateLimitCounterModel
+from app.infrastructure.db.models.stripe_event_model import StripeEventModel
 from app.infrastructure.db.models.user_model import UserModel
 from app.infrastructure.db.models.verification_token_model import VerificationTokenModel
 
@@ -29,6 +38,9 @@ __all__ = [
     'CartItemModel',
     'OrderModel',
     'OrderItemModel',
+    'OrderNumberCounterModel',
+    'DailySalesModel',
+    'CustomerStatsModel',
     'ProductMasterModel',
     'ProductModel',
     'ProductImageModel',
@@ -38,4 +50,8 @@ __all__ = [
     'ProductFeatureModel',
     'ProductFaqModel',
     'ProductRelationModel',
+    'ProductListViewModel',
+    'RateLimitCounterModel',
+    'EmailOutboxModel',
+    'StripeEventModel',
 ]
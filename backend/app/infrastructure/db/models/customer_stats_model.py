@@ -0,0 +1,22 @@
+"""顧客別集計DBモデル"""
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer
+
+from app.infrastructure.db.models.base import Base
+
+
+class CustomerStatsModel(Base):
+    """顧客別集計テーブル（注文数・累計購入金額・最終注文日時）
+
+    注文の作成・更新時に OrderRepositoryImpl が同一トランザクション内で増減する。
+    注文のない顧客は行を持たない（0件として扱う）。
+    """
+
+    __tablename__ = 'customer_stats'
+
+    user_id = Column(
+        Integer, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True
+    )
+    order_count = Column(Integer, nullable=False, default=0, index=True)
+    total_spent = Column(BigInteger, nullable=False, default=0, index=True)
+    last_order_at = Column(DateTime, nullable=True, index=True)
@@ -0,0 +1,20 @@
+"""日次売上集計DBモデル"""
+
+from sqlalchemy import BigInteger, Column, Date, Integer, String
+
+from app.infrastructure.db.models.base import Base
+
+
+class DailySalesModel(Base):
+    """日次売上集計テーブル（注文日・ステータスごとの件数と売上）
+
+    注文の作成・更新時に OrderRepositoryImpl が同一トランザクション内で増減する。
+    売上統計（週次・月次を含む）はこのテーブルから集計する。
+    """
+
+    __tablename__ = 'daily_sales'
+
+    sales_date = Column(Date, primary_key=True)  # 注文日（orders.created_at の日付）
+    status = Column(String(30), primary_key=True)
+    orders = Column(Integer, nullable=False, default=0)
+    revenue = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,32 @@
+"""メール送信キューDBモデル"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.db.models.base import Base
+
+
+class EmailOutboxModel(Base):
+    """メール送信キューテーブル（アウトボックス）
+
+    ユースケースのトランザクション内で記録し、バックグラウンドの配信処理が送信する。
+    送信待ちの行は部分インデックス ix_email_outbox_pending（status = 'pending'）で、
+    リース期限切れの送信中の行は ix_email_outbox_sending（status = 'sending'）で取得する。
+    """
+
+    __tablename__ = 'email_outbox'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)  # verification, order_confirmation 等
+    to_email = Column(String(255), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    dedupe_key = Column(String(255), nullable=True, unique=True)
+    # pending/sending/sent/failed
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, server_default=func.now())
+    # 送信中（sending）の行のリース期限。過ぎた場合は別の配信処理が送信し直す
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
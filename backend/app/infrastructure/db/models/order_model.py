@@ -1,6 +1,6 @@
 """注文DBモデル"""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -32,6 +32,11 @@ class OrderModel(Base):
     cancel_reason = Column(Text, nullable=True)
     notes = Column(Text, nullable=True)
     admin_notes = Column(Text, nullable=True)
+    # 注文作成時に明細の入稿要件から計算（支払い後のステータス判定・管理画面の絞り込み用）
+    requires_upload = Column(
+        Boolean, nullable=False, default=False, server_default='false'
+    )
+    upload_item_count = Column(Integer, nullable=False, default=0, server_default='0')
     created_at = Column(DateTime, nullable=False, server_default=func.now(), index=True)
     updated_at = Column(
         DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
@@ -0,0 +1,14 @@
+"""注文番号カウンターDBモデル"""
+
+from sqlalchemy import Column, Date, Integer
+
+from app.infrastructure.db.models.base import Base
+
+
+class OrderNumberCounterModel(Base):
+    """注文番号カウンターテーブル（日付ごとに最後に採番した連番）"""
+
+    __tablename__ = 'order_number_counters'
+
+    counter_date = Column(Date, primary_key=True)  # 注文番号の日付部分
+    last_value = Column(Integer, nullable=False, default=0)
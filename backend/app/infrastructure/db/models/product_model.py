@@ -1,11 +1,36 @@
 """商品DBモデル"""
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.infrastructure.db.models.base import Base
 
+# 英数字トークン（英語名・型番等）の全文検索ベクトル
+# 日本語は空白で区切られないため 'simple' 設定で文単位のトークンになり、
+# 日本語の検索は search_text のトライグラムで行う
+PRODUCT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(tagline, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+
+# 部分一致検索の対象列を連結したテキスト（旧実装のILIKE対象と同じ4列）
+PRODUCT_SEARCH_TEXT_SQL = (
+    "coalesce(name, '') || ' ' || coalesce(name_ja, '') || ' ' || "
+    "coalesce(tagline, '') || ' ' || coalesce(description, '')"
+)
+
 
 class ProductModel(Base):
     """商品テーブル"""
@@ -38,6 +63,16 @@ class ProductModel(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # 検索用の生成列（DB側で自動計算・通常の読み込みでは取得しない）
+    # search_vector: 英数字トークンの全文検索用（GINインデックス）
+    # search_text: 日本語を含む部分一致検索用（pg_trgm GINインデックス）
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(PRODUCT_SEARCH_VECTOR_SQL, persisted=True))
+    )
+    search_text = deferred(
+        Column(Text, Computed(PRODUCT_SEARCH_TEXT_SQL, persisted=True))
+    )
+
     # リレーション
     master = relationship('ProductMasterModel', back_populates='products')
     images = relationship(
@@ -189,3 +224,29 @@ class ProductRelationModel(Base):
         'ProductModel', foreign_keys=[product_id], back_populates='relations'
     )
     related_product = relationship('ProductModel', foreign_keys=[related_product_id])
+
+
+class ProductListViewModel(Base):
+    """商品一覧用の非正規化テーブル（商品カード表示用の列のみ）
+
+    商品・商品画像の書き込み時に ProductRepositoryImpl が同一トランザクションで更新する。
+    メイン画像URLは書き込み時に解決済みの値を保持する。
+    """
+
+    __tablename__ = 'product_list_view'
+
+    product_id = Column(
+        String(100), ForeignKey('products.id', ondelete='CASCADE'), primary_key=True
+    )
+    category_id = Column(String(50), nullable=False)
+    name = Column(String(200), nullable=False)
+    name_ja = Column(String(200), nullable=False)
+    slug = Column(String(200), nullable=True)
+    tagline = Column(String(255), nullable=True)
+    base_price = Column(Integer, nullable=False)
+    price_note = Column(String(255), nullable=True)
+    main_image_url = Column(String(500), nullable=True)
+    is_active = Column(Boolean)
+    is_featured = Column(Boolean)
+    sort_order = Column(Integer)
+    created_at = Column(DateTime)
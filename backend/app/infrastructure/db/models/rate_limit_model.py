@@ -0,0 +1,16 @@
+"""レート制限カウンターDBモデル"""
+
+from sqlalchemy import BigInteger, Column, Integer, String
+
+from app.infrastructure.db.models.base import Base
+
+
+class RateLimitCounterModel(Base):
+    """レート制限カウンターテーブル（複数タスクで共有する固定ウィンドウの試行回数）"""
+
+    __tablename__ = 'rate_limit_counters'
+
+    key = Column(String(320), primary_key=True)  # 例: login:ip:203.0.113.1
+    window_start = Column(BigInteger, primary_key=True)  # ウィンドウ開始（UNIX秒）
+    count = Column(Integer, nullable=False, default=0)
+    expires_at = Column(BigInteger, nullable=False, index=True)  # 削除可能時刻（UNIX秒）
@@ -0,0 +1,32 @@
+"""Stripeイベント台帳DBモデル"""
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.db.models.base import Base
+
+
+class StripeEventModel(Base):
+    """Stripe Webhookイベントの受信台帳テーブル
+
+    Webhookの受信時に INSERT ... ON CONFLICT DO NOTHING で記録し、
+    バックグラウンドの処理が注文の更新などを行う。主キーがStripeのイベントIDのため、
+    再送・重複配信されたイベントは記録されず、2度処理されない。
+    処理待ちの行は部分インデックス ix_stripe_events_pending（status = 'pending'）で、
+    リース期限切れの処理中の行は ix_stripe_events_processing（status = 'processing'）で取得する。
+    """
+
+    __tablename__ = 'stripe_events'
+
+    id = Column(String(255), primary_key=True)  # StripeのイベントID（evt_...）
+    type = Column(String(100), nullable=False)  # payment_intent.succeeded 等
+    payload = Column(JSONB, nullable=False)  # イベントのオブジェクト（data.object）
+    # pending/processing/processed/failed
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, server_default=func.now())
+    # 処理中（processing）の行のリース期限。過ぎた場合は別の処理スレッドが処理し直す
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    received_at = Column(DateTime, nullable=False, server_default=func.now())
+    processed_at = Column(DateTime, nullable=True)
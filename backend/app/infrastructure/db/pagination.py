@@ -0,0 +1,175 @@
+"""ページング付きクエリのヘルパー
+
+一覧取得のたびに「データ取得」と「同じ条件でのcount」を別々に発行していたものを、
+count(*) OVER() で1クエリにまとめる。
+
+履歴系の一覧（注文・操作ログ・入稿データ）は (created_at, id) のキーセットページングにも
+対応し、深いページでもOFFSETによる読み飛ばしが発生しないようにする。
+
+使用例:
+    query = self.session.query(UserModel).filter(...).order_by(...)
+    return paginate(query, self._to_entity, limit=limit, offset=offset)
+
+    query = self.session.query(OrderModel).filter(...)
+    return paginate_by_created_at(
+        query, OrderModel, self._to_entity, limit=limit, offset=offset, cursor=cursor
+    )
+"""
+
+import base64
+import binascii
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+
+from app.domain.entities.page import Page
+from app.domain.exceptions.common import InvalidCursorError
+
+T = TypeVar('T')
+
+
+def paginate(
+    query: Query,
+    to_entity: Callable[[Any], T],
+    limit: int | None,
+    offset: int = 0,
+    estimate_threshold: int | None = None,
+    cursor_of: Callable[[Any], str] | None = None,
+) -> Page[T]:
+    """並び順を指定済みのクエリを1ページ分実行し、総件数と合わせて返す
+
+    総件数は count(*) OVER() により同じクエリで取得する。
+    estimate_threshold を指定した場合、プランナの推定件数がそれ以上であれば
+    全件を数えずに推定値を総件数とする（件数が増え続ける巨大なテーブル向け）。
+    cursor_of を指定した場合、次ページがあればページ末尾の行から next_cursor を作る。
+    """
+    if estimate_threshold is not None:
+        estimated = estimate_count(query)
+        if estimated >= estimate_threshold:
+            models = _slice(query, limit, offset).all()
+            has_next = limit is not None and len(models) == limit
+            return Page(
+                items=[to_entity(model) for model in models],
+                total=estimated,
+                limit=limit,
+                offset=offset,
+                is_total_estimated=True,
+                next_cursor=_next_cursor(models, has_next, cursor_of),
+            )
+
+    rows = _slice(query.add_columns(func.count().over()), limit, offset).all()
+    if rows:
+        total = rows[0][-1]
+    elif offset > 0:
+        # 最終ページを超えた場合は行がないため、件数のみ別途取得する
+        total = query.order_by(None).count()
+    else:
+        total = 0
+
+    models = [row[0] for row in rows]
+    return Page(
+        items=[to_entity(model) for model in models],
+        total=total,
+        limit=limit,
+        offset=offset,
+        next_cursor=_next_cursor(models, offset + len(models) < total, cursor_of),
+    )
+
+
+def paginate_by_created_at(
+    query: Query,
+    model: type,
+    to_entity: Callable[[Any], T],
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    estimate_threshold: int | None = None,
+) -> Page[T]:
+    """(created_at, id) の降順で1ページ分を取得する
+
+    cursor を指定した場合はキーセットページング（WHERE (created_at, id) < cursor）で
+    取得し、総件数は数えない（total=None）。指定しない場合は従来のオフセットページング。
+    どちらのモードでも、次ページがあれば next_cursor を返す。
+    model には created_at と id を持つモデルクラスを渡し、
+    (created_at, id) の複合インデックスを用意しておくこと。
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor is None:
+        return paginate(
+            query,
+            to_entity,
+            limit=limit,
+            offset=offset,
+            estimate_threshold=estimate_threshold,
+            cursor_of=_created_at_cursor,
+        )
+
+    created_at, last_id = decode_cursor(cursor)
+    query = query.filter(tuple_(model.created_at, model.id) < tuple_(created_at, last_id))
+    # 1件多く取得して次ページの有無を判定する
+    models = query.limit(limit + 1).all()
+    has_next = len(models) > limit
+    models = models[:limit]
+    return Page(
+        items=[to_entity(m) for m in models],
+        total=None,
+        limit=limit,
+        next_cursor=_next_cursor(models, has_next, _created_at_cursor),
+    )
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """(created_at, id) を不透明なカーソル文字列に変換"""
+    raw = f'{created_at.isoformat()}|{record_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """カーソル文字列を (created_at, id) に戻す"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, record_id = (
+            base64.urlsafe_b64decode(padded).decode().split('|', maxsplit=1)
+        )
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError() from e
+
+
+def estimate_count(query: Query) -> int:
+    """EXPLAINの推定行数からクエリの件数を概算する（PostgreSQL）"""
+    statement = query.enable_eagerloads(False).order_by(None).statement
+    compiled = statement.compile(
+        dialect=query.session.get_bind().dialect,
+        compile_kwargs={'render_postcompile': True},
+    )
+    result = query.session.connection().exec_driver_sql(
+        f'EXPLAIN (FORMAT JSON) {compiled.string}', compiled.params
+    )
+    plan = result.scalar()
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _created_at_cursor(model: Any) -> str:
+    return encode_cursor(model.created_at, model.id)
+
+
+def _next_cursor(
+    models: list[Any], has_next: bool, cursor_of: Callable[[Any], str] | None
+) -> str | None:
+    """次ページがある場合、ページ末尾の行からカーソルを作る"""
+    if cursor_of is None or not has_next or not models:
+        return None
+    return cursor_of(models[-1])
+
+
+def _slice(query: Query, limit: int | None, offset: int) -> Query:
+    """オフセット・件数を適用"""
+    query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
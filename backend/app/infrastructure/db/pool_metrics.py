@@ -0,0 +1,139 @@
+"""コネクションプールの計測
+
+プールからの接続取得（checkout）にかかった時間をヒストグラムで記録し、
+使用中・オーバーフローの接続数とあわせて統計として取得できるようにする。
+ECSタスク数 × プール上限が RDS の max_connections に収まるかの見積もりや、
+プール待ちがレイテンシに占める割合の確認に使う（Admin API で公開）。
+
+使用例:
+    engine = create_engine(url, poolclass=InstrumentedQueuePool, pool_size=10)
+    stats = pool_stats('sync', engine.pool, max_overflow=20)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# checkout待ち時間のヒストグラムの上限値（ms）。最後のバケットは上限なし
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass(frozen=True)
+class HistogramBucket:
+    """ヒストグラムのバケット（le_ms 以下だった件数の累積。le_ms=None は全件）"""
+
+    le_ms: float | None
+    count: int
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """コネクションプールの統計"""
+
+    name: str
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+    checkout_wait_histogram: list[HistogramBucket]
+
+
+class PoolMetrics:
+    """checkout待ち時間・タイムアウト件数の記録"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    def observe_checkout(self, seconds: float) -> None:
+        """接続の取得に成功した際の待ち時間を記録"""
+        wait_ms = seconds * 1000
+        index = next(
+            (i for i, le in enumerate(CHECKOUT_WAIT_BUCKETS_MS) if wait_ms <= le),
+            len(CHECKOUT_WAIT_BUCKETS_MS),
+        )
+        with self._lock:
+            self._bucket_counts[index] += 1
+            self._checkouts += 1
+            self._wait_seconds += seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, seconds)
+
+    def record_timeout(self) -> None:
+        """pool_timeout 以内に接続を取得できなかったことを記録"""
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> tuple[int, int, float, float, list[HistogramBucket]]:
+        """(checkout件数, タイムアウト件数, 平均待ち[ms], 最大待ち[ms], ヒストグラム)"""
+        with self._lock:
+            counts = list(self._bucket_counts)
+            checkouts = self._checkouts
+            timeouts = self._timeouts
+            avg_ms = self._wait_seconds / checkouts * 1000 if checkouts else 0.0
+            max_ms = self._max_wait_seconds * 1000
+
+        histogram = []
+        cumulative = 0
+        for le_ms, count in zip((*CHECKOUT_WAIT_BUCKETS_MS, None), counts, strict=True):
+            cumulative += count
+            histogram.append(HistogramBucket(le_ms=le_ms, count=cumulative))
+        return checkouts, timeouts, avg_ms, max_ms, histogram
+
+
+class _InstrumentedPoolMixin:
+    """QueuePool の接続取得（_do_get）を計測する
+
+    dispose() 等でプールが再生成された場合、統計は新しいプールで0から数え直す。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.observe_checkout(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """計測付きの QueuePool（同期エンジン用）"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """計測付きの AsyncAdaptedQueuePool（非同期エンジン用）"""
+
+
+def pool_stats(name: str, pool: QueuePool, max_overflow: int) -> PoolStats:
+    """プールの現在の接続数と計測結果をまとめる"""
+    metrics = getattr(pool, 'metrics', None) or PoolMetrics()
+    checkouts, timeouts, avg_ms, max_ms, histogram = metrics.snapshot()
+    return PoolStats(
+        name=name,
+        size=pool.size(),
+        max_overflow=max_overflow,
+        checked_out=pool.checkedout(),
+        # overflow() は未作成の枠を負数で返すため、超過して作成した接続数に直す
+        overflow=max(pool.overflow(), 0),
+        checkouts=checkouts,
+        timeouts=timeouts,
+        avg_checkout_wait_ms=avg_ms,
+        max_checkout_wait_ms=max_ms,
+        checkout_wait_histogram=histogram,
+    )
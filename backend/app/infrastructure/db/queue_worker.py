@@ -0,0 +1,282 @@
+"""テーブルをキューとして使うバックグラウンド処理の共通部分
+
+メール送信キュー（email_outbox）・Stripeイベント台帳（stripe_events）のように、
+処理待ちの行をバックグラウンドスレッドで1件ずつ処理するワーカーの基底クラス。
+サブクラスは対象のテーブル（model 等のクラス属性）と1件の処理（handle）だけを定義する。
+
+- 処理待ちで処理予定時刻を過ぎた行を batch_size 件ずつ FOR UPDATE SKIP LOCKED で選び、
+  処理中（in_progress_status）とリース期限（locked_until）を設定してすぐにコミットする。
+  複数のECSタスクで同時に動かしても同じ行を二重に処理しない
+- 1件ごとに別のトランザクションで handle を呼び、成功したら同じトランザクションで
+  完了（done_status）を記録する。外部APIの呼び出し中にトランザクションを保持せず、
+  1件の失敗で同じバッチの他の行の処理は取り消されない
+- 失敗した場合は指数バックオフ（backoff_base_seconds × 2^(試行回数-1)、
+  上限 backoff_max_seconds）で再処理し、max_attempts 回失敗したら failed にする
+- 処理中にプロセスが停止した行は、リース期限を過ぎると再び処理する
+- 行を記録したトランザクションのコミット時に notify() で起こされ、
+  それ以外は poll_interval_seconds ごとに処理待ちを確認する
+- 完了・失敗の行は retention_days を過ぎたら削除する
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any, ClassVar
+
+from sqlalchemy import Row, and_, delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 完了・失敗の行を削除する間隔（秒）
+CLEANUP_INTERVAL_SECONDS = 3600
+
+
+def backoff_seconds(attempts: int, base_seconds: float, max_seconds: float) -> float:
+    """attempts 回目の失敗後、次に処理するまでの秒数"""
+    return min(base_seconds * 2 ** (attempts - 1), max_seconds)
+
+
+class QueueWorker(ABC):
+    """処理待ちの行をリース付きで取得し、1件ずつ handle で処理する
+
+    対象のテーブルは id, status, attempts, next_attempt_at, locked_until, last_error の列を持つ。
+    """
+
+    # 対象のテーブル
+    model: ClassVar[Any]
+    # 処理中・完了のステータス（処理待ちは 'pending'、失敗は 'failed'）
+    in_progress_status: ClassVar[str]
+    done_status: ClassVar[str]
+    # 完了日時の列・保持期間の判定に使う作成日時の列
+    done_at_column: ClassVar[str]
+    created_at_column: ClassVar[str]
+    # スレッド名・ログに出す行の種類
+    thread_name: ClassVar[str]
+    label: ClassVar[str]
+
+    _wakeup: ClassVar[threading.Event]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._wakeup = threading.Event()
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 20,
+        max_attempts: int = 8,
+        backoff_base_seconds: float = 30.0,
+        backoff_max_seconds: float = 3600.0,
+        poll_interval_seconds: float = 5.0,
+        retention_days: int = 30,
+        lease_seconds: float = 600.0,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retention_days = retention_days
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_cleanup = 0.0
+
+    @classmethod
+    def notify(cls) -> None:
+        """処理待ちの行が増えたことをこのワーカーに知らせる"""
+        cls._wakeup.set()
+
+    @abstractmethod
+    def handle(self, session: Session, row: Row) -> None:
+        """1件処理する（失敗した場合は例外を送出する）
+
+        Args:
+            session: この行の処理用のセッション（成功時は完了の記録と同じトランザクションでコミット）
+            row: 取得した行（リース取得時点の値）
+        """
+        pass
+
+    def describe(self, row: Row) -> str:
+        """ログに出す行の説明"""
+        return f'{self.label} {row.id}'
+
+    def process_batch(self) -> int:
+        """処理予定時刻を過ぎた行を最大 batch_size 件処理する
+
+        Returns:
+            処理した件数（成功・失敗を含む）
+        """
+        rows = self._claim()
+        for row in rows:
+            self._process(row)
+        return len(rows)
+
+    def start(self) -> None:
+        """バックグラウンドスレッドで処理を開始"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=self.thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """処理を停止（処理中のバッチの完了を待つ）"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            processed = 0
+            try:
+                processed = self.process_batch()
+                self._cleanup_if_due()
+            except Exception:
+                logger.exception(f'{self.thread_name} failed')
+
+            # バッチが埋まっていた場合は残りを続けて処理する
+            if processed < self.batch_size:
+                self._wakeup.wait(self.poll_interval_seconds)
+                self._wakeup.clear()
+
+    def _claim(self) -> list[Row]:
+        """処理する行を処理中にしてリース期限を設定し、コミットして返す
+
+        処理待ちで処理予定時刻を過ぎた行と、リース期限を過ぎた処理中の行が対象。
+        """
+        table = self.model.__table__
+        claimable = (
+            select(table.c.id)
+            .where(
+                or_(
+                    and_(
+                        table.c.status == 'pending',
+                        table.c.next_attempt_at <= func.now(),
+                    ),
+                    and_(
+                        table.c.status == self.in_progress_status,
+                        table.c.locked_until <= func.now(),
+                    ),
+                )
+            )
+            .order_by(
+                table.c.next_attempt_at, table.c[self.created_at_column], table.c.id
+            )
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        with self._session_factory() as session:
+            rows = session.execute(
+                update(table)
+                .where(table.c.id.in_(claimable.scalar_subquery()))
+                .values(
+                    status=self.in_progress_status,
+                    locked_until=func.now() + timedelta(seconds=self.lease_seconds),
+                )
+                .returning(*table.c)
+            ).all()
+            session.commit()
+        return sorted(
+            rows,
+            key=lambda row: (
+                row.next_attempt_at,
+                getattr(row, self.created_at_column),
+                row.id,
+            ),
+        )
+
+    def _process(self, row: Row) -> None:
+        """1件を別のトランザクションで処理し、結果を記録する"""
+        with self._session_factory() as session:
+            try:
+                self.handle(session, row)
+                done = self._record(
+                    session,
+                    row,
+                    status=self.done_status,
+                    last_error=None,
+                    **{self.done_at_column: func.now()},
+                )
+            except Exception as e:
+                session.rollback()
+                error = str(e) or type(e).__name__
+            else:
+                if done:
+                    session.commit()
+                else:
+                    # リースを失っていた（別のワーカーが処理し直している）場合は取り消す
+                    session.rollback()
+                return
+
+            attempts = row.attempts + 1
+            if attempts >= self.max_attempts:
+                logger.error(
+                    f'{self.describe(row)} failed after {attempts} attempts: {error}'
+                )
+                self._record(
+                    session, row, status='failed', attempts=attempts, last_error=error
+                )
+            else:
+                delay = backoff_seconds(
+                    attempts, self.backoff_base_seconds, self.backoff_max_seconds
+                )
+                self._record(
+                    session,
+                    row,
+                    status='pending',
+                    attempts=attempts,
+                    last_error=error,
+                    next_attempt_at=func.now() + timedelta(seconds=delay),
+                )
+            session.commit()
+
+    def _record(self, session: Session, row: Row, **values) -> bool:
+        """処理結果を行に記録し、リースを解放する
+
+        Returns:
+            記録できたか（リース期限が過ぎて別のワーカーが取得し直していた場合はFalse）
+        """
+        table = self.model.__table__
+        result = session.execute(
+            update(table)
+            .where(
+                table.c.id == row.id,
+                table.c.status == self.in_progress_status,
+                table.c.locked_until == row.locked_until,
+            )
+            .values(locked_until=None, **values)
+        )
+        if result.rowcount == 0:
+            logger.warning(
+                f'{self.describe(row)} lease expired before its result was recorded'
+            )
+            return False
+        return True
+
+    def _cleanup_if_due(self) -> None:
+        """保持期間を過ぎた完了・失敗の行を削除（CLEANUP_INTERVAL_SECONDS に1回）"""
+        now = time.monotonic()
+        if self._last_cleanup and now - self._last_cleanup < CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cleanup = now
+        table = self.model.__table__
+        with self._session_factory() as session:
+            session.execute(
+                delete(table).where(
+                    table.c.status.in_((self.done_status, 'failed')),
+                    table.c[self.created_at_column]
+                    < func.now() - timedelta(days=self.retention_days),
+                )
+            )
+            session.commit()
@@ -0,0 +1,44 @@
+"""読み取りクエリの振り分け（プライマリ / リードレプリカ）
+
+読み取り専用セッションは、リードレプリカが設定されていればレプリカに接続する。
+レプリカは数百ms〜数秒遅れることがあるため、書き込み直後の読み取りはプライマリに向ける。
+
+- このプロセスでカタログを更新した直後: pin_primary_reads() で一定時間プライマリに固定する
+  （レプリカの古いデータでカタログキャッシュを作り直さないため）
+- 管理画面で更新した管理者のリクエスト: presentation 側のCookieで判定し、
+  create_read_session(prefer_primary=True) でプライマリを使う
+"""
+
+import threading
+import time
+
+_lock = threading.Lock()
+_pinned_until = 0.0
+# 書き込み後にプライマリへ固定する秒数（レプリカ未設定の場合は0 = 固定しない）
+_read_your_writes_seconds = 0.0
+
+
+def configure_read_routing(read_your_writes_seconds: float) -> None:
+    """リードレプリカを使う場合に、書き込み後にプライマリへ固定する秒数を設定する"""
+    global _read_your_writes_seconds
+    _read_your_writes_seconds = read_your_writes_seconds
+
+
+def pin_primary_reads(seconds: float | None = None) -> None:
+    """このプロセスの読み取りを一定時間プライマリに固定する
+
+    Args:
+        seconds: 固定する秒数（省略時は configure_read_routing で設定した秒数）
+    """
+    global _pinned_until
+    if seconds is None:
+        seconds = _read_your_writes_seconds
+    if seconds <= 0:
+        return
+    with _lock:
+        _pinned_until = max(_pinned_until, time.monotonic() + seconds)
+
+
+def primary_reads_pinned() -> bool:
+    """読み取りをプライマリに固定している期間か"""
+    return time.monotonic() < _pinned_until
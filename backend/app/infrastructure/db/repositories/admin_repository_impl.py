@@ -4,9 +4,12 @@ from datetime import datetime
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.domain.entities.admin import Admin, AdminLog, AdminRole
+from app.domain.entities.page import Page
 from app.domain.repositories.admin_repository import IAdminLogRepository, IAdminRepository
 from app.infrastructure.db.models.admin_model import AdminLogModel, AdminModel
+from app.infrastructure.db.pagination import paginate, paginate_by_created_at
 
 
 class AdminRepositoryImpl(IAdminRepository):
@@ -31,29 +34,15 @@ class AdminRepositoryImpl(IAdminRepository):
         is_active: bool | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Admin]:
-        """管理者一覧を取得"""
+    ) -> Page[Admin]:
+        """管理者一覧を総件数と合わせて取得"""
         query = self.session.query(AdminModel)
         if role is not None:
             query = query.filter(AdminModel.role == role.value)
         if is_active is not None:
             query = query.filter(AdminModel.is_active == is_active)
         query = query.order_by(AdminModel.created_at.desc())
-        models = query.offset(offset).limit(limit).all()
-        return [self._to_entity(m) for m in models]
-
-    def count_all(
-        self,
-        role: AdminRole | None = None,
-        is_active: bool | None = None,
-    ) -> int:
-        """管理者数を取得"""
-        query = self.session.query(AdminModel)
-        if role is not None:
-            query = query.filter(AdminModel.role == role.value)
-        if is_active is not None:
-            query = query.filter(AdminModel.is_active == is_active)
-        return query.count()
+        return paginate(query, self._to_entity, limit=limit, offset=offset)
 
     def create(self, admin: Admin) -> Admin:
         """管理者を作成"""
@@ -159,34 +148,13 @@ class AdminLogRepositoryImpl(IAdminLogRepository):
         date_to: datetime | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[AdminLog]:
-        """操作ログ一覧を取得（フィルタリング対応）"""
-        query = self.session.query(AdminLogModel)
-
-        if admin_id is not None:
-            query = query.filter(AdminLogModel.admin_id == admin_id)
-        if action:
-            query = query.filter(AdminLogModel.action == action)
-        if target_type:
-            query = query.filter(AdminLogModel.target_type == target_type)
-        if date_from:
-            query = query.filter(AdminLogModel.created_at >= date_from)
-        if date_to:
-            query = query.filter(AdminLogModel.created_at <= date_to)
-
-        query = query.order_by(AdminLogModel.created_at.desc())
-        models = query.offset(offset).limit(limit).all()
-        return [self._to_entity(m) for m in models]
+        cursor: str | None = None,
+    ) -> Page[AdminLog]:
+        """操作ログ一覧を総件数と合わせて取得（フィルタリング対応）
 
-    def count_all(
-        self,
-        admin_id: int | None = None,
-        action: str | None = None,
-        target_type: str | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """操作ログ数を取得"""
+        ログは増え続けるため、推定件数が閾値を超える場合は総件数を概算値とする。
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
         query = self.session.query(AdminLogModel)
 
         if admin_id is not None:
@@ -200,7 +168,15 @@ class AdminLogRepositoryImpl(IAdminLogRepository):
         if date_to:
             query = query.filter(AdminLogModel.created_at <= date_to)
 
-        return query.count()
+        return paginate_by_created_at(
+            query,
+            AdminLogModel,
+            self._to_entity,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            estimate_threshold=get_settings().pagination_estimate_threshold,
+        )
 
     def _to_entity(self, model: AdminLogModel) -> AdminLog:
         """モデルをエンティティに変換"""
@@ -0,0 +1,42 @@
+"""顧客別集計リポジトリ実装"""
+
+from sqlalchemy.orm import Session
+
+from app.domain.entities.customer_stats import CustomerStats
+from app.domain.repositories.customer_stats_repository import ICustomerStatsRepository
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+
+
+class CustomerStatsRepositoryImpl(ICustomerStatsRepository):
+    """顧客別集計リポジトリの実装（集計は OrderRepositoryImpl が更新する）"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_user_id(self, user_id: int) -> CustomerStats:
+        """顧客の注文集計を取得（注文がない場合は0件の集計）"""
+        return self.get_by_user_ids([user_id])[user_id]
+
+    def get_by_user_ids(self, user_ids: list[int]) -> dict[int, CustomerStats]:
+        """複数顧客の注文集計を1回のクエリで取得（注文がない顧客は0件の集計）"""
+        stats = {user_id: CustomerStats(user_id=user_id) for user_id in user_ids}
+        if not user_ids:
+            return stats
+
+        models = (
+            self.session.query(CustomerStatsModel)
+            .filter(CustomerStatsModel.user_id.in_(user_ids))
+            .all()
+        )
+        for model in models:
+            stats[model.user_id] = self._to_entity(model)
+        return stats
+
+    def _to_entity(self, model: CustomerStatsModel) -> CustomerStats:
+        """DBモデルをエンティティに変換"""
+        return CustomerStats(
+            user_id=model.user_id,
+            order_count=model.order_count,
+            total_spent=model.total_spent,
+            last_order_at=model.last_order_at,
+        )
@@ -0,0 +1,69 @@
+"""ダッシュボード集計リポジトリ実装"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.dashboard import DashboardSummary
+from app.domain.entities.order import OrderStatus
+from app.domain.repositories.dashboard_repository import IDashboardRepository
+from app.infrastructure.db.models.order_model import OrderModel
+from app.infrastructure.db.models.user_model import UserModel
+
+# 売上に含めない注文ステータス（未払い・キャンセル）
+_EXCLUDED_FROM_SALES = [OrderStatus.PENDING.value, OrderStatus.CANCELLED.value]
+# 対応待ち（審査待ち・再入稿待ち）
+_PENDING_STATUSES = [OrderStatus.REVIEWING.value, OrderStatus.REVISION_REQUIRED.value]
+# 製作中（確定・製作中）
+_PROCESSING_STATUSES = [OrderStatus.CONFIRMED.value, OrderStatus.PROCESSING.value]
+
+
+class DashboardRepositoryImpl(IDashboardRepository):
+    """ダッシュボード集計リポジトリの実装"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_summary(self) -> DashboardSummary:
+        """ダッシュボードの概要を1回のクエリで集計
+
+        注文は本日作成分と対応待ち・製作中のものだけを対象に FILTER 句で数え、
+        今月の新規会員数はスカラーサブクエリで同じ文に含める。
+        """
+        now = datetime.now()
+        today_start = datetime(now.year, now.month, now.day)
+        tomorrow_start = today_start + timedelta(days=1)
+        month_start = datetime(now.year, now.month, 1)
+
+        is_today = and_(
+            OrderModel.created_at >= today_start,
+            OrderModel.created_at < tomorrow_start,
+        )
+        is_today_sale = and_(is_today, OrderModel.status.notin_(_EXCLUDED_FROM_SALES))
+        is_pending = OrderModel.status.in_(_PENDING_STATUSES)
+        is_processing = OrderModel.status.in_(_PROCESSING_STATUSES)
+
+        new_customers = (
+            select(func.count(UserModel.id))
+            .where(UserModel.created_at >= month_start)
+            .scalar_subquery()
+        )
+        statement = select(
+            func.count(OrderModel.id).filter(is_today_sale),
+            func.coalesce(func.sum(OrderModel.total).filter(is_today_sale), 0),
+            func.count(OrderModel.id).filter(is_pending),
+            func.count(OrderModel.id).filter(is_processing),
+            new_customers,
+        ).where(or_(is_today, is_pending, is_processing))
+
+        today_orders, today_revenue, pending, processing, new_customers_count = (
+            self.session.execute(statement).one()
+        )
+        return DashboardSummary(
+            today_orders=today_orders,
+            today_revenue=int(today_revenue),
+            pending_orders=pending,
+            processing_orders=processing,
+            new_customers_this_month=new_customers_count,
+        )
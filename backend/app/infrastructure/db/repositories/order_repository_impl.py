@@ -1,18 +1,29 @@
 """注文リポジトリ実装"""
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import DateTime, cast, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.domain.entities.order import Order, OrderItem, OrderStatus, PaymentMethod
+from app.domain.entities.page import Page
 from app.domain.repositories.order_repository import (
     IOrderItemRepository,
     IOrderRepository,
 )
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.models.daily_sales_model import DailySalesModel
 from app.infrastructure.db.models.order_model import OrderItemModel, OrderModel
+from app.infrastructure.db.models.order_number_counter_model import (
+    OrderNumberCounterModel,
+)
 from app.infrastructure.db.models.user_model import UserModel
+from app.infrastructure.db.pagination import paginate_by_created_at
+
+# 売上・累計購入金額に含めない注文ステータス（未払い・キャンセル）
+_EXCLUDED_FROM_SALES = [OrderStatus.PENDING.value, OrderStatus.CANCELLED.value]
 
 
 class OrderRepositoryImpl(IOrderRepository):
@@ -96,6 +107,8 @@ class OrderRepositoryImpl(IOrderRepository):
             stripe_payment_intent_id=order.stripe_payment_intent_id,
             notes=order.notes,
             admin_notes=order.admin_notes,
+            requires_upload=order.requires_upload,
+            upload_item_count=order.upload_item_count,
         )
 
         self.session.add(order_model)
@@ -112,6 +125,7 @@ class OrderRepositoryImpl(IOrderRepository):
                 unit_price=item.unit_price,
                 options=item.options,
                 subtotal=item.subtotal,
+                upload_requirements=item.upload_requirements,
             )
             self.session.add(item_model)
 
@@ -120,16 +134,39 @@ class OrderRepositoryImpl(IOrderRepository):
         # リレーションをリフレッシュ
         self.session.refresh(order_model)
 
+        self._apply_daily_sales(
+            order_model.created_at.date(),
+            {order_model.status: (1, order_model.total)},
+        )
+        self._apply_customer_stats(
+            order_model.user_id,
+            orders=1,
+            spent=self._spent(order_model.status, order_model.total),
+            ordered_at=order_model.created_at,
+        )
+
         return self._to_entity(order_model)
 
     def update(self, order: Order) -> Order:
-        """注文を更新"""
+        """注文を更新
+
+        更新前のステータス・金額から日次売上集計・顧客別集計の増減を求めるため、
+        注文の行をロックして最新の値を読み直す。Webhookの処理と管理画面の操作が
+        同じ注文を同時に更新しても、同じ遷移の増減が二重に加算されない。
+        """
         order_model = (
-            self.session.query(OrderModel).filter(OrderModel.id == order.id).first()
+            self.session.query(OrderModel)
+            .filter(OrderModel.id == order.id)
+            .with_for_update()
+            .populate_existing()
+            .first()
         )
         if order_model is None:
             raise ValueError(f'Order with id {order.id} not found')
 
+        previous_status = order_model.status
+        previous_total = order_model.total
+
         order_model.status = order.status.value
         order_model.shipping_address_id = order.shipping_address_id
         order_model.subtotal = order.subtotal
@@ -150,41 +187,43 @@ class OrderRepositoryImpl(IOrderRepository):
         order_model.notes = order.notes
         order_model.admin_notes = order.admin_notes
 
+        # ステータス・金額が変わった場合は日次売上集計を付け替える
+        if (previous_status, previous_total) != (order_model.status, order_model.total):
+            deltas = {previous_status: (-1, -previous_total)}
+            current = deltas.get(order_model.status, (0, 0))
+            deltas[order_model.status] = (current[0] + 1, current[1] + order_model.total)
+            self._apply_daily_sales(order_model.created_at.date(), deltas)
+
+            spent = self._spent(order_model.status, order_model.total) - self._spent(
+                previous_status, previous_total
+            )
+            if spent != 0:
+                self._apply_customer_stats(order_model.user_id, orders=0, spent=spent)
+
         self.session.flush()
         return self._to_entity(order_model)
 
     def generate_order_number(self) -> str:
-        """注文番号を生成（ACQ-YYMMDD-XXX形式）"""
-        today = datetime.now()
-        date_part = today.strftime('%y%m%d')
-        prefix = f'ACQ-{date_part}-'
+        """注文番号を生成（ACQ-YYMMDD-XXX形式）
 
-        # 本日の注文数をカウント
-        today_start = datetime(today.year, today.month, today.day)
-        today_end = datetime(today.year, today.month, today.day, 23, 59, 59)
-
-        count = (
-            self.session.query(OrderModel)
-            .filter(OrderModel.created_at >= today_start)
-            .filter(OrderModel.created_at <= today_end)
-            .count()
+        日付ごとのカウンター行を UPDATE ... RETURNING（初回は INSERT）で1つ進める。
+        行ロックにより同時に注文しても番号は重複しない。ロックは注文作成のトランザクションの
+        終了まで保持されるため、ロールバックした場合は番号が欠番にならず再利用される。
+        """
+        today = datetime.now()
+        table = OrderNumberCounterModel.__table__
+        statement = (
+            insert(table)
+            .values(counter_date=today.date(), last_value=1)
+            .on_conflict_do_update(
+                index_elements=[table.c.counter_date],
+                set_={'last_value': table.c.last_value + 1},
+            )
+            .returning(table.c.last_value)
         )
+        sequence = self.session.execute(statement).scalar_one()
 
-        return f'{prefix}{count + 1:03d}'
-
-    def get_total_spent_by_user_id(self, user_id: int) -> int:
-        """ユーザーの累計購入金額を取得（キャンセル・未払いを除く）"""
-        excluded_statuses = [
-            OrderStatus.PENDING.value,
-            OrderStatus.CANCELLED.value,
-        ]
-        result = (
-            self.session.query(func.coalesce(func.sum(OrderModel.total), 0))
-            .filter(OrderModel.user_id == user_id)
-            .filter(OrderModel.status.notin_(excluded_statuses))
-            .scalar()
-        )
-        return int(result)
+        return f'ACQ-{today.strftime("%y%m%d")}-{sequence:03d}'
 
     def get_all(
         self,
@@ -192,48 +231,17 @@ class OrderRepositoryImpl(IOrderRepository):
         status: list[OrderStatus] | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
+        requires_upload: bool | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Order]:
-        """注文一覧を取得（Admin用）"""
-        query = self.session.query(OrderModel).options(joinedload(OrderModel.items))
+        cursor: str | None = None,
+    ) -> Page[Order]:
+        """注文一覧を総件数と合わせて取得（Admin用）
 
-        # 検索（注文番号、顧客名、メールアドレス）
-        if search:
-            search_pattern = f'%{search}%'
-            query = query.join(UserModel, OrderModel.user_id == UserModel.id).filter(
-                or_(
-                    OrderModel.order_number.ilike(search_pattern),
-                    UserModel.name.ilike(search_pattern),
-                    UserModel.email.ilike(search_pattern),
-                )
-            )
-
-        # ステータスフィルタ
-        if status:
-            status_values = [s.value for s in status]
-            query = query.filter(OrderModel.status.in_(status_values))
-
-        # 日付範囲フィルタ
-        if date_from:
-            query = query.filter(OrderModel.created_at >= date_from)
-        if date_to:
-            query = query.filter(OrderModel.created_at <= date_to)
-
-        order_models = (
-            query.order_by(OrderModel.created_at.desc()).offset(offset).limit(limit).all()
-        )
-        return [self._to_entity(model) for model in order_models]
-
-    def count_all(
-        self,
-        search: str | None = None,
-        status: list[OrderStatus] | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """注文数を取得（Admin用）"""
-        query = self.session.query(OrderModel)
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
+        # 明細はLIMIT付きのJOINを避けるためIN句で別途読み込む
+        query = self.session.query(OrderModel).options(selectinload(OrderModel.items))
 
         # 検索（注文番号、顧客名、メールアドレス）
         if search:
@@ -251,13 +259,19 @@ class OrderRepositoryImpl(IOrderRepository):
             status_values = [s.value for s in status]
             query = query.filter(OrderModel.status.in_(status_values))
 
+        # 入稿有無フィルタ
+        if requires_upload is not None:
+            query = query.filter(OrderModel.requires_upload.is_(requires_upload))
+
         # 日付範囲フィルタ
         if date_from:
             query = query.filter(OrderModel.created_at >= date_from)
         if date_to:
             query = query.filter(OrderModel.created_at <= date_to)
 
-        return query.count()
+        return paginate_by_created_at(
+            query, OrderModel, self._to_entity, limit=limit, offset=offset, cursor=cursor
+        )
 
     def get_stats(
         self,
@@ -265,30 +279,30 @@ class OrderRepositoryImpl(IOrderRepository):
         date_to: datetime,
         group_by: str = 'daily',
     ) -> list[dict[str, Any]]:
-        """売上統計を取得"""
-        # キャンセル・未払いを除外
-        excluded_statuses = [
-            OrderStatus.PENDING.value,
-            OrderStatus.CANCELLED.value,
-        ]
-
+        """売上統計を取得（日次売上集計テーブルから集計）"""
+        # date_trunc に DATE を渡すと timestamptz になり、日付の文字列にタイムゾーンが付くため
+        # timestamp に変換してから切り捨てる（週次・月次は 'YYYY-MM-DD 00:00:00' 形式）
+        sales_timestamp = cast(DailySalesModel.sales_date, DateTime)
         if group_by == 'daily':
-            date_expr = func.date(OrderModel.created_at)
+            date_expr = DailySalesModel.sales_date
         elif group_by == 'weekly':
-            date_expr = func.date_trunc('week', OrderModel.created_at)
+            date_expr = func.date_trunc('week', sales_timestamp)
         else:  # monthly
-            date_expr = func.date_trunc('month', OrderModel.created_at)
+            date_expr = func.date_trunc('month', sales_timestamp)
 
+        orders = func.sum(DailySalesModel.orders)
         results = (
             self.session.query(
                 date_expr.label('date'),
-                func.count(OrderModel.id).label('orders'),
-                func.coalesce(func.sum(OrderModel.total), 0).label('revenue'),
+                orders.label('orders'),
+                func.coalesce(func.sum(DailySalesModel.revenue), 0).label('revenue'),
             )
-            .filter(OrderModel.created_at >= date_from)
-            .filter(OrderModel.created_at <= date_to)
-            .filter(OrderModel.status.notin_(excluded_statuses))
+            .filter(DailySalesModel.sales_date >= date_from.date())
+            .filter(DailySalesModel.sales_date <= date_to.date())
+            .filter(DailySalesModel.status.notin_(_EXCLUDED_FROM_SALES))
             .group_by(date_expr)
+            # 注文が別ステータスへ移って0件になった日は含めない
+            .having(orders > 0)
             .order_by(date_expr)
             .all()
         )
@@ -296,63 +310,138 @@ class OrderRepositoryImpl(IOrderRepository):
         return [
             {
                 'date': str(row.date),
-                'orders': row.orders,
+                'orders': int(row.orders),
                 'revenue': int(row.revenue),
             }
             for row in results
         ]
 
-    def get_today_stats(self) -> dict[str, Any]:
-        """本日の統計を取得"""
-        today = datetime.now()
-        today_start = datetime(today.year, today.month, today.day)
-        today_end = datetime(today.year, today.month, today.day, 23, 59, 59)
+    # ===================
+    # 日次売上集計 (Daily Sales)
+    # ===================
+
+    def refresh_daily_sales(
+        self, date_from: date | None = None, date_to: date | None = None
+    ) -> None:
+        """日次売上集計テーブルを orders から再計算する
+
+        初期投入・集計のずれの修正用（通常は注文の作成・更新時に増減される）。
+        期間を省略した場合は全期間を再計算する。
+        """
+        source = select(
+            func.date(OrderModel.created_at),
+            OrderModel.status,
+            func.count(OrderModel.id),
+            func.coalesce(func.sum(OrderModel.total), 0),
+        ).group_by(func.date(OrderModel.created_at), OrderModel.status)
+        clear = delete(DailySalesModel)
+
+        if date_from is not None:
+            source = source.where(
+                OrderModel.created_at >= datetime.combine(date_from, time.min)
+            )
+            clear = clear.where(DailySalesModel.sales_date >= date_from)
+        if date_to is not None:
+            source = source.where(
+                OrderModel.created_at
+                < datetime.combine(date_to + timedelta(days=1), time.min)
+            )
+            clear = clear.where(DailySalesModel.sales_date <= date_to)
 
-        # キャンセル・未払いを除外
-        excluded_statuses = [
-            OrderStatus.PENDING.value,
-            OrderStatus.CANCELLED.value,
-        ]
+        self.session.execute(clear)
+        self.session.execute(
+            insert(DailySalesModel).from_select(
+                ['sales_date', 'status', 'orders', 'revenue'], source
+            )
+        )
 
-        result = (
-            self.session.query(
-                func.count(OrderModel.id).label('orders'),
-                func.coalesce(func.sum(OrderModel.total), 0).label('revenue'),
+    # ===================
+    # 顧客別集計 (Customer Stats)
+    # ===================
+
+    def refresh_customer_stats(self, user_ids: list[int] | None = None) -> None:
+        """顧客別集計テーブルを orders から再計算する
+
+        初期投入・集計のずれの修正用（通常は注文の作成・更新時に増減される）。
+        user_ids を省略した場合は全顧客を再計算する。
+        """
+        is_sale = OrderModel.status.notin_(_EXCLUDED_FROM_SALES)
+        source = select(
+            OrderModel.user_id,
+            func.count(OrderModel.id),
+            func.coalesce(func.sum(OrderModel.total).filter(is_sale), 0),
+            func.max(OrderModel.created_at),
+        ).group_by(OrderModel.user_id)
+        clear = delete(CustomerStatsModel)
+
+        if user_ids is not None:
+            source = source.where(OrderModel.user_id.in_(user_ids))
+            clear = clear.where(CustomerStatsModel.user_id.in_(user_ids))
+
+        self.session.execute(clear)
+        self.session.execute(
+            insert(CustomerStatsModel).from_select(
+                ['user_id', 'order_count', 'total_spent', 'last_order_at'], source
             )
-            .filter(OrderModel.created_at >= today_start)
-            .filter(OrderModel.created_at <= today_end)
-            .filter(OrderModel.status.notin_(excluded_statuses))
-            .first()
         )
 
-        return {
-            'orders': result.orders if result else 0,
-            'revenue': int(result.revenue) if result else 0,
-        }
+    # ===================
+    # Private methods
+    # ===================
 
-    def get_pending_count(self) -> int:
-        """対応待ち注文数を取得（審査待ち・再入稿待ち）"""
-        pending_statuses = [
-            OrderStatus.REVIEWING.value,
-            OrderStatus.REVISION_REQUIRED.value,
-        ]
-        return (
-            self.session.query(OrderModel)
-            .filter(OrderModel.status.in_(pending_statuses))
-            .count()
-        )
+    @staticmethod
+    def _spent(status: str, total: int) -> int:
+        """累計購入金額に計上する金額（キャンセル・未払いは0）"""
+        return 0 if status in _EXCLUDED_FROM_SALES else total
 
-    def get_processing_count(self) -> int:
-        """製作中注文数を取得"""
-        processing_statuses = [
-            OrderStatus.CONFIRMED.value,
-            OrderStatus.PROCESSING.value,
-        ]
-        return (
-            self.session.query(OrderModel)
-            .filter(OrderModel.status.in_(processing_statuses))
-            .count()
+    def _apply_customer_stats(
+        self,
+        user_id: int,
+        orders: int,
+        spent: int,
+        ordered_at: datetime | None = None,
+    ) -> None:
+        """顧客別集計に注文数・累計購入金額の増減を加算する"""
+        table = CustomerStatsModel.__table__
+        statement = insert(table).values(
+            user_id=user_id,
+            order_count=orders,
+            total_spent=spent,
+            last_order_at=ordered_at,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={
+                'order_count': table.c.order_count + statement.excluded.order_count,
+                'total_spent': table.c.total_spent + statement.excluded.total_spent,
+                # GREATEST はNULLを無視する
+                'last_order_at': func.greatest(
+                    table.c.last_order_at, statement.excluded.last_order_at
+                ),
+            },
         )
+        self.session.execute(statement)
+
+    def _apply_daily_sales(
+        self, sales_date: date, deltas: dict[str, tuple[int, int]]
+    ) -> None:
+        """日次売上集計にステータスごとの (件数, 売上) の増減を加算する
+
+        同じ日の注文を並行して更新してもデッドロックしないよう、ステータス順に行を更新する。
+        """
+        table = DailySalesModel.__table__
+        for status, (orders, revenue) in sorted(deltas.items()):
+            statement = insert(table).values(
+                sales_date=sales_date, status=status, orders=orders, revenue=revenue
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.sales_date, table.c.status],
+                set_={
+                    'orders': table.c.orders + statement.excluded.orders,
+                    'revenue': table.c.revenue + statement.excluded.revenue,
+                },
+            )
+            self.session.execute(statement)
 
     def _to_entity(self, order_model: OrderModel) -> Order:
         """DBモデルをエンティティに変換"""
@@ -381,6 +470,8 @@ class OrderRepositoryImpl(IOrderRepository):
             cancel_reason=order_model.cancel_reason,
             notes=order_model.notes,
             admin_notes=order_model.admin_notes,
+            requires_upload=order_model.requires_upload,
+            upload_item_count=order_model.upload_item_count,
             created_at=order_model.created_at,
             updated_at=order_model.updated_at,
             items=[self._item_to_entity(item) for item in order_model.items],
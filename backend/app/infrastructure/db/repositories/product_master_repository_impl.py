@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.domain.entities.product_master import ProductMaster
 from app.domain.repositories.product_master_repository import IProductMasterRepository
+from app.infrastructure.cache.catalog_cache import mark_catalog_dirty
 from app.infrastructure.db.models.product_master_model import ProductMasterModel
 
 
@@ -67,6 +68,7 @@ class ProductMasterRepositoryImpl(IProductMasterRepository):
 
     def create(self, master: ProductMaster) -> ProductMaster:
         """商品マスタを作成"""
+        mark_catalog_dirty(self.session)
         master_model = ProductMasterModel(
             id=master.id,
             name=master.name,
@@ -84,6 +86,7 @@ class ProductMasterRepositoryImpl(IProductMasterRepository):
 
     def update(self, master: ProductMaster) -> ProductMaster:
         """商品マスタを更新"""
+        mark_catalog_dirty(self.session)
         master_model = (
             self.session.query(ProductMasterModel)
             .filter(ProductMasterModel.id == master.id)
@@ -106,6 +109,7 @@ class ProductMasterRepositoryImpl(IProductMasterRepository):
 
     def delete(self, master_id: str) -> bool:
         """商品マスタを削除"""
+        mark_catalog_dirty(self.session)
         master_model = (
             self.session.query(ProductMasterModel)
             .filter(ProductMasterModel.id == master_id)
@@ -1,36 +1,87 @@
 """商品リポジトリ実装"""
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+import re
 
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload, subqueryload
+
+from app.domain.entities.page import Page
 from app.domain.entities.product import (
     Product,
     ProductFaq,
     ProductFeature,
     ProductImage,
+    ProductListItem,
     ProductOption,
     ProductOptionValue,
+    ProductProjection,
     ProductRelation,
     ProductSpec,
+    ProductSummary,
+    ProductVersion,
+    RelatedProduct,
 )
 from app.domain.repositories.product_repository import IProductRepository
+from app.infrastructure.cache.catalog_cache import mark_catalog_dirty
 from app.infrastructure.db.models.product_model import (
     ProductFaqModel,
     ProductFeatureModel,
     ProductImageModel,
+    ProductListViewModel,
     ProductModel,
     ProductOptionModel,
     ProductOptionValueModel,
     ProductRelationModel,
     ProductSpecModel,
 )
+from app.infrastructure.db.pagination import paginate
+
+# リレーションごとのeager load戦略
+# 1対多のコレクションをまとめてjoinedloadすると行数が各コレクション件数の積になるため、
+# コレクションはselectin（IN句による追加SELECT）で読み込む。
+# joinedは1対1・多対1のリレーションにのみ使用する。
+DEFAULT_RELATION_LOAD_STRATEGIES: dict[str, str] = {
+    'images': 'selectin',
+    'options': 'selectin',
+    'options.values': 'selectin',
+    'specs': 'selectin',
+    'features': 'selectin',
+    'faqs': 'selectin',
+    'relations': 'selectin',
+}
+
+# 全文検索に渡す英数字トークン（to_tsqueryの演算子を含まないものに限定する）
+_SEARCH_TOKEN_PATTERN = re.compile(r'[0-9a-z]+')
+
+_LOADERS = {
+    'selectin': selectinload,
+    'subquery': subqueryload,
+    'joined': joinedload,
+}
+
+
+def _escape_like(value: str) -> str:
+    """LIKEのワイルドカード文字をエスケープ"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
 
 
 class ProductRepositoryImpl(IProductRepository):
     """商品リポジトリの実装"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        load_strategies: dict[str, str] | None = None,
+    ):
         self.session = session
+        self.load_strategies = {
+            **DEFAULT_RELATION_LOAD_STRATEGIES,
+            **(load_strategies or {}),
+        }
+        unknown = set(self.load_strategies.values()) - _LOADERS.keys()
+        if unknown:
+            raise ValueError(f'Unknown load strategy: {", ".join(sorted(unknown))}')
 
     # ===================
     # 商品 (Products)
@@ -45,27 +96,56 @@ class ProductRepositoryImpl(IProductRepository):
         offset: int = 0,
     ) -> list[Product]:
         """商品一覧を取得"""
-        query = self.session.query(ProductModel)
-
-        if category_id is not None:
-            query = query.filter(ProductModel.category_id == category_id)
-        if is_active is not None:
-            query = query.filter(ProductModel.is_active == is_active)
-        if is_featured is not None:
-            query = query.filter(ProductModel.is_featured == is_featured)
-
-        query = query.order_by(ProductModel.sort_order, ProductModel.created_at.desc())
-        query = query.offset(offset)
+        query = self._list_query(category_id, is_active, is_featured).offset(offset)
 
         if limit is not None:
             query = query.limit(limit)
 
-        # 画像は一覧でも必要なのでeager load
-        query = query.options(joinedload(ProductModel.images))
-
         products = query.all()
         return [self._to_entity(p, include_relations=False) for p in products]
 
+    def get_page(
+        self,
+        category_id: str | None = None,
+        is_active: bool | None = True,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[Product]:
+        """商品一覧を総件数と合わせて取得"""
+        return paginate(
+            self._list_query(category_id, is_active, is_featured),
+            self._to_list_entity,
+            limit=limit,
+            offset=offset,
+        )
+
+    def get_list_items(
+        self,
+        category_id: str | None = None,
+        is_featured: bool | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Page[ProductListItem]:
+        """公開中の商品カード一覧を総件数と合わせて取得
+
+        商品一覧用の非正規化テーブルを (is_active, category_id, sort_order, created_at)
+        のインデックス順に読むため、画像テーブルとの結合やソートは発生しない。
+        """
+        query = self.session.query(ProductListViewModel).filter(
+            ProductListViewModel.is_active.is_(True)
+        )
+
+        if category_id is not None:
+            query = query.filter(ProductListViewModel.category_id == category_id)
+        if is_featured is not None:
+            query = query.filter(ProductListViewModel.is_featured == is_featured)
+
+        query = query.order_by(
+            ProductListViewModel.sort_order, ProductListViewModel.created_at.desc()
+        )
+        return paginate(query, self._list_item_to_entity, limit=limit, offset=offset)
+
     def get_by_id(
         self, product_id: str, include_relations: bool = True
     ) -> Product | None:
@@ -81,6 +161,92 @@ class ProductRepositoryImpl(IProductRepository):
 
         return self._to_entity(product_model, include_relations=include_relations)
 
+    def get_many_by_ids(
+        self,
+        product_ids: list[str],
+        projection: ProductProjection = ProductProjection.SUMMARY,
+    ) -> dict[str, ProductSummary]:
+        """複数の商品を1クエリで取得（商品IDをキーとする辞書、存在しないIDは含まない）
+
+        必要な列のみをSELECTし、リレーションはロードしない。
+        メイン画像URLは相関サブクエリで同じクエリ内に解決する。
+        """
+        unique_ids = list(dict.fromkeys(product_ids))
+        if not unique_ids:
+            return {}
+
+        columns = [
+            ProductModel.id,
+            ProductModel.name,
+            ProductModel.name_ja,
+            ProductModel.base_price,
+            ProductModel.upload_requirements,
+            ProductModel.is_active,
+        ]
+        if projection == ProductProjection.SUMMARY_WITH_IMAGE:
+            columns.append(self._main_image_url_subquery().label('main_image_url'))
+
+        rows = self.session.query(*columns).filter(ProductModel.id.in_(unique_ids)).all()
+
+        return {
+            row.id: ProductSummary(
+                id=row.id,
+                name=row.name,
+                name_ja=row.name_ja,
+                base_price=row.base_price,
+                upload_requirements=row.upload_requirements,
+                is_active=bool(row.is_active),
+                main_image_url=(
+                    row.main_image_url
+                    if projection == ProductProjection.SUMMARY_WITH_IMAGE
+                    else None
+                ),
+            )
+            for row in rows
+        }
+
+    def get_version(self, product_id: str) -> ProductVersion | None:
+        """商品詳細のバージョン情報を取得（条件付きGET用）
+
+        商品本体の列と、子コレクションごとの「件数:最大ID」を1クエリで取得する。
+        子コレクションは一括更新で削除→再作成されるためIDが変わり、
+        リポジトリ外での変更も検出できる。
+        """
+        collections = {
+            'images': (ProductImageModel, ProductImageModel.product_id),
+            'options': (ProductOptionModel, ProductOptionModel.product_id),
+            'specs': (ProductSpecModel, ProductSpecModel.product_id),
+            'features': (ProductFeatureModel, ProductFeatureModel.product_id),
+            'faqs': (ProductFaqModel, ProductFaqModel.product_id),
+        }
+        columns = [
+            self._collection_stamp(model.id, product_fk == ProductModel.id).label(name)
+            for name, (model, product_fk) in collections.items()
+        ]
+        columns.append(
+            self._collection_stamp(
+                ProductOptionValueModel.id,
+                ProductOptionValueModel.option_id == ProductOptionModel.id,
+                ProductOptionModel.product_id == ProductModel.id,
+            ).label('option_values')
+        )
+
+        row = (
+            self.session.query(ProductModel.is_active, ProductModel.updated_at, *columns)
+            .filter(ProductModel.id == product_id)
+            .first()
+        )
+        if row is None:
+            return None
+
+        child_names = [*collections, 'option_values']
+        return ProductVersion(
+            product_id=product_id,
+            is_active=bool(row.is_active),
+            updated_at=row.updated_at,
+            child_versions={name: getattr(row, name) for name in child_names},
+        )
+
     def get_by_slug(self, slug: str, include_relations: bool = True) -> Product | None:
         """スラッグで商品を取得"""
         query = self.session.query(ProductModel).filter(ProductModel.slug == slug)
@@ -102,30 +268,27 @@ class ProductRepositoryImpl(IProductRepository):
         self,
         keyword: str,
         category_id: str | None = None,
+        is_active: bool | None = True,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Product]:
-        """商品を検索"""
-        query = self.session.query(ProductModel).filter(ProductModel.is_active == True)  # noqa: E712
-
-        # キーワード検索（名前、説明）
-        search_filter = or_(
-            ProductModel.name.ilike(f'%{keyword}%'),
-            ProductModel.name_ja.ilike(f'%{keyword}%'),
-            ProductModel.tagline.ilike(f'%{keyword}%'),
-            ProductModel.description.ilike(f'%{keyword}%'),
-        )
-        query = query.filter(search_filter)
+    ) -> Page[Product]:
+        """商品を関連度順に検索し、総件数と合わせて返す"""
+        search_filter, rank = self._search_clauses(keyword)
+        query = self.session.query(ProductModel).filter(search_filter)
 
         if category_id is not None:
             query = query.filter(ProductModel.category_id == category_id)
+        if is_active is not None:
+            query = query.filter(ProductModel.is_active == is_active)
 
-        query = query.order_by(ProductModel.sort_order, ProductModel.created_at.desc())
-        query = query.offset(offset).limit(limit)
-        query = query.options(joinedload(ProductModel.images))
-
-        products = query.all()
-        return [self._to_entity(p, include_relations=False) for p in products]
+        query = query.order_by(
+            rank.desc(),
+            ProductModel.sort_order,
+            ProductModel.created_at.desc(),
+            ProductModel.id,
+        )
+        query = query.options(self._loader('images')(ProductModel.images))
+        return paginate(query, self._to_list_entity, limit=limit, offset=offset)
 
     def count(
         self,
@@ -134,25 +297,21 @@ class ProductRepositoryImpl(IProductRepository):
         keyword: str | None = None,
     ) -> int:
         """商品数をカウント"""
-        query = self.session.query(ProductModel)
+        query = self.session.query(func.count(ProductModel.id))
 
         if category_id is not None:
             query = query.filter(ProductModel.category_id == category_id)
         if is_active is not None:
             query = query.filter(ProductModel.is_active == is_active)
         if keyword is not None:
-            search_filter = or_(
-                ProductModel.name.ilike(f'%{keyword}%'),
-                ProductModel.name_ja.ilike(f'%{keyword}%'),
-                ProductModel.tagline.ilike(f'%{keyword}%'),
-                ProductModel.description.ilike(f'%{keyword}%'),
-            )
+            search_filter, _ = self._search_clauses(keyword)
             query = query.filter(search_filter)
 
-        return query.count()
+        return query.scalar()
 
     def create(self, product: Product) -> Product:
         """商品を作成"""
+        mark_catalog_dirty(self.session)
         product_model = ProductModel(
             id=product.id,
             category_id=product.category_id,
@@ -175,10 +334,12 @@ class ProductRepositoryImpl(IProductRepository):
         )
         self.session.add(product_model)
         self.session.flush()
+        self.refresh_list_view([product_model.id])
         return self._to_entity(product_model, include_relations=False)
 
     def update(self, product: Product) -> Product:
         """商品を更新"""
+        mark_catalog_dirty(self.session)
         product_model = (
             self.session.query(ProductModel).filter(ProductModel.id == product.id).first()
         )
@@ -204,10 +365,12 @@ class ProductRepositoryImpl(IProductRepository):
         product_model.sort_order = product.sort_order
 
         self.session.flush()
+        self.refresh_list_view([product_model.id])
         return self._to_entity(product_model, include_relations=False)
 
     def delete(self, product_id: str) -> bool:
         """商品を削除"""
+        mark_catalog_dirty(self.session)
         product_model = (
             self.session.query(ProductModel).filter(ProductModel.id == product_id).first()
         )
@@ -245,6 +408,8 @@ class ProductRepositoryImpl(IProductRepository):
 
     def add_image(self, image: ProductImage) -> ProductImage:
         """商品画像を追加"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(image.product_id)
         image_model = ProductImageModel(
             product_id=image.product_id,
             s3_url=image.s3_url,
@@ -254,10 +419,12 @@ class ProductRepositoryImpl(IProductRepository):
         )
         self.session.add(image_model)
         self.session.flush()
+        self.refresh_list_view([image_model.product_id])
         return self._image_to_entity(image_model)
 
     def update_image(self, image: ProductImage) -> ProductImage:
         """商品画像を更新（メタデータのみ: alt, is_main, sort_order）"""
+        mark_catalog_dirty(self.session)
         image_model = (
             self.session.query(ProductImageModel)
             .filter(ProductImageModel.id == image.id)
@@ -265,16 +432,19 @@ class ProductRepositoryImpl(IProductRepository):
         )
         if image_model is None:
             raise ValueError(f'Image with id {image.id} not found')
+        self._touch_product(image_model.product_id)
 
         image_model.alt = image.alt
         image_model.is_main = image.is_main
         image_model.sort_order = image.sort_order
 
         self.session.flush()
+        self.refresh_list_view([image_model.product_id])
         return self._image_to_entity(image_model)
 
     def delete_image(self, image_id: int) -> bool:
         """商品画像を削除"""
+        mark_catalog_dirty(self.session)
         image_model = (
             self.session.query(ProductImageModel)
             .filter(ProductImageModel.id == image_id)
@@ -283,8 +453,11 @@ class ProductRepositoryImpl(IProductRepository):
         if image_model is None:
             return False
 
+        product_id = image_model.product_id
+        self._touch_product(product_id)
         self.session.delete(image_model)
         self.session.flush()
+        self.refresh_list_view([product_id])
         return True
 
     # ===================
@@ -306,6 +479,8 @@ class ProductRepositoryImpl(IProductRepository):
         self, product_id: str, options: list[ProductOption]
     ) -> list[ProductOption]:
         """商品オプションを一括更新（既存を削除して新規作成）"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(product_id)
         # 既存のオプションを削除
         self.session.query(ProductOptionModel).filter(
             ProductOptionModel.product_id == product_id
@@ -357,6 +532,8 @@ class ProductRepositoryImpl(IProductRepository):
         self, product_id: str, specs: list[ProductSpec]
     ) -> list[ProductSpec]:
         """商品スペックを一括更新"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(product_id)
         # 既存のスペックを削除
         self.session.query(ProductSpecModel).filter(
             ProductSpecModel.product_id == product_id
@@ -395,6 +572,8 @@ class ProductRepositoryImpl(IProductRepository):
         self, product_id: str, features: list[ProductFeature]
     ) -> list[ProductFeature]:
         """商品特長を一括更新"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(product_id)
         # 既存の特長を削除
         self.session.query(ProductFeatureModel).filter(
             ProductFeatureModel.product_id == product_id
@@ -431,6 +610,8 @@ class ProductRepositoryImpl(IProductRepository):
 
     def update_faqs(self, product_id: str, faqs: list[ProductFaq]) -> list[ProductFaq]:
         """商品FAQを一括更新"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(product_id)
         # 既存のFAQを削除
         self.session.query(ProductFaqModel).filter(
             ProductFaqModel.product_id == product_id
@@ -455,27 +636,62 @@ class ProductRepositoryImpl(IProductRepository):
     # 関連商品 (Product Relations)
     # ===================
 
-    def get_related_products(self, product_id: str) -> list[Product]:
-        """関連商品を取得"""
-        relations = (
-            self.session.query(ProductRelationModel)
-            .filter(ProductRelationModel.product_id == product_id)
-            .order_by(ProductRelationModel.sort_order)
+    def get_related_products(self, product_id: str) -> list[RelatedProduct] | None:
+        """公開中の関連商品を並び順で取得（商品が存在しない場合はNone）
+
+        元商品 → 関連 → 関連商品を外部結合した1クエリで、元商品の存在確認・
+        公開中の関連商品の列・メイン画像URLをまとめて取得する。
+        """
+        related = aliased(ProductModel, name='related_product')
+        rows = (
+            self.session.query(
+                related.id,
+                related.name,
+                related.name_ja,
+                related.slug,
+                related.base_price,
+                self._main_image_url_subquery(related).label('main_image_url'),
+            )
+            .select_from(ProductModel)
+            .outerjoin(
+                ProductRelationModel,
+                ProductRelationModel.product_id == ProductModel.id,
+            )
+            .outerjoin(
+                related,
+                and_(
+                    related.id == ProductRelationModel.related_product_id,
+                    related.is_active == True,  # noqa: E712
+                ),
+            )
+            .filter(ProductModel.id == product_id)
+            .order_by(ProductRelationModel.sort_order, ProductRelationModel.id)
             .all()
         )
 
-        related_products = []
-        for relation in relations:
-            product = self.get_by_id(relation.related_product_id, include_relations=False)
-            if product and product.is_active:
-                related_products.append(product)
+        # 元商品が存在すれば関連がなくても1行（関連商品列はNULL）返る
+        if not rows:
+            return None
 
-        return related_products
+        return [
+            RelatedProduct(
+                id=row.id,
+                name=row.name,
+                name_ja=row.name_ja,
+                slug=row.slug,
+                base_price=row.base_price,
+                main_image_url=row.main_image_url,
+            )
+            for row in rows
+            if row.id is not None
+        ]
 
     def update_relations(
         self, product_id: str, relations: list[ProductRelation]
     ) -> list[ProductRelation]:
         """関連商品を一括更新"""
+        mark_catalog_dirty(self.session)
+        self._touch_product(product_id)
         # 既存の関連を削除
         self.session.query(ProductRelationModel).filter(
             ProductRelationModel.product_id == product_id
@@ -495,21 +711,183 @@ class ProductRepositoryImpl(IProductRepository):
 
         return result
 
+    # ===================
+    # 商品一覧ビュー (Product List View)
+    # ===================
+
+    def refresh_list_view(self, product_ids: list[str] | None = None) -> None:
+        """商品一覧用の非正規化テーブルを products / product_images から再計算する
+
+        商品・画像の書き込み後に同一トランザクション内で呼び出す。
+        product_ids を省略した場合は全商品を再計算する（シード・一括投入後用）。
+        商品の削除は外部キーの ON DELETE CASCADE で反映される。
+        """
+        source = select(
+            ProductModel.id,
+            ProductModel.category_id,
+            ProductModel.name,
+            ProductModel.name_ja,
+            ProductModel.slug,
+            ProductModel.tagline,
+            ProductModel.base_price,
+            ProductModel.price_note,
+            self._main_image_url_subquery(),
+            ProductModel.is_active,
+            ProductModel.is_featured,
+            ProductModel.sort_order,
+            ProductModel.created_at,
+        )
+        if product_ids is not None:
+            source = source.where(ProductModel.id.in_(product_ids))
+
+        columns = [
+            'product_id',
+            'category_id',
+            'name',
+            'name_ja',
+            'slug',
+            'tagline',
+            'base_price',
+            'price_note',
+            'main_image_url',
+            'is_active',
+            'is_featured',
+            'sort_order',
+            'created_at',
+        ]
+        statement = insert(ProductListViewModel).from_select(columns, source)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ProductListViewModel.product_id],
+            set_={
+                column: statement.excluded[column]
+                for column in columns
+                if column != 'product_id'
+            },
+        )
+        self.session.execute(statement)
+
     # ===================
     # Private methods
     # ===================
 
+    def _collection_stamp(self, id_column, *conditions):
+        """子コレクションの「件数:最大ID」を返す相関スカラーサブクエリ"""
+        return (
+            select(
+                func.concat(
+                    func.count(id_column), ':', func.coalesce(func.max(id_column), 0)
+                )
+            )
+            .where(*conditions)
+            .correlate(ProductModel)
+            .scalar_subquery()
+        )
+
+    def _list_query(
+        self,
+        category_id: str | None,
+        is_active: bool | None,
+        is_featured: bool | None,
+    ):
+        """一覧用のクエリ（フィルタ・並び順・画像のeager load）を組み立てる"""
+        query = self.session.query(ProductModel)
+
+        if category_id is not None:
+            query = query.filter(ProductModel.category_id == category_id)
+        if is_active is not None:
+            query = query.filter(ProductModel.is_active == is_active)
+        if is_featured is not None:
+            query = query.filter(ProductModel.is_featured == is_featured)
+
+        query = query.order_by(ProductModel.sort_order, ProductModel.created_at.desc())
+        # 画像は一覧でも必要なのでeager load
+        return query.options(self._loader('images')(ProductModel.images))
+
+    def _search_clauses(self, keyword: str):
+        """検索条件と関連度スコアの式を組み立てる
+
+        - 部分一致: search_text に対するILIKE（pg_trgm GINインデックスで日本語にも対応）
+        - 全文検索: 英数字トークンの前方一致を search_vector（GINインデックス）で照合
+        関連度は全文検索のランクと、商品名（英語・日本語）とのトライグラム類似度の合計。
+        """
+        keyword = keyword.strip()
+        conditions = [ProductModel.search_text.ilike(f'%{_escape_like(keyword)}%')]
+        rank = func.greatest(
+            func.similarity(ProductModel.name_ja, keyword),
+            func.similarity(ProductModel.name, keyword),
+        )
+
+        tokens = _SEARCH_TOKEN_PATTERN.findall(keyword.lower())
+        if tokens:
+            ts_query = func.to_tsquery(
+                'simple', ' & '.join(f'{token}:*' for token in tokens)
+            )
+            conditions.append(ProductModel.search_vector.op('@@')(ts_query))
+            rank = rank + func.ts_rank_cd(ProductModel.search_vector, ts_query)
+
+        return or_(*conditions), rank
+
+    def _touch_product(self, product_id: str) -> None:
+        """子コレクションの更新時に商品のupdated_atを進める（ETag/Last-Modified用）"""
+        self.session.query(ProductModel).filter(ProductModel.id == product_id).update(
+            {ProductModel.updated_at: func.now()}, synchronize_session=False
+        )
+
+    def _loader(self, relation: str):
+        """リレーションに設定されたロード戦略のローダー関数を返す"""
+        return _LOADERS[self.load_strategies[relation]]
+
     def _add_relation_loads(self, query):
-        """関連データのeager loadを追加"""
+        """関連データのeager loadを追加（戦略はload_strategiesに従う）"""
         return query.options(
-            joinedload(ProductModel.images),
-            joinedload(ProductModel.options).joinedload(ProductOptionModel.values),
-            joinedload(ProductModel.specs),
-            joinedload(ProductModel.features),
-            joinedload(ProductModel.faqs),
-            joinedload(ProductModel.relations),
+            self._loader('images')(ProductModel.images),
+            self._loader('options')(ProductModel.options).options(
+                self._loader('options.values')(ProductOptionModel.values)
+            ),
+            self._loader('specs')(ProductModel.specs),
+            self._loader('features')(ProductModel.features),
+            self._loader('faqs')(ProductModel.faqs),
+            self._loader('relations')(ProductModel.relations),
         )
 
+    def _main_image_url_subquery(self, product=ProductModel):
+        """メイン画像URLを返す相関スカラーサブクエリ
+
+        Product.main_image_url と同じく is_main の画像を優先し、
+        なければ先頭の画像を返す。product には ProductModel のエイリアスも指定できる。
+        """
+        return (
+            select(ProductImageModel.s3_url)
+            .where(ProductImageModel.product_id == product.id)
+            .order_by(
+                ProductImageModel.is_main.desc().nulls_last(),
+                ProductImageModel.sort_order,
+                ProductImageModel.id,
+            )
+            .limit(1)
+            .correlate(product)
+            .scalar_subquery()
+        )
+
+    def _list_item_to_entity(self, model: ProductListViewModel) -> ProductListItem:
+        """一覧ビューのモデルをエンティティに変換"""
+        return ProductListItem(
+            id=model.product_id,
+            category_id=model.category_id,
+            name=model.name,
+            name_ja=model.name_ja,
+            slug=model.slug,
+            tagline=model.tagline,
+            base_price=model.base_price,
+            price_note=model.price_note,
+            is_featured=model.is_featured,
+            main_image_url=model.main_image_url,
+        )
+
+    def _to_list_entity(self, model: ProductModel) -> Product:
+        """一覧用（画像のみ読み込み済み）のモデルをエンティティに変換"""
+        return self._to_entity(model, include_relations=False)
+
     def _to_entity(self, model: ProductModel, include_relations: bool = True) -> Product:
         """DBモデルをエンティティに変換"""
         images = []
@@ -4,9 +4,11 @@ from datetime import datetime
 
 from sqlalchemy.orm import Session
 
+from app.domain.entities.page import Page
 from app.domain.entities.upload import Upload
 from app.domain.repositories.upload_repository import IUploadRepository
 from app.infrastructure.db.models.upload_model import UploadModel
+from app.infrastructure.db.pagination import paginate_by_created_at
 
 
 class UploadRepositoryImpl(IUploadRepository):
@@ -192,8 +194,12 @@ class UploadRepositoryImpl(IUploadRepository):
         date_to: datetime | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[Upload]:
-        """Admin用: 入稿データ一覧を取得（フィルタ・ページネーション対応）"""
+        cursor: str | None = None,
+    ) -> Page[Upload]:
+        """Admin用: 入稿データ一覧を総件数と合わせて取得（フィルタ・ページネーション対応）
+
+        cursor を指定した場合はカーソルページングになり、offset は無視され総件数は返さない。
+        """
         query = self.session.query(UploadModel)
 
         # フィルタ適用
@@ -212,39 +218,6 @@ class UploadRepositoryImpl(IUploadRepository):
         query = query.filter(UploadModel.order_id.isnot(None))
 
         # ソート・ページネーション
-        upload_models = (
-            query.order_by(UploadModel.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        return paginate_by_created_at(
+            query, UploadModel, self._to_entity, limit=limit, offset=offset, cursor=cursor
         )
-
-        return [self._to_entity(m) for m in upload_models]
-
-    def count_all_by_filters(
-        self,
-        status: str | None = None,
-        user_id: int | None = None,
-        order_id: int | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-    ) -> int:
-        """Admin用: フィルタ条件に合致する件数を取得"""
-        query = self.session.query(UploadModel)
-
-        # フィルタ適用
-        if status is not None:
-            query = query.filter(UploadModel.status == status)
-        if user_id is not None:
-            query = query.filter(UploadModel.user_id == user_id)
-        if order_id is not None:
-            query = query.filter(UploadModel.order_id == order_id)
-        if date_from is not None:
-            query = query.filter(UploadModel.created_at >= date_from)
-        if date_to is not None:
-            query = query.filter(UploadModel.created_at <= date_to)
-
-        # 注文に紐付いたもののみ（pending除外）
-        query = query.filter(UploadModel.order_id.isnot(None))
-
-        return query.count()
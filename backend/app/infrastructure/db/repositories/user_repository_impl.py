@@ -1,11 +1,15 @@
 from datetime import datetime
 
-from sqlalchemy import extract, or_
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from app.domain.entities.customer_stats import CustomerSortKey
+from app.domain.entities.page import Page
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
 from app.infrastructure.db.models.user_model import UserModel
+from app.infrastructure.db.pagination import paginate
 
 
 class UserRepositoryImpl(IUserRepository):
@@ -91,27 +95,14 @@ class UserRepositoryImpl(IUserRepository):
     def get_all(
         self,
         search: str | None = None,
+        sort_by: CustomerSortKey = CustomerSortKey.CREATED_AT,
         limit: int = 20,
         offset: int = 0,
-    ) -> list[User]:
-        """ユーザー一覧を取得（検索・ページネーション対応）"""
-        query = self.session.query(UserModel)
+    ) -> Page[User]:
+        """ユーザー一覧を総件数と合わせて取得（検索・並び替え・ページネーション対応）
 
-        if search:
-            search_pattern = f'%{search}%'
-            query = query.filter(
-                or_(
-                    UserModel.email.ilike(search_pattern),
-                    UserModel.name.ilike(search_pattern),
-                )
-            )
-
-        query = query.order_by(UserModel.created_at.desc())
-        user_models = query.offset(offset).limit(limit).all()
-        return [self._to_entity(m) for m in user_models]
-
-    def count_all(self, search: str | None = None) -> int:
-        """ユーザー数を取得"""
+        注文集計で並び替える場合は customer_stats を結合する（注文のない顧客は末尾）。
+        """
         query = self.session.query(UserModel)
 
         if search:
@@ -123,19 +114,14 @@ class UserRepositoryImpl(IUserRepository):
                 )
             )
 
-        return query.count()
+        if sort_by != CustomerSortKey.CREATED_AT:
+            sort_column = getattr(CustomerStatsModel, sort_by.value)
+            query = query.outerjoin(
+                CustomerStatsModel, CustomerStatsModel.user_id == UserModel.id
+            ).order_by(sort_column.desc().nulls_last())
 
-    def count_new_this_month(self) -> int:
-        """今月の新規ユーザー数を取得"""
-        now = datetime.now()
-        return (
-            self.session.query(UserModel)
-            .filter(
-                extract('year', UserModel.created_at) == now.year,
-                extract('month', UserModel.created_at) == now.month,
-            )
-            .count()
-        )
+        query = query.order_by(UserModel.created_at.desc(), UserModel.id.desc())
+        return paginate(query, self._to_entity, limit=limit, offset=offset)
 
     def _to_entity(self, user_model: UserModel) -> User:
         """DBモデルをエンティティに変換"""
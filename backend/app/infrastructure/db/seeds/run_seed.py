@@ -28,6 +28,12 @@ from app.infrastructure.db.models.product_model import (
 )
 from app.infrastructure.db.models.upload_model import UploadModel
 from app.infrastructure.db.models.user_model import UserModel
+from app.infrastructure.db.repositories.order_repository_impl import (
+    OrderRepositoryImpl,
+)
+from app.infrastructure.db.repositories.product_repository_impl import (
+    ProductRepositoryImpl,
+)
 from app.infrastructure.db.seeds.address_seed import ADDRESSES
 from app.infrastructure.db.seeds.cart_seed import CART_ITEMS
 from app.infrastructure.db.seeds.order_seed import ORDERS
@@ -224,6 +230,11 @@ def seed_products(session: Session) -> None:  # noqa: C901
     if skipped_count > 0:
         print(f'  商品画像を {skipped_count} 件スキップしました（画像ファイルなし）')
 
+    # 商品一覧用の非正規化テーブルを再計算
+    ProductRepositoryImpl(session).refresh_list_view()
+    session.commit()
+    print('  商品一覧ビューを更新しました')
+
     # 商品オプションを登録（option_idを保持するためのマッピング）
     option_id_map: dict[str, int] = {}
     for option_data in PRODUCT_OPTIONS:
@@ -513,6 +524,13 @@ def seed_orders(session: Session) -> None:
     print(f'  注文を {order_count} 件登録しました')
     print(f'  注文明細を {item_count} 件登録しました')
 
+    # 売上統計用の日次集計・顧客別集計を再計算
+    order_repository = OrderRepositoryImpl(session)
+    order_repository.refresh_daily_sales()
+    order_repository.refresh_customer_stats()
+    session.commit()
+    print('  日次売上集計・顧客別集計を更新しました')
+
 
 def run_all_seeds() -> None:
     """全シードを実行"""
@@ -1,7 +1,18 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_settings
+from app.infrastructure.db.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolStats,
+    pool_stats,
+)
+from app.infrastructure.db.read_routing import (
+    configure_read_routing,
+    primary_reads_pinned,
+)
 
 settings = get_settings()
 
@@ -13,9 +24,183 @@ db_name = settings.postgres_db
 
 # データベースのURLを設定
 DATABASE_URI = f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{db_name}'
+# 非同期API用（asyncpgドライバ）
+ASYNC_DATABASE_URI = f'postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}'
+
+# プール設定（同期・非同期エンジンで共通。タスクあたりの最大接続数は
+# 2 × (db_pool_size + db_max_overflow) × uvicornワーカー数 になる）
+POOL_OPTIONS = {
+    'pool_size': settings.db_pool_size,
+    'max_overflow': settings.db_max_overflow,
+    'pool_timeout': settings.db_pool_timeout_seconds,
+    'pool_recycle': settings.db_pool_recycle_seconds,
+    'pool_pre_ping': settings.db_pool_pre_ping,
+}
 
 # エンジンの作成
-engine = create_engine(DATABASE_URI, pool_size=10, max_overflow=20, echo=False)
+engine = create_engine(
+    DATABASE_URI,
+    poolclass=InstrumentedQueuePool,
+    echo=False,
+    **POOL_OPTIONS,
+)
 
 # セッションの作成
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 非同期エンジン・セッションの作成（カタログ・カート・注文APIで使用）
+# コミット後に属性へアクセスしても暗黙のI/Oが発生しないよう expire_on_commit=False
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URI,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    echo=False,
+    **POOL_OPTIONS,
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# 読み取り専用セッション（Session.info[READ_ONLY] が True）
+# AUTOCOMMITで実行するため BEGIN / COMMIT の往復が発生しない。
+# 複数の文の間で同一スナップショットは保証されないため、一貫性が必要な読み取りには使わない。
+READ_ONLY = 'read_only'
+ReadSessionLocal = sessionmaker(
+    autoflush=False,
+    bind=engine.execution_options(isolation_level='AUTOCOMMIT'),
+    info={READ_ONLY: True},
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_engine.execution_options(isolation_level='AUTOCOMMIT'),
+    autoflush=False,
+    expire_on_commit=False,
+    info={READ_ONLY: True},
+)
+
+# リードレプリカ（postgres_replica_host が設定されている場合のみ）
+# 読み取り専用セッションの接続先を create_read_session() で振り分ける
+replica_engine = None
+async_replica_engine = None
+ReplicaSessionLocal = ReadSessionLocal
+AsyncReplicaSessionLocal = AsyncReadSessionLocal
+if settings.postgres_replica_host:
+    replica_host = settings.postgres_replica_host
+    replica_port = settings.postgres_replica_port
+    REPLICA_DATABASE_URI = (
+        f'postgresql+psycopg2://{user}:{password}@{replica_host}:{replica_port}/{db_name}'
+    )
+    ASYNC_REPLICA_DATABASE_URI = (
+        f'postgresql+asyncpg://{user}:{password}@{replica_host}:{replica_port}/{db_name}'
+    )
+    replica_engine = create_engine(
+        REPLICA_DATABASE_URI,
+        poolclass=InstrumentedQueuePool,
+        isolation_level='AUTOCOMMIT',
+        echo=False,
+        **POOL_OPTIONS,
+    )
+    async_replica_engine = create_async_engine(
+        ASYNC_REPLICA_DATABASE_URI,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        isolation_level='AUTOCOMMIT',
+        echo=False,
+        **POOL_OPTIONS,
+    )
+    ReplicaSessionLocal = sessionmaker(
+        autoflush=False, bind=replica_engine, info={READ_ONLY: True}
+    )
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        bind=async_replica_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        info={READ_ONLY: True},
+    )
+    configure_read_routing(settings.replica_read_your_writes_seconds)
+
+
+def create_read_session(prefer_primary: bool = False) -> Session:
+    """読み取り専用セッションを作成（レプリカがあればレプリカ、書き込み直後はプライマリ）
+
+    Args:
+        prefer_primary: 自分の書き込みを読む必要があるリクエストの場合True
+    """
+    if prefer_primary or primary_reads_pinned():
+        return ReadSessionLocal()
+    return ReplicaSessionLocal()
+
+
+def create_async_read_session(prefer_primary: bool = False) -> AsyncSession:
+    """読み取り専用の非同期セッションを作成（振り分けは create_read_session と同じ）"""
+    if prefer_primary or primary_reads_pinned():
+        return AsyncReadSessionLocal()
+    return AsyncReplicaSessionLocal()
+
+
+# リクエストのセッションに設定する文の実行時間の上限（Session.info のキー）
+STATEMENT_TIMEOUT_MS = 'statement_timeout_ms'
+# 接続に statement_timeout を設定した読み取り専用セッションの接続（Session.info のキー）
+_TIMEOUT_CONNECTION = 'statement_timeout_connection'
+
+
+def set_request_statement_timeout(session: Session | AsyncSession) -> None:
+    """APIリクエストのセッションに文の実行時間の上限を設定する
+
+    バッチ・バックグラウンド処理のセッション（SessionLocal を直接使うもの）には設定しないため、
+    日次売上集計の再計算のような長時間の文は打ち切られない。
+    """
+    if settings.db_statement_timeout_ms > 0:
+        session.info[STATEMENT_TIMEOUT_MS] = settings.db_statement_timeout_ms
+
+
+def reset_statement_timeout(session: Session) -> None:
+    """読み取り専用セッションの接続に設定した statement_timeout を戻す（クローズ前に呼ぶ）"""
+    connection = session.info.pop(_TIMEOUT_CONNECTION, None)
+    if connection is None:
+        return
+    try:
+        connection.exec_driver_sql('RESET statement_timeout')
+    except Exception:
+        # 設定を戻せなかった接続は他の処理で使われないようプールに戻さない
+        connection.invalidate()
+
+
+@event.listens_for(Session, 'after_begin')
+def _apply_statement_timeout(session: Session, transaction, connection) -> None:
+    """リクエストのセッションが接続を使い始めたときに statement_timeout を設定する
+
+    通常のセッションは SET LOCAL でトランザクションの終了時に自動で元に戻す。
+    読み取り専用セッションは AUTOCOMMIT のため SET LOCAL が効かず、接続に設定して
+    reset_statement_timeout で戻す。
+    """
+    timeout_ms = session.info.get(STATEMENT_TIMEOUT_MS)
+    if not timeout_ms or connection.dialect.name != 'postgresql':
+        return
+    if session.info.get(READ_ONLY):
+        connection.exec_driver_sql(f'SET statement_timeout = {int(timeout_ms)}')
+        session.info[_TIMEOUT_CONNECTION] = connection
+    else:
+        connection.exec_driver_sql(f'SET LOCAL statement_timeout = {int(timeout_ms)}')
+
+
+@event.listens_for(Session, 'before_flush')
+def _reject_read_only_flush(session: Session, flush_context, instances) -> None:
+    """読み取り専用セッションでの書き込み（flush）を禁止する"""
+    if session.info.get(READ_ONLY):
+        raise RuntimeError('Cannot flush changes on a read-only session.')
+
+
+def get_pool_stats() -> list[PoolStats]:
+    """コネクションプール統計（このプロセス分・レプリカがあればレプリカも）"""
+    stats = [
+        pool_stats('sync', engine.pool, settings.db_max_overflow),
+        pool_stats('async', async_engine.sync_engine.pool, settings.db_max_overflow),
+    ]
+    if replica_engine is not None and async_replica_engine is not None:
+        stats += [
+            pool_stats('replica_sync', replica_engine.pool, settings.db_max_overflow),
+            pool_stats(
+                'replica_async',
+                async_replica_engine.sync_engine.pool,
+                settings.db_max_overflow,
+            ),
+        ]
+    return stats
@@ -1,5 +1,7 @@
 """メールサービス"""
 
+from app.infrastructure.email.email_outbox_impl import EmailOutboxImpl
+from app.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
 from app.infrastructure.email.resend_email_service import ResendEmailService
 
-__all__ = ['ResendEmailService']
+__all__ = ['EmailOutboxDispatcher', 'EmailOutboxImpl', 'ResendEmailService']
@@ -0,0 +1,56 @@
+"""メール送信キュー（アウトボックス）の実装"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.email_outbox import EmailKind, IEmailOutbox
+from app.infrastructure.db.models.email_outbox_model import EmailOutboxModel
+from app.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+
+_ENQUEUED_KEY = 'email_outbox_enqueued'
+
+
+class EmailOutboxImpl(IEmailOutbox):
+    """email_outbox テーブルにリクエストのセッションで記録する"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def enqueue(
+        self,
+        kind: EmailKind,
+        to_email: str,
+        payload: dict[str, Any],
+        dedupe_key: str | None = None,
+    ) -> None:
+        """メールを送信キューに記録（dedupe_key が記録済みの場合は何もしない）"""
+        statement = (
+            insert(EmailOutboxModel)
+            .values(
+                kind=kind.value,
+                to_email=to_email,
+                payload=payload,
+                dedupe_key=dedupe_key,
+                status='pending',
+                attempts=0,
+            )
+            .on_conflict_do_nothing(index_elements=[EmailOutboxModel.dedupe_key])
+        )
+        self.session.execute(statement)
+        self.session.info[_ENQUEUED_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _notify_on_commit(session: Session) -> None:
+    """メールを記録したトランザクションのコミット後に配信処理を起こす"""
+    if session.info.pop(_ENQUEUED_KEY, False):
+        EmailOutboxDispatcher.notify()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session: Session) -> None:
+    """ロールバックされた記録では配信処理を起こさない"""
+    session.info.pop(_ENQUEUED_KEY, None)
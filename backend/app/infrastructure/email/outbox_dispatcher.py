@@ -0,0 +1,86 @@
+"""メール送信キュー（アウトボックス）の配信処理
+
+email_outbox テーブルの送信待ちメールをバックグラウンドスレッドで送信する。
+取得・リース・再送・削除の仕組みは QueueWorker を参照。
+
+- 送信（Resend APIの呼び出し）は送信中（sending）としてコミットした後、
+  トランザクションの外で行う。送信中にプロセスが停止した場合に再送されるのは
+  送信中だった1件のみ
+- メールを記録したトランザクションのコミット時に EmailOutboxDispatcher.notify() で起こされる
+- 送信済み・失敗の行は retention_days を過ぎたら削除する
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.email_outbox import EmailKind, send_queued_email
+from app.application.interfaces.email_service import IEmailService
+from app.config import get_settings
+from app.infrastructure.db.models.email_outbox_model import EmailOutboxModel
+from app.infrastructure.db.queue_worker import QueueWorker
+from app.infrastructure.email.resend_email_service import ResendEmailService
+
+
+class EmailSendError(Exception):
+    """メールサービスが送信失敗を返した"""
+
+
+class EmailOutboxDispatcher(QueueWorker):
+    """送信待ちのメールを IEmailService で送信する"""
+
+    model = EmailOutboxModel
+    in_progress_status = 'sending'
+    done_status = 'sent'
+    done_at_column = 'sent_at'
+    created_at_column = 'created_at'
+    thread_name = 'email-outbox-dispatcher'
+    label = 'Email'
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        email_service: IEmailService,
+        **options,
+    ):
+        """
+        Args:
+            session_factory: セッションを生成する関数
+            email_service: 送信に使うメールサービス
+            **options: QueueWorker の設定（batch_size, max_attempts 等）
+        """
+        super().__init__(session_factory, **options)
+        self._email_service = email_service
+
+    def handle(self, session: Session, row: Row) -> None:
+        """1件送信する（セッションは使わないため、送信中に接続を保持しない）"""
+        sent = send_queued_email(
+            self._email_service, EmailKind(row.kind), row.to_email, row.payload
+        )
+        if not sent:
+            raise EmailSendError('send failed')
+
+    def describe(self, row: Row) -> str:
+        return f'Email {row.id} ({row.kind}) to {row.to_email}'
+
+
+@lru_cache
+def get_email_outbox_dispatcher() -> EmailOutboxDispatcher:
+    """設定から EmailOutboxDispatcher を生成（プロセス内で1つ）"""
+    # DBエンジンは配信処理を使う場合だけ生成する
+    from app.infrastructure.db.session import SessionLocal
+
+    settings = get_settings()
+    return EmailOutboxDispatcher(
+        session_factory=SessionLocal,
+        email_service=ResendEmailService(),
+        batch_size=settings.email_outbox_batch_size,
+        max_attempts=settings.email_outbox_max_attempts,
+        backoff_base_seconds=settings.email_outbox_backoff_base_seconds,
+        backoff_max_seconds=settings.email_outbox_backoff_max_seconds,
+        poll_interval_seconds=settings.email_outbox_poll_interval_seconds,
+        retention_days=settings.email_outbox_retention_days,
+        lease_seconds=settings.email_outbox_lease_seconds,
+    )
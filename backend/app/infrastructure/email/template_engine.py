@@ -0,0 +1,234 @@
+"""メールテンプレートの事前コンパイル
+
+templates/ のテンプレートを起動時に1度だけ読み込み、固定部分（文字列の断片）と
+差し込み位置に分解しておく。送信時は値を差し込んで連結するだけで、
+テンプレートの解析や f-string の組み立てを繰り返さない。
+
+テンプレートの記法:
+    {{ name }}    値をHTMLエスケープして差し込む（テキスト版・件名ではエスケープしない）
+    {{{ name }}}  値をそのまま差し込む（描画済みのHTML断片用）
+
+- HTML版は layout.html の {{{ body }}} に各メールの本文を埋め込んでからコンパイルする
+- frontend_url など送信ごとに変わらない値はコンパイル時に固定部分へ畳み込む
+- HTML版とあわせてテキスト版（*.txt）を描画し、multipart のメールとして送信する
+- 同じテンプレートで多数の宛先に送る場合は render_many で一括描画する
+
+使用例:
+    templates = get_email_templates()
+    email = templates.render('verification', {'verification_url': url})
+    emails = templates.render_many('welcome', [{'display_name': name}, ...])
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+# 件名（本文と同じ記法。エスケープはしない）
+SUBJECTS = {
+    'verification': '【ACRIQUE】メールアドレスの確認',
+    'password_reset': '【ACRIQUE】パスワードリセットのご案内',
+    'welcome': '【ACRIQUE】会員登録ありがとうございます',
+    'order_confirmation': '【ACRIQUE】ご注文ありがとうございます（{{ order_number }}）',
+}
+
+# 件名を持たない部品テンプレート（一覧の1行など）
+PARTIALS = ('order_item',)
+
+_PLACEHOLDER = re.compile(r'\{\{\{\s*(\w+)\s*\}\}\}|\{\{\s*(\w+)\s*\}\}')
+
+
+class CompiledTemplate:
+    """固定部分と差し込み位置に分解済みのテンプレート
+
+    コンパイル時にテンプレートごとの描画関数を生成する。
+    描画関数は固定部分と差し込み値を1つの f-string で連結するだけなので、
+    描画のたびにテンプレートを走査しない。
+    """
+
+    def __init__(
+        self,
+        source: str,
+        autoescape: bool = True,
+        static: Mapping[str, Any] | None = None,
+    ):
+        """
+        Args:
+            source: テンプレート文字列
+            autoescape: {{ name }} の値をHTMLエスケープするか
+            static: コンパイル時に固定部分へ畳み込む値
+        """
+        static = static or {}
+        fragments = ['']
+        slots: list[tuple[str, bool]] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            fragments[-1] += source[position : match.start()]
+            position = match.end()
+            raw_name, name = match.groups()
+            should_escape = autoescape and raw_name is None
+            name = raw_name or name
+            if name in static:
+                value = str(static[name])
+                fragments[-1] += escape(value) if should_escape else value
+                continue
+            slots.append((name, should_escape))
+            fragments.append('')
+        fragments[-1] += source[position:]
+
+        self.placeholders = frozenset(name for name, _ in slots)
+        self._render, self._render_many = _build_renderers(fragments, slots)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """値を差し込んだ文字列を返す（値が足りない場合は KeyError）"""
+        return self._render(values)
+
+    def render_many(self, values_list: Iterable[Mapping[str, Any]]) -> list[str]:
+        """複数の値の組を1回の内包表記で描画する"""
+        return self._render_many(values_list)
+
+
+def _build_renderers(
+    fragments: list[str], slots: list[tuple[str, bool]]
+) -> tuple[
+    Callable[[Mapping[str, Any]], str],
+    Callable[[Iterable[Mapping[str, Any]]], list[str]],
+]:
+    """固定部分と差し込み位置から render / render_many 関数を生成
+
+    固定部分は生成する関数のグローバル変数として渡し、コードには埋め込まない。
+    （テンプレート中の波括弧や引用符をエスケープする必要がない）
+    """
+    namespace: dict[str, Any] = {'_escape': escape, '_str': str}
+    parts = []
+    for index, fragment in enumerate(fragments):
+        if fragment:
+            namespace[f'_f{index}'] = fragment
+            parts.append(f'{{_f{index}}}')
+        if index < len(slots):
+            name, should_escape = slots[index]
+            value = f'values["{name}"]'
+            parts.append(
+                f'{{_escape(_str({value}))}}' if should_escape else f'{{{value}}}'
+            )
+    body = "f'" + ''.join(parts) + "'"
+    code = (
+        f'def render(values):\n    return {body}\n'
+        f'def render_many(values_list):\n'
+        f'    return [{body} for values in values_list]\n'
+    )
+    exec(compile(code, '<email-template>', 'exec'), namespace)  # noqa: S102
+    return namespace['render'], namespace['render_many']
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    """描画済みのメール"""
+
+    subject: str
+    html: str
+    text: str
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    """1種類のメールの件名・HTML版・テキスト版"""
+
+    subject: CompiledTemplate
+    html: CompiledTemplate
+    text: CompiledTemplate
+
+    def render(self, values: Mapping[str, Any]) -> RenderedEmail:
+        return RenderedEmail(
+            subject=self.subject.render(values),
+            html=self.html.render(values),
+            text=self.text.render(values),
+        )
+
+
+class EmailTemplates:
+    """テンプレートディレクトリを読み込み、全テンプレートをコンパイルして保持する"""
+
+    def __init__(
+        self,
+        template_dir: Path = TEMPLATE_DIR,
+        static: Mapping[str, Any] | None = None,
+    ):
+        """
+        Args:
+            template_dir: テンプレートのディレクトリ
+            static: 全テンプレート共通でコンパイル時に畳み込む値（frontend_url など）
+        """
+        layout = (template_dir / 'layout.html').read_text(encoding='utf-8')
+
+        self._templates: dict[str, EmailTemplate] = {}
+        for name, subject in SUBJECTS.items():
+            body = (template_dir / f'{name}.html').read_text(encoding='utf-8')
+            self._templates[name] = EmailTemplate(
+                subject=CompiledTemplate(subject, autoescape=False, static=static),
+                html=CompiledTemplate(
+                    layout.replace('{{{ body }}}', body.rstrip('\n')), static=static
+                ),
+                text=self._compile_text(template_dir, name, static),
+            )
+
+        self._partials: dict[str, tuple[CompiledTemplate, CompiledTemplate]] = {
+            name: (
+                CompiledTemplate(
+                    (template_dir / f'{name}.html').read_text(encoding='utf-8'),
+                    static=static,
+                ),
+                self._compile_text(template_dir, name, static),
+            )
+            for name in PARTIALS
+        }
+
+    def render(self, name: str, values: Mapping[str, Any]) -> RenderedEmail:
+        """メールを描画"""
+        return self._templates[name].render(values)
+
+    def render_many(
+        self, name: str, values_list: Iterable[Mapping[str, Any]]
+    ) -> list[RenderedEmail]:
+        """同じ種類のメールを宛先ごとの値でまとめて描画（一斉送信用）"""
+        values_list = list(values_list)
+        template = self._templates[name]
+        return [
+            RenderedEmail(subject=subject, html=html, text=text)
+            for subject, html, text in zip(
+                template.subject.render_many(values_list),
+                template.html.render_many(values_list),
+                template.text.render_many(values_list),
+                strict=True,
+            )
+        ]
+
+    def render_rows(
+        self, name: str, values_list: Iterable[Mapping[str, Any]]
+    ) -> tuple[str, str]:
+        """部品テンプレートで一覧を描画し、(HTML, テキスト) の断片を返す"""
+        values_list = list(values_list)
+        html, text = self._partials[name]
+        return ''.join(html.render_many(values_list)), ''.join(
+            text.render_many(values_list)
+        )
+
+    @staticmethod
+    def _compile_text(
+        template_dir: Path, name: str, static: Mapping[str, Any] | None
+    ) -> CompiledTemplate:
+        source = (template_dir / f'{name}.txt').read_text(encoding='utf-8')
+        return CompiledTemplate(source, autoescape=False, static=static)
+
+
+@lru_cache
+def get_email_templates() -> EmailTemplates:
+    """コンパイル済みのメールテンプレートを取得（プロセス内で1つ）"""
+    return EmailTemplates(static={'frontend_url': get_settings().frontend_url})
@@ -3,10 +3,11 @@
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, Request, status
-from jose import JWTError, jwt
+from jose import JWTError
 from pydantic import BaseModel, Field
 
 from app.config import get_settings
+from app.infrastructure.security.jwt_key_manager import get_jwt_key_manager
 
 
 class AdminAuth(BaseModel):
@@ -16,14 +17,6 @@ class AdminAuth(BaseModel):
     role: str = Field(..., description='権限')
 
 
-def _load_rsa_keys() -> tuple[bytes, bytes]:
-    """RSA鍵ペアを環境変数から読み込み"""
-    settings = get_settings()
-    jwt_private_key = settings.jwt_private_key.replace('\\n', '\n').encode('utf-8')
-    jwt_public_key = settings.jwt_public_key.replace('\\n', '\n').encode('utf-8')
-    return jwt_private_key, jwt_public_key
-
-
 def create_admin_access_token(
     admin_id: int,
     role: str,
@@ -39,7 +32,6 @@ def create_admin_access_token(
     Returns:
         JWTアクセストークン
     """
-    settings = get_settings()
     expire = datetime.utcnow() + (expires_delta or timedelta(hours=8))
     to_encode = {
         'admin_id': admin_id,
@@ -47,9 +39,7 @@ def create_admin_access_token(
         'exp': expire,
         'type': 'admin',  # ユーザートークンと区別
     }
-    private_key, _ = _load_rsa_keys()
-    encoded_jwt = jwt.encode(to_encode, private_key, algorithm=settings.jwt_algorithm)
-    return encoded_jwt if isinstance(encoded_jwt, str) else encoded_jwt.decode('utf-8')
+    return get_jwt_key_manager().encode(to_encode)
 
 
 def get_current_admin_from_cookie(request: Request) -> AdminAuth:
@@ -83,8 +73,7 @@ def get_current_admin_from_cookie(request: Request) -> AdminAuth:
     )
 
     try:
-        _, public_key = _load_rsa_keys()
-        payload = jwt.decode(token, public_key, algorithms=[settings.jwt_algorithm])
+        payload = get_jwt_key_manager().decode(token)
 
         # 管理者トークンかどうか確認
         if payload.get('type') != 'admin':
@@ -0,0 +1,160 @@
+"""JWT署名鍵の管理
+
+PEM形式の鍵は起動後に1度だけパースし、署名・検証では解析済みの鍵オブジェクトを使う。
+（リクエストごとにPEMを解析すると、検証で数百μs、署名で数十msかかる）
+
+鍵のローテーション:
+    新しい鍵ペアを JWT_PRIVATE_KEY / JWT_PUBLIC_KEY / JWT_KEY_ID に設定し、
+    旧公開鍵を JWT_ADDITIONAL_PUBLIC_KEYS（{"kid": "PEM"} のJSON）に残しておく。
+    新規トークンは新しい kid で署名され、旧 kid のトークンも有効期限まで検証できる。
+    kid ヘッダーのないトークン（ローテーション導入前に発行したもの）は現在の公開鍵で検証する。
+
+検証済みトークンのクレームは短時間キャッシュし、同じCookieでの連続リクエストでは
+署名検証を省略する（トークンの有効期限を超えてキャッシュすることはない）。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from jose import JWTError, jwk, jwt
+
+from app.config import get_settings
+
+ALGORITHM = 'RS256'
+
+
+class JwtKeyManager:
+    """解析済みのRSA鍵によるJWTの署名・検証"""
+
+    def __init__(
+        self,
+        private_key_pem: bytes,
+        key_id: str,
+        public_keys_pem: dict[str, bytes],
+        claims_cache_ttl_seconds: float = 30.0,
+        claims_cache_max_entries: int = 10_000,
+    ):
+        """
+        Args:
+            private_key_pem: 署名用の秘密鍵（PEM）
+            key_id: 署名用の鍵のID（トークンの kid ヘッダーに設定）
+            public_keys_pem: 検証に使う公開鍵（kid → PEM）。key_id の公開鍵を含むこと
+            claims_cache_ttl_seconds: 検証済みクレームをキャッシュする秒数（0で無効）
+            claims_cache_max_entries: キャッシュする最大トークン数
+        """
+        if key_id not in public_keys_pem:
+            raise ValueError(f'Public key for kid "{key_id}" is required.')
+
+        self.key_id = key_id
+        self._private_key = jwk.construct(private_key_pem, ALGORITHM)
+        self._public_keys = {
+            kid: jwk.construct(pem, ALGORITHM) for kid, pem in public_keys_pem.items()
+        }
+        self._cache_ttl = claims_cache_ttl_seconds
+        self._cache_max_entries = claims_cache_max_entries
+        # token -> (クレーム, キャッシュの有効期限[UNIX時刻])
+        self._claims_cache: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        """クレームに署名してトークンを生成"""
+        return jwt.encode(
+            claims, self._private_key, algorithm=ALGORITHM, headers={'kid': self.key_id}
+        )
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """トークンを検証してクレームを返す
+
+        Raises:
+            JWTError: 署名・有効期限が不正、または kid が未知の場合
+        """
+        now = time.time()
+        cached = self._get_cached(token, now)
+        if cached is not None:
+            return cached
+
+        kid = jwt.get_unverified_header(token).get('kid', self.key_id)
+        public_key = self._public_keys.get(kid)
+        if public_key is None:
+            raise JWTError(f'Unknown key id: {kid}')
+
+        claims = jwt.decode(token, public_key, algorithms=[ALGORITHM])
+        self._put_cached(token, claims, now)
+        return claims
+
+    def clear_cache(self) -> None:
+        """検証済みクレームのキャッシュを破棄"""
+        with self._lock:
+            self._claims_cache.clear()
+
+    def _get_cached(self, token: str, now: float) -> dict[str, Any] | None:
+        if self._cache_ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._claims_cache.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= now:
+                del self._claims_cache[token]
+                return None
+            self._claims_cache.move_to_end(token)
+            return claims
+
+    def _put_cached(self, token: str, claims: dict[str, Any], now: float) -> None:
+        if self._cache_ttl <= 0:
+            return
+        expires_at = now + self._cache_ttl
+        exp = claims.get('exp')
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, exp)
+        with self._lock:
+            self._claims_cache[token] = (claims, expires_at)
+            self._claims_cache.move_to_end(token)
+            while len(self._claims_cache) > self._cache_max_entries:
+                self._claims_cache.popitem(last=False)
+
+
+def load_rsa_keys() -> tuple[bytes, bytes]:
+    """RSA鍵ペア（PEM）を環境変数から読み込み"""
+    settings = get_settings()
+
+    jwt_private_key = settings.jwt_private_key
+    if not jwt_private_key:
+        raise ValueError('JWT_PRIVATE_KEY is required for RS256.')
+
+    jwt_public_key = settings.jwt_public_key
+    if not jwt_public_key:
+        raise ValueError('JWT_PUBLIC_KEY is required for RS256.')
+
+    return _to_pem(jwt_private_key), _to_pem(jwt_public_key)
+
+
+@lru_cache
+def get_jwt_key_manager() -> JwtKeyManager:
+    """設定から JwtKeyManager を生成（プロセス内で1つ）"""
+    settings = get_settings()
+    if settings.jwt_algorithm != ALGORITHM:
+        raise ValueError(f'Unsupported JWT algorithm: {settings.jwt_algorithm}')
+
+    private_key, public_key = load_rsa_keys()
+    public_keys = {
+        kid: _to_pem(pem) for kid, pem in settings.jwt_additional_public_keys.items()
+    }
+    public_keys[settings.jwt_key_id] = public_key
+
+    return JwtKeyManager(
+        private_key_pem=private_key,
+        key_id=settings.jwt_key_id,
+        public_keys_pem=public_keys,
+        claims_cache_ttl_seconds=settings.jwt_claims_cache_ttl_seconds,
+        claims_cache_max_entries=settings.jwt_claims_cache_max_entries,
+    )
+
+
+def _to_pem(value: str) -> bytes:
+    """環境変数の鍵文字列（改行が \\n でエスケープされたもの）をPEMに変換"""
+    return value.replace('\\n', '\n').encode('utf-8')
@@ -0,0 +1,232 @@
+"""パスワードハッシュ処理のワーカープール
+
+bcryptの計算（1回あたり数百ms）をリクエストスレッドで行うと、ログインが集中したときに
+APIワーカー全体のCPUを奪うため、専用のプロセスプールで実行する。
+
+- 同時に受け付ける件数は「ワーカー数 + 待ち行列の上限」まで。上限に達した場合は
+  queue_timeout_seconds だけ空きを待ち、それでも空かなければ ServiceBusyError を送出する
+- 待ち行列の長さ・処理時間などの統計は stats() で取得できる（Admin API で公開）
+- bcrypt のコスト（rounds）が設定値と異なるハッシュは verify_and_update で再ハッシュする
+- rounds=0 の場合は、1回のハッシュ化が target_ms 以内に収まる最大のコストを起動時に計測する
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from passlib.context import CryptContext
+
+from app.config import get_settings
+from app.domain.exceptions.common import ServiceBusyError
+
+logger = logging.getLogger(__name__)
+
+# 自動調整で選択するコストの範囲（下限は安全性のため、上限は応答時間のため）
+MIN_AUTO_ROUNDS = 10
+MAX_AUTO_ROUNDS = 14
+
+
+@dataclass(frozen=True)
+class PasswordHasherStats:
+    """パスワードハッシュ処理の統計"""
+
+    workers: int
+    max_queue: int
+    rounds: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    rehashed: int
+    avg_wait_ms: float
+    avg_run_ms: float
+
+
+class PasswordHasher:
+    """プロセスプールでbcryptを実行する、同時実行数に上限のあるハッシャー"""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 32,
+        queue_timeout_seconds: float = 5.0,
+        rounds: int = 12,
+        target_ms: float = 250.0,
+        executor: Executor | None = None,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.target_ms = target_ms
+        self._executor = executor
+        self._rounds = rounds
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._setup_lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._rehashed = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    @property
+    def rounds(self) -> int:
+        """bcryptのコスト（自動調整の場合は初回使用時に決定）"""
+        if self._rounds <= 0:
+            with self._setup_lock:
+                if self._rounds <= 0:
+                    executor = self._get_executor()
+                    self._rounds = executor.submit(_tune_rounds, self.target_ms).result()
+                    logger.info(f'bcrypt rounds auto-tuned: {self._rounds}')
+        return self._rounds
+
+    def hash(self, password: str) -> str:
+        """パスワードをハッシュ化"""
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """パスワードを検証"""
+        return self._run(_verify, password, password_hash, self.rounds)
+
+    def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> tuple[bool, str | None]:
+        """パスワードを検証し、コストが設定値と異なる場合は新しいハッシュも返す"""
+        verified, new_hash = self._run(
+            _verify_and_update, password, password_hash, self.rounds
+        )
+        if new_hash is not None:
+            with self._lock:
+                self._rehashed += 1
+        return verified, new_hash
+
+    def stats(self) -> PasswordHasherStats:
+        """現在の統計を取得"""
+        with self._lock:
+            return PasswordHasherStats(
+                workers=self.workers,
+                max_queue=self.max_queue,
+                rounds=self._rounds,
+                in_flight=self._in_flight,
+                queued=max(self._in_flight - self.workers, 0),
+                completed=self._completed,
+                rejected=self._rejected,
+                rehashed=self._rehashed,
+                avg_wait_ms=self._average_ms(self._wait_seconds),
+                avg_run_ms=self._average_ms(self._run_seconds),
+            )
+
+    def shutdown(self) -> None:
+        """ワーカープロセスを停止"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run(self, fn, *args):
+        """空き枠を確保してワーカーで fn を実行する（枠がなければ ServiceBusyError）"""
+        if not self._slots.acquire(timeout=self.queue_timeout_seconds):
+            with self._lock:
+                self._rejected += 1
+            raise ServiceBusyError()
+
+        submitted = time.monotonic()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            result, started, finished = (
+                self._get_executor().submit(_timed, fn, *args).result()
+            )
+            with self._lock:
+                self._completed += 1
+                self._wait_seconds += max(started - submitted, 0.0)
+                self._run_seconds += finished - started
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._setup_lock:
+                if self._executor is None:
+                    # uvicornのスレッドを引き継がないよう spawn で起動する
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                    )
+        return self._executor
+
+    def _average_ms(self, total_seconds: float) -> float:
+        return total_seconds / self._completed * 1000 if self._completed else 0.0
+
+
+# ===================
+# ワーカープロセスで実行する関数
+# ===================
+
+
+@lru_cache
+def _context(rounds: int) -> CryptContext:
+    """指定コストのCryptContext（コストが異なるハッシュは needs_update になる）"""
+    return CryptContext(
+        schemes=['bcrypt'],
+        deprecated='auto',
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+def _timed(fn, *args):
+    """fn を実行し、(結果, 開始時刻, 終了時刻) を返す
+
+    待ち時間を親プロセスの時刻と比較するため、システム共通の単調時計を使う。
+    """
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify(password: str, password_hash: str, rounds: int) -> bool:
+    return _context(rounds).verify(password, password_hash)
+
+
+def _verify_and_update(
+    password: str, password_hash: str, rounds: int
+) -> tuple[bool, str | None]:
+    return _context(rounds).verify_and_update(password, password_hash)
+
+
+def _tune_rounds(target_ms: float) -> int:
+    """1回のハッシュ化が target_ms 以内に収まる最大のコストを返す"""
+    rounds = MIN_AUTO_ROUNDS
+    for candidate in range(MIN_AUTO_ROUNDS, MAX_AUTO_ROUNDS + 1):
+        started = time.perf_counter()
+        _hash('calibration', candidate)
+        if (time.perf_counter() - started) * 1000 > target_ms:
+            break
+        rounds = candidate
+    return rounds
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    """設定から PasswordHasher を生成（プロセス内で1つ）"""
+    settings = get_settings()
+    return PasswordHasher(
+        workers=settings.password_hash_workers,
+        max_queue=settings.password_hash_max_queue,
+        queue_timeout_seconds=settings.password_hash_queue_timeout_seconds,
+        rounds=settings.password_bcrypt_rounds,
+        target_ms=settings.password_hash_target_ms,
+    )
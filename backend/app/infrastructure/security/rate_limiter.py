@@ -0,0 +1,163 @@
+"""認証系APIのレート制限
+
+スライディングウィンドウ（直前の固定ウィンドウの件数を経過割合で按分する近似）で
+試行回数を数える。上限を超えた試行も数えるため、攻撃を続ける限り拒否され続ける。
+
+バックエンド:
+    - memory: プロセス内のカウンター（単一タスク・開発環境向け）
+    - postgres: rate_limit_counters テーブル（複数のECSタスクで上限を共有する）
+
+postgres バックエンドはリクエストのセッションとは別のトランザクションで即時コミットする。
+（ログイン失敗でリクエストのトランザクションがロールバックされても試行回数を失わない）
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
+
+from app.application.interfaces.rate_limiter import IRateLimiter, RateLimit
+from app.config import get_settings
+from app.infrastructure.db.models.rate_limit_model import RateLimitCounterModel
+
+
+class InMemoryRateLimiter(IRateLimiter):
+    """プロセス内のカウンターによるレート制限"""
+
+    def __init__(self, max_entries: int = 100_000):
+        self._max_entries = max_entries
+        # key -> (ウィンドウ開始[UNIX秒], 直前ウィンドウの件数, 現在ウィンドウの件数)
+        self._counters: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rate_limit: RateLimit) -> float:
+        now = time.time()
+        window_start = _window_start(now, rate_limit)
+
+        with self._lock:
+            previous, current = self._roll(key, window_start, rate_limit)
+            current += 1
+            self._counters[key] = (window_start, previous, current)
+            self._counters.move_to_end(key)
+            while len(self._counters) > self._max_entries:
+                self._counters.popitem(last=False)
+
+        return _retry_after(previous, current, now - window_start, rate_limit)
+
+    def _roll(
+        self, key: str, window_start: int, rate_limit: RateLimit
+    ) -> tuple[int, int]:
+        """ウィンドウを進め、(直前ウィンドウの件数, 現在ウィンドウの件数) を返す"""
+        entry = self._counters.get(key)
+        if entry is None:
+            return 0, 0
+        stored_start, previous, current = entry
+        if stored_start == window_start:
+            return previous, current
+        if stored_start == window_start - rate_limit.window_seconds:
+            return current, 0
+        return 0, 0
+
+
+class PostgresRateLimiter(IRateLimiter):
+    """rate_limit_counters テーブルによる、複数タスクで共有するレート制限"""
+
+    def __init__(self, engine: Engine, cleanup_interval_seconds: float = 60.0):
+        self._engine = engine
+        self._cleanup_interval = cleanup_interval_seconds
+        self._last_cleanup = 0.0
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rate_limit: RateLimit) -> float:
+        now = time.time()
+        window_start = _window_start(now, rate_limit)
+        table = RateLimitCounterModel.__table__
+
+        # 現在ウィンドウの加算と直前ウィンドウの取得を1往復で行う
+        upsert = (
+            insert(table)
+            .values(
+                key=key,
+                window_start=window_start,
+                count=1,
+                expires_at=window_start + 2 * rate_limit.window_seconds,
+            )
+            .on_conflict_do_update(
+                index_elements=[table.c.key, table.c.window_start],
+                set_={'count': table.c.count + 1},
+            )
+            .returning(table.c.count)
+            .cte('hit')
+        )
+        previous = (
+            select(table.c.count)
+            .where(
+                table.c.key == key,
+                table.c.window_start == window_start - rate_limit.window_seconds,
+            )
+            .scalar_subquery()
+        )
+        statement = select(upsert.c.count, func.coalesce(previous, 0))
+
+        with self._engine.begin() as connection:
+            current, previous_count = connection.execute(statement).one()
+            if self._cleanup_due(now):
+                connection.execute(delete(table).where(table.c.expires_at < int(now)))
+
+        return _retry_after(previous_count, current, now - window_start, rate_limit)
+
+    def _cleanup_due(self, now: float) -> bool:
+        """期限切れカウンターを削除する時期か（プロセスごとに cleanup_interval に1回）"""
+        with self._lock:
+            if now - self._last_cleanup < self._cleanup_interval:
+                return False
+            self._last_cleanup = now
+            return True
+
+
+def _window_start(now: float, rate_limit: RateLimit) -> int:
+    """now を含む固定ウィンドウの開始時刻（UNIX秒）"""
+    return int(now // rate_limit.window_seconds) * rate_limit.window_seconds
+
+
+def _retry_after(
+    previous: int, current: int, elapsed: float, rate_limit: RateLimit
+) -> float:
+    """推定件数が上限を超えていれば、上限内に戻るまでの秒数を返す（超えていなければ0）
+
+    推定件数 = 直前ウィンドウの件数 × (1 - 経過割合) + 現在ウィンドウの件数
+    """
+    window = rate_limit.window_seconds
+    limit = rate_limit.limit
+    if previous * (1 - elapsed / window) + current <= limit:
+        return 0.0
+
+    if current > limit:
+        # 現在ウィンドウだけで超過: 次のウィンドウで按分後の件数が上限に収まるまで
+        wait = (window - elapsed) + window * (1 - limit / current)
+    else:
+        # 直前ウィンドウの按分が減って上限に収まるまで
+        wait = window * (1 - (limit - current) / previous) - elapsed
+    return max(math.ceil(wait), 1)
+
+
+@lru_cache
+def get_rate_limiter() -> IRateLimiter | None:
+    """設定からレート制限を生成（無効の場合はNone・プロセス内で1つ）"""
+    settings = get_settings()
+    if not settings.rate_limit_enabled:
+        return None
+
+    if settings.rate_limit_backend == 'postgres':
+        # memory バックエンドではDBエンジンを生成しないよう、ここで読み込む
+        from app.infrastructure.db.session import engine
+
+        return PostgresRateLimiter(engine)
+    if settings.rate_limit_backend == 'memory':
+        return InMemoryRateLimiter()
+    raise ValueError(f'Unknown rate limit backend: {settings.rate_limit_backend}')
@@ -1,12 +1,13 @@
 from datetime import datetime, timedelta
 
 from fastapi import HTTPException, Request, status
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError
 from pydantic import BaseModel, Field
 
 from app.application.interfaces.security_service import ISecurityService
 from app.config import get_settings
+from app.infrastructure.security.jwt_key_manager import get_jwt_key_manager
+from app.infrastructure.security.password_hasher import get_password_hasher
 
 
 class User(BaseModel):
@@ -15,9 +16,6 @@ class User(BaseModel):
     id: int = Field(..., description='ユーザーID')
 
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
-
-
 class SecurityServiceImpl(ISecurityService):
     """セキュリティサービスの実装"""
 
@@ -31,18 +29,7 @@ class SecurityServiceImpl(ISecurityService):
             expire = datetime.utcnow() + timedelta(days=7)
 
         to_encode = {'user_id': user_id, 'exp': expire}
-        settings = get_settings()
-        algorithm = settings.jwt_algorithm
-
-        if algorithm == 'RS256':
-            private_key, _ = _load_rsa_keys()
-            encoded_jwt = jwt.encode(to_encode, private_key, algorithm=algorithm)
-        else:
-            raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
-
-        if isinstance(encoded_jwt, bytes):
-            return encoded_jwt.decode('utf-8')
-        return encoded_jwt
+        return get_jwt_key_manager().encode(to_encode)
 
     def create_admin_access_token(
         self,
@@ -51,7 +38,6 @@ class SecurityServiceImpl(ISecurityService):
         expires_delta: timedelta | None = None,
     ) -> str:
         """管理者用アクセストークンを生成"""
-        settings = get_settings()
         expire = datetime.utcnow() + (expires_delta or timedelta(hours=8))
         to_encode = {
             'admin_id': admin_id,
@@ -59,40 +45,21 @@ class SecurityServiceImpl(ISecurityService):
             'exp': expire,
             'type': 'admin',
         }
-        private_key, _ = _load_rsa_keys()
-        encoded_jwt = jwt.encode(to_encode, private_key, algorithm=settings.jwt_algorithm)
-        if isinstance(encoded_jwt, bytes):
-            return encoded_jwt.decode('utf-8')
-        return encoded_jwt
+        return get_jwt_key_manager().encode(to_encode)
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """パスワードを検証"""
-        return pwd_context.verify(plain_password, hashed_password)
+        return get_password_hasher().verify(plain_password, hashed_password)
+
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """パスワードを検証し、コストが設定値と異なる場合は新しいハッシュも返す"""
+        return get_password_hasher().verify_and_update(plain_password, hashed_password)
 
     def hash_password(self, password: str) -> str:
         """パスワードをハッシュ化"""
-        return pwd_context.hash(password)
-
-
-def _load_rsa_keys() -> tuple:
-    """RSA鍵ペアを環境変数から読み込み"""
-    settings = get_settings()
-
-    if settings.jwt_algorithm != 'RS256':
-        return None, None
-
-    jwt_private_key = settings.jwt_private_key
-    if not jwt_private_key:
-        raise ValueError('JWT_PRIVATE_KEY is required for RS256.')
-
-    jwt_public_key = settings.jwt_public_key
-    if not jwt_public_key:
-        raise ValueError('JWT_PUBLIC_KEY is required for RS256.')
-
-    private_key = jwt_private_key.replace('\\n', '\n').encode('utf-8')
-    public_key = jwt_public_key.replace('\\n', '\n').encode('utf-8')
-
-    return private_key, public_key
+        return get_password_hasher().hash(password)
 
 
 def get_current_user_from_cookie(request: Request) -> User:
@@ -118,14 +85,7 @@ def get_current_user_from_cookie(request: Request) -> User:
     )
 
     try:
-        algorithm = settings.jwt_algorithm
-
-        if algorithm == 'RS256':
-            _, public_key = _load_rsa_keys()
-            payload = jwt.decode(token, public_key, algorithms=[algorithm])
-        else:
-            raise ValueError(f'Unsupported JWT algorithm: {algorithm}')
-
+        payload = get_jwt_key_manager().decode(token)
         user_id: int = payload.get('user_id')
         if user_id is None:
             raise credentials_exception
@@ -150,14 +110,7 @@ def get_optional_user_from_cookie(request: Request) -> User | None:
         return None
 
     try:
-        algorithm = settings.jwt_algorithm
-
-        if algorithm == 'RS256':
-            _, public_key = _load_rsa_keys()
-            payload = jwt.decode(token, public_key, algorithms=[algorithm])
-        else:
-            return None
-
+        payload = get_jwt_key_manager().decode(token)
         user_id: int = payload.get('user_id')
         if user_id is None:
             return None
@@ -0,0 +1,61 @@
+"""Stripeイベント台帳の処理
+
+stripe_events テーブルの処理待ちイベントをバックグラウンドスレッドで処理する。
+Webhookはイベントを記録して即座に応答し、注文の更新などはここで行う。
+取得・リース・再処理・削除の仕組みは QueueWorker を参照。
+
+- イベントごとに別のトランザクションで処理し、処理済みの記録も同じトランザクションで行う。
+  1件の失敗で同じバッチの他のイベントの処理は取り消されない
+- イベントを記録したトランザクションのコミット時に StripeEventProcessor.notify() で起こされる
+- 処理済み・失敗の行は retention_days を過ぎたら削除する
+  （Stripeの再送は最大3日間のため、それより長く残せば重複を弾ける）
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.stripe_event_model import StripeEventModel
+from app.infrastructure.db.queue_worker import QueueWorker
+
+# イベントを処理する関数（セッション, イベントの種類, イベントのオブジェクト）
+EventHandler = Callable[[Session, str, dict[str, Any]], None]
+
+
+class StripeEventProcessor(QueueWorker):
+    """処理待ちのStripeイベントを handler で処理する"""
+
+    model = StripeEventModel
+    in_progress_status = 'processing'
+    done_status = 'processed'
+    done_at_column = 'processed_at'
+    created_at_column = 'received_at'
+    thread_name = 'stripe-event-processor'
+    label = 'Stripe event'
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        handler: EventHandler,
+        **options,
+    ):
+        """
+        Args:
+            session_factory: セッションを生成する関数
+            handler: イベントを処理する関数
+            **options: QueueWorker の設定（batch_size, max_attempts 等）
+        """
+        options.setdefault('backoff_base_seconds', 10.0)
+        options.setdefault('backoff_max_seconds', 600.0)
+        options.setdefault('lease_seconds', 300.0)
+        super().__init__(session_factory, **options)
+        self._handler = handler
+
+    def handle(self, session: Session, row: Row) -> None:
+        """1件処理する（処理済みの記録と同じトランザクション）"""
+        self._handler(session, row.type, row.payload)
+
+    def describe(self, row: Row) -> str:
+        return f'Stripe event {row.id} ({row.type})'
@@ -1,12 +1,86 @@
-"""Stripeクライアント初期化"""
+"""Stripeクライアント初期化
 
+プロセス内で1つの StripeClient を使い回し、HTTP接続を keep-alive で再利用する。
+
+- HTTPクライアントは httpx（同期・非同期の両方のメソッドを使える）で、
+  接続数の上限・keep-alive の保持秒数・タイムアウト（接続/読み取り）を設定できる
+- 通信エラー・409・5xx 等は max_network_retries 回まで再試行する
+  （POSTの再試行にはSDKが冪等キーを付与するため、二重に作成されない）
+- stripe_api_base を設定すると、stripe-mock 等のローカルのスタブサーバーに接続する
+"""
+
+from functools import lru_cache
+
+import httpx
 import stripe
 
 from app.config import get_settings
 
 
-def get_stripe_client() -> stripe:
-    """Stripeクライアントを取得（APIキー設定済み）"""
+class PooledHTTPXClient(stripe.HTTPXClient):
+    """接続数の上限・keep-alive・タイムアウトを設定した httpx のHTTPクライアント
+
+    stripe.HTTPXClient は httpx のクライアントを既定の設定で作成するため、
+    接続プールの設定をしたクライアントに差し替える。
+    """
+
+    def __init__(
+        self,
+        connect_timeout_seconds: float = 5.0,
+        read_timeout_seconds: float = 30.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_seconds: float = 30.0,
+        **kwargs,
+    ):
+        timeout = httpx.Timeout(read_timeout_seconds, connect=connect_timeout_seconds)
+        super().__init__(timeout=timeout, **kwargs)
+
+        options = {
+            'verify': stripe.ca_bundle_path if self._verify_ssl_certs else False,
+            'limits': httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry_seconds,
+            ),
+        }
+        self._client = httpx.Client(**options)
+        self._client_async = httpx.AsyncClient(**options)
+
+
+def create_stripe_client(
+    api_key: str,
+    api_base: str = '',
+    max_network_retries: int = 2,
+    **http_options,
+) -> stripe.StripeClient:
+    """StripeClient を作成
+
+    Args:
+        api_key: Stripeのシークレットキー
+        api_base: APIの接続先（空の場合はStripe本番。stripe-mock は http://localhost:12111）
+        max_network_retries: 通信エラー等の再試行回数
+        **http_options: PooledHTTPXClient の接続プール・タイムアウトの設定
+    """
+    return stripe.StripeClient(
+        api_key,
+        base_addresses={'api': api_base} if api_base else {},
+        max_network_retries=max_network_retries,
+        http_client=PooledHTTPXClient(**http_options),
+    )
+
+
+@lru_cache
+def get_stripe_client() -> stripe.StripeClient:
+    """設定から StripeClient を生成（プロセス内で1つ）"""
     settings = get_settings()
-    stripe.api_key = settings.stripe_secret_key
-    return stripe
+    return create_stripe_client(
+        settings.stripe_secret_key,
+        api_base=settings.stripe_api_base,
+        max_network_retries=settings.stripe_max_network_retries,
+        connect_timeout_seconds=settings.stripe_connect_timeout_seconds,
+        read_timeout_seconds=settings.stripe_read_timeout_seconds,
+        max_connections=settings.stripe_max_connections,
+        max_keepalive_connections=settings.stripe_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.stripe_keepalive_expiry_seconds,
+    )
@@ -0,0 +1,52 @@
+"""Stripeイベント台帳の実装"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.application.interfaces.stripe_event_ledger import IStripeEventLedger
+from app.infrastructure.db.models.stripe_event_model import StripeEventModel
+from app.infrastructure.stripe.event_processor import StripeEventProcessor
+
+_RECORDED_KEY = 'stripe_event_recorded'
+
+
+class StripeEventLedgerImpl(IStripeEventLedger):
+    """stripe_events テーブルにリクエストのセッションで記録する"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def record(self, event_id: str, event_type: str, payload: dict[str, Any]) -> bool:
+        """イベントを記録（記録済みのイベントIDの場合は何もせずFalse）"""
+        statement = (
+            insert(StripeEventModel)
+            .values(
+                id=event_id,
+                type=event_type,
+                payload=payload,
+                status='pending',
+                attempts=0,
+            )
+            .on_conflict_do_nothing(index_elements=[StripeEventModel.id])
+            .returning(StripeEventModel.id)
+        )
+        recorded = self.session.execute(statement).scalar() is not None
+        if recorded:
+            self.session.info[_RECORDED_KEY] = True
+        return recorded
+
+
+@event.listens_for(Session, 'after_commit')
+def _notify_on_commit(session: Session) -> None:
+    """イベントを記録したトランザクションのコミット後に処理を起こす"""
+    if session.info.pop(_RECORDED_KEY, False):
+        StripeEventProcessor.notify()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session: Session) -> None:
+    """ロールバックされた記録では処理を起こさない"""
+    session.info.pop(_RECORDED_KEY, None)
@@ -0,0 +1,125 @@
+"""Stripe API呼び出しの計測
+
+Stripe の操作（payment_intents.create 等）ごとに、呼び出しのレイテンシを
+ヒストグラムで記録し、呼び出し件数・エラー件数とあわせて統計として取得できるようにする。
+リトライを含めた1回の操作の所要時間を記録する（Admin API で公開）。
+
+使用例:
+    metrics = get_stripe_metrics()
+    with metrics.measure('payment_intents.create'):
+        client.payment_intents.create(params=params)
+    stats = metrics.stats()
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.infrastructure.db.pool_metrics import HistogramBucket
+
+# レイテンシのヒストグラムの上限値（ms）。最後のバケットは上限なし
+STRIPE_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+@dataclass(frozen=True)
+class StripeOperationStats:
+    """Stripeの操作ごとの統計"""
+
+    operation: str
+    calls: int
+    errors: int
+    avg_latency_ms: float
+    max_latency_ms: float
+    latency_histogram: list[HistogramBucket]
+
+
+class _OperationMetrics:
+    """1つの操作のレイテンシ・エラー件数（StripeMetrics のロック内で更新する）"""
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(STRIPE_LATENCY_BUCKETS_MS) + 1)
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class StripeMetrics:
+    """Stripeの操作ごとのレイテンシ・エラー件数の記録"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: dict[str, _OperationMetrics] = {}
+
+    def observe(self, operation: str, seconds: float, error: bool = False) -> None:
+        """操作1回の所要時間を記録"""
+        latency_ms = seconds * 1000
+        index = next(
+            (i for i, le in enumerate(STRIPE_LATENCY_BUCKETS_MS) if latency_ms <= le),
+            len(STRIPE_LATENCY_BUCKETS_MS),
+        )
+        with self._lock:
+            metrics = self._operations.get(operation)
+            if metrics is None:
+                metrics = self._operations[operation] = _OperationMetrics()
+            metrics.bucket_counts[index] += 1
+            metrics.calls += 1
+            metrics.errors += int(error)
+            metrics.seconds += seconds
+            metrics.max_seconds = max(metrics.max_seconds, seconds)
+
+    @contextmanager
+    def measure(self, operation: str) -> Iterator[None]:
+        """with ブロックの所要時間を operation の1回として記録（例外はエラーとして数える）"""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.observe(operation, time.perf_counter() - started, error=True)
+            raise
+        self.observe(operation, time.perf_counter() - started)
+
+    def stats(self) -> list[StripeOperationStats]:
+        """操作名順の統計"""
+        with self._lock:
+            snapshot = [
+                (
+                    operation,
+                    list(m.bucket_counts),
+                    m.calls,
+                    m.errors,
+                    m.seconds,
+                    m.max_seconds,
+                )
+                for operation, m in sorted(self._operations.items())
+            ]
+
+        stats = []
+        for operation, counts, calls, errors, seconds, max_seconds in snapshot:
+            histogram = []
+            cumulative = 0
+            for le_ms, count in zip(
+                (*STRIPE_LATENCY_BUCKETS_MS, None), counts, strict=True
+            ):
+                cumulative += count
+                histogram.append(HistogramBucket(le_ms=le_ms, count=cumulative))
+            stats.append(
+                StripeOperationStats(
+                    operation=operation,
+                    calls=calls,
+                    errors=errors,
+                    avg_latency_ms=seconds / calls * 1000 if calls else 0.0,
+                    max_latency_ms=max_seconds * 1000,
+                    latency_histogram=histogram,
+                )
+            )
+        return stats
+
+
+@lru_cache
+def get_stripe_metrics() -> StripeMetrics:
+    """Stripe API呼び出しの計測を取得（プロセス内で1つ）"""
+    return StripeMetrics()
@@ -1,6 +1,10 @@
 """Stripeサービス実装"""
 
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
 import stripe
+from sqlalchemy.util import await_only
 
 from app.application.interfaces.stripe_service import (
     IStripeService,
@@ -8,15 +12,30 @@ from app.application.interfaces.stripe_service import (
 )
 from app.config import get_settings
 from app.domain.exceptions.payment import PaymentIntentCreationError
+from app.infrastructure.stripe.stripe_client import get_stripe_client
+from app.infrastructure.stripe.stripe_metrics import StripeMetrics, get_stripe_metrics
+
+R = TypeVar('R')
 
 
 class StripeServiceImpl(IStripeService):
-    """Stripe操作を行うサービス実装"""
+    """Stripe操作を行うサービス実装
 
-    def __init__(self):
-        settings = get_settings()
-        stripe.api_key = settings.stripe_secret_key
-        self.webhook_secret = settings.stripe_webhook_secret
+    StripeClient（接続を再利用する共有クライアント）の同期メソッドで呼び出す。
+    操作ごとの所要時間は StripeMetrics に記録する。
+    """
+
+    def __init__(
+        self,
+        client: stripe.StripeClient | None = None,
+        metrics: StripeMetrics | None = None,
+        webhook_secret: str | None = None,
+    ):
+        self.client = client or get_stripe_client()
+        self.metrics = metrics or get_stripe_metrics()
+        if webhook_secret is None:
+            webhook_secret = get_settings().stripe_webhook_secret
+        self.webhook_secret = webhook_secret
 
     def create_payment_intent(
         self,
@@ -49,7 +68,11 @@ class StripeServiceImpl(IStripeService):
             if metadata:
                 params['metadata'] = metadata
 
-            payment_intent = stripe.PaymentIntent.create(**params)
+            payment_intent = self._call(
+                'payment_intents.create',
+                lambda: self.client.payment_intents.create(params=params),
+                lambda: self.client.payment_intents.create_async(params=params),
+            )
 
             return PaymentIntentResult(
                 payment_intent_id=payment_intent.id,
@@ -73,7 +96,11 @@ class StripeServiceImpl(IStripeService):
         Returns:
             PaymentIntentResult
         """
-        payment_intent = stripe.PaymentIntent.retrieve(payment_intent_id)
+        payment_intent = self._call(
+            'payment_intents.retrieve',
+            lambda: self.client.payment_intents.retrieve(payment_intent_id),
+            lambda: self.client.payment_intents.retrieve_async(payment_intent_id),
+        )
         return PaymentIntentResult(
             payment_intent_id=payment_intent.id,
             client_secret=payment_intent.client_secret,
@@ -105,7 +132,11 @@ class StripeServiceImpl(IStripeService):
         if metadata:
             params['metadata'] = metadata
 
-        customer = stripe.Customer.create(**params)
+        customer = self._call(
+            'customers.create',
+            lambda: self.client.customers.create(params=params),
+            lambda: self.client.customers.create_async(params=params),
+        )
         return customer.id
 
     def construct_webhook_event(
@@ -113,7 +144,7 @@ class StripeServiceImpl(IStripeService):
         payload: bytes,
         sig_header: str,
     ) -> dict:
-        """Webhookイベントを構築・検証
+        """Webhookイベントを構築・検証（署名の検証のみでAPIは呼ばない）
 
         Args:
             payload: リクエストボディ
@@ -125,15 +156,45 @@ class StripeServiceImpl(IStripeService):
         Raises:
             stripe.error.SignatureVerificationError: 署名検証失敗
         """
-        event = stripe.Webhook.construct_event(
+        event = self.client.construct_event(
             payload,
             sig_header,
             self.webhook_secret,
         )
         # Event objectを辞書に変換
         return {
+            'id': event.id,
             'type': event.type,
             'data': {
                 'object': dict(event.data.object),
             },
         }
+
+    def _call(
+        self,
+        operation: str,
+        call: Callable[[], R],
+        call_async: Callable[[], Awaitable[R]],
+    ) -> R:
+        """Stripe APIを呼び出し、所要時間を記録する（同期メソッドで呼び出す）"""
+        with self.metrics.measure(operation):
+            return call()
+
+
+class AsyncStripeServiceImpl(StripeServiceImpl):
+    """Stripe APIを非同期メソッドで呼び出すサービス実装
+
+    AsyncUsecase.run（AsyncSession.run_sync）の中で使う。
+    ユースケースは同期のまま、Stripe APIの呼び出しを DB と同じくイベントループ上で待機するため、
+    応答待ちの間スレッドプールのワーカーやイベントループを占有しない。
+    """
+
+    def _call(
+        self,
+        operation: str,
+        call: Callable[[], R],
+        call_async: Callable[[], Awaitable[R]],
+    ) -> R:
+        """Stripe APIを非同期メソッドで呼び出し、所要時間を記録する"""
+        with self.metrics.measure(operation):
+            return await_only(call_async())
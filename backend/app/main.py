@@ -1,10 +1,14 @@
 import os
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from app.config import get_settings
+from app.di.checkout.payment import get_stripe_event_processor
+from app.infrastructure.email.outbox_dispatcher import get_email_outbox_dispatcher
 from app.infrastructure.logging.logging import setup_logging
 from app.presentation.api.account.address_api import router as address_router
 from app.presentation.api.account.auth_api import router as auth_router
@@ -32,6 +36,7 @@ from app.presentation.api.checkout.payment_api import router as payment_router
 from app.presentation.api.checkout.upload_api import order_uploads_router
 from app.presentation.api.checkout.upload_api import router as upload_router
 from app.presentation.exception_handlers import register_exception_handlers
+from app.presentation.read_your_writes import register_read_your_writes_middleware
 
 # ロギングの設定を初期化
 setup_logging()
@@ -39,12 +44,34 @@ setup_logging()
 # 環境変数から環境を取得（デフォルトはdevelopment）
 ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動時にバックグラウンド処理を開始し、終了時に停止する
+
+    - メール送信キュー（email_outbox）の配信処理
+    - Stripe Webhookイベント台帳（stripe_events）の処理
+    """
+    settings = get_settings()
+    workers = []
+    if settings.email_outbox_dispatcher_enabled:
+        workers.append(get_email_outbox_dispatcher())
+    if settings.stripe_events_processor_enabled:
+        workers.append(get_stripe_event_processor())
+    for worker in workers:
+        worker.start()
+    yield
+    for worker in workers:
+        worker.stop()
+
+
 # FastAPI アプリケーションのインスタンスを作成
 # 本番環境ではドキュメントを無効化しましょう
 app = FastAPI(
     docs_url='/docs' if ENVIRONMENT != 'production' else None,
     redoc_url='/redoc' if ENVIRONMENT != 'production' else None,
     openapi_url='/openapi.json' if ENVIRONMENT != 'production' else None,
+    lifespan=lifespan,
 )
 
 allowed_origins = [
@@ -78,6 +105,9 @@ app.add_middleware(
 # ドメイン例外ハンドラーを登録
 register_exception_handlers(app)
 
+# 管理画面での更新直後はリードレプリカではなくプライマリから読む
+register_read_your_writes_middleware(app)
+
 # API ルーターをアプリケーションに含める
 app.include_router(auth_router, prefix='/api')
 app.include_router(user_router, prefix='/api')
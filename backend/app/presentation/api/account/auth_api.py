@@ -1,6 +1,6 @@
 """認証APIエンドポイント"""
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from app.application.use_cases.account.auth_usecase import AuthUsecase
 from app.di.account.auth import get_auth_usecase
@@ -9,6 +9,7 @@ from app.infrastructure.security.security_service_impl import (
     get_current_user_from_cookie,
     get_optional_user_from_cookie,
 )
+from app.presentation.client_ip import client_ip
 from app.presentation.schemas.account.auth_schemas import (
     LoginRequest,
     LoginResponse,
@@ -34,21 +35,23 @@ router = APIRouter(prefix='/auth', tags=['認証'])
 )
 def register(
     request: RegisterRequest,
+    http_request: Request,
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> RegisterResponse:
     """会員登録エンドポイント"""
-    output_dto = auth_usecase.register(request.to_dto())
+    output_dto = auth_usecase.register(request.to_dto(), client_ip(http_request))
     return RegisterResponse.from_dto(output_dto)
 
 
 @router.post('/login', response_model=LoginResponse, status_code=status.HTTP_200_OK)
 def login(
     request: LoginRequest,
+    http_request: Request,
     response: Response,
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> LoginResponse:
     """ログインエンドポイント"""
-    output_dto = auth_usecase.login(request.to_dto())
+    output_dto = auth_usecase.login(request.to_dto(), client_ip(http_request))
 
     # Cookieにアクセストークンを設定
     response.set_cookie(
@@ -109,10 +112,13 @@ def verify_email(
 )
 def request_password_reset(
     request: PasswordResetRequest,
+    http_request: Request,
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> PasswordResetResponse:
     """パスワードリセット依頼エンドポイント"""
-    output_dto = auth_usecase.request_password_reset(request.to_dto())
+    output_dto = auth_usecase.request_password_reset(
+        request.to_dto(), client_ip(http_request)
+    )
     return PasswordResetResponse.from_dto(output_dto)
 
 
@@ -137,8 +143,11 @@ def confirm_password_reset(
 )
 def resend_verification_email(
     request: ResendVerificationRequest,
+    http_request: Request,
     auth_usecase: AuthUsecase = Depends(get_auth_usecase),
 ) -> ResendVerificationResponse:
     """メール認証再送信エンドポイント"""
-    output_dto = auth_usecase.resend_verification_email(request.to_dto())
+    output_dto = auth_usecase.resend_verification_email(
+        request.to_dto(), client_ip(http_request)
+    )
     return ResendVerificationResponse.from_dto(output_dto)
@@ -10,6 +10,7 @@ from app.infrastructure.security.admin_security import (
     AdminAuth,
     get_current_admin_from_cookie,
 )
+from app.presentation.client_ip import client_ip
 from app.presentation.schemas.admin.admin_admin_schemas import (
     CreateAdminRequest,
     CreateAdminResponse,
@@ -55,7 +56,7 @@ def create_admin(
     super_adminの作成はsuper_adminのみ可能。
     adminはstaffのみ作成可能。
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     output_dto = usecase.create_admin(current_admin.id, request_body.to_dto(), ip_address)
     return CreateAdminResponse.from_dto(output_dto)
 
@@ -76,7 +77,7 @@ def update_admin(
     自分自身の編集は可能。
     他の管理者の編集はsuper_admin/adminのみ可能。
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     output_dto = usecase.update_admin(
         current_admin.id, admin_id, request_body.to_dto(), ip_address
     )
@@ -99,6 +100,6 @@ def delete_admin(
     super_adminはsuper_admin以外を削除可能。
     adminはstaffのみ削除可能。
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     output_dto = usecase.delete_admin(current_admin.id, admin_id, ip_address)
     return DeleteAdminResponse.from_dto(output_dto)
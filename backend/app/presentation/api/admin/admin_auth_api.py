@@ -8,6 +8,7 @@ from app.infrastructure.security.admin_security import (
     AdminAuth,
     get_current_admin_from_cookie,
 )
+from app.presentation.client_ip import client_ip
 from app.presentation.schemas.admin.admin_auth_schemas import (
     AdminLoginRequest,
     AdminLoginResponse,
@@ -30,7 +31,7 @@ def admin_login(
     管理者のメールアドレスとパスワードで認証し、
     アクセストークンをCookieに設定する。
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     output_dto = usecase.login(request_body.to_dto(), ip_address)
 
     # Cookieにアクセストークンを設定
@@ -59,7 +60,7 @@ def admin_logout(
 
     アクセストークンのCookieを削除する。
     """
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     output_dto = usecase.logout(current_admin.id, ip_address)
 
     # Cookieを削除
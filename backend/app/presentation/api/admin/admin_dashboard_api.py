@@ -7,16 +7,24 @@ from fastapi import APIRouter, Depends, Query
 from app.application.schemas.admin.admin_dashboard_schemas import GetStatsInputDTO
 from app.application.use_cases.admin.admin_dashboard_usecase import AdminDashboardUsecase
 from app.di.admin.admin_dashboard import get_admin_dashboard_usecase
+from app.infrastructure.cache.catalog_cache import get_catalog_cache
+from app.infrastructure.db.session import get_pool_stats
 from app.infrastructure.security.admin_security import (
     AdminAuth,
     get_current_admin_from_cookie,
 )
+from app.infrastructure.security.password_hasher import get_password_hasher
+from app.infrastructure.stripe.stripe_metrics import get_stripe_metrics
 from app.presentation.schemas.admin.admin_dashboard_schemas import (
+    CatalogCacheStatsResponse,
     DashboardSummaryResponse,
+    DbPoolStatsResponse,
     GetDashboardResponse,
     GetStatsResponse,
+    PasswordHasherStatsResponse,
     StatsDataPointResponse,
     StatsSummaryResponse,
+    StripeOperationStatsResponse,
 )
 
 router = APIRouter(prefix='/admin/dashboard', tags=['Admin Dashboard'])
@@ -57,3 +65,38 @@ async def get_stats(
         data=[StatsDataPointResponse.from_dto(d) for d in output.data],
         summary=StatsSummaryResponse.from_dto(output.summary),
     )
+
+
+@router.get('/cache', response_model=CatalogCacheStatsResponse)
+async def get_catalog_cache_stats(
+    admin: AdminAuth = Depends(get_current_admin_from_cookie),
+) -> CatalogCacheStatsResponse:
+    """カタログキャッシュのヒット/ミス統計を取得（このプロセス分）"""
+    return CatalogCacheStatsResponse.from_stats(get_catalog_cache().stats())
+
+
+@router.get('/password-hasher', response_model=PasswordHasherStatsResponse)
+async def get_password_hasher_stats(
+    admin: AdminAuth = Depends(get_current_admin_from_cookie),
+) -> PasswordHasherStatsResponse:
+    """パスワードハッシュ処理の待ち行列・処理時間の統計を取得（このプロセス分）"""
+    return PasswordHasherStatsResponse.from_stats(get_password_hasher().stats())
+
+
+@router.get('/db-pool', response_model=list[DbPoolStatsResponse])
+async def get_db_pool_stats(
+    admin: AdminAuth = Depends(get_current_admin_from_cookie),
+) -> list[DbPoolStatsResponse]:
+    """コネクションプールの使用数・checkout待ち時間の統計を取得（このプロセス分）"""
+    return [DbPoolStatsResponse.from_stats(stats) for stats in get_pool_stats()]
+
+
+@router.get('/stripe', response_model=list[StripeOperationStatsResponse])
+async def get_stripe_stats(
+    admin: AdminAuth = Depends(get_current_admin_from_cookie),
+) -> list[StripeOperationStatsResponse]:
+    """Stripe API呼び出しの操作ごとの件数・レイテンシの統計を取得（このプロセス分）"""
+    return [
+        StripeOperationStatsResponse.from_stats(stats)
+        for stats in get_stripe_metrics().stats()
+    ]
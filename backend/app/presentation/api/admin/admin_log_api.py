@@ -28,6 +28,10 @@ async def get_logs(
     date_to: date | None = Query(None, description='終了日'),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None,
+        description='次ページ取得用カーソル（指定時はoffsetを無視し総件数を返さない）',
+    ),
     admin: AdminAuth = Depends(get_current_admin_from_cookie),
     usecase: AdminLogUsecase = Depends(get_admin_log_usecase),
 ) -> GetAdminLogsResponse:
@@ -40,6 +44,7 @@ async def get_logs(
         date_to=date_to,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
     output = usecase.get_logs(input_dto)
 
@@ -48,4 +53,5 @@ async def get_logs(
         total=output.total,
         limit=output.limit,
         offset=output.offset,
+        next_cursor=output.next_cursor,
     )
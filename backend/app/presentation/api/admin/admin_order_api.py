@@ -34,8 +34,13 @@ async def get_orders(
     status: list[str] | None = Query(None, description='ステータスフィルタ'),
     date_from: datetime | None = Query(None, description='開始日'),
     date_to: datetime | None = Query(None, description='終了日'),
+    requires_upload: bool | None = Query(None, description='入稿の有無で絞り込み'),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None,
+        description='次ページ取得用カーソル（指定時はoffsetを無視し総件数を返さない）',
+    ),
     admin: AdminAuth = Depends(get_current_admin_from_cookie),
     usecase: AdminOrderUsecase = Depends(get_admin_order_usecase),
 ) -> GetAdminOrdersResponse:
@@ -47,8 +52,10 @@ async def get_orders(
         status=status_list,
         date_from=date_from,
         date_to=date_to,
+        requires_upload=requires_upload,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
     output = usecase.get_orders(input_dto)
 
@@ -57,6 +64,7 @@ async def get_orders(
         total=output.total,
         limit=output.limit,
         offset=output.offset,
+        next_cursor=output.next_cursor,
     )
 
 
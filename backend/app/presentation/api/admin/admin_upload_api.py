@@ -33,6 +33,10 @@ async def get_uploads(
     date_to: datetime | None = Query(None, description='終了日'),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None,
+        description='次ページ取得用カーソル（指定時はoffsetを無視し総件数を返さない）',
+    ),
     admin: AdminAuth = Depends(get_current_admin_from_cookie),
     usecase: AdminUploadUsecase = Depends(get_admin_upload_usecase),
 ) -> GetAdminUploadsResponse:
@@ -45,6 +49,7 @@ async def get_uploads(
         date_to=date_to,
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
     output = usecase.get_uploads(input_dto)
 
@@ -53,6 +58,7 @@ async def get_uploads(
         total=output.total,
         limit=output.limit,
         offset=output.offset,
+        next_cursor=output.next_cursor,
     )
 
 
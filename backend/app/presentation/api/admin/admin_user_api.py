@@ -8,6 +8,7 @@ from app.application.schemas.admin.admin_user_schemas import (
 )
 from app.application.use_cases.admin.admin_user_usecase import AdminUserUsecase
 from app.di.admin.admin_user import get_admin_user_usecase
+from app.domain.entities.customer_stats import CustomerSortKey
 from app.infrastructure.security.admin_security import (
     AdminAuth,
     get_current_admin_from_cookie,
@@ -24,6 +25,10 @@ router = APIRouter(prefix='/admin/users', tags=['顧客管理'])
 @router.get('', response_model=GetCustomersResponse, status_code=status.HTTP_200_OK)
 def get_customers(
     search: str | None = Query(None, description='検索キーワード（email/name）'),
+    sort_by: CustomerSortKey = Query(
+        CustomerSortKey.CREATED_AT,
+        description='並び順（created_at/order_count/total_spent/last_order_at・降順）',
+    ),
     limit: int = Query(20, ge=1, le=100, description='取得件数'),
     offset: int = Query(0, ge=0, description='オフセット'),
     current_admin: AdminAuth = Depends(get_current_admin_from_cookie),
@@ -32,8 +37,11 @@ def get_customers(
     """顧客一覧取得
 
     顧客の一覧を取得する。検索キーワードでメールアドレス・氏名を絞り込み可能。
+    注文数・累計購入金額・最終注文日時を含み、それらで並び替え可能。
     """
-    input_dto = GetCustomersInputDTO(search=search, limit=limit, offset=offset)
+    input_dto = GetCustomersInputDTO(
+        search=search, sort_by=sort_by, limit=limit, offset=offset
+    )
     output_dto = usecase.get_customers(input_dto)
     return GetCustomersResponse.from_dto(output_dto)
 
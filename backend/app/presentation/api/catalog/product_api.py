@@ -1,6 +1,6 @@
 """商品API"""
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 
 from app.application.schemas.catalog.product_schemas import (
     ProductListInputDTO,
@@ -8,6 +8,14 @@ from app.application.schemas.catalog.product_schemas import (
 )
 from app.application.use_cases.catalog.product_usecase import ProductUsecase
 from app.di.catalog.product import get_product_usecase
+from app.infrastructure.db.async_usecase import AsyncUsecase
+from app.presentation.http_cache import (
+    is_not_modified,
+    list_cache_control,
+    make_etag,
+    not_modified_response,
+    set_validators,
+)
 from app.presentation.schemas.catalog.product_schemas import (
     ProductDetailResponse,
     ProductListResponse,
@@ -20,66 +28,83 @@ router = APIRouter(prefix='/products', tags=['商品'])
 
 
 @router.get('', response_model=ProductListResponse, status_code=status.HTTP_200_OK)
-def get_products(
+async def get_products(
+    response: Response,
     category_id: str | None = Query(None, description='カテゴリID (shop/office/you)'),
     is_featured: bool | None = Query(None, description='おすすめ商品のみ'),
     limit: int = Query(20, ge=1, le=100, description='取得件数'),
     offset: int = Query(0, ge=0, description='オフセット'),
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
 ) -> ProductListResponse:
     """商品一覧を取得"""
+    response.headers['Cache-Control'] = list_cache_control()
     input_dto = ProductListInputDTO(
         category_id=category_id,
         is_featured=is_featured,
         limit=limit,
         offset=offset,
     )
-    output_dto = product_usecase.get_products(input_dto)
+    output_dto = await product_usecase.run(lambda u: u.get_products(input_dto))
     return ProductListResponse.from_dto(output_dto)
 
 
 @router.get(
     '/featured', response_model=ProductListResponse, status_code=status.HTTP_200_OK
 )
-def get_featured_products(
+async def get_featured_products(
+    response: Response,
     limit: int = Query(10, ge=1, le=50, description='取得件数'),
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
 ) -> ProductListResponse:
     """おすすめ商品を取得"""
-    output_dto = product_usecase.get_featured_products(limit=limit)
+    response.headers['Cache-Control'] = list_cache_control()
+    output_dto = await product_usecase.run(lambda u: u.get_featured_products(limit=limit))
     return ProductListResponse.from_dto(output_dto)
 
 
 @router.get(
     '/search', response_model=ProductSearchResponse, status_code=status.HTTP_200_OK
 )
-def search_products(
+async def search_products(
+    response: Response,
     keyword: str = Query(..., min_length=1, description='検索キーワード'),
     category_id: str | None = Query(None, description='カテゴリID'),
     limit: int = Query(20, ge=1, le=100, description='取得件数'),
     offset: int = Query(0, ge=0, description='オフセット'),
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
 ) -> ProductSearchResponse:
     """商品を検索"""
+    response.headers['Cache-Control'] = list_cache_control()
     input_dto = ProductSearchInputDTO(
         keyword=keyword,
         category_id=category_id,
         limit=limit,
         offset=offset,
     )
-    output_dto = product_usecase.search_products(input_dto)
+    output_dto = await product_usecase.run(lambda u: u.search_products(input_dto))
     return ProductSearchResponse.from_dto(output_dto)
 
 
 @router.get(
     '/{product_id}', response_model=ProductDetailResponse, status_code=status.HTTP_200_OK
 )
-def get_product(
+async def get_product(
     product_id: str,
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
-) -> ProductDetailResponse:
-    """商品詳細を取得"""
-    output_dto = product_usecase.get_product_by_id(product_id)
+    request: Request,
+    response: Response,
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
+) -> ProductDetailResponse | Response:
+    """商品詳細を取得
+
+    ETag / Last-Modified に対応し、変更がなければ詳細を組み立てずに 304 を返す。
+    """
+    version = await product_usecase.run(lambda u: u.get_product_version(product_id))
+    etag = make_etag(version.version)
+    if is_not_modified(request, etag, version.updated_at):
+        return not_modified_response(etag, version.updated_at)
+
+    output_dto = await product_usecase.run(lambda u: u.get_product_by_id(product_id))
+    set_validators(response, etag, version.updated_at)
     return ProductDetailResponse.from_dto(output_dto)
 
 
@@ -88,12 +113,14 @@ def get_product(
     response_model=ProductOptionsResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_product_options(
+async def get_product_options(
     product_id: str,
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
+    response: Response,
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
 ) -> ProductOptionsResponse:
     """商品オプションを取得"""
-    output_dto = product_usecase.get_product_options(product_id)
+    response.headers['Cache-Control'] = list_cache_control()
+    output_dto = await product_usecase.run(lambda u: u.get_product_options(product_id))
     return ProductOptionsResponse.from_dto(output_dto)
 
 
@@ -102,10 +129,12 @@ def get_product_options(
     response_model=ProductRelatedResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_related_products(
+async def get_related_products(
     product_id: str,
-    product_usecase: ProductUsecase = Depends(get_product_usecase),
+    response: Response,
+    product_usecase: AsyncUsecase[ProductUsecase] = Depends(get_product_usecase),
 ) -> ProductRelatedResponse:
     """関連商品を取得"""
-    output_dto = product_usecase.get_related_products(product_id)
+    response.headers['Cache-Control'] = list_cache_control()
+    output_dto = await product_usecase.run(lambda u: u.get_related_products(product_id))
     return ProductRelatedResponse.from_dto(output_dto)
@@ -1,9 +1,11 @@
 """商品マスタAPI（公開API）"""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.application.use_cases.catalog.product_master_usecase import ProductMasterUsecase
 from app.di.catalog.product_master import get_product_master_usecase
+from app.infrastructure.db.async_usecase import AsyncUsecase
+from app.presentation.http_cache import list_cache_control
 from app.presentation.schemas.catalog.product_master_schemas import (
     ProductMasterListResponse,
 )
@@ -16,9 +18,11 @@ router = APIRouter(prefix='/masters', tags=['商品マスタ'])
     response_model=ProductMasterListResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_product_masters(
-    usecase: ProductMasterUsecase = Depends(get_product_master_usecase),
+async def get_product_masters(
+    response: Response,
+    usecase: AsyncUsecase[ProductMasterUsecase] = Depends(get_product_master_usecase),
 ) -> ProductMasterListResponse:
     """商品マスタ一覧を取得"""
-    output_dto = usecase.get_product_masters()
+    response.headers['Cache-Control'] = list_cache_control()
+    output_dto = await usecase.run(lambda u: u.get_product_masters())
     return ProductMasterListResponse.from_dto(output_dto)
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, status
 
 from app.application.use_cases.checkout.cart_usecase import CartUsecase
 from app.di.checkout.cart import get_cart_usecase
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.security.security_service_impl import (
     User,
     get_current_user_from_cookie,
@@ -22,25 +23,27 @@ router = APIRouter(prefix='/cart', tags=['カート'])
 
 
 @router.get('', response_model=GetCartResponse, status_code=status.HTTP_200_OK)
-def get_cart(
+async def get_cart(
     current_user: User = Depends(get_current_user_from_cookie),
-    cart_usecase: CartUsecase = Depends(get_cart_usecase),
+    cart_usecase: AsyncUsecase[CartUsecase] = Depends(get_cart_usecase),
 ) -> GetCartResponse:
     """カート内容取得エンドポイント"""
-    output_dto = cart_usecase.get_cart(current_user.id)
+    output_dto = await cart_usecase.run(lambda u: u.get_cart(current_user.id))
     return GetCartResponse.from_dto(output_dto)
 
 
 @router.post(
     '/items', response_model=AddToCartResponse, status_code=status.HTTP_201_CREATED
 )
-def add_to_cart(
+async def add_to_cart(
     request: AddToCartRequest,
     current_user: User = Depends(get_current_user_from_cookie),
-    cart_usecase: CartUsecase = Depends(get_cart_usecase),
+    cart_usecase: AsyncUsecase[CartUsecase] = Depends(get_cart_usecase),
 ) -> AddToCartResponse:
     """カート追加エンドポイント"""
-    output_dto = cart_usecase.add_to_cart(current_user.id, request.to_dto())
+    output_dto = await cart_usecase.run(
+        lambda u: u.add_to_cart(current_user.id, request.to_dto())
+    )
     return AddToCartResponse.from_dto(output_dto)
 
 
@@ -49,14 +52,16 @@ def add_to_cart(
     response_model=UpdateCartItemResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_cart_item(
+async def update_cart_item(
     item_id: int,
     request: UpdateCartItemRequest,
     current_user: User = Depends(get_current_user_from_cookie),
-    cart_usecase: CartUsecase = Depends(get_cart_usecase),
+    cart_usecase: AsyncUsecase[CartUsecase] = Depends(get_cart_usecase),
 ) -> UpdateCartItemResponse:
     """カートアイテム更新エンドポイント"""
-    output_dto = cart_usecase.update_cart_item(current_user.id, item_id, request.to_dto())
+    output_dto = await cart_usecase.run(
+        lambda u: u.update_cart_item(current_user.id, item_id, request.to_dto())
+    )
     return UpdateCartItemResponse.from_dto(output_dto)
 
 
@@ -65,21 +70,23 @@ def update_cart_item(
     response_model=DeleteCartItemResponse,
     status_code=status.HTTP_200_OK,
 )
-def delete_cart_item(
+async def delete_cart_item(
     item_id: int,
     current_user: User = Depends(get_current_user_from_cookie),
-    cart_usecase: CartUsecase = Depends(get_cart_usecase),
+    cart_usecase: AsyncUsecase[CartUsecase] = Depends(get_cart_usecase),
 ) -> DeleteCartItemResponse:
     """カートアイテム削除エンドポイント"""
-    output_dto = cart_usecase.delete_cart_item(current_user.id, item_id)
+    output_dto = await cart_usecase.run(
+        lambda u: u.delete_cart_item(current_user.id, item_id)
+    )
     return DeleteCartItemResponse.from_dto(output_dto)
 
 
 @router.delete('', response_model=ClearCartResponse, status_code=status.HTTP_200_OK)
-def clear_cart(
+async def clear_cart(
     current_user: User = Depends(get_current_user_from_cookie),
-    cart_usecase: CartUsecase = Depends(get_cart_usecase),
+    cart_usecase: AsyncUsecase[CartUsecase] = Depends(get_cart_usecase),
 ) -> ClearCartResponse:
     """カート全削除エンドポイント"""
-    output_dto = cart_usecase.clear_cart(current_user.id)
+    output_dto = await cart_usecase.run(lambda u: u.clear_cart(current_user.id))
     return ClearCartResponse.from_dto(output_dto)
@@ -9,6 +9,7 @@ from app.application.schemas.checkout.payment_schemas import (
 )
 from app.application.use_cases.checkout.payment_usecase import PaymentUsecase
 from app.di.checkout.payment import get_payment_usecase
+from app.infrastructure.db.async_usecase import AsyncUsecase
 from app.infrastructure.security.security_service_impl import (
     User,
     get_current_user_from_cookie,
@@ -24,19 +25,19 @@ router = APIRouter(prefix='/payments', tags=['決済'])
     summary='PaymentIntent作成',
     description='注文の金額からPaymentIntentを作成し、client_secretを返却',
 )
-def create_payment_intent(
+async def create_payment_intent(
     request: CreatePaymentIntentRequest,
     current_user: User = Depends(get_current_user_from_cookie),
-    usecase: PaymentUsecase = Depends(get_payment_usecase),
+    usecase: AsyncUsecase[PaymentUsecase] = Depends(get_payment_usecase),
 ) -> CreatePaymentIntentResponse:
     """PaymentIntentを作成
 
     - 注文の金額からPaymentIntentを作成
     - client_secretを返却（Frontendで使用）
     """
-    output_dto = usecase.create_payment_intent(
-        user_id=current_user.id,
-        input_dto=request.to_dto(),
+    input_dto = request.to_dto()
+    output_dto = await usecase.run(
+        lambda u: u.create_payment_intent(user_id=current_user.id, input_dto=input_dto)
     )
     return CreatePaymentIntentResponse.from_dto(output_dto)
 
@@ -51,15 +52,17 @@ def create_payment_intent(
 async def handle_webhook(
     request: Request,
     stripe_signature: str = Header(..., alias='Stripe-Signature'),
-    usecase: PaymentUsecase = Depends(get_payment_usecase),
+    usecase: AsyncUsecase[PaymentUsecase] = Depends(get_payment_usecase),
 ) -> WebhookResponse:
-    """Stripe Webhookを処理
+    """Stripe Webhookを受信
 
-    処理するイベント:
+    署名を検証してイベントを台帳（stripe_events）に記録し、すぐに応答する。
+    再送・重複配信されたイベントは記録済みのため何もしない。
+    記録したイベントはバックグラウンドで処理する:
     - payment_intent.succeeded: 決済成功 → 注文ステータスをpaidに更新
     - payment_intent.payment_failed: 決済失敗 → ログ記録
     - charge.refunded: 返金 → ログ記録
     """
     payload = await request.body()
-    usecase.handle_webhook(payload, stripe_signature)
+    await usecase.run(lambda u: u.handle_webhook(payload, stripe_signature))
     return WebhookResponse(received=True)
@@ -0,0 +1,64 @@
+"""クライアントIPアドレスの解決（レート制限・操作ログ用）
+
+ALB は X-Forwarded-For の末尾（右端）に接続元のアドレスを追記する。先頭側の値は
+クライアントが任意に付けられるため、右端から信頼するプロキシ（ALB / VPC のCIDR）の
+アドレスを読み飛ばし、最初に現れた信頼できないアドレスをクライアントとみなす。
+
+- 接続元が信頼するプロキシでない場合は X-Forwarded-For を見ずに接続元を使う
+- 信頼するプロキシは TRUSTED_PROXY_CIDRS で設定する（未設定の場合はヘッダーを使わない）
+
+uvicorn の --forwarded-allow-ips "*" は先頭の値を採用するため、ヘッダーを偽装するだけで
+リクエストごとに別のレート制限のキーになる。コンテナでは指定せず、ここで解決する。
+"""
+
+import ipaddress
+from collections.abc import Sequence
+from functools import lru_cache
+
+from fastapi import Request
+
+from app.config import get_settings
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@lru_cache
+def _parse_networks(cidrs: tuple[str, ...]) -> tuple[IPNetwork, ...]:
+    return tuple(ipaddress.ip_network(cidr.strip(), strict=False) for cidr in cidrs)
+
+
+def _is_trusted(host: str, trusted_proxies: Sequence[IPNetwork]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted_proxies)
+
+
+def client_ip(
+    request: Request, trusted_proxies: Sequence[IPNetwork] | None = None
+) -> str | None:
+    """リクエストのクライアントIPアドレス
+
+    Args:
+        request: リクエスト
+        trusted_proxies: 信頼するプロキシのネットワーク（省略時は TRUSTED_PROXY_CIDRS）
+
+    Returns:
+        クライアントのIPアドレス（接続元が不明な場合はNone）
+    """
+    if request.client is None:
+        return None
+    peer = request.client.host
+    if trusted_proxies is None:
+        trusted_proxies = _parse_networks(tuple(get_settings().trusted_proxy_cidrs))
+    if not _is_trusted(peer, trusted_proxies):
+        return peer
+
+    forwarded_for = ','.join(request.headers.getlist('x-forwarded-for'))
+    hops = [hop.strip() for hop in forwarded_for.split(',') if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted_proxies):
+            return hop
+    # 全て信頼するプロキシの場合（VPC内からの直接アクセス等）は最も遠いアドレス
+    return hops[0] if hops else peer
@@ -23,6 +23,7 @@ from app.domain.exceptions.auth import (
     EmailNotVerifiedError,
     InvalidCredentialsError,
     InvalidTokenError,
+    RateLimitExceededError,
 )
 from app.domain.exceptions.base import DomainException
 from app.domain.exceptions.cart import (
@@ -31,9 +32,11 @@ from app.domain.exceptions.cart import (
     NoAvailableProductsError,
 )
 from app.domain.exceptions.common import (
+    InvalidCursorError,
     NotFoundError,
     OperationFailedError,
     PermissionDeniedError,
+    ServiceBusyError,
     ValidationError,
 )
 from app.domain.exceptions.order import OrderCannotCancelError, OrderNotFoundError
@@ -73,6 +76,7 @@ EXCEPTION_STATUS_MAP: dict[type[DomainException], int] = {
     PaymentIntentCreationError: 400,
     WebhookSignatureError: 400,
     ValidationError: 400,
+    InvalidCursorError: 400,
     AdminEmailAlreadyExistsError: 400,
     CannotDeleteSelfError: 400,
     InvalidContentTypeError: 400,
@@ -98,8 +102,12 @@ EXCEPTION_STATUS_MAP: dict[type[DomainException], int] = {
     AddressNotFoundError: 404,
     AdminNotFoundError: 404,
     UploadNotFoundError: 404,
+    # 429 Too Many Requests - 試行回数の上限超過
+    RateLimitExceededError: 429,
     # 500 Internal Server Error - 操作失敗
     OperationFailedError: 500,
+    # 503 Service Unavailable - 混雑による受付拒否
+    ServiceBusyError: 503,
 }
 
 
@@ -124,12 +132,18 @@ async def domain_exception_handler(
     else:
         logger.warning(f'Domain exception: {exc.code} - {exc.message}')
 
+    # レート制限の場合は再試行までの秒数を通知する
+    headers = None
+    if isinstance(exc, RateLimitExceededError):
+        headers = {'Retry-After': str(exc.retry_after_seconds)}
+
     return JSONResponse(
         status_code=status_code,
         content={
             'detail': exc.message,
             'code': exc.code,
         },
+        headers=headers,
     )
 
 
@@ -0,0 +1,98 @@
+"""HTTPキャッシュ（条件付きGET）ヘルパー
+
+カタログAPIで ETag / Last-Modified / Cache-Control を扱う。
+If-None-Match が一致した場合は 304 を返し、レスポンスの組み立てを省略する。
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+from app.config import get_settings
+
+# レスポンススキーマを変更した場合はこの値を変え、既存のETagを無効にする
+ETAG_SCHEMA_VERSION = 'v1'
+
+# ETag付きの詳細レスポンス用: CDN・ブラウザに保存させ、毎回ETagで再検証させる
+REVALIDATE_CACHE_CONTROL = 'public, no-cache'
+
+
+def make_etag(*parts: str) -> str:
+    """バージョン文字列から強いETagを生成"""
+    source = '|'.join([ETAG_SCHEMA_VERSION, *parts])
+    return f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+
+
+def list_cache_control() -> str:
+    """一覧系レスポンスのCache-Controlヘッダー値"""
+    settings = get_settings()
+    return (
+        f'public, max-age={settings.catalog_http_max_age_seconds}, '
+        f'stale-while-revalidate={settings.catalog_http_stale_while_revalidate_seconds}'
+    )
+
+
+def format_last_modified(updated_at: datetime | None) -> str | None:
+    """DBの更新日時（UTCのnaive datetime）をHTTP日付形式に変換"""
+    if updated_at is None:
+        return None
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    return format_datetime(updated_at.replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(
+    request: Request, etag: str, updated_at: datetime | None = None
+) -> bool:
+    """条件付きリクエストに対して 304 を返せるか判定
+
+    If-None-Match がある場合はそれのみで判定し（RFC 9110）、
+    ない場合に限り If-Modified-Since を使う。
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        # If-None-Match は弱い比較（W/ プレフィックスを無視）
+        candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return etag in candidates
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is None or updated_at is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    return updated_at.replace(microsecond=0) <= since
+
+
+def set_validators(
+    response: Response,
+    etag: str,
+    updated_at: datetime | None = None,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> None:
+    """ETag・Last-Modified・Cache-Controlをレスポンスに設定"""
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = cache_control
+    last_modified = format_last_modified(updated_at)
+    if last_modified is not None:
+        response.headers['Last-Modified'] = last_modified
+
+
+def not_modified_response(
+    etag: str,
+    updated_at: datetime | None = None,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    """304 Not Modified レスポンスを生成"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, updated_at, cache_control)
+    return response
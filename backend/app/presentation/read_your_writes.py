@@ -0,0 +1,56 @@
+"""管理画面の更新直後の読み取りをプライマリに向ける（read-your-writes）
+
+管理APIで更新系のリクエストが成功したら、一定時間有効なCookieを返す。
+Cookieを持つリクエストの読み取り専用セッションはリードレプリカではなくプライマリを使うため、
+レプリカの反映遅延があっても更新した本人には更新後のデータが見える。
+（Cookieはブラウザが保持するため、次のリクエストが別のECSタスクに届いても有効）
+"""
+
+import time
+
+from fastapi import FastAPI, Request
+
+from app.config import get_settings
+
+PRIMARY_READ_COOKIE = 'read_primary_until'
+
+# 更新系のHTTPメソッド
+_WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+def prefers_primary_reads(request: Request) -> bool:
+    """自分の更新を読む必要がある（プライマリから読むべき）リクエストか"""
+    value = request.cookies.get(PRIMARY_READ_COOKIE)
+    if value is None:
+        return False
+    try:
+        return time.time() < float(value)
+    except ValueError:
+        return False
+
+
+def register_read_your_writes_middleware(app: FastAPI) -> None:
+    """管理APIの更新成功時にCookieを設定するミドルウェアを登録
+
+    Args:
+        app: FastAPIアプリケーション
+    """
+
+    @app.middleware('http')
+    async def set_primary_read_cookie(request: Request, call_next):
+        response = await call_next(request)
+        if (
+            request.method in _WRITE_METHODS
+            and request.url.path.startswith('/api/admin/')
+            and response.status_code < 400
+        ):
+            seconds = get_settings().replica_read_your_writes_seconds
+            response.set_cookie(
+                key=PRIMARY_READ_COOKIE,
+                value=str(int(time.time() + seconds) + 1),
+                max_age=int(seconds) + 1,
+                httponly=True,
+                secure=True,
+                samesite='lax',
+            )
+        return response
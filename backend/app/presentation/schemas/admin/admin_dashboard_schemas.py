@@ -10,6 +10,10 @@ from app.application.schemas.admin.admin_dashboard_schemas import (
     StatsDataPointDTO,
     StatsSummaryDTO,
 )
+from app.infrastructure.cache.catalog_cache import CacheStats
+from app.infrastructure.db.pool_metrics import PoolStats
+from app.infrastructure.security.password_hasher import PasswordHasherStats
+from app.infrastructure.stripe.stripe_metrics import StripeOperationStats
 
 # ========== Response Models ==========
 
@@ -77,6 +81,129 @@ class GetStatsResponse(BaseModel):
     summary: StatsSummaryResponse
 
 
+class CatalogCacheStatsResponse(BaseModel):
+    """カタログキャッシュ統計レスポンス"""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    invalidations: int
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    version: int
+
+    @classmethod
+    def from_stats(cls, stats: CacheStats) -> 'CatalogCacheStatsResponse':
+        return cls(
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_rate=stats.hit_rate,
+            evictions=stats.evictions,
+            invalidations=stats.invalidations,
+            size=stats.size,
+            max_entries=stats.max_entries,
+            ttl_seconds=stats.ttl_seconds,
+            version=stats.version,
+        )
+
+
+class PasswordHasherStatsResponse(BaseModel):
+    """パスワードハッシュ処理の統計レスポンス"""
+
+    workers: int
+    max_queue: int
+    rounds: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    rehashed: int
+    avg_wait_ms: float
+    avg_run_ms: float
+
+    @classmethod
+    def from_stats(cls, stats: PasswordHasherStats) -> 'PasswordHasherStatsResponse':
+        return cls(
+            workers=stats.workers,
+            max_queue=stats.max_queue,
+            rounds=stats.rounds,
+            in_flight=stats.in_flight,
+            queued=stats.queued,
+            completed=stats.completed,
+            rejected=stats.rejected,
+            rehashed=stats.rehashed,
+            avg_wait_ms=stats.avg_wait_ms,
+            avg_run_ms=stats.avg_run_ms,
+        )
+
+
+class HistogramBucketResponse(BaseModel):
+    """ヒストグラムのバケット（le_ms 以下の累積件数。le_ms=null は全件）"""
+
+    le_ms: float | None
+    count: int
+
+
+class DbPoolStatsResponse(BaseModel):
+    """コネクションプール統計レスポンス"""
+
+    name: str
+    size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_checkout_wait_ms: float
+    max_checkout_wait_ms: float
+    checkout_wait_histogram: list[HistogramBucketResponse]
+
+    @classmethod
+    def from_stats(cls, stats: PoolStats) -> 'DbPoolStatsResponse':
+        return cls(
+            name=stats.name,
+            size=stats.size,
+            max_overflow=stats.max_overflow,
+            checked_out=stats.checked_out,
+            overflow=stats.overflow,
+            checkouts=stats.checkouts,
+            timeouts=stats.timeouts,
+            avg_checkout_wait_ms=stats.avg_checkout_wait_ms,
+            max_checkout_wait_ms=stats.max_checkout_wait_ms,
+            checkout_wait_histogram=[
+                HistogramBucketResponse(le_ms=b.le_ms, count=b.count)
+                for b in stats.checkout_wait_histogram
+            ],
+        )
+
+
+class StripeOperationStatsResponse(BaseModel):
+    """Stripe API呼び出しの操作ごとの統計レスポンス"""
+
+    operation: str
+    calls: int
+    errors: int
+    avg_latency_ms: float
+    max_latency_ms: float
+    latency_histogram: list[HistogramBucketResponse]
+
+    @classmethod
+    def from_stats(cls, stats: StripeOperationStats) -> 'StripeOperationStatsResponse':
+        return cls(
+            operation=stats.operation,
+            calls=stats.calls,
+            errors=stats.errors,
+            avg_latency_ms=stats.avg_latency_ms,
+            max_latency_ms=stats.max_latency_ms,
+            latency_histogram=[
+                HistogramBucketResponse(le_ms=b.le_ms, count=b.count)
+                for b in stats.latency_histogram
+            ],
+        )
+
+
 # ========== Request Models (Query Params) ==========
 
 
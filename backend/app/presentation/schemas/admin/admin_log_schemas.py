@@ -45,9 +45,10 @@ class GetAdminLogsResponse(BaseModel):
     """操作ログ一覧レスポンス"""
 
     logs: list[AdminLogResponse]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 # ========== Request Models (Query Params) ==========
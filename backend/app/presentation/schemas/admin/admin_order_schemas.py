@@ -62,6 +62,8 @@ class AdminOrderResponse(BaseModel):
     delivered_at: datetime | None
     cancelled_at: datetime | None
     notes: str | None
+    requires_upload: bool
+    upload_item_count: int
     created_at: datetime
 
     @classmethod
@@ -82,6 +84,8 @@ class AdminOrderResponse(BaseModel):
             delivered_at=dto.delivered_at,
             cancelled_at=dto.cancelled_at,
             notes=dto.notes,
+            requires_upload=dto.requires_upload,
+            upload_item_count=dto.upload_item_count,
             created_at=dto.created_at,
         )
 
@@ -120,6 +124,8 @@ class AdminOrderDetailResponse(AdminOrderResponse):
             cancel_reason=dto.cancel_reason,
             notes=dto.notes,
             admin_notes=dto.admin_notes,
+            requires_upload=dto.requires_upload,
+            upload_item_count=dto.upload_item_count,
             created_at=dto.created_at,
             updated_at=dto.updated_at,
             items=[AdminOrderItemResponse.from_dto(item) for item in dto.items],
@@ -130,9 +136,10 @@ class GetAdminOrdersResponse(BaseModel):
     """注文一覧レスポンス"""
 
     orders: list[AdminOrderResponse]
-    total: int
+    total: int | None
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 class GetAdminOrderResponse(BaseModel):
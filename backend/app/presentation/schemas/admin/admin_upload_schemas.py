@@ -50,9 +50,10 @@ class GetAdminUploadsResponse(BaseModel):
     """Admin入稿データ一覧レスポンス"""
 
     uploads: list[AdminUploadResponse] = Field(..., description='入稿データ一覧')
-    total: int = Field(..., description='総件数')
+    total: int | None = Field(..., description='総件数（カーソル指定時はNone）')
     limit: int = Field(..., description='取得件数')
     offset: int = Field(..., description='オフセット')
+    next_cursor: str | None = Field(None, description='次ページ取得用カーソル')
 
     @classmethod
     def from_dto(cls, dto: GetAdminUploadsOutputDTO) -> GetAdminUploadsResponse:
@@ -62,6 +63,7 @@ class GetAdminUploadsResponse(BaseModel):
             total=dto.total,
             limit=dto.limit,
             offset=dto.offset,
+            next_cursor=dto.next_cursor,
         )
 
 
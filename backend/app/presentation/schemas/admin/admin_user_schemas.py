@@ -25,6 +25,9 @@ class CustomerResponse(BaseModel):
     phone: str | None = Field(None, description='電話番号')
     company: str | None = Field(None, description='会社名')
     is_email_verified: bool = Field(..., description='メール認証済み')
+    order_count: int = Field(..., description='注文数')
+    total_spent: int = Field(..., description='累計購入金額')
+    last_order_at: datetime | None = Field(None, description='最終注文日時')
     created_at: datetime | None = Field(None, description='登録日時')
     updated_at: datetime | None = Field(None, description='更新日時')
 
@@ -38,8 +41,6 @@ class CustomerDetailResponse(CustomerResponse):
     """顧客詳細レスポンス"""
 
     stripe_customer_id: str | None = Field(None, description='Stripe顧客ID')
-    order_count: int = Field(..., description='注文数')
-    total_spent: int = Field(..., description='累計購入金額')
 
     @classmethod
     def from_dto(cls, dto: CustomerDetailDTO) -> 'CustomerDetailResponse':
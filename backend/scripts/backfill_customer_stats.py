@@ -0,0 +1,60 @@
+"""
+顧客別集計（customer_stats）の再計算スクリプト
+
+orders テーブルから顧客別集計（注文数・累計購入金額・最終注文日時）を作り直します。
+通常は注文の作成・更新時に集計が増減されるため、以下の場合に使用します。
+
+- 集計テーブル導入前のデータの投入（マイグレーションでも投入済み）
+- SQLでの直接修正など、アプリケーションを経由しない注文の変更の反映
+
+使用方法:
+    python backend/scripts/backfill_customer_stats.py
+    python backend/scripts/backfill_customer_stats.py --user-id 1 --user-id 2
+    または
+    make backfill-customer-stats
+
+注意:
+    - 対象顧客の行を削除して再投入するため、同一トランザクション内で実行します
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.infrastructure.db.repositories.order_repository_impl import (  # noqa: E402
+    OrderRepositoryImpl,
+)
+from app.infrastructure.db.session import SessionLocal  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='顧客別集計を orders から再計算する')
+    parser.add_argument(
+        '--user-id',
+        dest='user_ids',
+        type=int,
+        action='append',
+        help='対象のユーザーID（複数指定可・省略時は全顧客）',
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        OrderRepositoryImpl(session).refresh_customer_stats(args.user_ids)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    target = f'{len(args.user_ids)}件の顧客' if args.user_ids else '全顧客'
+    print(f'顧客別集計を再計算しました（{target}）')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+日次売上集計（daily_sales）の再計算スクリプト
+
+orders テーブルから日次売上集計を作り直します。
+通常は注文の作成・更新時に集計が増減されるため、以下の場合に使用します。
+
+- 集計テーブル導入前のデータの投入（マイグレーションでも投入済み）
+- SQLでの直接修正など、アプリケーションを経由しない注文の変更の反映
+
+使用方法:
+    python backend/scripts/backfill_daily_sales.py
+    python backend/scripts/backfill_daily_sales.py --from 2026-01-01 --to 2026-01-31
+    または
+    make backfill-daily-sales
+
+注意:
+    - 対象期間の行を削除して再投入するため、同一トランザクション内で実行します
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.infrastructure.db.repositories.order_repository_impl import (  # noqa: E402
+    OrderRepositoryImpl,
+)
+from app.infrastructure.db.session import SessionLocal  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='日次売上集計を orders から再計算する')
+    parser.add_argument(
+        '--from', dest='date_from', type=date.fromisoformat, help='開始日（YYYY-MM-DD）'
+    )
+    parser.add_argument(
+        '--to', dest='date_to', type=date.fromisoformat, help='終了日（YYYY-MM-DD）'
+    )
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        OrderRepositoryImpl(session).refresh_daily_sales(args.date_from, args.date_to)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    period = f'{args.date_from or "最初"} 〜 {args.date_to or "最後"}'
+    print(f'日次売上集計を再計算しました（{period}）')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""API同時実行ベンチマーク（同期セッション vs 非同期セッション）
+
+同じ ProductUsecase を
+- 同期: def エンドポイント + get_db（psycopg2・スレッドプールで実行）
+- 非同期: async def エンドポイント + get_async_db（asyncpg・run_syncで実行）
+の2通りで公開した計測用アプリを組み立て、同時リクエスト数を変えながら
+スループットとレイテンシを比較する。
+
+スレッドプールの上限（Starletteの既定は40）を超える同時実行数で、
+同期版は待ち行列が伸び、非同期版はDBのコネクションプールまで並列に処理できる。
+毎回DBへ問い合わせる状態で計測するため、カタログキャッシュを無効にして実行すること。
+
+使用方法:
+    docker compose exec -e CATALOG_CACHE_ENABLED=false backend \\
+        python -m scripts.benchmarks.api_concurrency
+    docker compose exec -e CATALOG_CACHE_ENABLED=false backend \\
+        python -m scripts.benchmarks.api_concurrency \\
+        --concurrency 10 50 100 --requests 1000 --path '/products?limit=20'
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from anyio import to_thread
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.application.schemas.catalog.product_schemas import ProductListInputDTO
+from app.config import get_settings
+from app.di import get_db
+from app.di.catalog.product import build_product_usecase, get_product_usecase
+from app.infrastructure.db.async_usecase import AsyncUsecase
+from app.infrastructure.db.session import async_engine, engine
+
+
+def create_app() -> FastAPI:
+    """同期版・非同期版の商品一覧エンドポイントを持つ計測用アプリ"""
+    app = FastAPI()
+
+    @app.get('/sync/products')
+    def sync_products(limit: int = 20, session: Session = Depends(get_db)):
+        output_dto = build_product_usecase(session).get_products(
+            ProductListInputDTO(limit=limit)
+        )
+        return {'total': output_dto.total}
+
+    @app.get('/async/products')
+    async def async_products(
+        limit: int = 20,
+        usecase: AsyncUsecase = Depends(get_product_usecase),
+    ):
+        output_dto = await usecase.run(
+            lambda u: u.get_products(ProductListInputDTO(limit=limit))
+        )
+        return {'total': output_dto.total}
+
+    return app
+
+
+async def run_load(
+    client: httpx.AsyncClient, path: str, concurrency: int, requests: int
+) -> tuple[float, float, float, int]:
+    """(req/s, p50[ms], p95[ms], エラー数) を返す"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    return requests / elapsed, p50, p95, errors
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if get_settings().catalog_cache_enabled:
+        print('警告: カタログキャッシュが有効です（CATALOG_CACHE_ENABLED=false を推奨）')
+    to_thread.current_default_thread_limiter().total_tokens = args.threadpool_size
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        # ウォームアップ（コネクションプールの確立）
+        for mode in ('sync', 'async'):
+            await run_load(client, f'/{mode}{args.path}', 10, 50)
+
+        print(
+            f'スレッドプール上限: {args.threadpool_size} / '
+            f'リクエスト数: {args.requests} / パス: {args.path}'
+        )
+        print(
+            f'{"同時実行":>8} {"方式":>6} {"req/s":>9} {"p50":>9} {"p95":>9} {"err":>5}'
+        )
+        for concurrency in args.concurrency:
+            for mode in ('sync', 'async'):
+                rps, p50, p95, errors = await run_load(
+                    client, f'/{mode}{args.path}', concurrency, args.requests
+                )
+                print(
+                    f'{concurrency:>8} {mode:>6} {rps:>9.1f} {p50:>9.1f} '
+                    f'{p95:>9.1f} {errors:>5}'
+                )
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='API同時実行ベンチマーク')
+    parser.add_argument(
+        '--concurrency', type=int, nargs='+', default=[10, 40, 100], help='同時実行数'
+    )
+    parser.add_argument('--requests', type=int, default=500, help='各計測のリクエスト数')
+    parser.add_argument(
+        '--path', default='/products?limit=20', help='計測するパス（/sync, /async以下）'
+    )
+    parser.add_argument(
+        '--threadpool-size', type=int, default=40, help='スレッドプールの上限'
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""メール本文の描画ベンチマーク
+
+旧実装（送信ごとに f-string でHTML全体を組み立て、商品行は文字列の += で連結）と
+コンパイル済みテンプレート（template_engine・HTML版とテキスト版の両方を描画）の
+1秒あたりの描画数を比較する。
+一斉送信を想定し、同じテンプレートを多数の宛先分まとめて描画する場合（render_many）も計測する。
+
+テンプレートの描画のみを計測するため、Resend のAPIキーやDBは不要。
+
+使用方法:
+    docker compose exec backend python -m scripts.benchmarks.email_render
+    docker compose exec backend python -m scripts.benchmarks.email_render \\
+        --repeat 5000 --items 10 --recipients 1000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from app.infrastructure.email.template_engine import EmailTemplates
+
+FRONTEND_URL = 'https://acrique.example.com'
+
+
+def legacy_order_confirmation(order: dict) -> str:
+    """旧実装と同じ組み立て方の注文確認メール"""
+    items_html = ''
+    for item in order['items']:
+        items_html += f"""
+            <tr>
+                <td style="padding: 12px 0; border-bottom: 1px solid #eee;">{item['name']}</td>
+                <td style="padding: 12px 0; border-bottom: 1px solid #eee; text-align: center;">{item['quantity']}</td>
+                <td style="padding: 12px 0; border-bottom: 1px solid #eee; text-align: right;">¥{item['price']:,}</td>
+            </tr>
+            """
+
+    display_name = order['user_name'] if order['user_name'] else 'お客様'
+
+    return f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; }}
+        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+        .header {{ text-align: center; padding: 20px 0; border-bottom: 1px solid #eee; }}
+        .content {{ padding: 30px 0; }}
+        .order-info {{ background-color: #f9f9f9; padding: 20px; border-radius: 4px; margin: 20px 0; }}
+        .button {{ display: inline-block; padding: 12px 24px; background-color: #000; color: #fff !important; text-decoration: none; border-radius: 4px; }}
+        .footer {{ text-align: center; padding: 20px 0; color: #888; font-size: 12px; border-top: 1px solid #eee; }}
+        table {{ width: 100%; border-collapse: collapse; }}
+        th {{ text-align: left; padding: 12px 0; border-bottom: 2px solid #333; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>ACRIQUE</h1>
+        </div>
+        <div class="content">
+            <p>{display_name}様</p>
+            <p>この度はACRIQUEをご利用いただき、誠にありがとうございます。<br>
+            以下の内容でご注文を承りました。</p>
+
+            <div class="order-info">
+                <p><strong>注文番号:</strong> {order['order_number']}</p>
+                <p><strong>ご注文日:</strong> {order['order_date']}</p>
+            </div>
+
+            <h3>ご注文商品</h3>
+            <table>
+                <thead>
+                    <tr>
+                        <th>商品名</th>
+                        <th style="text-align: center;">数量</th>
+                        <th style="text-align: right;">金額</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {items_html}
+                </tbody>
+            </table>
+
+            <div style="text-align: right; margin-top: 20px; padding-top: 20px; border-top: 2px solid #333;">
+                <p style="font-size: 18px;"><strong>合計（税込）: ¥{order['total']:,}</strong></p>
+            </div>
+
+            <div class="order-info">
+                <h3 style="margin-top: 0;">お届け先</h3>
+                <p style="white-space: pre-line;">{order['shipping_address']}</p>
+            </div>
+
+            <h3>今後の流れ</h3>
+            <ol>
+                <li>ご注文内容を確認し、準備を進めます</li>
+                <li>入稿データが必要な商品は、マイページから入稿してください</li>
+                <li>商品の準備ができ次第、発送いたします</li>
+                <li>発送時に追跡番号をメールでお知らせします</li>
+            </ol>
+
+            <p style="text-align: center; margin: 30px 0;">
+                <a href="{FRONTEND_URL}/mypage/orders" class="button">注文状況を確認する</a>
+            </p>
+
+            <p>ご不明な点がございましたら、お気軽にお問い合わせください。</p>
+        </div>
+        <div class="footer">
+            <p>&copy; ACRIQUE All Rights Reserved.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def legacy_welcome(user_name: str) -> str:
+    """旧実装と同じ組み立て方のウェルカムメール"""
+    display_name = user_name if user_name else 'お客様'
+    return f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{ font-family: 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; }}
+        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
+        .header {{ text-align: center; padding: 20px 0; border-bottom: 1px solid #eee; }}
+        .content {{ padding: 30px 0; }}
+        .button {{ display: inline-block; padding: 12px 24px; background-color: #000; color: #fff !important; text-decoration: none; border-radius: 4px; }}
+        .footer {{ text-align: center; padding: 20px 0; color: #888; font-size: 12px; border-top: 1px solid #eee; }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>ACRIQUE</h1>
+        </div>
+        <div class="content">
+            <p>{display_name}様</p>
+            <p>ACRIQUEへの会員登録が完了しました。</p>
+            <p>ACRIQUEでは、極上のアクリル製品を1個からお作りしています。<br>
+            店舗什器、オフィスサイン、記念品など、様々なシーンでご利用いただけます。</p>
+            <p style="text-align: center; margin: 30px 0;">
+                <a href="{FRONTEND_URL}" class="button">商品を見る</a>
+            </p>
+        </div>
+        <div class="footer">
+            <p>&copy; ACRIQUE All Rights Reserved.</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def ops_per_second(fn: Callable[[], object], repeat: int) -> float:
+    """fn を repeat 回実行した1秒あたりの処理数"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='メール本文の描画ベンチマーク')
+    parser.add_argument(
+        '--repeat', type=int, default=2000, help='1通ずつの描画の計測回数'
+    )
+    parser.add_argument('--items', type=int, default=5, help='注文確認メールの商品行数')
+    parser.add_argument(
+        '--recipients', type=int, default=500, help='一斉送信で描画する宛先数'
+    )
+    args = parser.parse_args()
+
+    templates = EmailTemplates(static={'frontend_url': FRONTEND_URL})
+
+    order = {
+        'user_name': '山田 太郎',
+        'order_number': 'ACQ-260101-001',
+        'order_date': '2026年01月01日',
+        'items': [
+            {'name': f'アクリルスタンド {i}', 'quantity': i + 1, 'price': 1100 * (i + 1)}
+            for i in range(args.items)
+        ],
+        'total': sum(1100 * (i + 1) for i in range(args.items)),
+        'shipping_address': '〒100-0001\n東京都千代田区千代田1-1\n山田 太郎',
+    }
+
+    def compiled_order_confirmation():
+        items_html, items_text = templates.render_rows(
+            'order_item',
+            (
+                {
+                    'name': item['name'],
+                    'quantity': item['quantity'],
+                    'price': f'¥{item["price"]:,}',
+                }
+                for item in order['items']
+            ),
+        )
+        return templates.render(
+            'order_confirmation',
+            {
+                'display_name': order['user_name'],
+                'order_number': order['order_number'],
+                'order_date': order['order_date'],
+                'items': items_html,
+                'items_text': items_text,
+                'total': f'¥{order["total"]:,}',
+                'shipping_address': order['shipping_address'],
+            },
+        )
+
+    names = [f'会員 {i}' for i in range(args.recipients)]
+    bulk_values = [{'display_name': name} for name in names]
+    bulk_repeat = max(args.repeat // args.recipients, 10)
+
+    results = [
+        (
+            '注文確認（1通）',
+            '旧実装（HTMLのみ）',
+            ops_per_second(lambda: legacy_order_confirmation(order), args.repeat),
+        ),
+        (
+            '注文確認（1通）',
+            'テンプレート（HTML+テキスト）',
+            ops_per_second(compiled_order_confirmation, args.repeat),
+        ),
+        (
+            f'一斉送信（{args.recipients}通）',
+            '旧実装（HTMLのみ）',
+            ops_per_second(lambda: [legacy_welcome(n) for n in names], bulk_repeat)
+            * args.recipients,
+        ),
+        (
+            f'一斉送信（{args.recipients}通）',
+            'テンプレート（1通ずつ）',
+            ops_per_second(
+                lambda: [templates.render('welcome', v) for v in bulk_values],
+                bulk_repeat,
+            )
+            * args.recipients,
+        ),
+        (
+            f'一斉送信（{args.recipients}通）',
+            'テンプレート（render_many）',
+            ops_per_second(
+                lambda: templates.render_many('welcome', bulk_values), bulk_repeat
+            )
+            * args.recipients,
+        ),
+    ]
+
+    print(f'{"処理":<16} {"実装":<28} {"通/s":>12} {"μs/通":>10}')
+    for operation, name, ops in results:
+        print(f'{operation:<16} {name:<28} {ops:>12.1f} {1_000_000 / ops:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
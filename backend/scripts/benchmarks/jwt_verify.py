@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""JWT署名・検証ベンチマーク
+
+旧実装（リクエストごとに設定からPEM文字列を組み立て、python-joseに毎回パースさせる）と
+JwtKeyManager（起動時に1度だけパースした鍵を使う・検証済みクレームのキャッシュあり/なし）の
+1秒あたりの処理数を比較する。
+
+鍵はベンチマーク内で生成するため、環境変数の設定やDBは不要。
+
+使用方法:
+    docker compose exec backend python -m scripts.benchmarks.jwt_verify
+    docker compose exec backend python -m scripts.benchmarks.jwt_verify --repeat 5000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.infrastructure.security.jwt_key_manager import JwtKeyManager
+
+
+def generate_env_keys() -> tuple[str, str]:
+    """環境変数と同じ形式（改行を \\n にエスケープ）のRSA鍵ペアを生成"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        .decode()
+    )
+    return private_pem.replace('\n', '\\n'), public_pem.replace('\n', '\\n')
+
+
+def ops_per_second(fn: Callable[[], object], repeat: int) -> float:
+    """fn を repeat 回実行した1秒あたりの処理数"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return repeat / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='JWT署名・検証ベンチマーク')
+    parser.add_argument('--repeat', type=int, default=2000, help='検証の計測回数')
+    parser.add_argument('--sign-repeat', type=int, default=50, help='署名の計測回数')
+    args = parser.parse_args()
+
+    env_private, env_public = generate_env_keys()
+    claims = {'user_id': 1, 'exp': datetime.utcnow() + timedelta(hours=1)}
+
+    def legacy_keys() -> tuple[bytes, bytes]:
+        return (
+            env_private.replace('\\n', '\n').encode('utf-8'),
+            env_public.replace('\\n', '\n').encode('utf-8'),
+        )
+
+    def legacy_encode() -> str:
+        private_key, _ = legacy_keys()
+        return jwt.encode(claims, private_key, algorithm='RS256')
+
+    def legacy_decode(token: str) -> dict:
+        _, public_key = legacy_keys()
+        return jwt.decode(token, public_key, algorithms=['RS256'])
+
+    private_pem, public_pem = legacy_keys()
+    manager = JwtKeyManager(
+        private_pem, 'default', {'default': public_pem}, claims_cache_ttl_seconds=0
+    )
+    cached_manager = JwtKeyManager(private_pem, 'default', {'default': public_pem})
+
+    token = manager.encode(claims)
+    cached_manager.decode(token)
+
+    results = [
+        ('署名', '旧実装', ops_per_second(legacy_encode, args.sign_repeat)),
+        (
+            '署名',
+            'JwtKeyManager',
+            ops_per_second(lambda: manager.encode(claims), args.sign_repeat),
+        ),
+        ('検証', '旧実装', ops_per_second(lambda: legacy_decode(token), args.repeat)),
+        (
+            '検証',
+            'JwtKeyManager',
+            ops_per_second(lambda: manager.decode(token), args.repeat),
+        ),
+        (
+            '検証',
+            'JwtKeyManager（キャッシュ）',
+            ops_per_second(lambda: cached_manager.decode(token), args.repeat),
+        ),
+    ]
+
+    print(f'{"処理":<4} {"実装":<28} {"ops/s":>12} {"μs/op":>10}')
+    for operation, name, ops in results:
+        print(f'{operation:<4} {name:<28} {ops:>12.1f} {1_000_000 / ops:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""商品詳細のeager load戦略ベンチマーク
+
+シード済みカタログ（app/infrastructure/db/seeds/product_seed.py）の全商品と、
+コレクションが多い合成商品（画像8・オプション4x値6・スペック10・特長10・FAQ10）に対して
+ProductRepositoryImpl.get_by_id(include_relations=True) を実行し、
+ロード戦略ごとのSQL発行数・取得行数・レイテンシを比較する。
+
+合成商品は1トランザクション内で作成し、計測後にロールバックするため
+DBには何も残らない。
+
+使用方法:
+    docker compose exec backend python -m scripts.benchmarks.product_loading
+    docker compose exec backend python -m scripts.benchmarks.product_loading --repeat 50
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.product_model import (
+    ProductFaqModel,
+    ProductFeatureModel,
+    ProductImageModel,
+    ProductModel,
+    ProductOptionModel,
+    ProductOptionValueModel,
+    ProductSpecModel,
+)
+from app.infrastructure.db.repositories.product_repository_impl import (
+    DEFAULT_RELATION_LOAD_STRATEGIES,
+    ProductRepositoryImpl,
+)
+from app.infrastructure.db.seeds.product_seed import PRODUCTS
+from app.infrastructure.db.session import SessionLocal, engine
+
+HEAVY_PRODUCT_ID = 'benchmark-heavy-product'
+
+STRATEGIES: dict[str, dict[str, str]] = {
+    'joined (旧実装)': dict.fromkeys(DEFAULT_RELATION_LOAD_STRATEGIES, 'joined'),
+    'subquery': dict.fromkeys(DEFAULT_RELATION_LOAD_STRATEGIES, 'subquery'),
+    'selectin (デフォルト)': DEFAULT_RELATION_LOAD_STRATEGIES,
+}
+
+
+@dataclass
+class QueryCounter:
+    """エンジンのカーソル実行をフックしてSQL数・取得行数を数える"""
+
+    statements: int = 0
+    rows: int = 0
+    _active: bool = field(default=False, repr=False)
+
+    def __post_init__(self):
+        event.listen(engine, 'after_cursor_execute', self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not self._active:
+            return
+        self.statements += 1
+        # SELECTのrowcountはpsycopg2ではフェッチ済み行数を返す
+        if cursor.rowcount and cursor.rowcount > 0:
+            self.rows += cursor.rowcount
+
+    def start(self) -> None:
+        self.statements = 0
+        self.rows = 0
+        self._active = True
+
+    def stop(self) -> None:
+        self._active = False
+
+    def close(self) -> None:
+        event.remove(engine, 'after_cursor_execute', self._on_execute)
+
+
+def create_heavy_product(session: Session) -> None:
+    """コレクション件数の多い合成商品を作成（呼び出し側でロールバックする）"""
+    session.add(
+        ProductModel(
+            id=HEAVY_PRODUCT_ID,
+            category_id='shop',
+            name='Benchmark Heavy Product',
+            name_ja='ベンチマーク用商品',
+            base_price=10000,
+        )
+    )
+    session.flush()
+
+    for i in range(8):
+        session.add(
+            ProductImageModel(
+                product_id=HEAVY_PRODUCT_ID,
+                s3_url=f'https://example.com/bench/{i}.jpg',
+                is_main=i == 0,
+                sort_order=i,
+            )
+        )
+    for i in range(4):
+        option = ProductOptionModel(
+            product_id=HEAVY_PRODUCT_ID, name=f'option-{i}', sort_order=i
+        )
+        session.add(option)
+        session.flush()
+        for j in range(6):
+            session.add(
+                ProductOptionValueModel(
+                    option_id=option.id, label=f'value-{i}-{j}', sort_order=j
+                )
+            )
+    for i in range(10):
+        session.add(
+            ProductSpecModel(
+                product_id=HEAVY_PRODUCT_ID, label=f'spec-{i}', value='v', sort_order=i
+            )
+        )
+        session.add(
+            ProductFeatureModel(
+                product_id=HEAVY_PRODUCT_ID, title=f'feature-{i}', sort_order=i
+            )
+        )
+        session.add(
+            ProductFaqModel(
+                product_id=HEAVY_PRODUCT_ID,
+                question=f'question-{i}',
+                answer='answer',
+                sort_order=i,
+            )
+        )
+    session.flush()
+
+
+def measure(
+    session: Session,
+    counter: QueryCounter,
+    strategies: dict[str, str],
+    product_ids: list[str],
+    repeat: int,
+) -> tuple[int, int, list[float]]:
+    """指定戦略でget_by_idを実行し、(SQL数, 行数, レイテンシms一覧) を返す"""
+    repository = ProductRepositoryImpl(session, load_strategies=strategies)
+    latencies: list[float] = []
+    statements = 0
+    rows = 0
+
+    for i in range(repeat):
+        for product_id in product_ids:
+            # アイデンティティマップを空にして毎回DBから読み込ませる
+            session.expunge_all()
+            counter.start()
+            started = time.perf_counter()
+            repository.get_by_id(product_id, include_relations=True)
+            latencies.append((time.perf_counter() - started) * 1000)
+            counter.stop()
+            if i == 0:
+                statements += counter.statements
+                rows += counter.rows
+
+    return statements, rows, latencies
+
+
+def print_report(
+    title: str, session: Session, counter: QueryCounter, ids: list[str], repeat: int
+) -> None:
+    """戦略ごとの結果を表形式で出力"""
+    print(f'\n=== {title}（{len(ids)}商品 x {repeat}回） ===')
+    print(f'{"戦略":<24}{"SQL数":>8}{"取得行数":>10}{"p50(ms)":>10}{"p95(ms)":>10}')
+    for name, strategies in STRATEGIES.items():
+        statements, rows, latencies = measure(session, counter, strategies, ids, repeat)
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else p50
+        print(f'{name:<24}{statements:>8}{rows:>10}{p50:>10.2f}{p95:>10.2f}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='商品詳細のeager load戦略ベンチマーク')
+    parser.add_argument('--repeat', type=int, default=20, help='各商品の計測回数')
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    counter = QueryCounter()
+    try:
+        seeded_ids = [
+            product_id
+            for (product_id,) in session.query(ProductModel.id)
+            .filter(ProductModel.id.in_([p['id'] for p in PRODUCTS]))
+            .all()
+        ]
+        if seeded_ids:
+            print_report('シード済みカタログ', session, counter, seeded_ids, args.repeat)
+        else:
+            print('シード済み商品が見つかりません（run_seed.py を先に実行してください）')
+
+        create_heavy_product(session)
+        print_report(
+            '合成商品（最悪ケース）', session, counter, [HEAVY_PRODUCT_ID], args.repeat
+        )
+    finally:
+        session.rollback()
+        session.close()
+        counter.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""商品検索ベンチマーク
+
+合成した10万件の商品カタログに対して、旧実装（4列のILIKE + 別クエリのcount）と
+ProductRepositoryImpl.search（pg_trgm / tsvector のGINインデックス + count(*) OVER()）の
+SQL発行数・レイテンシを比較する。
+
+合成商品は1トランザクション内で作成し、計測後にロールバックするため
+DBには何も残らない。事前にマイグレーション（i6d7e8f9a0b1）を適用しておくこと。
+
+使用方法:
+    docker compose exec backend python -m scripts.benchmarks.product_search
+    docker compose exec backend python -m scripts.benchmarks.product_search --size 100000 --repeat 20
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session, selectinload
+
+from app.infrastructure.db.models.product_model import ProductModel
+from app.infrastructure.db.repositories.product_repository_impl import (
+    ProductRepositoryImpl,
+)
+from app.infrastructure.db.session import SessionLocal
+from scripts.benchmarks.product_loading import QueryCounter
+
+# 英語・日本語・ヒットしないキーワードを混ぜる
+KEYWORDS = [
+    'acrylic',
+    'stand 42',
+    'キーホルダー',
+    '名札',
+    'ロゴプレート',
+    'zzz-not-found',
+]
+
+_EN_WORDS = [
+    'Acrylic',
+    'Stand',
+    'Block',
+    'Frame',
+    'Sign',
+    'Plate',
+    'Cube',
+    'Keychain',
+    'Panel',
+    'Logo',
+]
+_JA_WORDS = [
+    'アクリル',
+    'スタンド',
+    'ブロック',
+    'フレーム',
+    '看板',
+    'プレート',
+    'キューブ',
+    'キーホルダー',
+    '名札',
+    'ロゴ',
+]
+
+
+def _sql_array(words: list[str]) -> str:
+    return 'ARRAY[' + ', '.join(f"'{w}'" for w in words) + ']'
+
+
+def create_synthetic_catalog(session: Session, size: int) -> None:
+    """合成商品を一括作成し統計情報を更新（呼び出し側でロールバックする）"""
+    en = _sql_array(_EN_WORDS)
+    ja = _sql_array(_JA_WORDS)
+    session.execute(
+        text(
+            f"""
+            INSERT INTO products (
+                id, category_id, name, name_ja, tagline, description,
+                base_price, production_type, is_active, is_featured, sort_order
+            )
+            SELECT
+                'bench-' || g,
+                (ARRAY['shop', 'office', 'you'])[g % 3 + 1],
+                ({en})[g % 10 + 1] || ' ' || ({en})[(g / 10) % 10 + 1] || ' ' || g,
+                ({ja})[g % 10 + 1] || ({ja})[(g / 10) % 10 + 1],
+                '空間を彩る' || ({ja})[(g / 100) % 10 + 1] || 'シリーズ',
+                '高透明アクリルを使用した' || ({ja})[g % 10 + 1]
+                    || '。オフィスや店舗のディスプレイに最適です。',
+                1000 + g % 5000,
+                'standard',
+                g % 20 <> 0,
+                false,
+                g
+            FROM generate_series(1, :size) AS g
+            """
+        ),
+        {'size': size},
+    )
+    session.execute(text('ANALYZE products'))
+
+
+def legacy_search(session: Session, keyword: str, limit: int = 20) -> int:
+    """旧実装: 4列のILIKEで行を取得し、同じ条件で件数を別途数える"""
+    search_filter = or_(
+        ProductModel.name.ilike(f'%{keyword}%'),
+        ProductModel.name_ja.ilike(f'%{keyword}%'),
+        ProductModel.tagline.ilike(f'%{keyword}%'),
+        ProductModel.description.ilike(f'%{keyword}%'),
+    )
+    query = session.query(ProductModel).filter(
+        ProductModel.is_active == True,  # noqa: E712
+        search_filter,
+    )
+    rows = query.order_by(ProductModel.sort_order, ProductModel.created_at.desc())
+    rows.limit(limit).options(selectinload(ProductModel.images)).all()
+    return query.count()
+
+
+def current_search(session: Session, keyword: str, limit: int = 20) -> int:
+    """新実装: ProductRepositoryImpl.search"""
+    return ProductRepositoryImpl(session).search(keyword=keyword, limit=limit).total
+
+
+def measure(session: Session, counter: QueryCounter, search, repeat: int):
+    """キーワードごとに (総件数, SQL数, p50, p95) を返す"""
+    results = {}
+    for keyword in KEYWORDS:
+        latencies: list[float] = []
+        total = statements = 0
+        for i in range(repeat):
+            session.expunge_all()
+            counter.start()
+            started = time.perf_counter()
+            total = search(session, keyword)
+            latencies.append((time.perf_counter() - started) * 1000)
+            counter.stop()
+            if i == 0:
+                statements = counter.statements
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else p50
+        results[keyword] = (total, statements, p50, p95)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='商品検索ベンチマーク')
+    parser.add_argument('--size', type=int, default=100_000, help='合成商品数')
+    parser.add_argument('--repeat', type=int, default=20, help='各キーワードの計測回数')
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    counter = QueryCounter()
+    try:
+        print(f'合成商品を{args.size}件作成中...')
+        create_synthetic_catalog(session, args.size)
+
+        for title, search in (
+            ('ILIKE (旧実装)', legacy_search),
+            ('GIN (新実装)', current_search),
+        ):
+            print(f'\n=== {title}（{args.repeat}回） ===')
+            print(
+                f'{"キーワード":<16}{"件数":>8}{"SQL数":>8}{"p50(ms)":>10}{"p95(ms)":>10}'
+            )
+            results = measure(session, counter, search, args.repeat)
+            for keyword, (total, statements, p50, p95) in results.items():
+                print(f'{keyword:<16}{total:>8}{statements:>8}{p50:>10.2f}{p95:>10.2f}')
+    finally:
+        session.rollback()
+        session.close()
+        counter.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 from fastapi import HTTPException
 
-from app.application.interfaces.email_service import IEmailService
+from app.application.interfaces.email_outbox import IEmailOutbox
 from app.application.interfaces.security_service import ISecurityService
 from app.application.schemas.auth_schemas import (
     LoginInputDTO,
@@ -35,19 +35,19 @@ def mock_token_repository():
 
 
 @pytest.fixture
-def mock_email_service():
-    """モックEmailService"""
-    return MagicMock(spec=IEmailService)
+def mock_email_outbox():
+    """モックEmailOutbox"""
+    return MagicMock(spec=IEmailOutbox)
 
 
 @pytest.fixture
-def auth_usecase(mock_security_service, mock_user_repository, mock_token_repository, mock_email_service):
+def auth_usecase(mock_security_service, mock_user_repository, mock_token_repository, mock_email_outbox):
     """AuthUsecaseインスタンス"""
     return AuthUsecase(
         security_service=mock_security_service,
         user_repository=mock_user_repository,
         token_repository=mock_token_repository,
-        email_service=mock_email_service,
+        email_outbox=mock_email_outbox,
     )
 
 
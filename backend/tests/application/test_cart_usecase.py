@@ -0,0 +1,86 @@
+"""CartUsecaseのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.use_cases.checkout.cart_usecase import CartUsecase
+from app.domain.entities.cart_item import CartItem
+from app.domain.entities.product import ProductProjection, ProductSummary
+from app.domain.repositories.cart_item_repository import ICartItemRepository
+from app.domain.repositories.product_repository import IProductRepository
+
+
+@pytest.fixture
+def mock_cart_item_repository():
+    """モックCartItemRepository"""
+    return MagicMock(spec=ICartItemRepository)
+
+
+@pytest.fixture
+def mock_product_repository():
+    """モックProductRepository"""
+    return MagicMock(spec=IProductRepository)
+
+
+@pytest.fixture
+def cart_usecase(mock_cart_item_repository, mock_product_repository):
+    """CartUsecaseインスタンス"""
+    return CartUsecase(
+        cart_item_repository=mock_cart_item_repository,
+        product_repository=mock_product_repository,
+    )
+
+
+def _summary(product_id: str, base_price: int) -> ProductSummary:
+    return ProductSummary(
+        id=product_id,
+        name=product_id,
+        name_ja=product_id,
+        base_price=base_price,
+        main_image_url=f'https://cdn.example.com/{product_id}.png',
+    )
+
+
+class TestCartUsecase:
+    """CartUsecaseのテストクラス"""
+
+    def test_get_cart_loads_products_in_one_batch(
+        self, cart_usecase, mock_cart_item_repository, mock_product_repository
+    ):
+        """カート取得時は商品を1回の一括取得で読み込む"""
+        mock_cart_item_repository.get_by_user_id.return_value = [
+            CartItem(id=i, user_id=1, product_id=f'p{i}', quantity=2) for i in range(30)
+        ]
+        mock_product_repository.get_many_by_ids.return_value = {
+            f'p{i}': _summary(f'p{i}', 1000) for i in range(30)
+        }
+
+        result = cart_usecase.get_cart(user_id=1)
+
+        mock_product_repository.get_many_by_ids.assert_called_once_with(
+            [f'p{i}' for i in range(30)],
+            projection=ProductProjection.SUMMARY_WITH_IMAGE,
+        )
+        mock_product_repository.get_by_id.assert_not_called()
+        assert result.item_count == 30
+        assert result.subtotal == 30 * 2 * 1000
+        assert result.items[0].product_image_url == 'https://cdn.example.com/p0.png'
+
+    def test_get_cart_removes_deleted_products(
+        self, cart_usecase, mock_cart_item_repository, mock_product_repository
+    ):
+        """削除済み商品のカートアイテムは除去される"""
+        mock_cart_item_repository.get_by_user_id.return_value = [
+            CartItem(id=1, user_id=1, product_id='alive', quantity=1),
+            CartItem(id=2, user_id=1, product_id='deleted', quantity=1),
+        ]
+        mock_product_repository.get_many_by_ids.return_value = {
+            'alive': _summary('alive', 500),
+        }
+
+        result = cart_usecase.get_cart(user_id=1)
+
+        mock_cart_item_repository.delete.assert_called_once_with(2)
+        assert result.item_count == 1
+        assert result.subtotal == 500
@@ -0,0 +1,167 @@
+"""PaymentUsecaseのWebhook処理のテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.interfaces.email_outbox import IEmailOutbox
+from app.application.interfaces.stripe_event_ledger import IStripeEventLedger
+from app.application.interfaces.stripe_service import IStripeService
+from app.application.use_cases.checkout.payment_usecase import PaymentUsecase
+from app.domain.entities.order import Order, OrderItem, OrderStatus
+from app.domain.exceptions.payment import WebhookSignatureError
+from app.domain.repositories.address_repository import IAddressRepository
+from app.domain.repositories.order_repository import IOrderRepository
+from app.domain.repositories.user_repository import IUserRepository
+
+
+@pytest.fixture
+def mock_stripe_service():
+    """モックStripeService"""
+    return MagicMock(spec=IStripeService)
+
+
+@pytest.fixture
+def mock_order_repository():
+    """モックOrderRepository"""
+    return MagicMock(spec=IOrderRepository)
+
+
+@pytest.fixture
+def mock_stripe_event_ledger():
+    """モックStripeEventLedger"""
+    return MagicMock(spec=IStripeEventLedger)
+
+
+@pytest.fixture
+def payment_usecase(mock_stripe_service, mock_order_repository, mock_stripe_event_ledger):
+    """PaymentUsecaseインスタンス"""
+    return PaymentUsecase(
+        stripe_service=mock_stripe_service,
+        order_repository=mock_order_repository,
+        user_repository=MagicMock(spec=IUserRepository),
+        email_outbox=MagicMock(spec=IEmailOutbox),
+        address_repository=MagicMock(spec=IAddressRepository),
+        stripe_event_ledger=mock_stripe_event_ledger,
+    )
+
+
+def _event(event_type: str = 'payment_intent.succeeded') -> dict:
+    return {
+        'id': 'evt_1',
+        'type': event_type,
+        'data': {'object': {'id': 'pi_1', 'metadata': {'order_id': '10'}}},
+    }
+
+
+class TestPaymentWebhook:
+    """Webhook受信のテストクラス"""
+
+    def test_records_event_without_processing(
+        self,
+        payment_usecase,
+        mock_stripe_service,
+        mock_order_repository,
+        mock_stripe_event_ledger,
+    ):
+        """受信時はイベントを台帳に記録するだけで、注文は読み込まない"""
+        mock_stripe_service.construct_webhook_event.return_value = _event()
+        mock_stripe_event_ledger.record.return_value = True
+
+        payment_usecase.handle_webhook(b'{}', 'sig')
+
+        mock_stripe_event_ledger.record.assert_called_once_with(
+            'evt_1',
+            'payment_intent.succeeded',
+            {'id': 'pi_1', 'metadata': {'order_id': '10'}},
+        )
+        mock_order_repository.get_by_id.assert_not_called()
+
+    def test_duplicate_event_is_skipped(
+        self,
+        payment_usecase,
+        mock_stripe_service,
+        mock_order_repository,
+        mock_stripe_event_ledger,
+    ):
+        """再送されたイベントは台帳で弾かれ、何も処理しない"""
+        mock_stripe_service.construct_webhook_event.return_value = _event()
+        mock_stripe_event_ledger.record.return_value = False
+
+        payment_usecase.handle_webhook(b'{}', 'sig')
+
+        mock_order_repository.get_by_id.assert_not_called()
+
+    def test_unhandled_event_is_not_recorded(
+        self, payment_usecase, mock_stripe_service, mock_stripe_event_ledger
+    ):
+        """処理対象外のイベントは台帳に記録しない"""
+        mock_stripe_service.construct_webhook_event.return_value = _event(
+            'customer.created'
+        )
+
+        payment_usecase.handle_webhook(b'{}', 'sig')
+
+        mock_stripe_event_ledger.record.assert_not_called()
+
+    def test_invalid_signature(
+        self, payment_usecase, mock_stripe_service, mock_stripe_event_ledger
+    ):
+        """署名検証に失敗した場合は WebhookSignatureError"""
+        mock_stripe_service.construct_webhook_event.side_effect = ValueError('bad')
+
+        with pytest.raises(WebhookSignatureError):
+            payment_usecase.handle_webhook(b'{}', 'sig')
+
+        mock_stripe_event_ledger.record.assert_not_called()
+
+    def test_process_payment_succeeded(self, payment_usecase, mock_order_repository):
+        """バックグラウンドの処理で決済成功イベントの注文を読み込む"""
+        mock_order_repository.get_by_id.return_value = None
+
+        payment_usecase.process_webhook_event(
+            'payment_intent.succeeded', _event()['data']['object']
+        )
+
+        mock_order_repository.get_by_id.assert_called_once_with(10)
+
+    @pytest.mark.parametrize(
+        ('upload_requirements', 'expected_status'),
+        [
+            ({'formats': ['ai', 'pdf']}, OrderStatus.REVIEWING),
+            (None, OrderStatus.CONFIRMED),
+        ],
+    )
+    def test_process_payment_succeeded_uses_order_upload_flag(
+        self,
+        payment_usecase,
+        mock_order_repository,
+        upload_requirements,
+        expected_status,
+    ):
+        """支払い後のステータスは注文の入稿要否から決まる（商品は再取得しない）"""
+        order = Order(
+            id=10,
+            user_id=1,
+            order_number='ACQ-260101-001',
+            items=[
+                OrderItem(
+                    product_id='acrylic-stand',
+                    product_name='Acrylic Stand',
+                    quantity=1,
+                    unit_price=1000,
+                    subtotal=1000,
+                    upload_requirements=upload_requirements,
+                )
+            ],
+        )
+        order.calculate_upload_requirements()
+        mock_order_repository.get_by_id.return_value = order
+
+        payment_usecase.process_webhook_event(
+            'payment_intent.succeeded', _event()['data']['object']
+        )
+
+        updated = mock_order_repository.update.call_args.args[0]
+        assert updated.status == expected_status
+        assert updated.paid_at is not None
@@ -0,0 +1,89 @@
+"""ProductUsecaseのテスト"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.use_cases.catalog.product_usecase import ProductUsecase
+from app.domain.entities.page import Page
+from app.domain.entities.product import ProductListItem, RelatedProduct
+from app.domain.exceptions.product import ProductNotFoundError
+from app.domain.repositories.product_repository import IProductRepository
+
+
+@pytest.fixture
+def mock_product_repository():
+    """モックProductRepository"""
+    return MagicMock(spec=IProductRepository)
+
+
+@pytest.fixture
+def product_usecase(mock_product_repository):
+    """ProductUsecaseインスタンス"""
+    return ProductUsecase(product_repository=mock_product_repository)
+
+
+class TestProductUsecase:
+    """ProductUsecaseのテストクラス"""
+
+    def test_get_featured_products_reads_list_view(
+        self, product_usecase, mock_product_repository
+    ):
+        """おすすめ商品は一覧用の非正規化テーブルから取得する"""
+        mock_product_repository.get_list_items.return_value = Page(
+            items=[
+                ProductListItem(
+                    id='qr-cube',
+                    category_id='shop',
+                    name='QR Cube',
+                    name_ja='QRキューブ',
+                    base_price=5000,
+                    is_featured=True,
+                    main_image_url='https://cdn.example.com/qr-cube.png',
+                )
+            ],
+            total=1,
+            limit=10,
+        )
+
+        output = product_usecase.get_featured_products(limit=10)
+
+        mock_product_repository.get_list_items.assert_called_once_with(
+            is_featured=True, limit=10
+        )
+        assert output.total == 1
+        assert output.products[0].main_image_url == 'https://cdn.example.com/qr-cube.png'
+        assert output.products[0].images == []
+
+    def test_get_related_products_uses_single_repository_call(
+        self, product_usecase, mock_product_repository
+    ):
+        """関連商品は存在確認を含めて1回のリポジトリ呼び出しで取得する"""
+        mock_product_repository.get_related_products.return_value = [
+            RelatedProduct(
+                id='qr-cube',
+                name='QR Cube',
+                name_ja='QRキューブ',
+                slug='qr-cube',
+                base_price=5000,
+                main_image_url='https://cdn.example.com/qr-cube.png',
+            )
+        ]
+
+        output = product_usecase.get_related_products('name-plate')
+
+        assert output.product_id == 'name-plate'
+        assert [p.id for p in output.related_products] == ['qr-cube']
+        assert output.related_products[0].main_image_url == (
+            'https://cdn.example.com/qr-cube.png'
+        )
+        mock_product_repository.get_by_id.assert_not_called()
+
+    def test_get_related_products_not_found(
+        self, product_usecase, mock_product_repository
+    ):
+        """商品が存在しない場合はProductNotFoundError"""
+        mock_product_repository.get_related_products.return_value = None
+
+        with pytest.raises(ProductNotFoundError):
+            product_usecase.get_related_products('missing')
@@ -59,6 +59,9 @@ def test_client() -> Generator[TestClient, None, None]:
     """FastAPI TestClient"""
     # テスト用に認証を無効化
     os.environ['ENABLE_AUTH'] = 'false'
+    # テストではメール送信キュー・Stripeイベント台帳のバックグラウンド処理を起動しない
+    os.environ['EMAIL_OUTBOX_DISPATCHER_ENABLED'] = 'false'
+    os.environ['STRIPE_EVENTS_PROCESSOR_ENABLED'] = 'false'
 
     # get_settings()のキャッシュをクリア
     from app.config import get_settings
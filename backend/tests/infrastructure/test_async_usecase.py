@@ -0,0 +1,36 @@
+"""AsyncUsecaseのテスト"""
+
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.async_usecase import AsyncUsecase
+
+
+class FakeAsyncSession:
+    """run_sync で同期セッションを渡して関数を実行するだけの AsyncSession"""
+
+    def __init__(self):
+        self.sync_session = MagicMock(spec=Session)
+        self.run_sync_calls = 0
+
+    async def run_sync(self, fn):
+        self.run_sync_calls += 1
+        return fn(self.sync_session)
+
+
+class TestAsyncUsecase:
+    """AsyncUsecaseのテストクラス"""
+
+    async def test_builds_usecase_once_from_sync_session(self):
+        """ユースケースは同期セッションから1度だけ組み立て、run_sync上で実行する"""
+        session = FakeAsyncSession()
+        factory = MagicMock(side_effect=lambda s: {'session': s})
+        usecase = AsyncUsecase(session, factory)
+
+        first = await usecase.run(lambda u: u['session'])
+        second = await usecase.run(lambda u: u['session'])
+
+        factory.assert_called_once_with(session.sync_session)
+        assert first is second is session.sync_session
+        assert session.run_sync_calls == 2
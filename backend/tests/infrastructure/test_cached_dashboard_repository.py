@@ -0,0 +1,37 @@
+"""CachedDashboardRepositoryのテスト"""
+
+from unittest.mock import MagicMock
+
+from app.domain.entities.dashboard import DashboardSummary
+from app.domain.repositories.dashboard_repository import IDashboardRepository
+from app.infrastructure.cache.cached_dashboard_repository import CachedDashboardRepository
+from app.infrastructure.cache.catalog_cache import CatalogCache
+
+
+class TestCachedDashboardRepository:
+    """CachedDashboardRepositoryのテストクラス"""
+
+    def test_summary_is_cached_within_ttl(self):
+        """TTL内の再取得では集計クエリを実行しない"""
+        repository = MagicMock(spec=IDashboardRepository)
+        repository.get_summary.return_value = DashboardSummary(today_orders=3)
+        cached = CachedDashboardRepository(
+            repository, CatalogCache(max_entries=1, ttl_seconds=60)
+        )
+
+        assert cached.get_summary().today_orders == 3
+        assert cached.get_summary().today_orders == 3
+        repository.get_summary.assert_called_once()
+
+    def test_ttl_zero_disables_cache(self):
+        """TTLが0の場合は毎回集計する"""
+        repository = MagicMock(spec=IDashboardRepository)
+        repository.get_summary.return_value = DashboardSummary()
+        cached = CachedDashboardRepository(
+            repository, CatalogCache(max_entries=1, ttl_seconds=0)
+        )
+
+        cached.get_summary()
+        cached.get_summary()
+
+        assert repository.get_summary.call_count == 2
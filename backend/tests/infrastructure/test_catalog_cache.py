@@ -0,0 +1,103 @@
+"""CatalogCacheのテスト"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.infrastructure.cache.catalog_cache import CatalogCache, mark_catalog_dirty
+
+
+@pytest.fixture
+def cache():
+    """テスト用キャッシュ"""
+    return CatalogCache(max_entries=2, ttl_seconds=60)
+
+
+class TestCatalogCache:
+    """CatalogCacheのテストクラス"""
+
+    def test_get_or_load_counts_hits_and_misses(self, cache):
+        """2回目以降はloaderを呼ばずにキャッシュから返す"""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return 'value'
+
+        assert cache.get_or_load('key', loader) == 'value'
+        assert cache.get_or_load('key', loader) == 'value'
+
+        stats = cache.stats()
+        assert len(calls) == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_expired_entry_is_reloaded(self, cache):
+        """TTLを過ぎたエントリは再読み込みされる"""
+        with patch('app.infrastructure.cache.catalog_cache.time.monotonic') as now:
+            now.return_value = 0
+            cache.get_or_load('key', lambda: 'old')
+            now.return_value = 61
+            assert cache.get_or_load('key', lambda: 'new') == 'new'
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        """上限を超えると最も古く使われたエントリが追い出される"""
+        cache.get_or_load('a', lambda: 1)
+        cache.get_or_load('b', lambda: 2)
+        cache.get_or_load('a', lambda: 1)  # aを最近使用にする
+        cache.get_or_load('c', lambda: 3)
+
+        assert cache.get_or_load('a', lambda: 'reloaded') == 1
+        assert cache.get_or_load('b', lambda: 'reloaded') == 'reloaded'
+        assert cache.stats().evictions >= 1
+
+    def test_value_loaded_across_invalidation_is_not_stored(self, cache):
+        """読み込み中に無効化された場合、古い値は保存しない"""
+
+        def loader():
+            cache.invalidate()
+            return 'stale'
+
+        assert cache.get_or_load('key', loader) == 'stale'
+        assert cache.get_or_load('key', lambda: 'fresh') == 'fresh'
+
+
+class TestCatalogCacheInvalidationHooks:
+    """コミット時の無効化フックのテスト"""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine('sqlite:///:memory:')
+        with Session(engine) as session:
+            yield session
+
+    def test_commit_after_catalog_write_invalidates(self, session):
+        """カタログ更新をコミットするとキャッシュが無効化される"""
+        cache = CatalogCache()
+        with patch(
+            'app.infrastructure.cache.catalog_cache.get_catalog_cache',
+            return_value=cache,
+        ):
+            session.connection()
+            mark_catalog_dirty(session)
+            session.commit()
+
+        assert cache.stats().invalidations == 1
+
+    def test_rollback_discards_pending_invalidation(self, session):
+        """ロールバックされた更新ではキャッシュを無効化しない"""
+        cache = CatalogCache()
+        with patch(
+            'app.infrastructure.cache.catalog_cache.get_catalog_cache',
+            return_value=cache,
+        ):
+            session.connection()
+            mark_catalog_dirty(session)
+            session.rollback()
+            session.connection()
+            session.commit()
+
+        assert cache.stats().invalidations == 0
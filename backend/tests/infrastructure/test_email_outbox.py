@@ -0,0 +1,208 @@
+"""メール送信キュー（アウトボックス）のテスト"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete, func, update
+from sqlalchemy.orm import sessionmaker
+
+from app.application.interfaces.email_outbox import (
+    EmailKind,
+    IEmailOutbox,
+    send_queued_email,
+)
+from app.application.interfaces.email_service import IEmailService, OrderConfirmationData
+from app.infrastructure.db.models.email_outbox_model import EmailOutboxModel
+from app.infrastructure.db.queue_worker import backoff_seconds
+from app.infrastructure.email.email_outbox_impl import EmailOutboxImpl
+from app.infrastructure.email.outbox_dispatcher import EmailOutboxDispatcher
+
+
+class FakeEmailService(IEmailService):
+    """送信内容を記録するだけのメールサービス"""
+
+    def __init__(self, succeed: bool = True):
+        self.succeed = succeed
+        self.sent: list[tuple[str, str, object]] = []
+
+    def send_verification_email(self, to_email: str, verification_url: str) -> bool:
+        self.sent.append(('verification', to_email, verification_url))
+        return self.succeed
+
+    def send_password_reset_email(self, to_email: str, reset_url: str) -> bool:
+        self.sent.append(('password_reset', to_email, reset_url))
+        return self.succeed
+
+    def send_welcome_email(self, to_email: str, user_name: str) -> bool:
+        self.sent.append(('welcome', to_email, user_name))
+        return self.succeed
+
+    def send_order_confirmation_email(
+        self, to_email: str, order_data: OrderConfirmationData
+    ) -> bool:
+        self.sent.append(('order_confirmation', to_email, order_data))
+        return self.succeed
+
+
+class RecordingOutbox(IEmailOutbox):
+    """記録した内容を保持するだけの送信キュー"""
+
+    def __init__(self):
+        self.entries: list[tuple[EmailKind, str, dict, str | None]] = []
+
+    def enqueue(self, kind, to_email, payload, dedupe_key=None) -> None:
+        self.entries.append((kind, to_email, payload, dedupe_key))
+
+
+ORDER_DATA = OrderConfirmationData(
+    order_number='ACQ-260101-001',
+    order_date='2026年01月01日',
+    total=1100,
+    items=[{'name': '商品', 'quantity': 1, 'price': 1000}],
+    shipping_address='〒100-0001',
+    user_name='テスト',
+)
+
+
+class TestQueuedEmail:
+    """送信キューに記録したメールの送信のテスト"""
+
+    def test_order_confirmation_round_trip(self):
+        """記録した注文確認メールが同じ内容で送信される"""
+        outbox = RecordingOutbox()
+        outbox.enqueue_order_confirmation_email(
+            'user@example.com', ORDER_DATA, dedupe_key='order_confirmation:1'
+        )
+        kind, to_email, payload, dedupe_key = outbox.entries[0]
+        assert dedupe_key == 'order_confirmation:1'
+
+        email_service = FakeEmailService()
+        assert send_queued_email(email_service, kind, to_email, payload) is True
+        assert email_service.sent == [
+            ('order_confirmation', 'user@example.com', ORDER_DATA)
+        ]
+
+    def test_failure_is_reported(self):
+        """送信に失敗した場合はFalseを返す"""
+        outbox = RecordingOutbox()
+        outbox.enqueue_verification_email('user@example.com', 'https://example.com/v')
+        kind, to_email, payload, _ = outbox.entries[0]
+
+        email_service = FakeEmailService(succeed=False)
+        assert send_queued_email(email_service, kind, to_email, payload) is False
+
+    def test_backoff_grows_exponentially_up_to_max(self):
+        """再送間隔は失敗ごとに倍になり、上限で止まる"""
+        delays = [backoff_seconds(n, 30.0, 3600.0) for n in range(1, 10)]
+        assert delays[:4] == [30.0, 60.0, 120.0, 240.0]
+        assert delays[-1] == 3600.0
+
+
+class TestEmailOutboxDispatcher:
+    """送信キューの記録と配信のテスト（PostgreSQL）"""
+
+    @pytest.fixture
+    def session_factory(self, test_db_engine):
+        if test_db_engine.dialect.name != 'postgresql':
+            pytest.skip('ON CONFLICT / SKIP LOCKED の検証にはPostgreSQLが必要')
+        factory = sessionmaker(bind=test_db_engine)
+        yield factory
+        with factory() as session:
+            session.execute(delete(EmailOutboxModel))
+            session.commit()
+
+    def test_dedupe_and_dispatch(self, session_factory):
+        """同じ重複防止キーのメールは1通だけ送信される"""
+        with session_factory() as session:
+            outbox = EmailOutboxImpl(session)
+            for _ in range(2):
+                outbox.enqueue_welcome_email(
+                    'user@example.com', 'テスト', dedupe_key='welcome:1'
+                )
+            session.commit()
+
+        email_service = FakeEmailService()
+        dispatcher = EmailOutboxDispatcher(session_factory, email_service)
+        assert dispatcher.process_batch() == 1
+        assert dispatcher.process_batch() == 0
+        assert email_service.sent == [('welcome', 'user@example.com', 'テスト')]
+
+    def test_failed_send_is_retried_then_given_up(self, session_factory):
+        """送信に失敗したメールは再送を予約し、上限回数で failed になる"""
+        with session_factory() as session:
+            EmailOutboxImpl(session).enqueue_password_reset_email(
+                'user@example.com', 'https://example.com/reset'
+            )
+            session.commit()
+
+        dispatcher = EmailOutboxDispatcher(
+            session_factory, FakeEmailService(succeed=False), max_attempts=2
+        )
+        assert dispatcher.process_batch() == 1
+        # 再送予定時刻まではスキップされる
+        assert dispatcher.process_batch() == 0
+
+        with session_factory() as session:
+            session.execute(
+                update(EmailOutboxModel).values(
+                    next_attempt_at=EmailOutboxModel.created_at
+                )
+            )
+            session.commit()
+        assert dispatcher.process_batch() == 1
+
+        with session_factory() as session:
+            row = session.query(EmailOutboxModel).one()
+            assert (row.status, row.attempts) == ('failed', 2)
+
+    def test_send_runs_after_claim_is_committed(self, session_factory):
+        """送信時には行が送信中としてコミット済みで、送信はトランザクションの外で行う"""
+        with session_factory() as session:
+            EmailOutboxImpl(session).enqueue_welcome_email('user@example.com', 'テスト')
+            session.commit()
+
+        observed: list[tuple[str, bool]] = []
+
+        class ObservingEmailService(FakeEmailService):
+            def send_welcome_email(self, to_email: str, user_name: str) -> bool:
+                # 別のセッションから送信中の状態とリース期限が見える
+                with session_factory() as other:
+                    row = other.query(EmailOutboxModel).one()
+                    observed.append((row.status, row.locked_until is not None))
+                return super().send_welcome_email(to_email, user_name)
+
+        dispatcher = EmailOutboxDispatcher(session_factory, ObservingEmailService())
+        assert dispatcher.process_batch() == 1
+        assert observed == [('sending', True)]
+
+        with session_factory() as session:
+            row = session.query(EmailOutboxModel).one()
+            assert (row.status, row.locked_until) == ('sent', None)
+
+    def test_expired_lease_is_claimed_again(self, session_factory):
+        """送信中に停止した行はリース期限を過ぎると送信し直す"""
+        with session_factory() as session:
+            EmailOutboxImpl(session).enqueue_welcome_email('user@example.com', 'テスト')
+            session.commit()
+            # 別のプロセスが送信中のまま停止した状態
+            session.execute(
+                update(EmailOutboxModel).values(
+                    status='sending', locked_until=func.now() + timedelta(minutes=5)
+                )
+            )
+            session.commit()
+
+        email_service = FakeEmailService()
+        dispatcher = EmailOutboxDispatcher(session_factory, email_service)
+        # リース期限内は他の配信処理の送信中とみなしてスキップする
+        assert dispatcher.process_batch() == 0
+
+        with session_factory() as session:
+            session.execute(
+                update(EmailOutboxModel).values(
+                    locked_until=func.now() - timedelta(seconds=1)
+                )
+            )
+            session.commit()
+        assert dispatcher.process_batch() == 1
+        assert email_service.sent == [('welcome', 'user@example.com', 'テスト')]
@@ -0,0 +1,163 @@
+"""メールテンプレート（事前コンパイル）のテスト"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.application.interfaces.email_service import OrderConfirmationData
+from app.infrastructure.email import resend_email_service
+from app.infrastructure.email.resend_email_service import ResendEmailService
+from app.infrastructure.email.template_engine import (
+    CompiledTemplate,
+    EmailTemplates,
+)
+
+FRONTEND_URL = 'https://acrique.example.com'
+
+
+@pytest.fixture(scope='module')
+def templates():
+    return EmailTemplates(static={'frontend_url': FRONTEND_URL})
+
+
+class TestCompiledTemplate:
+    """CompiledTemplateのテストクラス"""
+
+    def test_escapes_values_unless_raw(self):
+        """{{ }} はエスケープし、{{{ }}} はそのまま差し込む"""
+        template = CompiledTemplate('<p>{{ name }}</p>{{{ html }}}')
+
+        assert (
+            template.render({'name': '<b>"A&B"</b>', 'html': '<br>'})
+            == '<p>&lt;b&gt;&quot;A&amp;B&quot;&lt;/b&gt;</p><br>'
+        )
+
+    def test_autoescape_disabled(self):
+        """テキスト版はエスケープしない"""
+        template = CompiledTemplate('{{ name }}様', autoescape=False)
+
+        assert template.render({'name': 'A&B'}) == 'A&B様'
+
+    def test_static_values_are_folded(self):
+        """コンパイル時の値は固定部分に畳み込まれ、差し込み位置に残らない"""
+        template = CompiledTemplate(
+            '<a href="{{ url }}/orders">{{ name }}</a>', static={'url': FRONTEND_URL}
+        )
+
+        assert template.placeholders == {'name'}
+        assert template.render({'name': 'x'}) == f'<a href="{FRONTEND_URL}/orders">x</a>'
+
+    def test_template_with_braces(self):
+        """差し込み位置以外の波括弧・引用符はそのまま出力する"""
+        template = CompiledTemplate("body { color: '#333'; } {{ a }} \"{b}\"")
+
+        assert template.render({'a': 1}) == "body { color: '#333'; } 1 \"{b}\""
+
+    def test_missing_value_raises(self):
+        """差し込む値が足りない場合は KeyError"""
+        with pytest.raises(KeyError):
+            CompiledTemplate('{{ name }}').render({})
+
+    def test_render_many_matches_render(self):
+        """一括描画は1件ずつ描画した結果と一致する"""
+        template = CompiledTemplate('<li>{{ name }}: {{{ price }}}</li>')
+        values_list = [{'name': f'<商品{i}>', 'price': f'¥{i:,}'} for i in range(100)]
+
+        assert template.render_many(values_list) == [
+            template.render(values) for values in values_list
+        ]
+
+
+class TestEmailTemplates:
+    """EmailTemplatesのテストクラス"""
+
+    @pytest.mark.parametrize(
+        'name, values',
+        [
+            ('verification', {'verification_url': f'{FRONTEND_URL}/verify?token=t'}),
+            ('password_reset', {'reset_url': f'{FRONTEND_URL}/reset?token=t'}),
+            ('welcome', {'display_name': '山田'}),
+            (
+                'order_confirmation',
+                {
+                    'display_name': '山田',
+                    'order_number': 'ACQ-260101-001',
+                    'order_date': '2026年01月01日',
+                    'items': '',
+                    'items_text': '',
+                    'total': '¥0',
+                    'shipping_address': '東京都',
+                },
+            ),
+        ],
+    )
+    def test_render_all_templates(self, templates, name, values):
+        """全テンプレートがHTML版・テキスト版ともに描画できる"""
+        email = templates.render(name, values)
+
+        assert email.subject.startswith('【ACRIQUE】')
+        assert email.html.startswith('<!DOCTYPE html>')
+        assert '{{' not in email.html
+        assert '{{' not in email.text
+        assert '<' not in email.text
+
+    def test_render_many(self, templates):
+        """一斉送信向けの一括描画は1通ずつ描画した結果と一致する"""
+        values_list = [{'display_name': f'会員{i}'} for i in range(10)]
+
+        assert templates.render_many('welcome', values_list) == [
+            templates.render('welcome', values) for values in values_list
+        ]
+
+
+class TestResendEmailService:
+    """ResendEmailServiceのテストクラス"""
+
+    @pytest.fixture
+    def sent(self, monkeypatch):
+        sent = []
+        monkeypatch.setattr(
+            resend_email_service,
+            'get_settings',
+            lambda: SimpleNamespace(resend_api_key='re_test', email_from='shop@acrique'),
+        )
+        monkeypatch.setattr(resend_email_service.resend.Emails, 'send', sent.append)
+        return sent
+
+    def test_order_confirmation(self, templates, sent):
+        """注文確認メールはHTML版とテキスト版を送信し、商品名をエスケープする"""
+        service = ResendEmailService(templates)
+        order_data = OrderConfirmationData(
+            order_number='ACQ-260101-001',
+            order_date='2026年01月01日',
+            user_name='',
+            items=[
+                {'name': 'スタンド<大>', 'quantity': 2, 'price': 2200},
+                {'name': 'キーホルダー', 'quantity': 1, 'price': 550},
+            ],
+            total=2750,
+            shipping_address='東京都千代田区',
+        )
+
+        assert service.send_order_confirmation_email('user@example.com', order_data)
+
+        (params,) = sent
+        assert params['to'] == ['user@example.com']
+        assert params['subject'] == '【ACRIQUE】ご注文ありがとうございます（ACQ-260101-001）'
+        assert 'お客様様' in params['html']
+        assert 'スタンド&lt;大&gt;' in params['html']
+        assert '¥2,750' in params['html']
+        assert f'{FRONTEND_URL}/mypage/orders' in params['html']
+        assert '- スタンド<大> × 2  ¥2,200' in params['text']
+        assert '- キーホルダー × 1  ¥550' in params['text']
+
+    def test_send_failure_returns_false(self, templates, monkeypatch, sent):
+        """送信に失敗した場合は False を返す"""
+
+        def fail(params):
+            raise RuntimeError('resend down')
+
+        monkeypatch.setattr(resend_email_service.resend.Emails, 'send', fail)
+        service = ResendEmailService(templates)
+
+        assert service.send_welcome_email('user@example.com', '山田') is False
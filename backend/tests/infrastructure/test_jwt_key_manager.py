@@ -0,0 +1,96 @@
+"""JwtKeyManagerのテスト"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwt
+
+from app.infrastructure.security.jwt_key_manager import JwtKeyManager
+
+
+def _generate_key_pair() -> tuple[bytes, bytes]:
+    """テスト用のRSA鍵ペア（PEM）を生成"""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem, public_pem
+
+
+@pytest.fixture(scope='module')
+def old_keys():
+    return _generate_key_pair()
+
+
+@pytest.fixture(scope='module')
+def new_keys():
+    return _generate_key_pair()
+
+
+def _claims(minutes: int = 10) -> dict:
+    return {'user_id': 1, 'exp': datetime.utcnow() + timedelta(minutes=minutes)}
+
+
+class TestJwtKeyManager:
+    """JwtKeyManagerのテストクラス"""
+
+    def test_encode_sets_kid_and_decodes(self, new_keys):
+        """署名したトークンに kid が付与され、検証できる"""
+        private_pem, public_pem = new_keys
+        manager = JwtKeyManager(private_pem, 'new', {'new': public_pem})
+
+        token = manager.encode(_claims())
+
+        assert jwt.get_unverified_header(token)['kid'] == 'new'
+        assert manager.decode(token)['user_id'] == 1
+
+    def test_rotation_accepts_old_kid_and_legacy_token(self, old_keys, new_keys):
+        """ローテーション後も旧 kid のトークンと kid なしのトークンを検証できる"""
+        old_private, old_public = old_keys
+        new_private, new_public = new_keys
+        old_manager = JwtKeyManager(old_private, 'old', {'old': old_public})
+        manager = JwtKeyManager(
+            new_private, 'new', {'new': new_public, 'old': old_public}
+        )
+        legacy_token = jwt.encode(_claims(), new_private, algorithm='RS256')
+
+        assert manager.decode(old_manager.encode(_claims()))['user_id'] == 1
+        assert manager.decode(legacy_token)['user_id'] == 1
+
+    def test_unknown_kid_is_rejected(self, old_keys, new_keys):
+        """未知の kid で署名されたトークンは拒否する"""
+        old_private, old_public = old_keys
+        _, new_public = new_keys
+        other = JwtKeyManager(old_private, 'other', {'other': old_public})
+        manager = JwtKeyManager(old_private, 'new', {'new': new_public})
+
+        with pytest.raises(JWTError):
+            manager.decode(other.encode(_claims()))
+
+    def test_verified_claims_are_cached(self, new_keys, monkeypatch):
+        """検証済みのトークンは再検証せずキャッシュから返す"""
+        private_pem, public_pem = new_keys
+        manager = JwtKeyManager(private_pem, 'new', {'new': public_pem})
+        token = manager.encode(_claims())
+        manager.decode(token)
+
+        def fail(*args, **kwargs):
+            raise AssertionError('signature should not be verified again')
+
+        monkeypatch.setattr(jwt, 'decode', fail)
+        assert manager.decode(token)['user_id'] == 1
+
+    def test_expired_token_is_rejected(self, new_keys):
+        """有効期限切れのトークンは拒否する"""
+        private_pem, public_pem = new_keys
+        manager = JwtKeyManager(private_pem, 'new', {'new': public_pem})
+
+        with pytest.raises(JWTError):
+            manager.decode(manager.encode(_claims(minutes=-1)))
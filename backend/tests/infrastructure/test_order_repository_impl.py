@@ -0,0 +1,392 @@
+"""OrderRepositoryImplのテスト（日次売上集計・顧客別集計・注文番号の採番）"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.domain.entities.order import Order, OrderStatus
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.models.daily_sales_model import DailySalesModel
+from app.infrastructure.db.models.order_model import OrderItemModel, OrderModel
+from app.infrastructure.db.models.order_number_counter_model import (
+    OrderNumberCounterModel,
+)
+from app.infrastructure.db.repositories.customer_stats_repository_impl import (
+    CustomerStatsRepositoryImpl,
+)
+from app.infrastructure.db.repositories.order_repository_impl import OrderRepositoryImpl
+
+
+def _daily_sales(session: Session, sales_date: date) -> dict[str, tuple[int, int]]:
+    """日次売上集計のその日の行（ステータスごとの (件数, 売上)）"""
+    rows = session.execute(
+        select(DailySalesModel).where(DailySalesModel.sales_date == sales_date)
+    ).scalars()
+    return {row.status: (row.orders, row.revenue) for row in rows}
+
+
+def _restore_daily_sales(
+    session: Session, sales_date: date, snapshot: dict[str, tuple[int, int]]
+) -> None:
+    """日次売上集計のその日の行をテスト前の状態に戻す"""
+    session.execute(
+        delete(DailySalesModel).where(DailySalesModel.sales_date == sales_date)
+    )
+    session.add_all(
+        DailySalesModel(
+            sales_date=sales_date, status=status, orders=orders, revenue=revenue
+        )
+        for status, (orders, revenue) in snapshot.items()
+    )
+
+
+class TestOrderRepositoryDailySales:
+    """注文の作成・更新で日次売上集計が増減されることのテスト"""
+
+    def _create_user_id(self, db_session) -> int:
+        from app.infrastructure.db.models.user_model import UserModel
+
+        user_model = UserModel(
+            email='daily_sales@example.com',
+            password_hash='hashed_password',
+            name='Daily Sales User',
+        )
+        db_session.add(user_model)
+        db_session.flush()
+        return user_model.id
+
+    def _stats(self, repository: OrderRepositoryImpl) -> list[dict]:
+        now = datetime.now()
+        return repository.get_stats(now - timedelta(days=1), now + timedelta(days=1))
+
+    def test_status_transitions_update_stats(self, db_session):
+        """支払い前は集計に含まれず、支払い後に含まれ、キャンセルで除外される"""
+        repository = OrderRepositoryImpl(session=db_session)
+        repository.refresh_daily_sales()
+        order = repository.create(
+            Order(
+                user_id=self._create_user_id(db_session),
+                order_number='ACQ-TEST-001',
+                status=OrderStatus.PENDING,
+                total=1000,
+            )
+        )
+        assert self._stats(repository) == []
+
+        order.status = OrderStatus.CONFIRMED
+        order = repository.update(order)
+        stats = self._stats(repository)
+        assert [(row['orders'], row['revenue']) for row in stats] == [(1, 1000)]
+
+        order.status = OrderStatus.CANCELLED
+        repository.update(order)
+        assert self._stats(repository) == []
+
+    def test_refresh_daily_sales_matches_incremental(self, db_session):
+        """再計算の結果が増減による集計と一致する"""
+        repository = OrderRepositoryImpl(session=db_session)
+        repository.refresh_daily_sales()
+        order = repository.create(
+            Order(
+                user_id=self._create_user_id(db_session),
+                order_number='ACQ-TEST-002',
+                status=OrderStatus.CONFIRMED,
+                total=2500,
+            )
+        )
+        order.total = 3000
+        repository.update(order)
+        incremental = self._stats(repository)
+
+        repository.refresh_daily_sales()
+        assert self._stats(repository) == incremental
+
+    @pytest.mark.parametrize('group_by', ['weekly', 'monthly'])
+    def test_grouped_stats_date_has_no_timezone(self, db_session, group_by):
+        """週次・月次の日付は 'YYYY-MM-DD 00:00:00' 形式（タイムゾーンを含まない）"""
+        repository = OrderRepositoryImpl(session=db_session)
+        repository.create(
+            Order(
+                user_id=self._create_user_id(db_session),
+                order_number='ACQ-TEST-004',
+                status=OrderStatus.CONFIRMED,
+                total=500,
+            )
+        )
+        now = datetime.now()
+
+        stats = repository.get_stats(
+            now - timedelta(days=40), now + timedelta(days=1), group_by=group_by
+        )
+
+        assert stats
+        for row in stats:
+            assert datetime.strptime(row['date'], '%Y-%m-%d %H:%M:%S').time() == (
+                datetime.min.time()
+            )
+
+    def test_customer_stats_follow_order_changes(self, db_session):
+        """注文数は全ステータス、累計購入金額は支払い済みの注文のみを数える"""
+        repository = OrderRepositoryImpl(session=db_session)
+        stats_repository = CustomerStatsRepositoryImpl(session=db_session)
+        user_id = self._create_user_id(db_session)
+        order = repository.create(
+            Order(
+                user_id=user_id,
+                order_number='ACQ-TEST-003',
+                status=OrderStatus.PENDING,
+                total=1200,
+            )
+        )
+        stats = stats_repository.get_by_user_id(user_id)
+        assert (stats.order_count, stats.total_spent) == (1, 0)
+        assert stats.last_order_at == order.created_at
+
+        order.status = OrderStatus.CONFIRMED
+        repository.update(order)
+        stats = stats_repository.get_by_user_ids([user_id, user_id + 1])
+        assert (stats[user_id].order_count, stats[user_id].total_spent) == (1, 1200)
+        assert stats[user_id + 1].order_count == 0
+
+
+class TestConcurrentOrderUpdates:
+    """同じ注文を並行して更新した場合の集計のテスト"""
+
+    def test_concurrent_transitions_do_not_double_count(self, test_db_engine):
+        """支払い処理と管理画面のキャンセルが同時でも集計が二重に増減されない"""
+        if test_db_engine.dialect.name != 'postgresql':
+            pytest.skip('行ロックの検証にはPostgreSQLが必要')
+
+        from app.infrastructure.db.models.user_model import UserModel
+
+        engine = create_engine(test_db_engine.url)
+        session_factory = sessionmaker(bind=engine)
+
+        with session_factory() as session:
+            # 注文日（created_at は DB の now()）
+            today = session.execute(select(func.current_date())).scalar()
+            before = _daily_sales(session, today)
+            user = UserModel(
+                email='concurrent_update@example.com',
+                password_hash='hashed_password',
+                name='Concurrent Update User',
+            )
+            session.add(user)
+            session.flush()
+            user_id = user.id
+            order = OrderRepositoryImpl(session=session).create(
+                Order(
+                    user_id=user_id,
+                    order_number='ACQ-TEST-LOCK',
+                    status=OrderStatus.PENDING,
+                    total=1000,
+                )
+            )
+            session.commit()
+
+        def cancel(pid_ready: threading.Event, pid: list[int]) -> None:
+            with session_factory() as session:
+                pid.append(session.execute(text('SELECT pg_backend_pid()')).scalar())
+                repository = OrderRepositoryImpl(session=session)
+                stale = repository.get_by_id(order.id)
+                pid_ready.set()
+                stale.status = OrderStatus.CANCELLED
+                repository.update(stale)
+                session.commit()
+
+        try:
+            with session_factory() as payment_session:
+                # 支払い処理が先に行をロックする（未コミット）
+                repository = OrderRepositoryImpl(session=payment_session)
+                paid = repository.get_by_id(order.id)
+                paid.status = OrderStatus.CONFIRMED
+                repository.update(paid)
+
+                # 同じ注文を PENDING として読んだ管理画面のキャンセルを並行して実行
+                pid_ready = threading.Event()
+                pid: list[int] = []
+                canceller = threading.Thread(target=cancel, args=(pid_ready, pid))
+                canceller.start()
+                pid_ready.wait(timeout=10)
+                with engine.connect() as monitor:
+                    for _ in range(100):
+                        wait_event = monitor.execute(
+                            text(
+                                'SELECT wait_event_type FROM pg_stat_activity '
+                                'WHERE pid = :pid'
+                            ),
+                            {'pid': pid[0]},
+                        ).scalar()
+                        if wait_event == 'Lock':
+                            break
+                        time.sleep(0.05)
+                payment_session.commit()
+                canceller.join(timeout=10)
+
+            with session_factory() as session:
+                after = _daily_sales(session, today)
+                changed = {
+                    status: (
+                        counts[0] - before.get(status, (0, 0))[0],
+                        counts[1] - before.get(status, (0, 0))[1],
+                    )
+                    for status, counts in after.items()
+                }
+                assert {k: v for k, v in changed.items() if v != (0, 0)} == {
+                    OrderStatus.CANCELLED.value: (1, 1000)
+                }
+
+                stats = session.get(CustomerStatsModel, user_id)
+                assert (stats.order_count, stats.total_spent) == (1, 0)
+        finally:
+            with session_factory() as session:
+                session.execute(delete(OrderModel).where(OrderModel.user_id == user_id))
+                session.execute(
+                    delete(CustomerStatsModel).where(
+                        CustomerStatsModel.user_id == user_id
+                    )
+                )
+                session.execute(delete(UserModel).where(UserModel.id == user_id))
+                _restore_daily_sales(session, today, before)
+                session.commit()
+            engine.dispose()
+
+
+class TestOrderNumberGeneration:
+    """注文番号の採番のテスト"""
+
+    def test_concurrent_checkouts_get_unique_order_numbers(self, test_db_engine):
+        """同時に大量の注文を作成しても注文番号が重複せず、集計も件数分増える"""
+        if test_db_engine.dialect.name != 'postgresql':
+            pytest.skip('行ロックによる採番の検証にはPostgreSQLが必要')
+
+        from app.application.schemas.checkout.order_schemas import (
+            CreateOrderInputDTO,
+            CreateOrderItemInputDTO,
+        )
+        from app.di.checkout.order import build_order_usecase
+        from app.domain.entities.order import PaymentMethod
+        from app.infrastructure.db.models.address_model import AddressModel
+        from app.infrastructure.db.models.product_model import ProductModel
+        from app.infrastructure.db.models.user_model import UserModel
+
+        engine = create_engine(test_db_engine.url, pool_size=50, max_overflow=0)
+        session_factory = sessionmaker(bind=engine)
+        checkouts = 300
+        barrier = threading.Barrier(50)
+        product_id = 'test-order-number-product'
+
+        with session_factory() as session:
+            # 注文番号の日付（アプリの現在日時）と日次売上集計の日付（DB の now()）
+            counter_date = date.today()
+            counter_before = session.get(OrderNumberCounterModel, counter_date)
+            last_value_before = counter_before.last_value if counter_before else None
+            sales_date = session.execute(select(func.current_date())).scalar()
+            sales_before = _daily_sales(session, sales_date)
+
+            user = UserModel(
+                email='order_number@example.com',
+                password_hash='hashed_password',
+                name='Order Number User',
+            )
+            session.add(user)
+            session.flush()
+            address = AddressModel(
+                user_id=user.id,
+                name='Order Number User',
+                postal_code='100-0001',
+                prefecture='東京都',
+                city='千代田区',
+                address1='千代田1-1',
+                phone='03-0000-0000',
+            )
+            session.add(address)
+            session.add(
+                ProductModel(
+                    id=product_id,
+                    category_id='shop',
+                    name='Order Number Product',
+                    name_ja='注文番号テスト商品',
+                    base_price=100,
+                    is_active=True,
+                )
+            )
+            session.commit()
+            user_id = user.id
+            address_id = address.id
+
+        input_dto = CreateOrderInputDTO(
+            shipping_address_id=address_id,
+            payment_method=PaymentMethod.STRIPE,
+            items=[CreateOrderItemInputDTO(product_id=product_id, quantity=1)],
+        )
+
+        def checkout(index: int) -> str:
+            if index < barrier.parties:
+                barrier.wait()
+            with session_factory() as session:
+                output = build_order_usecase(session).create_order(user_id, input_dto)
+                session.commit()
+                return output.order.order_number
+
+        try:
+            with ThreadPoolExecutor(max_workers=50) as executor:
+                order_numbers = list(executor.map(checkout, range(checkouts)))
+
+            assert len(set(order_numbers)) == checkouts
+            sequences = sorted(int(number.rsplit('-', 1)[1]) for number in order_numbers)
+            assert sequences == list(range(sequences[0], sequences[0] + checkouts))
+
+            with session_factory() as session:
+                # 小計100円 + 消費税10円
+                orders, revenue = _daily_sales(session, sales_date)[
+                    OrderStatus.PENDING.value
+                ]
+                before_orders, before_revenue = sales_before.get(
+                    OrderStatus.PENDING.value, (0, 0)
+                )
+                assert (orders - before_orders, revenue - before_revenue) == (
+                    checkouts,
+                    checkouts * 110,
+                )
+                stats = session.get(CustomerStatsModel, user_id)
+                assert (stats.order_count, stats.total_spent) == (
+                    checkouts,
+                    checkouts * 110,
+                )
+        finally:
+            with session_factory() as session:
+                order_ids = select(OrderModel.id).where(OrderModel.user_id == user_id)
+                session.execute(
+                    delete(OrderItemModel).where(OrderItemModel.order_id.in_(order_ids))
+                )
+                session.execute(delete(OrderModel).where(OrderModel.user_id == user_id))
+                session.execute(
+                    delete(CustomerStatsModel).where(
+                        CustomerStatsModel.user_id == user_id
+                    )
+                )
+                session.execute(
+                    delete(AddressModel).where(AddressModel.user_id == user_id)
+                )
+                session.execute(delete(ProductModel).where(ProductModel.id == product_id))
+                session.execute(delete(UserModel).where(UserModel.id == user_id))
+                _restore_daily_sales(session, sales_date, sales_before)
+                session.execute(
+                    delete(OrderNumberCounterModel).where(
+                        OrderNumberCounterModel.counter_date == counter_date
+                    )
+                )
+                if last_value_before is not None:
+                    session.add(
+                        OrderNumberCounterModel(
+                            counter_date=counter_date, last_value=last_value_before
+                        )
+                    )
+                session.commit()
+            engine.dispose()
@@ -0,0 +1,143 @@
+"""ページングヘルパーのテスト"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from app.domain.exceptions.common import InvalidCursorError
+from app.infrastructure.db.pagination import paginate, paginate_by_created_at
+
+Base = declarative_base()
+
+
+class ItemModel(Base):
+    """テスト用テーブル"""
+
+    __tablename__ = 'pagination_items'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+@pytest.fixture
+def session():
+    """10件のデータを持つインメモリDBのセッション"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        # id 1〜10。created_at は2件ずつ同じ値（同時刻の行をidで区別できるか確認する）
+        base = datetime(2025, 1, 1)
+        session.add_all(
+            [
+                ItemModel(
+                    id=i,
+                    name=f'item-{i}',
+                    created_at=base + timedelta(hours=(i + 1) // 2),
+                )
+                for i in range(1, 11)
+            ]
+        )
+        session.commit()
+
+        statements = []
+        event.listen(
+            engine,
+            'before_cursor_execute',
+            lambda *args: statements.append(args[2]),
+        )
+        session.info['statements'] = statements
+        yield session
+
+
+class TestPaginate:
+    """paginateのテストクラス"""
+
+    def test_returns_items_and_total_in_one_query(self, session: Session):
+        """1クエリでページ内の要素と総件数を返す"""
+        query = session.query(ItemModel).order_by(ItemModel.id)
+
+        page = paginate(query, lambda m: m.name, limit=3, offset=3)
+
+        assert page.items == ['item-4', 'item-5', 'item-6']
+        assert page.total == 10
+        assert page.limit == 3
+        assert page.offset == 3
+        assert page.is_total_estimated is False
+        assert len(session.info['statements']) == 1
+
+    def test_total_respects_filters(self, session: Session):
+        """総件数はフィルタ後の件数"""
+        query = session.query(ItemModel).filter(ItemModel.id > 7).order_by(ItemModel.id)
+
+        page = paginate(query, lambda m: m.id, limit=2)
+
+        assert page.items == [8, 9]
+        assert page.total == 3
+
+    def test_offset_past_last_page_still_returns_total(self, session: Session):
+        """最終ページを超えた場合も総件数を返す"""
+        query = session.query(ItemModel).order_by(ItemModel.id)
+
+        page = paginate(query, lambda m: m.id, limit=5, offset=20)
+
+        assert page.items == []
+        assert page.total == 10
+
+    def test_empty_result(self, session: Session):
+        """該当なしの場合は追加クエリを発行しない"""
+        query = session.query(ItemModel).filter(ItemModel.id > 100)
+
+        page = paginate(query, lambda m: m.id, limit=5)
+
+        assert page.items == []
+        assert page.total == 0
+        assert len(session.info['statements']) == 1
+
+
+class TestPaginateByCreatedAt:
+    """paginate_by_created_atのテストクラス"""
+
+    def test_offset_mode_returns_next_cursor(self, session: Session):
+        """オフセットモードでも次ページ用のカーソルを返す"""
+        page = paginate_by_created_at(
+            session.query(ItemModel), ItemModel, lambda m: m.id, limit=4
+        )
+
+        assert page.items == [10, 9, 8, 7]
+        assert page.total == 10
+        assert page.next_cursor is not None
+
+    def test_cursor_mode_walks_all_rows_without_total(self, session: Session):
+        """カーソルをたどると全件を重複・欠落なく取得できる"""
+        ids: list[int] = []
+        cursor = None
+        while True:
+            page = paginate_by_created_at(
+                session.query(ItemModel),
+                ItemModel,
+                lambda m: m.id,
+                limit=3,
+                cursor=cursor,
+            )
+            ids.extend(page.items)
+            if cursor is not None:
+                assert page.total is None
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert ids == list(range(10, 0, -1))
+
+    def test_invalid_cursor(self, session: Session):
+        """不正なカーソルはInvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            paginate_by_created_at(
+                session.query(ItemModel),
+                ItemModel,
+                lambda m: m.id,
+                limit=3,
+                cursor='not-a-cursor',
+            )
@@ -0,0 +1,52 @@
+"""PasswordHasherのテスト"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.domain.exceptions.common import ServiceBusyError
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def executor():
+    """プロセスを起動しないよう、テストではスレッドプールで代用する"""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+class TestPasswordHasher:
+    """PasswordHasherのテストクラス"""
+
+    def test_hash_and_verify(self, executor):
+        """ハッシュ化したパスワードを検証できる"""
+        hasher = PasswordHasher(workers=1, rounds=4, executor=executor)
+
+        password_hash = hasher.hash('secret-password')
+
+        assert hasher.verify('secret-password', password_hash) is True
+        assert hasher.verify('wrong-password', password_hash) is False
+        assert hasher.stats().completed == 3
+
+    def test_verify_and_update_rehashes_other_cost(self, executor):
+        """コストが設定値と異なるハッシュは検証時に新しいハッシュを返す"""
+        old_hash = PasswordHasher(workers=1, rounds=4, executor=executor).hash('pw')
+        hasher = PasswordHasher(workers=1, rounds=5, executor=executor)
+
+        verified, new_hash = hasher.verify_and_update('pw', old_hash)
+
+        assert verified is True
+        assert new_hash is not None and new_hash.startswith('$2b$05$')
+        assert hasher.verify_and_update('pw', new_hash) == (True, None)
+        assert hasher.stats().rehashed == 1
+
+    def test_rejects_when_queue_is_full(self, executor):
+        """ワーカーと待ち行列が埋まっている場合はServiceBusyError"""
+        hasher = PasswordHasher(
+            workers=1, max_queue=0, queue_timeout_seconds=0, rounds=4, executor=executor
+        )
+        hasher._slots.acquire()
+
+        with pytest.raises(ServiceBusyError):
+            hasher.hash('pw')
+        assert hasher.stats().rejected == 1
@@ -0,0 +1,43 @@
+"""コネクションプール計測のテスト"""
+
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.infrastructure.db.pool_metrics import InstrumentedQueuePool, pool_stats
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        'sqlite://',
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestInstrumentedQueuePool:
+    """InstrumentedQueuePoolのテストクラス"""
+
+    def test_records_checkouts(self, engine):
+        """checkoutの件数・使用中の接続数・ヒストグラムを記録する"""
+        with engine.connect():
+            stats = pool_stats('sync', engine.pool, max_overflow=0)
+            assert stats.checked_out == 1
+
+        stats = pool_stats('sync', engine.pool, max_overflow=0)
+        assert stats.checked_out == 0
+        assert stats.checkouts == 1
+        assert stats.checkout_wait_histogram[-1].le_ms is None
+        assert stats.checkout_wait_histogram[-1].count == 1
+
+    def test_records_timeouts(self, engine):
+        """プールが埋まっていて取得できなかった場合はタイムアウトとして数える"""
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert pool_stats('sync', engine.pool, max_overflow=0).timeouts == 1
@@ -0,0 +1,63 @@
+"""レート制限のテスト"""
+
+import pytest
+
+from app.application.interfaces.rate_limiter import RateLimit
+from app.domain.exceptions.auth import RateLimitExceededError
+from app.infrastructure.security import rate_limiter
+from app.infrastructure.security.rate_limiter import InMemoryRateLimiter
+
+LIMIT = RateLimit(limit=3, window_seconds=60)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """rate_limiter の time.time() を固定する"""
+    now = {'value': 6000.0}
+    monkeypatch.setattr(rate_limiter.time, 'time', lambda: now['value'])
+    return now
+
+
+class TestInMemoryRateLimiter:
+    """InMemoryRateLimiterのテストクラス"""
+
+    def test_rejects_after_limit(self, clock):
+        """上限を超えた試行は再試行までの秒数を返す"""
+        limiter = InMemoryRateLimiter()
+
+        results = [limiter.hit('login:email:a@example.com', LIMIT) for _ in range(4)]
+
+        assert results[:3] == [0.0, 0.0, 0.0]
+        assert results[3] > 0
+
+    def test_previous_window_is_weighted(self, clock):
+        """直前ウィンドウの件数は経過割合で按分される"""
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            limiter.hit('key', LIMIT)
+
+        # 次のウィンドウの冒頭では直前の3件がほぼそのまま残る
+        clock['value'] = 6060.0
+        assert limiter.hit('key', LIMIT) > 0
+
+        # ウィンドウの2/3が経過すると按分後は 3 × 1/3 + 1 件
+        clock['value'] = 6100.0
+        assert limiter.hit('key', LIMIT) == 0.0
+
+    def test_keys_are_independent(self, clock):
+        """キーごとに独立して数える"""
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            limiter.hit('login:ip:192.0.2.1', LIMIT)
+
+        assert limiter.hit('login:ip:192.0.2.2', LIMIT) == 0.0
+
+    def test_enforce_raises_with_retry_after(self, clock):
+        """enforce は上限超過時に RateLimitExceededError を送出する"""
+        limiter = InMemoryRateLimiter()
+        for _ in range(3):
+            limiter.enforce('login', '192.0.2.1', 'A@example.com', LIMIT, LIMIT)
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.enforce('login', '192.0.2.9', 'a@example.com', LIMIT, LIMIT)
+        assert exc_info.value.retry_after_seconds >= 1
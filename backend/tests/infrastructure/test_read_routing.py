@@ -0,0 +1,31 @@
+"""読み取り振り分けのテスト"""
+
+from app.infrastructure.db import read_routing
+
+
+class TestReadRouting:
+    """pin_primary_reads / primary_reads_pinned のテストクラス"""
+
+    def test_pin_expires(self, monkeypatch):
+        """固定した秒数が過ぎるとレプリカへの振り分けに戻る"""
+        now = {'value': 1000.0}
+        monkeypatch.setattr(read_routing.time, 'monotonic', lambda: now['value'])
+        monkeypatch.setattr(read_routing, '_pinned_until', 0.0)
+
+        assert read_routing.primary_reads_pinned() is False
+
+        read_routing.pin_primary_reads(5.0)
+        assert read_routing.primary_reads_pinned() is True
+
+        now['value'] = 1005.0
+        assert read_routing.primary_reads_pinned() is False
+
+    def test_shorter_pin_does_not_shorten(self, monkeypatch):
+        """短い固定で既存の固定期間を縮めない"""
+        monkeypatch.setattr(read_routing.time, 'monotonic', lambda: 1000.0)
+        monkeypatch.setattr(read_routing, '_pinned_until', 0.0)
+
+        read_routing.pin_primary_reads(10.0)
+        read_routing.pin_primary_reads(1.0)
+
+        assert read_routing._pinned_until == 1010.0
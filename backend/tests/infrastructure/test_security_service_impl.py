@@ -6,10 +6,8 @@ import pytest
 from jose import jwt
 
 from app.config import get_settings
-from app.infrastructure.security.security_service_impl import (
-    SecurityServiceImpl,
-    _load_rsa_keys,
-)
+from app.infrastructure.security.jwt_key_manager import load_rsa_keys
+from app.infrastructure.security.security_service_impl import SecurityServiceImpl
 
 
 class TestSecurityServiceImpl:
@@ -52,7 +50,7 @@ class TestSecurityServiceImpl:
         settings = get_settings()
 
         # RS256で署名されたトークンをデコード
-        _, public_key = _load_rsa_keys()
+        _, public_key = load_rsa_keys()
 
         decoded = jwt.decode(token, public_key, algorithms=[settings.jwt_algorithm])
 
@@ -0,0 +1,49 @@
+"""リクエスト単位の statement_timeout のテスト"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def session_module(test_db_engine):
+    """statement_timeout のフックを登録済みのセッションモジュール（PostgreSQLのみ）"""
+    if test_db_engine.dialect.name != 'postgresql':
+        pytest.skip('statement_timeout の検証にはPostgreSQLが必要')
+    from app.infrastructure.db import session
+
+    return session
+
+
+def _statement_timeout(db) -> str:
+    return db.execute(text('SHOW statement_timeout')).scalar()
+
+
+class TestStatementTimeout:
+    """リクエストのセッションだけに statement_timeout が設定されることのテスト"""
+
+    def test_request_session_is_bounded_for_its_transaction(
+        self, test_db_engine, session_module
+    ):
+        """リクエストのセッションはトランザクションの間だけ上限が設定される"""
+        factory = sessionmaker(bind=test_db_engine)
+        with factory() as db:
+            db.info[session_module.STATEMENT_TIMEOUT_MS] = 1500
+            assert _statement_timeout(db) == '1500ms'
+            db.rollback()
+
+            # バッチ・バックグラウンド処理のセッションには設定されない
+            with factory() as batch:
+                assert _statement_timeout(batch) == '0'
+
+    def test_read_only_session_resets_connection(self, test_db_engine, session_module):
+        """AUTOCOMMIT の読み取り専用セッションはクローズ前に設定を戻す"""
+        engine = test_db_engine.execution_options(isolation_level='AUTOCOMMIT')
+        factory = sessionmaker(bind=engine, info={session_module.READ_ONLY: True})
+        with factory() as db:
+            db.info[session_module.STATEMENT_TIMEOUT_MS] = 1500
+            assert _statement_timeout(db) == '1500ms'
+            connection = db.connection()
+
+            session_module.reset_statement_timeout(db)
+            assert connection.exec_driver_sql('SHOW statement_timeout').scalar() == '0'
@@ -0,0 +1,169 @@
+"""Stripeイベント台帳の処理のテスト"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import delete, func, update
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.db.models.email_outbox_model import EmailOutboxModel
+from app.infrastructure.db.models.stripe_event_model import StripeEventModel
+from app.infrastructure.email.email_outbox_impl import EmailOutboxImpl
+from app.infrastructure.stripe.event_processor import StripeEventProcessor
+from app.infrastructure.stripe.stripe_event_ledger_impl import StripeEventLedgerImpl
+
+
+class RecordingHandler:
+    """処理したイベントを記録し、指定した種類のイベントで失敗するハンドラー
+
+    処理の中でメール送信キューに記録するため、処理の取り消しを確認できる。
+    """
+
+    def __init__(self, fail_types: tuple[str, ...] = ()):
+        self.fail_types = fail_types
+        self.handled: list[str] = []
+
+    def __call__(self, session, event_type, payload) -> None:
+        self.handled.append(payload['id'])
+        EmailOutboxImpl(session).enqueue_welcome_email(
+            f'{payload["id"]}@example.com', 'テスト'
+        )
+        if event_type in self.fail_types:
+            raise RuntimeError(f'{event_type} failed')
+
+
+class TestStripeEventProcessor:
+    """記録したイベントの処理のテスト（PostgreSQL）"""
+
+    @pytest.fixture
+    def session_factory(self, test_db_engine):
+        if test_db_engine.dialect.name != 'postgresql':
+            pytest.skip('ON CONFLICT / SKIP LOCKED の検証にはPostgreSQLが必要')
+        factory = sessionmaker(bind=test_db_engine)
+        yield factory
+        with factory() as session:
+            session.execute(delete(StripeEventModel))
+            session.execute(delete(EmailOutboxModel))
+            session.commit()
+
+    def _record(self, session_factory, *events: tuple[str, str]) -> None:
+        with session_factory() as session:
+            ledger = StripeEventLedgerImpl(session)
+            for event_id, event_type in events:
+                ledger.record(event_id, event_type, {'id': event_id})
+            session.commit()
+
+    def _statuses(self, session_factory) -> dict[str, tuple[str, int]]:
+        with session_factory() as session:
+            return {
+                row.id: (row.status, row.attempts)
+                for row in session.query(StripeEventModel)
+            }
+
+    def _outbox_recipients(self, session_factory) -> set[str]:
+        with session_factory() as session:
+            return {row.to_email for row in session.query(EmailOutboxModel)}
+
+    def test_processed_event_is_marked(self, session_factory):
+        """処理したイベントは processed になり、再び処理されない"""
+        self._record(session_factory, ('evt_1', 'payment_intent.succeeded'))
+
+        handler = RecordingHandler()
+        processor = StripeEventProcessor(session_factory, handler)
+        assert processor.process_batch() == 1
+        assert processor.process_batch() == 0
+        assert handler.handled == ['evt_1']
+
+        with session_factory() as session:
+            row = session.query(StripeEventModel).one()
+            assert (row.status, row.attempts, row.last_error) == ('processed', 0, None)
+            assert row.processed_at is not None
+            assert row.locked_until is None
+        assert self._outbox_recipients(session_factory) == {'evt_1@example.com'}
+
+    def test_failing_event_does_not_roll_back_others(self, session_factory):
+        """1件の失敗で同じバッチの他のイベントの処理は取り消されない"""
+        self._record(
+            session_factory,
+            ('evt_1', 'payment_intent.succeeded'),
+            ('evt_2', 'payment_intent.payment_failed'),
+            ('evt_3', 'payment_intent.succeeded'),
+        )
+
+        handler = RecordingHandler(fail_types=('payment_intent.payment_failed',))
+        processor = StripeEventProcessor(session_factory, handler)
+        assert processor.process_batch() == 3
+        assert handler.handled == ['evt_1', 'evt_2', 'evt_3']
+
+        assert self._statuses(session_factory) == {
+            'evt_1': ('processed', 0),
+            'evt_2': ('pending', 1),
+            'evt_3': ('processed', 0),
+        }
+        # 失敗したイベントの処理の中で記録した行だけが取り消される
+        assert self._outbox_recipients(session_factory) == {
+            'evt_1@example.com',
+            'evt_3@example.com',
+        }
+
+    def test_failed_event_is_retried_then_given_up(self, session_factory):
+        """処理に失敗したイベントは再処理を予約し、上限回数で failed になる"""
+        self._record(session_factory, ('evt_1', 'payment_intent.payment_failed'))
+
+        processor = StripeEventProcessor(
+            session_factory,
+            RecordingHandler(fail_types=('payment_intent.payment_failed',)),
+            max_attempts=2,
+            backoff_base_seconds=10.0,
+        )
+        assert processor.process_batch() == 1
+
+        with session_factory() as session:
+            row = session.query(StripeEventModel).one()
+            assert (row.status, row.attempts) == ('pending', 1)
+            assert row.last_error == 'payment_intent.payment_failed failed'
+            assert row.locked_until is None
+            # 1回目の失敗後は backoff_base_seconds 後に再処理する
+            delay = (row.next_attempt_at - row.received_at).total_seconds()
+            assert 10.0 <= delay < 20.0
+        # 再処理予定時刻まではスキップされる
+        assert processor.process_batch() == 0
+
+        with session_factory() as session:
+            session.execute(
+                update(StripeEventModel).values(
+                    next_attempt_at=StripeEventModel.received_at
+                )
+            )
+            session.commit()
+        assert processor.process_batch() == 1
+        assert self._statuses(session_factory) == {'evt_1': ('failed', 2)}
+        assert processor.process_batch() == 0
+
+    def test_expired_lease_is_claimed_again(self, session_factory):
+        """処理中に停止したイベントはリース期限を過ぎると処理し直す"""
+        self._record(session_factory, ('evt_1', 'payment_intent.succeeded'))
+        with session_factory() as session:
+            # 別のプロセスが処理中のまま停止した状態
+            session.execute(
+                update(StripeEventModel).values(
+                    status='processing', locked_until=func.now() + timedelta(minutes=5)
+                )
+            )
+            session.commit()
+
+        handler = RecordingHandler()
+        processor = StripeEventProcessor(session_factory, handler)
+        # リース期限内は他の処理スレッドの処理中とみなしてスキップする
+        assert processor.process_batch() == 0
+
+        with session_factory() as session:
+            session.execute(
+                update(StripeEventModel).values(
+                    locked_until=func.now() - timedelta(seconds=1)
+                )
+            )
+            session.commit()
+        assert processor.process_batch() == 1
+        assert handler.handled == ['evt_1']
+        assert self._statuses(session_factory) == {'evt_1': ('processed', 0)}
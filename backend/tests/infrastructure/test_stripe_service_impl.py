@@ -0,0 +1,152 @@
+"""StripeServiceImplのテスト（ローカルのスタブサーバーに接続）"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy.util import greenlet_spawn
+
+from app.domain.exceptions.payment import PaymentIntentCreationError
+from app.infrastructure.stripe.stripe_client import create_stripe_client
+from app.infrastructure.stripe.stripe_metrics import StripeMetrics
+from app.infrastructure.stripe.stripe_service_impl import (
+    AsyncStripeServiceImpl,
+    StripeServiceImpl,
+)
+
+
+class StubStripeServer(ThreadingHTTPServer):
+    """stripe-mock と同じ形式で PaymentIntent を返すスタブサーバー"""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        self.connections: set[int] = set()
+        self.requests: list[tuple[str, str]] = []
+        # 先頭から順に、この件数だけ 500 を返す
+        self.failures = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.rfile.read(length)
+        self._respond('POST')
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def _respond(self, method: str):
+        server: StubStripeServer = self.server
+        server.connections.add(self.client_address[1])
+        server.requests.append((method, self.path))
+
+        if server.failures > 0:
+            server.failures -= 1
+            self._send(500, {'error': {'type': 'api_error', 'message': 'stub'}})
+            return
+        self._send(
+            200,
+            {
+                'id': 'pi_stub',
+                'object': 'payment_intent',
+                'amount': 1100,
+                'client_secret': 'pi_stub_secret',
+                'status': 'requires_payment_method',
+            },
+        )
+
+    def _send(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        if status >= 500:
+            self.send_header('Stripe-Should-Retry', 'true')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = StubStripeServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _service(cls, stub_server, max_network_retries: int = 0):
+    client = create_stripe_client(
+        'sk_test_stub',
+        api_base=stub_server.url,
+        max_network_retries=max_network_retries,
+        read_timeout_seconds=5.0,
+    )
+    return cls(client=client, metrics=StripeMetrics(), webhook_secret='whsec_stub')
+
+
+class TestStripeServiceImpl:
+    """StripeServiceImplのテストクラス"""
+
+    def test_reuses_connection_and_records_latency(self, stub_server):
+        """同じ接続を keep-alive で再利用し、操作ごとのレイテンシを記録する"""
+        service = _service(StripeServiceImpl, stub_server)
+
+        for _ in range(3):
+            result = service.create_payment_intent(amount=1100)
+        service.retrieve_payment_intent('pi_stub')
+
+        assert result.payment_intent_id == 'pi_stub'
+        assert result.client_secret == 'pi_stub_secret'
+        assert len(stub_server.connections) == 1
+        stats = {s.operation: s for s in service.metrics.stats()}
+        assert stats['payment_intents.create'].calls == 3
+        assert stats['payment_intents.create'].latency_histogram[-1].count == 3
+        assert stats['payment_intents.retrieve'].calls == 1
+
+    def test_retries_server_errors(self, stub_server):
+        """5xx は max_network_retries 回まで再試行する"""
+        stub_server.failures = 1
+        service = _service(StripeServiceImpl, stub_server, max_network_retries=1)
+
+        result = service.create_payment_intent(amount=1100)
+
+        assert result.payment_intent_id == 'pi_stub'
+        assert len(stub_server.requests) == 2
+
+    def test_error_is_recorded(self, stub_server):
+        """再試行しても失敗した場合は PaymentIntentCreationError・エラーとして記録"""
+        stub_server.failures = 1
+        service = _service(StripeServiceImpl, stub_server)
+
+        with pytest.raises(PaymentIntentCreationError):
+            service.create_payment_intent(amount=1100)
+
+        (stats,) = service.metrics.stats()
+        assert stats.errors == 1
+
+    def test_async_service_in_greenlet(self, stub_server):
+        """非同期版は AsyncSession.run_sync と同じ greenlet の中から呼び出せる"""
+        service = _service(AsyncStripeServiceImpl, stub_server)
+
+        async def run():
+            return await greenlet_spawn(
+                lambda: service.create_payment_intent(amount=1100, metadata={'a': '1'})
+            )
+
+        result = asyncio.run(run())
+
+        assert result.payment_intent_id == 'pi_stub'
+        assert stub_server.requests == [('POST', '/v1/payment_intents')]
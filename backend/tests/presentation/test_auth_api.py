@@ -1,5 +1,7 @@
 """Auth APIエンドポイントのテスト"""
 
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -147,3 +149,41 @@ class TestAuthAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert 'message' in data
+
+    def test_spoofed_forwarded_for_does_not_change_rate_limit_key(
+        self, test_client: TestClient, monkeypatch
+    ):
+        """X-Forwarded-Forを偽装してもレート制限に渡すアドレスは変わらない"""
+        from app.application.schemas.account.auth_schemas import LoginOutputDTO
+        from app.application.use_cases.account.auth_usecase import AuthUsecase
+        from app.di.account.auth import get_auth_usecase
+        from app.main import app
+
+        monkeypatch.setattr(
+            'app.presentation.client_ip.get_settings',
+            lambda: MagicMock(trusted_proxy_cidrs=['10.0.0.0/16']),
+        )
+        usecase = MagicMock(spec=AuthUsecase)
+        usecase.login.return_value = LoginOutputDTO(access_token='token', user_id=1)
+        app.dependency_overrides[get_auth_usecase] = lambda: usecase
+
+        async def behind_alb(scope, receive, send):
+            # ALB（10.0.1.5）からの接続として扱う
+            if scope['type'] == 'http':
+                scope['client'] = ('10.0.1.5', 443)
+            await app(scope, receive, send)
+
+        try:
+            client = TestClient(behind_alb)
+            for spoofed in ('192.0.2.1', '192.0.2.2', '198.51.100.3'):
+                response = client.post(
+                    '/api/auth/login',
+                    json={'email': 'user@example.com', 'password': 'password123'},
+                    headers={'X-Forwarded-For': f'{spoofed}, 203.0.113.10'},
+                )
+                assert response.status_code == status.HTTP_200_OK
+        finally:
+            app.dependency_overrides.pop(get_auth_usecase)
+
+        ips = {call.args[1] for call in usecase.login.call_args_list}
+        assert ips == {'203.0.113.10'}
@@ -0,0 +1,57 @@
+"""クライアントIPアドレス解決のテスト"""
+
+import ipaddress
+
+from starlette.requests import Request
+
+from app.presentation.client_ip import client_ip
+
+ALB_SUBNET = [ipaddress.ip_network('10.0.0.0/16')]
+
+
+def _request(peer: str, forwarded_for: str | None = None) -> Request:
+    """接続元とX-Forwarded-Forを指定してリクエストを生成"""
+    headers = []
+    if forwarded_for is not None:
+        headers.append((b'x-forwarded-for', forwarded_for.encode()))
+    return Request(
+        {
+            'type': 'http',
+            'method': 'POST',
+            'headers': headers,
+            'client': (peer, 50000),
+        }
+    )
+
+
+class TestClientIp:
+    """クライアントIPアドレス解決のテストクラス"""
+
+    def test_uses_rightmost_hop_appended_by_alb(self):
+        """ALB経由の場合はALBが右端に追記したアドレスを使う"""
+        request = _request('10.0.1.5', '198.51.100.7, 203.0.113.10')
+
+        assert client_ip(request, ALB_SUBNET) == '203.0.113.10'
+
+    def test_spoofed_header_does_not_change_key(self):
+        """クライアントが先頭に付けた値を変えても同じアドレスになる"""
+        keys = {
+            client_ip(_request('10.0.1.5', f'192.0.2.{n}, 203.0.113.10'), ALB_SUBNET)
+            for n in range(1, 20)
+        }
+
+        assert keys == {'203.0.113.10'}
+
+    def test_skips_trusted_hops(self):
+        """信頼するプロキシのアドレスは右端から読み飛ばす"""
+        request = _request('10.0.1.5', '192.0.2.1, 203.0.113.10, 10.0.2.8')
+
+        assert client_ip(request, ALB_SUBNET) == '203.0.113.10'
+
+    def test_ignores_header_from_untrusted_peer(self):
+        """信頼するプロキシ以外からの接続ではヘッダーを使わない"""
+        request = _request('203.0.113.10', '192.0.2.1')
+
+        assert client_ip(request, ALB_SUBNET) == '203.0.113.10'
+        assert client_ip(request, []) == '203.0.113.10'
+
@@ -0,0 +1,76 @@
+"""HTTPキャッシュ（条件付きGET）ヘルパーのテスト"""
+
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.presentation.http_cache import (
+    format_last_modified,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+
+UPDATED_AT = datetime(2025, 1, 2, 3, 4, 5, 678000)
+
+
+def _request(headers: dict[str, str]) -> Request:
+    """指定ヘッダー付きのリクエストを生成"""
+    return Request(
+        {
+            'type': 'http',
+            'method': 'GET',
+            'headers': [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+class TestHttpCache:
+    """HTTPキャッシュヘルパーのテストクラス"""
+
+    def test_make_etag_is_stable_and_quoted(self):
+        """同じバージョンからは同じETagが生成される"""
+        etag = make_etag('product-1|2025-01-02T03:04:05')
+
+        assert etag == make_etag('product-1|2025-01-02T03:04:05')
+        assert etag != make_etag('product-1|2025-01-02T03:04:06')
+        assert etag.startswith('"') and etag.endswith('"')
+
+    def test_if_none_match_matches_weak_and_list(self):
+        """If-None-Match は弱い比較・複数指定に対応する"""
+        etag = make_etag('v')
+
+        assert is_not_modified(_request({'If-None-Match': etag}), etag)
+        assert is_not_modified(_request({'If-None-Match': f'"x", W/{etag}'}), etag)
+        assert not is_not_modified(_request({'If-None-Match': '"other"'}), etag)
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        """If-None-Match がある場合は If-Modified-Since を無視する"""
+        request = _request(
+            {
+                'If-None-Match': '"other"',
+                'If-Modified-Since': format_last_modified(UPDATED_AT),
+            }
+        )
+
+        assert not is_not_modified(request, make_etag('v'), UPDATED_AT)
+
+    def test_if_modified_since(self):
+        """If-Modified-Since は秒単位で比較する"""
+        etag = make_etag('v')
+        same = _request({'If-Modified-Since': format_last_modified(UPDATED_AT)})
+        older = _request({'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'})
+        invalid = _request({'If-Modified-Since': 'invalid'})
+
+        assert is_not_modified(same, etag, UPDATED_AT)
+        assert not is_not_modified(older, etag, UPDATED_AT)
+        assert not is_not_modified(invalid, etag, UPDATED_AT)
+
+    def test_not_modified_response(self):
+        """304レスポンスにバリデータが設定される"""
+        etag = make_etag('v')
+        response = not_modified_response(etag, UPDATED_AT)
+
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag
+        assert response.headers['Last-Modified'] == 'Thu, 02 Jan 2025 03:04:05 GMT'
@@ -0,0 +1,7 @@
+#!/bin/bash
+# プライマリ: レプリカ（db-replica）からのストリーミングレプリケーション接続を許可する
+# 初回起動時（db_data が空のとき）に /docker-entrypoint-initdb.d から実行される。
+# 既存の db_data を使う場合は、同じ行を db_data/pg_hba.conf に追記して再起動すること。
+set -euo pipefail
+
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,18 @@
+#!/bin/bash
+# レプリカ: プライマリ（db）のベースバックアップを取得し、ホットスタンバイとして起動する
+# ローカルでリードレプリカへの振り分けを検証するためのもの（docker compose --profile replica）
+set -euo pipefail
+
+PGDATA="${PGDATA:-/var/lib/postgresql/data}"
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+  until pg_isready -h db -U "$POSTGRES_USER" -d "$POSTGRES_DB"; do
+    sleep 1
+  done
+  # -R: standby.signal と primary_conninfo を書き出す
+  PGPASSWORD="$POSTGRES_PASSWORD" pg_basebackup \
+    -h db -U "$POSTGRES_USER" -D "$PGDATA" -R -X stream
+  chmod 700 "$PGDATA"
+fi
+
+exec postgres -c hot_standby=on
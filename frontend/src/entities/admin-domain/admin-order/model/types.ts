@@ -35,6 +35,8 @@ export interface AdminOrder {
   delivered_at: string | null;
   cancelled_at: string | null;
   notes: string | null;
+  requires_upload: boolean;
+  upload_item_count: number;
   created_at: string;
 }
 
@@ -55,6 +57,7 @@ export interface GetAdminOrdersRequest {
   status?: OrderStatus[];
   date_from?: string;
   date_to?: string;
+  requires_upload?: boolean;
   limit?: number;
   offset?: number;
 }
@@ -31,6 +31,9 @@ export interface AdminUser {
   phone: string | null;
   company: string | null;
   is_email_verified: boolean;
+  order_count: number;
+  total_spent: number;
+  last_order_at: string | null;
   created_at: string | null;
   updated_at: string | null;
 }
@@ -38,13 +41,19 @@ export interface AdminUser {
 // === 管理者用顧客詳細情報 ===
 export interface AdminUserDetail extends AdminUser {
   stripe_customer_id: string | null;
-  order_count: number;
-  total_spent: number;
 }
 
+// === 顧客一覧の並び順（いずれも降順） ===
+export type AdminUserSortKey =
+  | 'created_at'
+  | 'order_count'
+  | 'total_spent'
+  | 'last_order_at';
+
 // === 顧客一覧取得リクエスト ===
 export interface GetAdminUsersRequest {
   search?: string;
+  sort_by?: AdminUserSortKey;
   limit?: number;
   offset?: number;
 }
@@ -2,7 +2,13 @@
 
 import { useState } from 'react';
 import Link from 'next/link';
-import { Search, Eye, Mail, MoreHorizontal } from 'lucide-react';
+import {
+  ArrowUpDown,
+  Search,
+  Eye,
+  Mail,
+  MoreHorizontal,
+} from 'lucide-react';
 import { Button } from '@/shared/ui/shadcn/ui/button';
 import { Input } from '@/shared/ui/shadcn/ui/input';
 import { Badge } from '@/shared/ui/shadcn/ui/badge';
@@ -21,18 +27,42 @@ import {
   DropdownMenuItem,
   DropdownMenuTrigger,
 } from '@/shared/ui/shadcn/ui/dropdown-menu';
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from '@/shared/ui/shadcn/ui/select';
 import { AdminLayout } from '@/widgets/admin/layout/ui/AdminLayout';
 import { useAdminUsers } from '@/features/admin-domain/admin-user/get-users/lib/use-admin-users';
 import { AdminPagination } from '@/shared/ui/components/pagination/AdminPagination';
+import type { AdminUserSortKey } from '@/entities/admin-domain/admin-user/model/types';
 
 const PAGE_SIZE = 20;
 
+const SORT_LABELS: Record<AdminUserSortKey, string> = {
+  created_at: '登録日順',
+  order_count: '注文数順',
+  total_spent: '累計購入金額順',
+  last_order_at: '最終注文日順',
+};
+
+const formatCurrency = (amount: number) => {
+  return new Intl.NumberFormat('ja-JP', {
+    style: 'currency',
+    currency: 'JPY',
+  }).format(amount);
+};
+
 export function UsersHomeContainer() {
   const [searchQuery, setSearchQuery] = useState('');
+  const [sortBy, setSortBy] = useState<AdminUserSortKey>('created_at');
   const [offset, setOffset] = useState(0);
 
   const { data, isLoading } = useAdminUsers({
     search: searchQuery || undefined,
+    sort_by: sortBy,
     limit: PAGE_SIZE,
     offset,
   });
@@ -42,6 +72,11 @@ export function UsersHomeContainer() {
     setOffset(0);
   };
 
+  const handleSortChange = (value: AdminUserSortKey) => {
+    setSortBy(value);
+    setOffset(0);
+  };
+
   return (
     <AdminLayout title='顧客管理'>
       {/* ヘッダー */}
@@ -58,6 +93,24 @@ export function UsersHomeContainer() {
                 className='w-full pl-9 sm:w-64'
               />
             </div>
+            <Select
+              value={sortBy}
+              onValueChange={(value) =>
+                handleSortChange(value as AdminUserSortKey)
+              }
+            >
+              <SelectTrigger className='w-full sm:w-44'>
+                <ArrowUpDown className='mr-2 h-4 w-4' />
+                <SelectValue placeholder='並び順' />
+              </SelectTrigger>
+              <SelectContent>
+                {Object.entries(SORT_LABELS).map(([key, label]) => (
+                  <SelectItem key={key} value={key}>
+                    {label}
+                  </SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
           </div>
         </div>
       </div>
@@ -80,6 +133,9 @@ export function UsersHomeContainer() {
                   <TableHead>名前</TableHead>
                   <TableHead>会社名</TableHead>
                   <TableHead>ステータス</TableHead>
+                  <TableHead className='text-right'>注文数</TableHead>
+                  <TableHead className='text-right'>累計購入金額</TableHead>
+                  <TableHead>最終注文日</TableHead>
                   <TableHead>登録日</TableHead>
                   <TableHead className='w-12'></TableHead>
                 </TableRow>
@@ -115,6 +171,19 @@ export function UsersHomeContainer() {
                         {customer.is_email_verified ? '認証済み' : '未認証'}
                       </Badge>
                     </TableCell>
+                    <TableCell className='text-right'>
+                      {customer.order_count}
+                    </TableCell>
+                    <TableCell className='text-right'>
+                      {formatCurrency(customer.total_spent)}
+                    </TableCell>
+                    <TableCell className='text-muted-foreground'>
+                      {customer.last_order_at
+                        ? new Date(customer.last_order_at).toLocaleDateString(
+                            'ja-JP',
+                          )
+                        : '-'}
+                    </TableCell>
                     <TableCell className='text-muted-foreground'>
                       {customer.created_at
                         ? new Date(customer.created_at).toLocaleDateString(